@@ -4,6 +4,7 @@ import numpy as np
 from evolvekit.core.Ga.GaEvaluator import GaEvaluator
 from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.helpers.GaBoundedSum import bounded_sum
 
 
 class RastriginEvaluator(GaEvaluator):
@@ -41,14 +42,45 @@ class RastriginEvaluator(GaEvaluator):
         Compute fitness value for the provided chromosome.
 
         :param args: GaEvaluatorArgs containing real_chrom
-        :returns: function value f(x)
+        :returns: function value f(x), or a bound above args.cutoff
         :raises: None
         """
         x = args.real_chrom[: self._dim]
-        return float(
-            self._A * self._dim + np.sum(x**2 - self._A * np.cos(2 * np.pi * x))
+        # Every term shifted by A is nonnegative, so partial sums only grow.
+        return bounded_sum(
+            lambda i, j: np.sum(self._terms(x[i:j]) + self._A), len(x), args.cutoff
         )
 
+    def evaluate_delta(self, args: GaEvaluatorArgs) -> float:
+        """
+        Update the parent's fitness value with the terms of changed genes only.
+
+        :param args: GaEvaluatorArgs containing real_chrom and its parent
+        :returns: function value f(x)
+        :raises: None
+        """
+        changed = args.changed_genes[args.changed_genes < self._dim]
+        new = self._terms(args.real_chrom[changed])
+        old = self._terms(args.parent_real_chrom[changed])
+        return float(args.parent_value + np.sum(new - old))
+
+    def _terms(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the per-gene terms of the sum.
+
+        :param x: gene values
+        :returns: x_i^2 - A*cos(2*pi*x_i) for every gene
+        """
+        return x**2 - self._A * np.cos(2 * np.pi * x)
+
+    def cache_key(self) -> object:
+        """
+        Returns the default key extended with parameter A, which is not visible in the domain.
+
+        :returns: Configuration identifying the function.
+        """
+        return {**super().cache_key(), "A": self._A}
+
     def extremum(self) -> GaExtremum:
         """
         Returns the optimization direction.
@@ -4,6 +4,7 @@ import numpy as np
 from evolvekit.core.Ga.GaEvaluator import GaEvaluator
 from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.helpers.GaBoundedSum import bounded_sum
 
 
 class RosenbrockEvaluator(GaEvaluator):
@@ -35,13 +36,19 @@ class RosenbrockEvaluator(GaEvaluator):
         Compute fitness value for the provided chromosome.
 
         :param args: GaEvaluatorArgs containing real_chrom
-        :returns: function value f(x)
+        :returns: function value f(x), or a bound above args.cutoff
         :raises: None
         """
         x = args.real_chrom[: self._dim]
         x_i = x[:-1]
         x_next = x[1:]
-        return float(np.sum(100.0 * (x_next - x_i**2) ** 2 + (1.0 - x_i) ** 2))
+        return bounded_sum(
+            lambda i, j: np.sum(
+                100.0 * (x_next[i:j] - x_i[i:j] ** 2) ** 2 + (1.0 - x_i[i:j]) ** 2
+            ),
+            len(x_i),
+            args.cutoff,
+        )
 
     def extremum(self) -> GaExtremum:
         """
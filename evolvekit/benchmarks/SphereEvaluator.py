@@ -4,6 +4,7 @@ import numpy as np
 from evolvekit.core.Ga.GaEvaluator import GaEvaluator
 from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.helpers.GaBoundedSum import bounded_sum
 
 
 class SphereEvaluator(GaEvaluator):
@@ -34,11 +35,24 @@ class SphereEvaluator(GaEvaluator):
         Compute fitness value for the provided chromosome.
 
         :param args: GaEvaluatorArgs containing real_chrom
-        :returns: function value f(x)
+        :returns: function value f(x), or a bound above args.cutoff
         :raises: None
         """
         x = args.real_chrom[: self._dim]
-        return float(np.sum(np.square(x)))
+        return bounded_sum(lambda i, j: np.sum(np.square(x[i:j])), len(x), args.cutoff)
+
+    def evaluate_delta(self, args: GaEvaluatorArgs) -> float:
+        """
+        Update the parent's fitness value with the terms of changed genes only.
+
+        :param args: GaEvaluatorArgs containing real_chrom and its parent
+        :returns: function value f(x)
+        :raises: None
+        """
+        changed = args.changed_genes[args.changed_genes < self._dim]
+        new = args.real_chrom[changed]
+        old = args.parent_real_chrom[changed]
+        return float(args.parent_value + np.sum(np.square(new) - np.square(old)))
 
     def extremum(self) -> GaExtremum:
         """
@@ -0,0 +1,38 @@
+from abc import abstractmethod
+from typing import List
+
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+
+
+class AsyncGaEvaluator(GaEvaluator):
+    """
+    Abstract class representing fitness function computed by a coroutine.
+
+    Derive from it when evaluation mostly waits for I/O, e.g. for a model
+    server or a database. Islands using such an evaluator have to be
+    started with :func:`GaIsland.run_async()`, which runs many evaluations
+    concurrently in a single thread.
+    """
+
+    @abstractmethod
+    async def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Calculates the fitness value for a given set of arguments.
+
+        :param args: Object representing a particular solution for the
+            posited problem.
+        :returns: A value representing fitness for this particular
+            solution.
+        :rtype: float
+        """
+        pass
+
+    def evaluate_batch(self, args: List[GaEvaluatorArgs]) -> List[float]:
+        """
+        Synchronous batch evaluation is not available for coroutine evaluators.
+
+        :raises TypeError: Always, use :func:`GaIsland.run_async()` instead.
+        """
+
+        raise TypeError("AsyncGaEvaluator can only be used with GaIsland.run_async().")
@@ -23,6 +23,50 @@ class GaEvaluator(ABC):
         """
         pass
 
+    def evaluate_batch(self, args: List[GaEvaluatorArgs]) -> List[float]:
+        """
+        Calculates fitness values for a batch of solutions.
+
+        Override this method when evaluating many solutions at once is
+        cheaper than evaluating them one by one, e.g. when the fitness
+        function runs in an external program. By default it calls
+        :func:`evaluate()` for every element.
+
+        :param args: Objects representing solutions for the posited problem.
+        :returns: Fitness values in the same order as ``args``.
+        :rtype: List[float]
+        """
+
+        return [
+            (
+                self.evaluate(arg)
+                if arg.changed_genes is None
+                else self.evaluate_delta(arg)
+            )
+            for arg in args
+        ]
+
+    def evaluate_delta(self, args: GaEvaluatorArgs) -> float:
+        """
+        Calculates the fitness value of a solution which differs from an
+        already evaluated parent only in genes listed in ``args.changed_genes``.
+
+        Override this method when the fitness can be updated from
+        ``args.parent_value`` and ``args.parent_real_chrom`` faster than it
+        can be computed from scratch, e.g. for separable sums, where only
+        the terms of changed genes need recomputing. It is only called when
+        ``args.changed_genes`` is not None. By default it calls
+        :func:`evaluate()`.
+
+        :param args: Object representing a particular solution for the
+            posited problem, together with its parent.
+        :returns: A value representing fitness for this particular
+            solution.
+        :rtype: float
+        """
+
+        return self.evaluate(args)
+
     @abstractmethod
     def extremum(self) -> GaExtremum:
         """
@@ -57,3 +101,48 @@ class GaEvaluator(ABC):
         :rtype: int
         """
         return 0
+
+    def setup_worker(self):
+        """
+        Prepares the evaluator for evaluating individuals in the current
+        process. It is called exactly once in every process that evaluates
+        individuals, before the first call to :func:`evaluate()`. When no
+        worker processes are used, it is called in the process running
+        the simulation.
+
+        Override this method to load data which should not be sent to
+        worker processes together with the evaluator, e.g. to open files
+        or to attach to a :class:`GaSharedArray`.
+
+        :returns: None.
+        """
+        pass
+
+    def cache_key(self) -> object:
+        """
+        Returns the configuration which identifies the fitness function,
+        e.g. for :class:`GaResultCache` to recognize runs it has seen before.
+        By default these are the domain of real genes, the length of binary
+        chromosomes, the optimization criterion and the public attributes of
+        the evaluator, i.e. those whose names do not start with an underscore.
+
+        Override this method when the fitness depends on private attributes
+        not visible in the domain, extending the default key, or when public
+        attributes hold runtime state, e.g. handles of external processes,
+        which must not change the key.
+
+        :returns: Data made of numbers, strings, sequences, dictionaries,
+            enums, arrays and objects described the same way.
+        :rtype: object
+        """
+
+        return {
+            "real_domain": self.real_domain(),
+            "bin_length": self.bin_length(),
+            "extremum": self.extremum(),
+            "attributes": {
+                name: value
+                for name, value in vars(self).items()
+                if not name.startswith("_")
+            },
+        }
@@ -8,10 +8,25 @@ class GaEvaluatorArgs:
     """
     Class for supplying arguments to :class:`GaEvaulator` class.
     By default contains real and binary chromosome.
+
+    When the individual differs from an already evaluated parent only in
+    some real genes, 'parent_real_chrom', 'parent_value' and
+    'changed_genes' describe the parent and the indices of changed genes,
+    see :func:`GaEvaluator.evaluate_delta()`. Otherwise they are None.
+
+    With bounded evaluation, 'cutoff' is the fitness value an individual
+    has to beat to matter for selection, otherwise it is None. An
+    evaluator may stop as soon as it knows the individual is worse than
+    'cutoff' and return a bound: any value between 'cutoff' and the
+    exact fitness.
     """
 
     real_chrom: npt.NDArray[np.float64]
     bin_chrom: npt.NDArray[np.uint8]
+    parent_real_chrom: npt.NDArray[np.float64] | None
+    parent_value: float | None
+    changed_genes: npt.NDArray[np.intp] | None
+    cutoff: float | None
 
     def __init__(self, individual: GaIndividual):
         """
@@ -24,3 +39,11 @@ class GaEvaluatorArgs:
         """
         self.real_chrom = np.copy(individual.real_chrom)
         self.bin_chrom = np.copy(individual.bin_chrom)
+        self.parent_real_chrom = None
+        self.parent_value = None
+        self.changed_genes = None
+        self.cutoff = individual.cutoff
+        if individual.changed_genes is not None:
+            self.parent_real_chrom = individual.parent_real_chrom
+            self.parent_value = individual.parent_value
+            self.changed_genes = individual.changed_genes
@@ -1,14 +1,36 @@
 from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 
 import numpy as np
 import numpy.typing as npt
 
+from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
+
 
 @dataclass
 class GaIndividual:
     """
     Class representing a single, potential solution of a problem
-    posited in the simulation.
+    posited in the simulation. Its value is 'estimated' when it was
+    predicted by a surrogate model or inherited from its parents instead
+    of computed by the evaluator. Offspring created by a crossover keep
+    their 'lineage': pairs of parent index in the selected population and
+    the weight with which that parent was mixed in. Offspring which differ
+    from an evaluated parent only in genes recorded by mutation keep the
+    parent's real chromosome and value along with 'changed_genes', the
+    indices of real genes changed since, for incremental evaluation.
+    An individual evaluated with a 'cutoff' whose value is worse than the
+    cutoff is 'partial': its value is only a bound, good enough to compare
+    it with individuals better than the cutoff.
+    An individual whose evaluation failed on every attempt allowed by the
+    evaluation policy is 'failed': its value is the penalty of the policy.
+    An individual refined by Baldwinian local search keeps its chromosomes
+    but takes the value of the refined individual, which it keeps as
+    'learned': the value is only meant for selection.
+    Offspring created by adaptive operators record the 'arms', i.e.
+    operators chosen from their pools, by category, and the
+    'reference_value' of their parents weighted by lineage, which
+    improvements are credited against.
     """
 
     real_chrom: npt.NDArray[np.float64] = field(
@@ -18,6 +40,17 @@ class GaIndividual:
         default_factory=lambda: np.array([], dtype=np.uint8)
     )
     value: float = field(default=0.0)
+    estimated: bool = field(default=False)
+    lineage: List[Tuple[int, float]] = field(default_factory=list)
+    parent_real_chrom: npt.NDArray[np.float64] | None = field(default=None)
+    parent_value: float | None = field(default=None)
+    changed_genes: npt.NDArray[np.intp] | None = field(default=None)
+    cutoff: float | None = field(default=None)
+    partial: bool = field(default=False)
+    failed: bool = field(default=False)
+    learned: "GaIndividual | None" = field(default=None)
+    arms: Dict[GaOpCategory, int] | None = field(default=None)
+    reference_value: float | None = field(default=None)
 
     def __deepcopy__(self, memodict=None):
         if memodict is None:
@@ -27,6 +60,17 @@ class GaIndividual:
             real_chrom=np.copy(self.real_chrom),
             bin_chrom=np.copy(self.bin_chrom),
             value=self.value,
+            estimated=self.estimated,
+            lineage=list(self.lineage),
+            parent_real_chrom=self.parent_real_chrom,
+            parent_value=self.parent_value,
+            changed_genes=self.changed_genes,
+            cutoff=self.cutoff,
+            partial=self.partial,
+            failed=self.failed,
+            learned=self.learned,
+            arms=dict(self.arms) if self.arms is not None else None,
+            reference_value=self.reference_value,
         )
 
         memodict[id(self)] = copy
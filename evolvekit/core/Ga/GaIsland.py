@@ -1,9 +1,12 @@
+import asyncio
 import heapq
 import copy
-from typing import List
+import time
+from typing import List, Tuple
 
 import numpy as np
 
+from evolvekit.core.Ga.AsyncGaEvaluator import AsyncGaEvaluator
 from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
 from evolvekit.core.Ga.GaIndividual import GaIndividual
 from evolvekit.core.Ga.helpers.ClampStrategy import get_clamp_strategy
@@ -11,15 +14,26 @@ from evolvekit.core.Ga.GaEvaluator import GaEvaluator
 from evolvekit.core.Ga.GaInspector import GaInspector
 from evolvekit.core.Ga.GaResults import GaResults
 from evolvekit.core.Ga.GaState import GaState
+from evolvekit.core.Ga.GaVisitedSet import GaVisitedSet
 from evolvekit.core.Ga.enums.GaAction import GaAction
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.enums.GaClampStrategy import GaClampStrategy
+from evolvekit.core.Ga.enums.GaDeduplication import GaDeduplication
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
+from evolvekit.core.Ga.enums.GaRestartStrategy import GaRestartStrategy
+from evolvekit.core.Ga.enums.GaWriteBack import GaWriteBack
 from evolvekit.core.Ga.helpers.GaGenerateRandomPopulation import (
     generate_random_population,
 )
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes, mix_lineage
+from evolvekit.core.Ga.memetic.GaLocalSearch import GaLocalSearch
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
+from evolvekit.core.Ga.parallel.GaEvaluationPool import GaEvaluationPool
+from evolvekit.core.Ga.parallel.GaEvaluationPolicy import GaEvaluationPolicy
+from evolvekit.core.Ga.parallel.GaFitnessStore import GaFitnessStore
+from evolvekit.core.Ga.surrogate.GaSurrogate import GaSurrogate
 
 import evolvekit.operators.Ga.real as real_ops
 import evolvekit.operators.Ga.binary as bin_ops
@@ -37,6 +51,23 @@ class GaIsland(GaState):
     real_mutation: GaOperator | None
     bin_crossover: GaOperator | None
     bin_mutation: GaOperator | None
+    evolution_mode: GaEvolutionMode
+    replacement_size: int
+    workers: int
+    evaluation_policy: GaEvaluationPolicy | None
+    max_concurrency: int
+    fitness_store: GaFitnessStore | None
+    surrogate: GaSurrogate | None
+    inheritance_fraction: float
+    bounded_evaluation: bool
+    deduplication: GaDeduplication
+    visited_set: GaVisitedSet | None
+    restart: GaRestartStrategy
+    restart_stagnation: int
+    restart_diversity: float
+    population_growth: float
+    max_evaluations: int | None
+    local_search: GaLocalSearch | None
 
     def __init__(self):
         super().__init__()
@@ -47,37 +78,43 @@ class GaIsland(GaState):
         self.max_generations = 200
         self.seed = 0
         self.real_clamp_strategy = GaClampStrategy.NONE
-
-        # FIXME: I know I shouldn't do this in a constructor. It's a temporary solution until more basic operators will be implemented.
-        dim = 15
-        virus_vectors = [
-            [0.0] * dim,  # full reset pattern
-            [None if i < dim // 2 else 0.0 for i in range(dim)],  # half reset
-            [
-                np.random.normal(0.0, 0.7) if np.random.rand() < 0.5 else None
-                for _ in range(dim)
-            ],
-        ]
-
-        virus_vectors_binary = [
-            [0] * dim,  # full reset pattern
-            ["*" if i < dim // 2 else 0 for i in range(dim)],  # half reset
-            [
-                np.random.choice([0, 1]) if np.random.rand() < 0.5 else "*"
-                for _ in range(dim)
-            ],
-        ]
+        self.evolution_mode = GaEvolutionMode.GENERATIONAL
+        self.replacement_size = 2
+        self.workers = 1
+        self.evaluation_policy = None
+        self.max_concurrency = 64
+        self.fitness_store = None
+        self.surrogate = None
+        self.inheritance_fraction = 0.0
+        self.bounded_evaluation = False
+        self.deduplication = GaDeduplication.NONE
+        self.visited_set = None
+        self.restart = GaRestartStrategy.NONE
+        self.restart_stagnation = 30
+        self.restart_diversity = 1e-3
+        self.population_growth = 2.0
+        self.max_evaluations = None
+        self.local_search = None
 
         self.inspector = None
-        self.selection = uni_ops.RankSelection(target_population=15)
-        self.real_crossover = real_ops.OnePointCrossover()
-        self.real_mutation = real_ops.VirusInfectionMutation(virus_vectors=virus_vectors)
-        self.bin_crossover = bin_ops.OnePointCrossover()
-        self.bin_mutation = bin_ops.VirusInfectionMutation(
-            virus_vectors=virus_vectors_binary
-        )
+        self.selection = None
+        self.real_crossover = None
+        self.real_mutation = None
+        self.bin_crossover = None
+        self.bin_mutation = None
+        self.__default_operators = {}
+        self.__delta_evaluation = False
         self.__binary_representation = False
         self.__real_representation = False
+        self.__pool = None
+        self.__semaphore = None
+        self.__initial_size = None
+        self.__restarted_at = 0
+        self.__large_restarts = 0
+        self.__budgets = {}
+        self.__regime = None
+        self.__spent = 0
+        self.__refined = set()
 
     def __verify(self):
         """
@@ -96,22 +133,13 @@ class GaIsland(GaState):
             raise ValueError(
                 "Both bin_length is 0 and real_domain is empty list in evaluator."
             )
-        if self.evaluator.bin_length() > 0:
-            self.__binary_representation = True
-            if not self.bin_mutation or not self.bin_crossover:
-                raise ValueError(
-                    "Binary chromosome set as active but binary mutation or binary crossover is empty."
-                )
-
-        if not self.selection:
-            raise TypeError("Selection cannot be empty")
-
-        if self.evaluator.real_domain():
-            self.__real_representation = True
-            if not self.real_mutation or not self.real_crossover:
-                raise ValueError(
-                    "Real chromosome set as active but real mutation or real crossover is empty."
-                )
+        self.__binary_representation = self.evaluator.bin_length() > 0
+        self.__real_representation = bool(self.evaluator.real_domain())
+        self.__delta_evaluation = type(
+            self.evaluator
+        ).evaluate_delta is not GaEvaluator.evaluate_delta and not isinstance(
+            self.evaluator, AsyncGaEvaluator
+        )
 
         if (
             self.real_crossover
@@ -160,6 +188,56 @@ class GaIsland(GaState):
         if self.max_generations <= 0:
             raise ValueError("Max generations must be greater than 0.")
 
+        if self.workers <= 0:
+            raise ValueError("Number of workers must be greater than 0.")
+
+        if self.max_concurrency <= 0:
+            raise ValueError("Maximum concurrency must be greater than 0.")
+
+        if not 0 <= self.inheritance_fraction < 1:
+            raise ValueError("Inheritance fraction must be between 0 and 1.")
+
+        if (
+            self.evolution_mode != GaEvolutionMode.GENERATIONAL
+            and not 0 < self.replacement_size <= self.population_size
+        ):
+            raise ValueError("Replacement size must be between 1 and population size.")
+
+        if self.bounded_evaluation:
+            if self.evolution_mode == GaEvolutionMode.GENERATIONAL:
+                raise ValueError(
+                    "Bounded evaluation requires a steady-state evolution mode."
+                )
+            if self.selection and not self.selection.comparison_only():
+                raise ValueError(
+                    "Bounded evaluation requires a selection which only compares fitness values."
+                )
+            if isinstance(self.evaluator, AsyncGaEvaluator):
+                raise TypeError("Bounded evaluation does not support AsyncGaEvaluator.")
+
+        if self.restart != GaRestartStrategy.NONE:
+            if self.evolution_mode == GaEvolutionMode.ASYNC_STEADY_STATE:
+                raise ValueError(
+                    "Restarts are not supported in asynchronous steady-state mode."
+                )
+            if self.restart_stagnation <= 0:
+                raise ValueError("Restart stagnation must be greater than 0.")
+            if not 0 <= self.restart_diversity < 1:
+                raise ValueError("Restart diversity must be between 0 and 1.")
+            if self.population_growth < 1:
+                raise ValueError("Population growth must be greater or equal 1.")
+
+        if self.max_evaluations is not None and self.max_evaluations <= 0:
+            raise ValueError("Max evaluations must be greater than 0.")
+
+        if self.local_search:
+            if self.evolution_mode == GaEvolutionMode.ASYNC_STEADY_STATE:
+                raise ValueError(
+                    "Local search is not supported in asynchronous steady-state mode."
+                )
+            if isinstance(self.evaluator, AsyncGaEvaluator):
+                raise TypeError("Local search does not support AsyncGaEvaluator.")
+
     def __initialize(self):
         """
         Initializes evolution state to prepare for genetic evolution loop.
@@ -167,7 +245,15 @@ class GaIsland(GaState):
         :returns: None.
         """
 
+        self.__build_default_operators()
         np.random.seed(self.seed)
+        self.__initial_size = self.population_size
+        self.__restarted_at = 0
+        self.__large_restarts = 0
+        self.__budgets = {"large": 0, "small": 0}
+        self.__regime = "large"
+        self.__spent = 0
+        self.__refined = set()
         self.current_population = generate_random_population(
             self.evaluator, self.population_size
         )
@@ -183,6 +269,68 @@ class GaIsland(GaState):
             self.bin_crossover.initialize(self)
         if self.bin_mutation:
             self.bin_mutation.initialize(self)
+        if not isinstance(self.evaluator, AsyncGaEvaluator) and (
+            self.workers > 1
+            or self.evolution_mode == GaEvolutionMode.ASYNC_STEADY_STATE
+            or (self.evaluation_policy and self.evaluation_policy.requires_workers())
+        ):
+            self.__pool = GaEvaluationPool(
+                self.evaluator, self.workers, self.evaluation_policy
+            )
+            self.__pool.start()
+        else:
+            self.evaluator.setup_worker()
+
+    def __build_default_operators(self):
+        """
+        Internal: Builds default operators for every operator slot left empty
+        which is needed by the chromosomes of the evaluator.
+
+        Defaults are sized from the evaluator and drawn from a generator seeded
+        with 'seed', so building them neither depends on nor changes the global
+        random state. Defaults built by a previous run are rebuilt as well.
+        """
+
+        rng = np.random.default_rng(self.seed)
+        real_dim = len(self.evaluator.real_domain())
+        bin_dim = self.evaluator.bin_length()
+        defaults = {
+            "selection": lambda: uni_ops.RankSelection(target_population=15),
+            "real_crossover": lambda: real_ops.OnePointCrossover(),
+            "real_mutation": lambda: real_ops.VirusInfectionMutation(
+                virus_vectors=[
+                    [0.0] * real_dim,  # full reset pattern
+                    [None if i < real_dim // 2 else 0.0 for i in range(real_dim)],
+                    [
+                        rng.normal(0.0, 0.7) if rng.random() < 0.5 else None
+                        for _ in range(real_dim)
+                    ],
+                ]
+            ),
+            "bin_crossover": lambda: bin_ops.OnePointCrossover(),
+            "bin_mutation": lambda: bin_ops.VirusInfectionMutation(
+                virus_vectors=[
+                    [0] * bin_dim,  # full reset pattern
+                    ["*" if i < bin_dim // 2 else 0 for i in range(bin_dim)],
+                    [
+                        int(rng.integers(2)) if rng.random() < 0.5 else "*"
+                        for _ in range(bin_dim)
+                    ],
+                ]
+            ),
+        }
+
+        if not real_dim:
+            del defaults["real_crossover"], defaults["real_mutation"]
+        if not bin_dim:
+            del defaults["bin_crossover"], defaults["bin_mutation"]
+
+        for field, build in defaults.items():
+            operator = getattr(self, field)
+            if operator is None or operator is self.__default_operators.get(field):
+                operator = build()
+                self.__default_operators[field] = operator
+                setattr(self, field, operator)
 
     def __evaluate(self):
         """
@@ -191,8 +339,532 @@ class GaIsland(GaState):
         :returns: None.
         """
 
-        for indiv in self.current_population:
-            indiv.value = self.evaluator.evaluate(GaEvaluatorArgs(indiv))
+        self.__evaluate_individuals(self.current_population)
+
+    def __evaluate_individuals(self, individuals: List[GaIndividual]):
+        """
+        Internal: Evaluates given individuals, in parallel if a worker pool is running.
+        Individuals with inherited fitness keep estimated values, duplicated
+        chromosomes are handled according to 'deduplication'.
+        """
+
+        evaluated = [indiv for indiv in individuals if not indiv.estimated]
+        duplicates = []
+        if self.deduplication != GaDeduplication.NONE:
+            evaluated, duplicates = self.__deduplicate(evaluated)
+
+        self.__evaluate_distinct(evaluated)
+        self.__share_values(duplicates)
+        self.__credit(individuals)
+
+    def __evaluate_distinct(self, individuals: List[GaIndividual]):
+        """
+        Internal: Evaluates given individuals, in parallel if a worker pool is running.
+        Individuals found in 'fitness_store' are not evaluated again, those
+        screened out by 'surrogate' keep estimated values.
+        """
+
+        individuals, predictions = self.__screen(self.__restore_values(individuals))
+        self.__evaluate_exactly(individuals, predictions)
+
+    def __evaluate_exactly(
+        self, individuals: List[GaIndividual], predictions: List[float] | None = None
+    ):
+        """
+        Internal: Evaluates given individuals with the evaluator, in parallel if a worker pool is running,
+        and records their values.
+        """
+
+        if not individuals:
+            return
+
+        for indiv in individuals:
+            indiv.failed = False
+            indiv.learned = None
+        if self.__pool:
+            values = self.__pool.evaluate(individuals)
+            self.__sync_pool_statistics()
+        elif self.evaluation_policy:
+            values = self.__evaluate_with_policy(individuals)
+        else:
+            values = self.__evaluate_serial(individuals)
+
+        for indiv, value in zip(individuals, values):
+            indiv.value = value
+        self.statistic_engine.evaluations += len(individuals)
+        self.__store_values(individuals, predictions)
+
+    def __deduplicate(
+        self, individuals: List[GaIndividual]
+    ) -> Tuple[List[GaIndividual], List[Tuple[GaIndividual, GaIndividual]]]:
+        """
+        Internal: Finds individuals whose chromosomes equal those of an earlier individual.
+        With 'GaDeduplication.SHARE' they are returned as pairs of a duplicate and its original,
+        otherwise they are replaced with random or mutated individuals and evaluated as well.
+
+        :returns: Individuals to evaluate and pairs of a duplicate and its original.
+        """
+
+        originals = {}
+        distinct = []
+        duplicates = []
+        for indiv in individuals:
+            key = indiv.real_chrom.tobytes() + indiv.bin_chrom.tobytes()
+            original = originals.setdefault(key, indiv)
+            if original is indiv:
+                distinct.append(indiv)
+                continue
+
+            self.statistic_engine.duplicates += 1
+            if self.deduplication == GaDeduplication.SHARE:
+                duplicates.append((indiv, original))
+                continue
+
+            # A replacement may collide with another chromosome, give it a few more tries.
+            for _ in range(10):
+                self.__diversify(indiv, self.deduplication)
+                key = indiv.real_chrom.tobytes() + indiv.bin_chrom.tobytes()
+                if key not in originals:
+                    break
+            originals.setdefault(key, indiv)
+            distinct.append(indiv)
+        return distinct, duplicates
+
+    @staticmethod
+    def __share_values(duplicates: List[Tuple[GaIndividual, GaIndividual]]):
+        """
+        Internal: Copies values of evaluated originals to their duplicates.
+        """
+
+        for duplicate, original in duplicates:
+            duplicate.value = original.value
+            duplicate.estimated = original.estimated
+            duplicate.partial = original.partial
+            duplicate.failed = original.failed
+            duplicate.learned = original.learned
+            duplicate.cutoff = None
+            duplicate.parent_real_chrom = duplicate.parent_value = None
+            duplicate.changed_genes = None
+
+    def __diversify(self, indiv: GaIndividual, deduplication: GaDeduplication):
+        """
+        Internal: Replaces chromosomes of a duplicate with random ones or, with
+        'GaDeduplication.MUTATE', changes a single random gene of them.
+        """
+
+        real_domain = self.evaluator.real_domain()
+        if deduplication == GaDeduplication.RANDOM:
+            fresh = generate_random_population(self.evaluator, 1)[0]
+            indiv.real_chrom = fresh.real_chrom
+            indiv.bin_chrom = fresh.bin_chrom
+            indiv.lineage = []
+            indiv.parent_real_chrom = indiv.parent_value = indiv.changed_genes = None
+            return
+
+        gene = np.random.randint(len(real_domain) + self.evaluator.bin_length())
+        if gene < len(real_domain):
+            # Chromosomes of clones may be shared with their parents.
+            indiv.real_chrom = np.copy(indiv.real_chrom)
+            indiv.real_chrom[gene] = np.random.uniform(*real_domain[gene])
+            mark_changed_genes(indiv, [gene])
+        else:
+            bit = gene - len(real_domain)
+            indiv.bin_chrom = np.copy(indiv.bin_chrom)
+            indiv.bin_chrom[bit // 8] ^= 1 << (7 - bit % 8)
+            indiv.parent_real_chrom = indiv.parent_value = indiv.changed_genes = None
+
+    def __restore_values(self, individuals: List[GaIndividual]) -> List[GaIndividual]:
+        """
+        Internal: Assigns values found in 'fitness_store' and returns individuals which still need evaluation.
+        Chromosomes are looked up in 'visited_set' first.
+        """
+
+        if self.visited_set is not None:
+            individuals = self.__revisit(individuals)
+        if self.fitness_store is None:
+            return individuals
+
+        pending = []
+        restored = []
+        for indiv, value in zip(individuals, self.fitness_store.get_many(individuals)):
+            if value is None:
+                pending.append(indiv)
+            else:
+                indiv.value = value
+                indiv.estimated = False
+                indiv.partial = False
+                indiv.failed = False
+                indiv.learned = None
+                indiv.cutoff = None
+                restored.append(indiv)
+        self.statistic_engine.store_hits += len(restored)
+        if self.surrogate is not None:
+            self.surrogate.archive(restored, self.evaluator.bin_length())
+        return pending
+
+    def __revisit(self, individuals: List[GaIndividual]) -> List[GaIndividual]:
+        """
+        Internal: Assigns values cached by 'visited_set' and returns individuals which still need evaluation.
+        """
+
+        pending = []
+        for indiv in individuals:
+            value = self.visited_set.get(indiv)
+            if value is not None or indiv in self.visited_set:
+                self.statistic_engine.revisits += 1
+
+            if value is None:
+                pending.append(indiv)
+            else:
+                indiv.value = value
+                indiv.estimated = False
+                indiv.partial = False
+                indiv.failed = False
+                indiv.learned = None
+                indiv.cutoff = None
+        return pending
+
+    def __screen(
+        self, individuals: List[GaIndividual]
+    ) -> Tuple[List[GaIndividual], List[float] | None]:
+        """
+        Internal: Assigns 'surrogate' predictions to individuals not worth a true evaluation.
+        Returns the most promising individuals, which still need evaluation, and their predictions.
+        """
+
+        if self.surrogate is None or not individuals or not self.surrogate.ready():
+            return individuals, None
+
+        predictions = self.surrogate.estimate(individuals, self.evaluator.bin_length())
+        order = np.argsort(predictions, kind="stable")
+        if self.evaluator.extremum() == GaExtremum.MAXIMUM:
+            order = order[::-1]
+        count = int(np.ceil(self.surrogate.fraction * len(individuals)))
+
+        for i in order[count:]:
+            individuals[i].value = predictions[i]
+            individuals[i].estimated = True
+            individuals[i].learned = None
+        promising = sorted(order[:count])
+        return [individuals[i] for i in promising], [predictions[i] for i in promising]
+
+    def __store_values(
+        self, individuals: List[GaIndividual], predictions: List[float] | None = None
+    ):
+        """
+        Internal: Records values of evaluated individuals in 'fitness_store' and in the archive of 'surrogate'.
+        Penalties given for failed evaluations, bounds of partially evaluated individuals
+        and values learned by local search are not recorded.
+        Parents kept for incremental evaluation are dropped.
+        """
+
+        maximize = self.evaluator.extremum() == GaExtremum.MAXIMUM
+        for indiv in individuals:
+            indiv.estimated = False
+            indiv.partial = indiv.cutoff is not None and (
+                indiv.value < indiv.cutoff if maximize else indiv.value > indiv.cutoff
+            )
+            indiv.cutoff = None
+            indiv.parent_real_chrom = indiv.parent_value = indiv.changed_genes = None
+        if predictions is None:
+            predictions = [None] * len(individuals)
+
+        self.statistic_engine.partial_evaluations += sum(
+            indiv.partial for indiv in individuals
+        )
+
+        records = [
+            (indiv, prediction)
+            for indiv, prediction in zip(individuals, predictions)
+            if not indiv.partial and not indiv.failed and indiv.learned is None
+        ]
+        individuals = [indiv for indiv, _ in records]
+        predictions = [prediction for _, prediction in records]
+
+        self.statistic_engine.add_surrogate_errors(
+            abs(indiv.value - prediction)
+            for indiv, prediction in zip(individuals, predictions)
+            if prediction is not None
+        )
+        if self.surrogate is not None:
+            self.surrogate.archive(individuals, self.evaluator.bin_length())
+        if self.visited_set is not None:
+            self.visited_set.put_many(
+                individuals, [indiv.value for indiv in individuals]
+            )
+        if self.fitness_store is not None:
+            self.fitness_store.put_many(
+                individuals, [indiv.value for indiv in individuals]
+            )
+
+    def __evaluate_serial(self, individuals: List[GaIndividual]) -> List[float]:
+        """
+        Internal: Evaluates given individuals in the calling process and records their latencies.
+        Evaluators overriding 'evaluate_batch' are timed per batch, each individual gets the batch average.
+        """
+
+        args = [GaEvaluatorArgs(indiv) for indiv in individuals]
+        if type(self.evaluator).evaluate_batch is GaEvaluator.evaluate_batch:
+            values = []
+            latencies = []
+            for arg in args:
+                started = time.perf_counter()
+                if arg.changed_genes is None:
+                    values.append(self.evaluator.evaluate(arg))
+                else:
+                    values.append(self.evaluator.evaluate_delta(arg))
+                latencies.append(time.perf_counter() - started)
+        else:
+            started = time.perf_counter()
+            values = self.evaluator.evaluate_batch(args)
+            latencies = [(time.perf_counter() - started) / len(args)] * len(args)
+
+        self.statistic_engine.add_latencies(latencies)
+        return values
+
+    def __evaluate_with_policy(self, individuals: List[GaIndividual]) -> List[float]:
+        """
+        Internal: Evaluates given individuals in the calling process according to 'evaluation_policy'.
+        Individuals are evaluated, retried and penalized one by one. Evaluators overriding
+        'evaluate_batch' get the whole batch first, which counts as a failed attempt when it fails.
+        """
+
+        if type(self.evaluator).evaluate_batch is not GaEvaluator.evaluate_batch:
+            try:
+                return self.__evaluate_serial(individuals)
+            except Exception as error:
+                self.__count_failure(error)
+
+        policy = self.evaluation_policy
+        values = []
+        for indiv in individuals:
+            value = policy.penalty_value(self.evaluator.extremum())
+            indiv.failed = True
+            for _ in range(policy.max_retries + 1):
+                try:
+                    value = self.__evaluate_serial([indiv])[0]
+                    indiv.failed = False
+                    break
+                except Exception as error:
+                    self.__count_failure(error)
+            values.append(value)
+        return values
+
+    def __count_failure(self, error: Exception):
+        """
+        Internal: Counts a failed evaluation attempt in statistics.
+        """
+
+        self.statistic_engine.failures += 1
+        if isinstance(error, TimeoutError):
+            self.statistic_engine.timeouts += 1
+
+    def __sync_pool_statistics(self):
+        """
+        Internal: Copies failure counters and evaluation latencies of the worker pool into statistics.
+        """
+
+        self.statistic_engine.failures = self.__pool.failures
+        self.statistic_engine.timeouts = self.__pool.timeouts
+        self.statistic_engine.add_latencies(self.__pool.drain_latencies())
+
+    def __advance(self) -> bool:
+        """
+        Internal: Updates statistics, consults the inspector and checks the generation and evaluation limits.
+
+        :returns: True if the simulation should continue.
+        """
+
+        if (
+            self.local_search
+            and self.statistic_engine.generation % self.local_search.interval == 0
+        ):
+            self.__refine()
+        if self.bounded_evaluation:
+            self.__complete_best()
+        self.statistic_engine.advance(self)
+        if self.inspector:
+            action = self.inspector.inspect(self.statistic_engine)
+            if action is GaAction.TERMINATE:
+                return False
+        if (
+            self.max_evaluations is not None
+            and self.statistic_engine.evaluations >= self.max_evaluations
+        ):
+            return False
+        return self.statistic_engine.generation <= self.max_generations
+
+    def __refine(self):
+        """
+        Internal: Improves the best individuals of the current population, whose chromosomes
+        were not refined before, with 'local_search' and writes the results back to them.
+        Baldwinian write-back keeps the refined individual as 'learned' along with its value.
+        """
+
+        candidates = [
+            indiv
+            for indiv in self.current_population
+            if not indiv.estimated
+            and not indiv.partial
+            and not indiv.failed
+            and np.isfinite(indiv.value)
+            and indiv.real_chrom.tobytes() + indiv.bin_chrom.tobytes()
+            not in self.__refined
+        ]
+        better = (
+            heapq.nlargest
+            if self.evaluator.extremum() == GaExtremum.MAXIMUM
+            else heapq.nsmallest
+        )
+        best = better(
+            self.local_search.count, candidates, key=lambda indiv: indiv.value
+        )
+
+        for indiv in best:
+            self.__refined.add(indiv.real_chrom.tobytes() + indiv.bin_chrom.tobytes())
+            refined = self.local_search.refine(
+                indiv,
+                self.evaluator,
+                lambda individuals: self.__evaluate_exactly(
+                    self.__restore_values(individuals)
+                ),
+            )
+            if refined is None:
+                continue
+
+            self.statistic_engine.refinements += 1
+            indiv.value = refined.value
+            if self.local_search.write_back == GaWriteBack.LAMARCKIAN:
+                indiv.real_chrom = refined.real_chrom
+                indiv.bin_chrom = refined.bin_chrom
+                self.__refined.add(
+                    indiv.real_chrom.tobytes() + indiv.bin_chrom.tobytes()
+                )
+            else:
+                indiv.learned = refined
+
+    def __cutoff(self) -> float | None:
+        """
+        Internal: Returns the value of the worst exactly evaluated individual of the current population,
+        which offspring have to beat to matter for selection, or None if no value is known exactly.
+        """
+
+        values = [
+            indiv.value
+            for indiv in self.current_population
+            if not indiv.estimated and not indiv.partial and np.isfinite(indiv.value)
+        ]
+        if not values:
+            return None
+        if self.evaluator.extremum() == GaExtremum.MAXIMUM:
+            return min(values)
+        return max(values)
+
+    def __complete_best(self):
+        """
+        Internal: Evaluates partially evaluated individuals exactly as long as one of them
+        looks best, so that a bound is never reported as the result.
+        """
+
+        better = max if self.evaluator.extremum() == GaExtremum.MAXIMUM else min
+        while True:
+            population = [
+                indiv for indiv in self.current_population if not indiv.estimated
+            ] or self.current_population
+            best = better(population, key=lambda indiv: indiv.value)
+            if not best.partial:
+                return
+            best.partial = False
+            self.__evaluate_individuals([best])
+
+    def __stalled(self) -> bool:
+        """
+        Internal: Checks whether the search should be restarted by 'restart', because it
+        stalled for 'restart_stagnation' generations or its diversity collapsed.
+        """
+
+        if self.restart == GaRestartStrategy.NONE:
+            return False
+        # The best individual survives restarts, so a new run must have stalled too.
+        generations = self.statistic_engine.generation - self.__restarted_at
+        stalled = (
+            min(self.statistic_engine.stagnation, generations)
+            >= self.restart_stagnation
+        )
+        return stalled or self.__diversity() < self.restart_diversity
+
+    def __diversity(self) -> float:
+        """
+        Internal: Returns the spread of genes in the current population, the mean over genes of
+        their standard deviation relative to that of a uniformly random population, 1 for
+        random individuals and 0 when every individual is the same.
+        """
+
+        spreads = []
+        if self.__real_representation:
+            real = np.array([indiv.real_chrom for indiv in self.current_population])
+            lower, upper = np.array(self.evaluator.real_domain(), dtype=np.float64).T
+            width = upper - lower
+            fixed = width <= 0
+            # Genes with an empty domain cannot spread and are left out.
+            spreads.append(
+                np.std(real[:, ~fixed], axis=0) * np.sqrt(12) / width[~fixed]
+            )
+        if self.__binary_representation:
+            bins = np.array([indiv.bin_chrom for indiv in self.current_population])
+            bits = np.unpackbits(bins, axis=1, count=self.evaluator.bin_length())
+            share = np.mean(bits, axis=0)
+            spreads.append(2 * np.sqrt(share * (1 - share)))
+        spreads = np.concatenate(spreads)
+        return float(np.mean(spreads)) if len(spreads) else 0.0
+
+    def __restart(self) -> List[GaIndividual]:
+        """
+        Internal: Replaces the current population with random individuals, keeping
+        the best 'elite_size' individuals, but at least one, as an elite archive.
+        The population size is chosen by 'restart'.
+
+        :returns: The new random individuals, which still need evaluation.
+        """
+
+        self.statistic_engine.restarts += 1
+        self.__restarted_at = self.statistic_engine.generation
+        evaluations = self.statistic_engine.evaluations
+        self.__budgets[self.__regime] += evaluations - self.__spent
+        self.__spent = evaluations
+
+        default = self.__initial_size
+        if (
+            self.restart == GaRestartStrategy.BIPOP
+            and self.__budgets["small"] < self.__budgets["large"]
+        ):
+            self.__regime = "small"
+            large = default * self.population_growth**self.__large_restarts
+            size = int(default * (large / default) ** (np.random.uniform() ** 2))
+        else:
+            self.__regime = "large"
+            self.__large_restarts += 1
+            size = int(default * self.population_growth**self.__large_restarts)
+
+        better = (
+            heapq.nlargest
+            if self.evaluator.extremum() == GaExtremum.MAXIMUM
+            else heapq.nsmallest
+        )
+        archive = copy.deepcopy(
+            better(
+                max(1, self.elite_size),
+                [indiv for indiv in self.current_population if not indiv.estimated]
+                or self.current_population,
+                key=lambda indiv: indiv.value,
+            )
+        )
+        self.population_size = max(size, len(archive) + 1)
+        fresh = generate_random_population(
+            self.evaluator, self.population_size - len(archive)
+        )
+        self.current_population = archive + fresh
+        return fresh
 
     def __evolve(self):
         """
@@ -212,14 +884,42 @@ class GaIsland(GaState):
             )
 
         self.elite_population = copy.deepcopy(elite_population)
+        for elite in self.elite_population:
+            # Elites with estimated fitness are evaluated in the next generation.
+            elite.estimated = False
+        self.offspring_population = self.__breed(self.population_size)
+
+        indices = np.random.choice(
+            len(self.offspring_population),
+            size=len(self.elite_population),
+            replace=False,
+        )
+
+        for elite_index, offspring_index in enumerate(indices):
+            self.offspring_population[offspring_index] = self.elite_population[
+                elite_index
+            ]
+
+        self.current_population = self.offspring_population
+        self.offspring_population = []
+        self.elite_population = []
+
+    def __breed(self, count: int) -> List[GaIndividual]:
+        """
+        Internal: Creates 'count' offspring by executing selection-crossover-mutation sequence and clamping.
+        """
+
         self.selected_population = copy.deepcopy(
             self.selection.perform(GaOperatorArgs(self, self.selection.category()))
         )
+        for index, indiv in enumerate(self.selected_population):
+            indiv.lineage = [(index, 1.0)]
+            indiv.arms = None
         self.offspring_population = [
             GaIndividual(
                 np.array([], dtype=np.float64), np.array([], dtype=np.uint8), 0
             )
-            for _ in range(self.population_size)
+            for _ in range(count)
         ]
 
         if self.__binary_representation:
@@ -228,6 +928,8 @@ class GaIsland(GaState):
                 self.offspring_population, bin_crossover_list
             ):
                 offspring.bin_chrom = crossover_indiv.bin_chrom
+                offspring.lineage = crossover_indiv.lineage
+                offspring.arms = crossover_indiv.arms
 
             mutation_offspring = self.bin_mutation.perform(
                 GaOperatorArgs(self, self.bin_mutation.category())
@@ -236,15 +938,29 @@ class GaIsland(GaState):
 
         if self.__real_representation:
             real_crossover_list = self.__perform_crossover(self.real_crossover)
+            real_share = len(self.evaluator.real_domain()) / (
+                len(self.evaluator.real_domain()) + self.evaluator.bin_length()
+            )
             for offspring, crossover_indiv in zip(
                 self.offspring_population, real_crossover_list
             ):
                 offspring.real_chrom = crossover_indiv.real_chrom
+                offspring.lineage = mix_lineage(
+                    [offspring.lineage, crossover_indiv.lineage],
+                    [1 - real_share, real_share],
+                )
+                if crossover_indiv.arms:
+                    offspring.arms = (offspring.arms or {}) | crossover_indiv.arms
 
+            if self.__delta_evaluation:
+                self.__record_parents()
             mutation_offspring = self.real_mutation.perform(
                 GaOperatorArgs(self, self.real_mutation.category())
             )
-            self.__assignPopulationAfterMutation(mutation_offspring)
+            mutated = self.__assignPopulationAfterMutation(mutation_offspring)
+            if not self.real_mutation.tracks_changed_genes():
+                for i in mutated:
+                    self.offspring_population[i].changed_genes = None
 
         if self.real_clamp_strategy != GaClampStrategy.NONE:
             for indiv in self.offspring_population:
@@ -257,47 +973,197 @@ class GaIsland(GaState):
                         indiv.real_chrom[i] = get_clamp_strategy(
                             self.real_clamp_strategy
                         )(gene_value, domain)
+                        mark_changed_genes(indiv, [i])
 
-        indices = np.random.choice(
-            len(self.offspring_population),
-            size=len(self.elite_population),
-            replace=False,
-        )
+        if self.visited_set is not None and self.visited_set.regenerate:
+            self.__regenerate(self.offspring_population)
 
-        for elite_index, offspring_index in enumerate(indices):
-            self.offspring_population[offspring_index] = self.elite_population[
-                elite_index
-            ]
+        if self.inheritance_fraction:
+            self.__inherit_fitness(self.offspring_population)
 
-        self.current_population = self.offspring_population
+        for indiv in self.offspring_population:
+            if indiv.arms:
+                self.__record_reference(indiv)
+
+        if self.bounded_evaluation:
+            cutoff = self.__cutoff()
+            for indiv in self.offspring_population:
+                indiv.cutoff = cutoff
+
+        offspring = self.offspring_population
         self.selected_population = []
         self.offspring_population = []
-        self.elite_population = []
+        return offspring
+
+    def __regenerate(self, offspring: List[GaIndividual]):
+        """
+        Internal: Changes offspring reported as visited by 'visited_set', whose values are
+        no longer cached, by a random gene until they are new.
+        """
+
+        for indiv in offspring:
+            if indiv in self.visited_set and self.visited_set.get(indiv) is None:
+                self.statistic_engine.revisits += 1
+                for _ in range(10):
+                    self.__diversify(indiv, GaDeduplication.MUTATE)
+                    if indiv not in self.visited_set:
+                        break
+
+    def __inherit_fitness(self, offspring: List[GaIndividual]):
+        """
+        Internal: Gives about 'inheritance_fraction' of offspring a fitness estimated from
+        the fitness of their parents, weighted as given by their lineage, instead of an evaluation.
+        """
+
+        for indiv in offspring:
+            if (
+                indiv.lineage
+                and not any(
+                    self.selected_population[index].partial
+                    for index, _ in indiv.lineage
+                )
+                and np.random.random() < self.inheritance_fraction
+            ):
+                value = sum(
+                    weight * self.selected_population[index].value
+                    for index, weight in indiv.lineage
+                )
+                if np.isfinite(value):
+                    indiv.value = value
+                    indiv.estimated = True
+                    indiv.learned = None
+
+    def __record_reference(self, indiv: GaIndividual):
+        """
+        Internal: Records the value of the parents of an offspring created by adaptive operators,
+        weighted as given by its lineage. Offspring of parents without an exact value are not credited.
+        """
+
+        parents = [self.selected_population[index] for index, _ in indiv.lineage]
+        value = sum(
+            weight * parent.value for parent, (_, weight) in zip(parents, indiv.lineage)
+        )
+        if (
+            parents
+            and not any(
+                parent.estimated or parent.partial or parent.learned is not None
+                for parent in parents
+            )
+            and np.isfinite(value)
+        ):
+            indiv.reference_value = value
+        else:
+            indiv.arms = None
+
+    def __credit(self, individuals: List[GaIndividual]):
+        """
+        Internal: Reports improvements of evaluated offspring over their parents to the variation
+        operators, which adaptive operators use to allocate further offspring.
+        """
+
+        credited = [
+            indiv
+            for indiv in individuals
+            if indiv.arms
+            and not indiv.estimated
+            and not indiv.partial
+            and np.isfinite(indiv.value)
+        ]
+        if credited:
+            sign = 1.0 if self.evaluator.extremum() == GaExtremum.MAXIMUM else -1.0
+            improvements = [
+                sign * (indiv.value - indiv.reference_value) for indiv in credited
+            ]
+            for operator in (
+                self.bin_crossover,
+                self.bin_mutation,
+                self.real_crossover,
+                self.real_mutation,
+            ):
+                if operator is not None:
+                    operator.feedback(credited, improvements)
+
+        for indiv in individuals:
+            indiv.arms = None
+            indiv.reference_value = None
+
+    def __replace_worst(self, offspring: List[GaIndividual]):
+        """
+        Internal: Replaces the worst individuals of the current population with evaluated offspring.
+        """
+
+        population = self.current_population
+        if self.evaluator.extremum() == GaExtremum.MAXIMUM:
+            worst = heapq.nsmallest(
+                len(offspring),
+                range(len(population)),
+                key=lambda i: population[i].value,
+            )
+        else:
+            worst = heapq.nlargest(
+                len(offspring),
+                range(len(population)),
+                key=lambda i: population[i].value,
+            )
+
+        for index, indiv in zip(worst, offspring):
+            population[index] = indiv
 
     def __perform_crossover(self, crossover: GaOperator) -> List[GaIndividual]:
         """
-        Internal: Performs crossover until the number of individuals is 'population_size'.
+        Internal: Performs crossover until the number of individuals matches 'offspring_population'.
         """
 
+        count = len(self.offspring_population)
         crossover_list = []
-        while len(crossover_list) < self.population_size:
+        while len(crossover_list) < count:
             if np.random.random() < self.crossover_prob:
                 crossover_list.extend(
                     crossover.perform(GaOperatorArgs(self, crossover.category()))
                 )
             else:
                 crossover_list.append(np.random.choice(self.selected_population))
-        crossover_list = crossover_list[: self.population_size]
+        crossover_list = crossover_list[:count]
         return crossover_list
 
-    def __assignPopulationAfterMutation(self, mutation_offspring: List[GaIndividual]):
+    def __assignPopulationAfterMutation(
+        self, mutation_offspring: List[GaIndividual]
+    ) -> List[int]:
         """
         Internal: Assigns mutated population to 'offspring_population' with 'mutation_prob' probability.
+
+        :returns: Indices of replaced offspring.
         """
 
-        for i in range(self.population_size):
+        mutated = []
+        for i in range(len(self.offspring_population)):
             if np.random.random() < self.mutation_prob:
                 self.offspring_population[i] = mutation_offspring[i]
+                mutated.append(i)
+        return mutated
+
+    def __record_parents(self):
+        """
+        Internal: Records the evaluated parent of every offspring which is still an exact copy of it,
+        so that genes changed by mutation can be evaluated incrementally.
+        """
+
+        for offspring in self.offspring_population:
+            if len(offspring.lineage) != 1 or offspring.lineage[0][1] != 1.0:
+                continue
+            parent = self.selected_population[offspring.lineage[0][0]]
+            if (
+                not parent.estimated
+                and not parent.partial
+                and not parent.failed
+                and parent.learned is None
+                and np.isfinite(parent.value)
+                and np.array_equal(offspring.real_chrom, parent.real_chrom)
+                and np.array_equal(offspring.bin_chrom, parent.bin_chrom)
+            ):
+                offspring.parent_real_chrom = np.copy(parent.real_chrom)
+                offspring.parent_value = parent.value
+                offspring.changed_genes = np.array([], dtype=np.intp)
 
     def __finish(self) -> GaResults:
         """
@@ -320,21 +1186,353 @@ class GaIsland(GaState):
         """
 
         self.__verify()
+        if isinstance(self.evaluator, AsyncGaEvaluator):
+            raise TypeError(
+                "AsyncGaEvaluator requires running the simulation with run_async()."
+            )
         self.__initialize()
 
-        while True:
-            self.__evaluate()
-            self.statistic_engine.advance(self)
-            if self.inspector:
-                action = self.inspector.inspect(self.statistic_engine)
-                if action is GaAction.TERMINATE:
-                    break
-            if self.statistic_engine.generation > self.max_generations:
-                break
-            self.__evolve()
+        try:
+            match self.evolution_mode:
+                case GaEvolutionMode.GENERATIONAL:
+                    self.__run_generational()
+                case GaEvolutionMode.STEADY_STATE:
+                    self.__run_steady_state()
+                case GaEvolutionMode.ASYNC_STEADY_STATE:
+                    self.__run_async_steady_state()
+        finally:
+            if self.__pool:
+                self.__pool.shutdown()
+                self.__pool = None
+            if self.fitness_store is not None:
+                self.fitness_store.flush()
+            self.population_size = self.__initial_size
+
+        return self.__finish()
+
+    async def run_async(self) -> GaResults:
+        """
+        Run entire simulation, evaluating individuals concurrently with an :class:`AsyncGaEvaluator`.
+
+        At most 'max_concurrency' evaluations are in flight at a time, all in the
+        calling thread, so worker processes are not used. The timeout, retries and
+        penalty of 'evaluation_policy' apply to every evaluation. Evaluations still
+        in flight when the simulation stops, fails or is cancelled are cancelled.
+
+        :returns: Object representing final result of running genetic algorithm.
+        :rtype: :class:`GaResults`.
+        :raises TypeError: If the evaluator is not an :class:`AsyncGaEvaluator`.
+        """
+
+        self.__verify()
+        if not isinstance(self.evaluator, AsyncGaEvaluator):
+            raise TypeError(
+                "run_async() requires an AsyncGaEvaluator, use run() instead."
+            )
+        self.__initialize()
+        self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            match self.evolution_mode:
+                case GaEvolutionMode.GENERATIONAL:
+                    await self.__run_generational_async()
+                case GaEvolutionMode.STEADY_STATE:
+                    await self.__run_steady_state_async()
+                case GaEvolutionMode.ASYNC_STEADY_STATE:
+                    await self.__run_async_steady_state_async()
+        finally:
+            self.__semaphore = None
+            if self.fitness_store is not None:
+                self.fitness_store.flush()
+            self.population_size = self.__initial_size
 
         return self.__finish()
 
+    async def __evaluate_async(
+        self, indiv: GaIndividual, prediction: float | None = None
+    ) -> float:
+        """
+        Internal: Evaluates a single individual with the coroutine evaluator according to 'evaluation_policy'.
+        Values kept by 'fitness_store' and 'visited_set' must have been looked up before.
+        """
+
+        policy = self.evaluation_policy
+        attempts = policy.max_retries + 1 if policy else 1
+        timeout = policy.timeout if policy else None
+        indiv.failed = False
+        indiv.learned = None
+        async with self.__semaphore:
+            for _ in range(attempts):
+                started = time.perf_counter()
+                try:
+                    value = await asyncio.wait_for(
+                        self.evaluator.evaluate(GaEvaluatorArgs(indiv)), timeout
+                    )
+                except asyncio.TimeoutError:
+                    if policy is None:
+                        raise
+                    self.statistic_engine.timeouts += 1
+                    self.statistic_engine.failures += 1
+                except Exception:
+                    if policy is None:
+                        raise
+                    self.statistic_engine.failures += 1
+                else:
+                    self.statistic_engine.add_latencies([time.perf_counter() - started])
+                    self.statistic_engine.evaluations += 1
+                    indiv.value = value
+                    self.__store_values([indiv], [prediction])
+                    return value
+
+        self.statistic_engine.evaluations += 1
+        indiv.failed = True
+        return policy.penalty_value(self.evaluator.extremum())
+
+    async def __evaluate_individuals_async(self, individuals: List[GaIndividual]):
+        """
+        Internal: Evaluates given individuals concurrently.
+        Individuals screened out by 'surrogate' or with inherited fitness keep estimated values,
+        duplicated chromosomes are handled according to 'deduplication'.
+        """
+
+        evaluated = [indiv for indiv in individuals if not indiv.estimated]
+        duplicates = []
+        if self.deduplication != GaDeduplication.NONE:
+            evaluated, duplicates = self.__deduplicate(evaluated)
+        evaluated, predictions = self.__screen(self.__restore_values(evaluated))
+        tasks = [
+            asyncio.ensure_future(self.__evaluate_async(indiv, prediction))
+            for indiv, prediction in zip(
+                evaluated, predictions or [None] * len(evaluated)
+            )
+        ]
+        try:
+            values = await asyncio.gather(*tasks)
+        finally:
+            await self.__cancel(tasks)
+
+        for indiv, value in zip(evaluated, values):
+            indiv.value = value
+        self.__share_values(duplicates)
+        self.__credit(individuals)
+
+    @staticmethod
+    async def __cancel(tasks):
+        """
+        Internal: Cancels unfinished evaluations and waits until they stop.
+        """
+
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+    async def __run_generational_async(self):
+        """
+        Internal: Coroutine version of the generational evolution loop.
+        """
+
+        await self.__evaluate_individuals_async(self.current_population)
+        while self.__advance():
+            if self.__stalled():
+                await self.__evaluate_individuals_async(self.__restart())
+            else:
+                self.__evolve()
+                await self.__evaluate_individuals_async(self.current_population)
+
+    async def __run_steady_state_async(self):
+        """
+        Internal: Coroutine version of the steady-state evolution loop.
+        """
+
+        await self.__evaluate_individuals_async(self.current_population)
+        while self.__advance():
+            if self.__stalled():
+                await self.__evaluate_individuals_async(self.__restart())
+                continue
+            evaluations = 0
+            while evaluations < self.population_size:
+                count = min(self.replacement_size, self.population_size - evaluations)
+                offspring = self.__breed(count)
+                await self.__evaluate_individuals_async(offspring)
+                self.__replace_worst(offspring)
+                evaluations += count
+
+    async def __run_async_steady_state_async(self):
+        """
+        Internal: Coroutine version of the asynchronous steady-state evolution loop.
+        Keeps 'max_concurrency' evaluations in flight and inserts each one as soon as it finishes.
+        """
+
+        await self.__evaluate_individuals_async(self.current_population)
+        if not self.__advance():
+            return
+
+        in_flight = {}
+        inserted = 0
+        try:
+            while True:
+                finished = []
+                while len(in_flight) < self.max_concurrency and not finished:
+                    indiv = self.__breed(1)[0]
+                    if not indiv.estimated and self.__restore_values([indiv]):
+                        task = asyncio.ensure_future(self.__evaluate_async(indiv))
+                        in_flight[task] = indiv
+                    else:
+                        finished.append(indiv)
+
+                if not finished:
+                    done, _ = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        finished.append(in_flight.pop(task))
+                        finished[-1].value = task.result()
+
+                for indiv in finished:
+                    self.__credit([indiv])
+                    self.__replace_worst([indiv])
+                    inserted += 1
+                    if inserted == self.population_size:
+                        inserted = 0
+                        if not self.__advance():
+                            return
+        finally:
+            await self.__cancel(in_flight)
+
+    def __run_generational(self):
+        """
+        Internal: Evolution loop replacing the whole population every generation.
+        """
+
+        self.__evaluate()
+        while self.__advance():
+            if self.__stalled():
+                self.__evaluate_individuals(self.__restart())
+            else:
+                self.__evolve()
+                self.__evaluate()
+
+    def __run_steady_state(self):
+        """
+        Internal: Evolution loop replacing 'replacement_size' worst individuals at a time.
+        A generation is counted every 'population_size' evaluations.
+        """
+
+        self.__evaluate()
+        while self.__advance():
+            if self.__stalled():
+                self.__evaluate_individuals(self.__restart())
+                continue
+            evaluations = 0
+            while evaluations < self.population_size:
+                count = min(self.replacement_size, self.population_size - evaluations)
+                offspring = self.__breed(count)
+                self.__evaluate_individuals(offspring)
+                self.__replace_worst(offspring)
+                evaluations += count
+
+    def __run_async_steady_state(self):
+        """
+        Internal: Steady-state evolution loop which keeps every worker busy.
+        Each finished evaluation is inserted immediately and a new offspring is submitted in its place.
+        A generation is counted every 'population_size' insertions.
+        """
+
+        self.__evaluate()
+        if not self.__advance():
+            return
+
+        in_flight = {}
+        next_key = 0
+        inserted = 0
+        while True:
+            finished = []
+            while self.__pool.pending() < self.workers and not finished:
+                indiv = self.__breed(1)[0]
+                if not indiv.estimated and self.__restore_values([indiv]):
+                    in_flight[next_key] = indiv
+                    self.__pool.submit(next_key, indiv)
+                    next_key += 1
+                else:
+                    finished.append(indiv)
+
+            if not finished:
+                for key, value in self.__pool.collect():
+                    finished.append(in_flight.pop(key))
+                    finished[-1].value = value
+                self.__sync_pool_statistics()
+                self.statistic_engine.evaluations += len(finished)
+                self.__store_values(finished)
+                self.__credit(finished)
+
+            for indiv in finished:
+                self.__replace_worst([indiv])
+                inserted += 1
+                if inserted == self.population_size:
+                    inserted = 0
+                    if not self.__advance():
+                        return
+
+    def configuration(self) -> dict:
+        """
+        Returns every setting which determines the course of the simulation,
+        e.g. to compare or hash configurations. Operator slots which are
+        filled with defaults on run are reported as None.
+
+        :returns: Dictionary mapping setting names to their values.
+        :rtype: dict
+        """
+
+        operators = {
+            field: (
+                None
+                if getattr(self, field) is self.__default_operators.get(field)
+                else getattr(self, field)
+            )
+            for field in (
+                "selection",
+                "real_crossover",
+                "real_mutation",
+                "bin_crossover",
+                "bin_mutation",
+            )
+        }
+        return {
+            "population_size": self.population_size,
+            "elite_size": self.elite_size,
+            "crossover_prob": self.crossover_prob,
+            "mutation_prob": self.mutation_prob,
+            "max_generations": self.max_generations,
+            "seed": self.seed,
+            "real_clamp_strategy": self.real_clamp_strategy,
+            "evolution_mode": self.evolution_mode,
+            "replacement_size": self.replacement_size,
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "evaluation_policy": self.evaluation_policy,
+            "evaluator": self.evaluator,
+            "inspector": self.inspector,
+            "surrogate": self.surrogate,
+            "inheritance_fraction": self.inheritance_fraction,
+            "bounded_evaluation": self.bounded_evaluation,
+            "deduplication": self.deduplication,
+            "visited_set": self.visited_set
+            and {
+                "capacity": self.visited_set.capacity,
+                "error_rate": self.visited_set.error_rate,
+                "regenerate": self.visited_set.regenerate,
+            },
+            "restart": self.restart,
+            "restart_stagnation": self.restart_stagnation,
+            "restart_diversity": self.restart_diversity,
+            "population_growth": self.population_growth,
+            "max_evaluations": self.max_evaluations,
+            "local_search": self.local_search,
+            **operators,
+        }
+
     def set_elite_count(self, count: int):
         """
         Setter method.
@@ -462,6 +1660,174 @@ class GaIsland(GaState):
 
         self.real_clamp_strategy = strategy
 
+    def set_evolution_mode(self, mode: GaEvolutionMode):
+        """
+        Setter method.
+
+        Set the way in which the population is replaced during evolution.
+
+        :param mode: A value representing chosen evolution mode.
+        :type mode: :class:`GaEvolutionMode`.
+        :returns: None.
+        """
+
+        self.evolution_mode = mode
+
+    def set_replacement_size(self, size: int):
+        """
+        Setter method.
+
+        Set the number of individuals bred and replaced at a time in steady-state mode.
+
+        :param size: Number of individuals.
+        :type size: int.
+        :returns: None.
+        """
+
+        self.replacement_size = size
+
+    def set_workers(self, count: int):
+        """
+        Setter method.
+
+        Set the number of worker processes used to evaluate individuals.
+        A value of 1 evaluates individuals in the calling process, unless
+        asynchronous steady-state mode is selected.
+
+        :param count: Number of worker processes.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.workers = count
+
+    def set_max_concurrency(self, count: int):
+        """
+        Setter method.
+
+        Set the maximum number of evaluations in flight at a time when running with :func:`run_async()`.
+
+        :param count: Number of concurrent evaluations.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.max_concurrency = count
+
+    def set_evaluation_policy(self, policy: GaEvaluationPolicy | None):
+        """
+        Setter method.
+
+        Set the timeout, retry, penalty and worker recycling rules applied to evaluations.
+        If None, a failed evaluation stops the simulation.
+
+        :param policy: Object describing how evaluation failures are handled.
+        :type policy: :class:`GaEvaluationPolicy` | None.
+        :returns: None.
+        """
+
+        self.evaluation_policy = policy
+
+    def set_fitness_store(self, store: GaFitnessStore | None):
+        """
+        Setter method.
+
+        Set the persistent store consulted before evaluating individuals and
+        updated with every new fitness value. If None, every individual is evaluated.
+
+        :param store: Store of fitness values shared by runs and processes.
+        :type store: :class:`GaFitnessStore` | None.
+        :returns: None.
+        """
+
+        self.fitness_store = store
+
+    def set_surrogate(self, surrogate: GaSurrogate | None):
+        """
+        Setter method.
+
+        Set the model pre-screening offspring, so that only the most promising
+        ones are evaluated and the rest keeps predicted fitness values.
+        If None, every individual is evaluated.
+
+        :param surrogate: Cheap model of the fitness function.
+        :type surrogate: :class:`GaSurrogate` | None.
+        :returns: None.
+        """
+
+        self.surrogate = surrogate
+
+    def set_fitness_inheritance(self, fraction: float):
+        """
+        Setter method.
+
+        Set the fraction of offspring which inherit a fitness estimated from
+        their parents, mixed with the coefficients reported by the crossover,
+        instead of being evaluated. A value of 0 evaluates every offspring.
+
+        :param fraction: Fraction of offspring with inherited fitness, between 0 and 1.
+        :type fraction: float.
+        :returns: None.
+        """
+
+        self.inheritance_fraction = fraction
+
+    def set_bounded_evaluation(self, enabled: bool):
+        """
+        Setter method.
+
+        Enable bounded evaluation: every offspring is evaluated with the value
+        of the worst exactly evaluated individual of the current population as
+        'cutoff', so the evaluator may stop early and return a bound for
+        offspring worse than it (see :class:`GaEvaluatorArgs`). Such offspring
+        are marked 'partial' and never recorded in the fitness store or
+        surrogate archive. A partial individual which would be reported as the
+        best is evaluated exactly.
+
+        Only steady-state modes are supported: there a partial individual is
+        worse than every exactly evaluated one, so comparisons with it are
+        exact, while partial individuals are ranked among themselves by their
+        bounds. Requires a selection operator which only compares fitness
+        values, see :func:`GaOperator.comparison_only()`.
+
+        :param enabled: Whether offspring are evaluated with a cutoff.
+        :type enabled: bool.
+        :returns: None.
+        """
+
+        self.bounded_evaluation = enabled
+
+    def set_deduplication(self, deduplication: GaDeduplication):
+        """
+        Setter method.
+
+        Set how individuals with identical chromosomes, evaluated together
+        in one generation, are handled, see :class:`GaDeduplication`.
+
+        :param deduplication: Handling of duplicated chromosomes.
+        :type deduplication: :class:`GaDeduplication`.
+        :returns: None.
+        """
+
+        self.deduplication = deduplication
+
+    def set_visited_set(self, visited_set: GaVisitedSet | None):
+        """
+        Setter method.
+
+        Set the probabilistic set of visited chromosomes. Values it caches
+        are used instead of evaluating individuals again, chromosomes it
+        reports as seen are counted as revisits and, if it asks for it,
+        offspring are regenerated before evaluation.
+        Its memory use is fixed when it is created, see :class:`GaVisitedSet`.
+
+        :param visited_set: Visited set, or None to disable it.
+        :type visited_set: :class:`GaVisitedSet` | None.
+        :returns: None.
+        """
+
+        self.visited_set = visited_set
+
     def set_population_size(self, size: int):
         """
         Setter method.
@@ -473,3 +1839,99 @@ class GaIsland(GaState):
         """
 
         self.population_size = size
+
+    def set_restart(self, restart: GaRestartStrategy):
+        """
+        Setter method.
+
+        Set the strategy restarting a stalled search. A restarted search
+        starts from random individuals, except for the best 'elite_size'
+        individuals, but at least one, which are kept as an elite archive,
+        so the best individual found by any run is the result. Restarts
+        are counted in :class:`GaStatistics` restarts, and the population
+        size grows as described by :class:`GaRestartStrategy`. Restarts are
+        not supported in asynchronous steady-state mode.
+
+        :param restart: Restart strategy.
+        :type restart: :class:`GaRestartStrategy`.
+        :returns: None.
+        """
+
+        self.restart = restart
+
+    def set_restart_stagnation(self, count: int):
+        """
+        Setter method.
+
+        Set the number of generations without improvement, see
+        :class:`GaStatistics` stagnation, after which the search is restarted.
+
+        :param count: Number of generations.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.restart_stagnation = count
+
+    def set_restart_diversity(self, diversity: float):
+        """
+        Setter method.
+
+        Set the diversity below which the search is restarted. Diversity is
+        the mean over genes of their standard deviation in the population,
+        relative to that of a uniformly random population, so it is about 1
+        for random individuals and 0 when every individual is the same.
+        A value of 0 restarts only on stagnation.
+
+        :param diversity: Diversity in range [0, 1).
+        :type diversity: float.
+        :returns: None.
+        """
+
+        self.restart_diversity = diversity
+
+    def set_population_growth(self, factor: float):
+        """
+        Setter method.
+
+        Set the factor multiplying the population size on every large restart.
+        A value of 1 restarts with the same population size.
+
+        :param factor: Growth factor.
+        :type factor: float.
+        :returns: None.
+        """
+
+        self.population_growth = factor
+
+    def set_max_evaluations(self, count: int | None):
+        """
+        Setter method.
+
+        Set the number of evaluations, shared by every restart, after which
+        the simulation ends. It is checked once every generation.
+        If None, only the number of generations is limited.
+
+        :param count: Maximum number of evaluations.
+        :type count: int | None.
+        :returns: None.
+        """
+
+        self.max_evaluations = count
+
+    def set_local_search(self, local_search: GaLocalSearch | None):
+        """
+        Setter method.
+
+        Set the memetic stage refining the best individuals of the population
+        with a local optimizer once they are evaluated, see :class:`GaLocalSearch`.
+        Its evaluations are counted like any other and spread across the worker
+        pool. Local search is not supported in asynchronous steady-state mode
+        nor with an :class:`AsyncGaEvaluator`. If None, individuals are not refined.
+
+        :param local_search: Local search stage.
+        :type local_search: :class:`GaLocalSearch` | None.
+        :returns: None.
+        """
+
+        self.local_search = local_search
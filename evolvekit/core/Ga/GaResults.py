@@ -13,6 +13,8 @@ class GaResults:
     bin_chrom: npt.NDArray[np.uint8]
     value: float
     total_generations: int
+    total_evaluations: int
+    total_restarts: int
     total_time: float
 
     def __init__(self, stats: GaStatistics):
@@ -27,6 +29,8 @@ class GaResults:
         """
 
         self.total_generations = stats.generation
+        self.total_evaluations = stats.evaluations
+        self.total_restarts = stats.restarts
         self.total_time = stats.last_time - stats.start_time
         self.real_chrom = np.copy(stats.best_indiv.real_chrom)
         self.bin_chrom = np.copy(stats.best_indiv.bin_chrom)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import time
 import copy
+from typing import Iterable
 
 import numpy as np
 
@@ -16,6 +17,11 @@ class GaStatisticEngine(GaStatistics):
     algorithm.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__latencies = []
+        self.__surrogate_errors = []
+
     def start(self, state: "GaState"):
         """
         Initializes data class structure of :class:`GaStatisticEngine`
@@ -28,13 +34,28 @@ class GaStatisticEngine(GaStatistics):
 
         self.generation = 0
         self.stagnation = 0
+        self.evaluations = 0
+        self.store_hits = 0
+        self.partial_evaluations = 0
+        self.duplicates = 0
+        self.revisits = 0
+        self.restarts = 0
+        self.refinements = 0
+        self.failures = 0
+        self.timeouts = 0
         self.mean = 0
         self.median = 0
         self.stdev = 0
+        self.latency_p50 = 0
+        self.latency_p90 = 0
+        self.latency_p99 = 0
+        self.surrogate_error = 0
         self.best_indiv = None
         self.worst_indiv = None
         self.start_time = time.process_time()
         self.last_time = self.start_time
+        self.__latencies = []
+        self.__surrogate_errors = []
 
     def advance(self, state: "GaState"):
         """
@@ -48,6 +69,20 @@ class GaStatisticEngine(GaStatistics):
         prev_best = self.best_indiv
         self.refresh(state)
 
+        if self.__latencies:
+            self.latency_p50, self.latency_p90, self.latency_p99 = np.percentile(
+                self.__latencies, [50, 90, 99]
+            )
+            self.__latencies = []
+        else:
+            self.latency_p50 = self.latency_p90 = self.latency_p99 = 0
+
+        if self.__surrogate_errors:
+            self.surrogate_error = np.mean(self.__surrogate_errors)
+            self.__surrogate_errors = []
+        else:
+            self.surrogate_error = 0
+
         self.generation += 1
         if prev_best and prev_best.value == self.best_indiv.value:
             self.stagnation += 1
@@ -56,6 +91,32 @@ class GaStatisticEngine(GaStatistics):
 
         self.last_time = time.process_time()
 
+    def add_latencies(self, latencies: Iterable[float]):
+        """
+        Records durations of single evaluations. Latency percentiles are
+        calculated from evaluations recorded since the previous generation,
+        they are 0 if none were recorded.
+
+        :param latencies: Durations of evaluations in seconds.
+        :type latencies: Iterable[float].
+        :returns: None.
+        """
+
+        self.__latencies.extend(latencies)
+
+    def add_surrogate_errors(self, errors: Iterable[float]):
+        """
+        Records absolute differences between surrogate predictions and true
+        fitness values. The surrogate error is the mean of differences
+        recorded since the previous generation, it is 0 if none were recorded.
+
+        :param errors: Absolute prediction errors.
+        :type errors: Iterable[float].
+        :returns: None.
+        """
+
+        self.__surrogate_errors.extend(errors)
+
     def refresh(self, state: "GaState"):
         """
         Updates statistics WITHOUT increasing generation number.
@@ -73,12 +134,21 @@ class GaStatisticEngine(GaStatistics):
 
         key_func = lambda ind: ind.value
         extremum = state.evaluator.extremum()
-        population = state.current_population
+        # Fitness predicted by a surrogate must not be reported as the result.
+        population = [
+            ind for ind in state.current_population if not ind.estimated
+        ] or state.current_population
 
         match extremum:
             case GaExtremum.MAXIMUM:
-                self.best_indiv = copy.deepcopy(max(population, key=key_func))
-                self.worst_indiv = copy.deepcopy(min(population, key=key_func))
+                best = max(population, key=key_func)
+                worst = min(population, key=key_func)
             case GaExtremum.MINIMUM:
-                self.best_indiv = copy.deepcopy(min(population, key=key_func))
-                self.worst_indiv = copy.deepcopy(max(population, key=key_func))
+                best = min(population, key=key_func)
+                worst = max(population, key=key_func)
+
+        # Values learned by local search are reported with the refined chromosomes.
+        self.best_indiv = copy.deepcopy(best if best.learned is None else best.learned)
+        self.worst_indiv = copy.deepcopy(
+            worst if worst.learned is None else worst.learned
+        )
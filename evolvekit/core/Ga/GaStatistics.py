@@ -13,9 +13,22 @@ class GaStatistics:
 
     generation: int = field(default=0)
     stagnation: int = field(default=0)
+    evaluations: int = field(default=0)
+    store_hits: int = field(default=0)
+    partial_evaluations: int = field(default=0)
+    duplicates: int = field(default=0)
+    revisits: int = field(default=0)
+    restarts: int = field(default=0)
+    refinements: int = field(default=0)
+    failures: int = field(default=0)
+    timeouts: int = field(default=0)
     mean: float = field(default=0.0)
     median: float = field(default=0.0)
     stdev: float = field(default=0.0)
+    latency_p50: float = field(default=0.0)
+    latency_p90: float = field(default=0.0)
+    latency_p99: float = field(default=0.0)
+    surrogate_error: float = field(default=0.0)
     best_indiv: GaIndividual | None = field(default=None)
     worst_indiv: GaIndividual | None = field(default=None)
     start_time: float = field(default=0.0)
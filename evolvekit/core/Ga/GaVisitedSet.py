@@ -0,0 +1,213 @@
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Sequence
+
+import numpy as np
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+
+
+class GaVisitedSet:
+    """
+    Probabilistic set of chromosomes visited during a simulation.
+
+    Membership is kept in a Bloom filter with a fixed number of bits, so
+    memory use does not grow with the number of evaluations: a filter
+    sized for ``capacity`` chromosomes with false positive rate
+    ``error_rate`` takes about ``-capacity * ln(error_rate) / ln(2)^2``
+    bits, e.g. 180 MB for 100 million chromosomes at 0.1%. A chromosome
+    reported as seen was visited before with probability ``1 - error_rate``
+    as long as no more than ``capacity`` chromosomes were added, never
+    seen chromosomes are reported as such.
+
+    Values of the ``cache_size`` most recently visited chromosomes are
+    additionally kept exactly, keyed by a 16-byte digest of the
+    chromosomes, and served by :class:`GaIsland` instead of evaluating
+    them again. With ``regenerate``, chromosomes reported as seen which
+    are not in the cache are changed by a random gene until they are new.
+
+    The set is meant for binary chromosomes with small bit lengths,
+    which are revisited constantly, but keys include real chromosomes
+    as well.
+    """
+
+    capacity: int
+    error_rate: float
+    cache_size: int
+    regenerate: bool
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        cache_size: int = 0,
+        regenerate: bool = False,
+    ):
+        """
+        Constructor method.
+
+        :param capacity: Number of chromosomes the filter is sized for.
+        :type capacity: int.
+        :param error_rate: False positive rate of the filter filled up to capacity.
+        :type error_rate: float.
+        :param cache_size: Number of most recently visited chromosomes whose values are kept exactly.
+        :type cache_size: int.
+        :param regenerate: Whether chromosomes visited before and missing from the cache are regenerated.
+        :type regenerate: bool.
+        :returns: None.
+        """
+
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0.")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1.")
+        if cache_size < 0:
+            raise ValueError("Cache size must be greater than or equal 0.")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.cache_size = cache_size
+        self.regenerate = regenerate
+        self.__bits_count = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        )
+        self.__hash_count = max(1, round(self.__bits_count / capacity * math.log(2)))
+        self.__bits = np.zeros((self.__bits_count + 7) // 8, dtype=np.uint8)
+        self.__cache = OrderedDict()
+        self.__added = 0
+
+    def __len__(self) -> int:
+        return self.__added
+
+    def __contains__(self, indiv: GaIndividual) -> bool:
+        bytes_, masks = self.__positions(self.key(indiv))
+        return bool(np.all(self.__bits[bytes_] & masks))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the filter, without the cache.
+
+        :returns: Size of the bit array in bytes.
+        :rtype: int
+        """
+        return self.__bits.nbytes
+
+    @staticmethod
+    def key(indiv: GaIndividual) -> bytes:
+        """
+        Computes the key of an individual's chromosomes.
+
+        :param indiv: Individual to compute the key for.
+        :type indiv: :class:`GaIndividual`.
+        :returns: 16-byte BLAKE2 digest.
+        :rtype: bytes
+        """
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(len(indiv.real_chrom).to_bytes(8, "little"))
+        digest.update(indiv.real_chrom.astype("<f8").tobytes())
+        digest.update(indiv.bin_chrom.astype("u1").tobytes())
+        return digest.digest()
+
+    def __positions(self, key: bytes):
+        """
+        Internal: Returns byte indices and bit masks of the filter positions of a key,
+        derived from two halves of the digest by double hashing.
+        """
+
+        first = int.from_bytes(key[:8], "little")
+        second = int.from_bytes(key[8:], "little") | 1
+        positions = np.array(
+            [
+                (first + i * second) % self.__bits_count
+                for i in range(self.__hash_count)
+            ],
+            dtype=np.int64,
+        )
+        return positions >> 3, (1 << (positions & 7)).astype(np.uint8)
+
+    def add(self, indiv: GaIndividual) -> bool:
+        """
+        Adds chromosomes of an individual to the filter.
+
+        :param indiv: Visited individual.
+        :type indiv: :class:`GaIndividual`.
+        :returns: True if the chromosomes were probably added before.
+        :rtype: bool
+        """
+
+        return self.__add(self.key(indiv))
+
+    def __add(self, key: bytes) -> bool:
+        """
+        Internal: Sets filter positions of a key, returns whether all of them were set before.
+        """
+
+        bytes_, masks = self.__positions(key)
+        seen = bool(np.all(self.__bits[bytes_] & masks))
+        if not seen:
+            np.bitwise_or.at(self.__bits, bytes_, masks)
+            self.__added += 1
+        return seen
+
+    def get(self, indiv: GaIndividual) -> float | None:
+        """
+        Returns the cached fitness of an individual.
+
+        :param indiv: Individual to look up.
+        :type indiv: :class:`GaIndividual`.
+        :returns: Cached fitness value, or None if the individual is not cached.
+        :rtype: float | None
+        """
+
+        key = self.key(indiv)
+        value = self.__cache.get(key)
+        if value is not None:
+            self.__cache.move_to_end(key)
+        return value
+
+    def put_many(self, individuals: Sequence[GaIndividual], values: Sequence[float]):
+        """
+        Adds evaluated individuals to the filter and caches their fitness values,
+        evicting least recently used values above 'cache_size'.
+
+        :param individuals: Evaluated individuals.
+        :type individuals: Sequence[:class:`GaIndividual`].
+        :param values: Fitness value of every individual.
+        :type values: Sequence[float].
+        :returns: None.
+        """
+
+        for indiv, value in zip(individuals, values):
+            key = self.key(indiv)
+            self.__add(key)
+            if self.cache_size:
+                self.__cache[key] = float(value)
+                self.__cache.move_to_end(key)
+                if len(self.__cache) > self.cache_size:
+                    self.__cache.popitem(last=False)
+
+    def false_positive_rate(self) -> float:
+        """
+        Estimates the current false positive rate from the number of added chromosomes.
+
+        :returns: Probability that a new chromosome is reported as seen.
+        :rtype: float
+        """
+
+        return (
+            1 - math.exp(-self.__hash_count * self.__added / self.__bits_count)
+        ) ** self.__hash_count
+
+    def clear(self):
+        """
+        Removes every chromosome from the filter and the cache.
+
+        :returns: None.
+        """
+
+        self.__bits[:] = 0
+        self.__cache.clear()
+        self.__added = 0
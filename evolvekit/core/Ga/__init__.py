@@ -1,4 +1,5 @@
 # GA Core Components
+from evolvekit.core.Ga.AsyncGaEvaluator import AsyncGaEvaluator
 from evolvekit.core.Ga.GaEvaluator import GaEvaluator
 from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
 from evolvekit.core.Ga.GaIndividual import GaIndividual
@@ -8,19 +9,29 @@ from evolvekit.core.Ga.GaResults import GaResults
 from evolvekit.core.Ga.GaState import GaState
 from evolvekit.core.Ga.GaStatisticEngine import GaStatisticEngine
 from evolvekit.core.Ga.GaStatistics import GaStatistics
+from evolvekit.core.Ga.GaVisitedSet import GaVisitedSet
 
 # Submodules
+from evolvekit.core.Ga.engines import *
 from evolvekit.core.Ga.enums import *
 from evolvekit.core.Ga.helpers import *
+from evolvekit.core.Ga.memetic import *
 from evolvekit.core.Ga.operators import *
+from evolvekit.core.Ga.parallel import *
+from evolvekit.core.Ga.surrogate import *
 
 # Combine __all__
+from evolvekit.core.Ga.engines import __all__ as engines_all
 from evolvekit.core.Ga.enums import __all__ as enums_all
 from evolvekit.core.Ga.helpers import __all__ as helpers_all
+from evolvekit.core.Ga.memetic import __all__ as memetic_all
 from evolvekit.core.Ga.operators import __all__ as operators_all
+from evolvekit.core.Ga.parallel import __all__ as parallel_all
+from evolvekit.core.Ga.surrogate import __all__ as surrogate_all
 
 __all__ = (
     [
+        "AsyncGaEvaluator",
         "GaEvaluator",
         "GaEvaluatorArgs",
         "GaIndividual",
@@ -30,8 +41,13 @@ __all__ = (
         "GaState",
         "GaStatisticEngine",
         "GaStatistics",
+        "GaVisitedSet",
     ]
+    + engines_all
     + enums_all
     + helpers_all
+    + memetic_all
     + operators_all
+    + parallel_all
+    + surrogate_all
 )
@@ -0,0 +1,311 @@
+import math
+
+import numpy as np
+
+from evolvekit.core.Ga.engines.GaEngine import GaEngine
+from evolvekit.core.Ga.enums.GaRestartStrategy import GaRestartStrategy
+
+
+class CmaEsIsland(GaEngine):
+    """
+    Covariance Matrix Adaptation Evolution Strategy on real valued chromosomes.
+
+    Every generation is sampled as one matrix draw from a multivariate
+    normal distribution, restored to the domain with 'real_clamp_strategy'
+    and evaluated as one batch. The mean, covariance matrix and step size
+    are updated from the best half of the samples with rank-one and
+    rank-mu updates. The covariance matrix is decomposed again only when
+    enough updates accumulated for the decomposition to be outdated, every
+    ``1 / (10 * n * (c1 + cmu))`` generations, which is about n / 10 for
+    the default population size, so the cost of a generation is
+    O(lambda * n^2) instead of O(n^3).
+
+    With 'population_size' set to None the default ``4 + 3 ln(n)`` is used.
+    'sigma' is the initial step size relative to the mean width of the domain.
+
+    With a 'restart' strategy other than NONE, the search is restarted from
+    a new random mean once it stalled for 'restart_stagnation' generations,
+    judged by :class:`GaStatistics` stagnation, or its distribution
+    degenerated. Restarts are counted in :class:`GaStatistics` restarts.
+    """
+
+    sigma: float
+    restart: GaRestartStrategy
+    restart_stagnation: int
+    population_growth: float
+
+    def __init__(self):
+        super().__init__()
+        self.population_size = None
+        self.sigma = 0.3
+        self.restart = GaRestartStrategy.NONE
+        self.restart_stagnation = 30
+        self.population_growth = 2.0
+        self.__large_restarts = 0
+        self.__budgets = {}
+        self.__regime = None
+        self.__spent = 0
+
+    def verify(self):
+        """
+        Self-verifies integrity of provided data.
+
+        :returns: None.
+        """
+
+        super().verify()
+
+        if not self.evaluator.real_domain() or self.evaluator.bin_length() > 0:
+            raise ValueError("CMA-ES requires an evaluator with real chromosomes only.")
+
+        if self.population_size is not None and self.population_size < 2:
+            raise ValueError("Population size must be at least 2.")
+
+        if self.sigma <= 0:
+            raise ValueError("Sigma must be greater than 0.")
+
+        if self.restart_stagnation <= 0:
+            raise ValueError("Restart stagnation must be greater than 0.")
+
+        if self.population_growth < 1:
+            raise ValueError("Population growth must be greater or equal 1.")
+
+    def start(self):
+        """
+        Initializes the distribution and evaluates the first generation.
+
+        :returns: None.
+        """
+
+        self.__large_restarts = 0
+        self.__budgets = {"large": 0, "small": 0}
+        self.__regime = "large"
+        self.__spent = 0
+        self.__initialize(self.__default_size(), self.sigma)
+        self.__generation()
+
+    def step(self):
+        """
+        Samples, evaluates and learns from the next generation, restarting a stalled search first.
+
+        :returns: None.
+        """
+
+        if self.restart != GaRestartStrategy.NONE and self.__stalled():
+            self.__restart()
+        self.__generation()
+
+    def __default_size(self) -> int:
+        """
+        Internal: Returns the population size of the first run.
+        """
+
+        if self.population_size is not None:
+            return self.population_size
+        return 4 + int(3 * math.log(len(self.evaluator.real_domain())))
+
+    def __initialize(self, size: int, sigma: float):
+        """
+        Internal: Sets strategy parameters for a population size and resets the distribution.
+        """
+
+        lower, upper = self.bounds()
+        n = len(lower)
+        self.__size = size
+        self.__mu = size // 2
+        weights = math.log(self.__mu + 0.5) - np.log(np.arange(1, self.__mu + 1))
+        self.__weights = weights / np.sum(weights)
+        self.__mueff = 1.0 / np.sum(self.__weights**2)
+
+        mueff = self.__mueff
+        self.__cc = (4 + mueff / n) / (n + 4 + 2 * mueff / n)
+        self.__cs = (mueff + 2) / (n + mueff + 5)
+        self.__c1 = 2 / ((n + 1.3) ** 2 + mueff)
+        self.__cmu = min(
+            1 - self.__c1, 2 * (mueff - 2 + 1 / mueff) / ((n + 2) ** 2 + mueff)
+        )
+        self.__damps = (
+            1 + 2 * max(0.0, math.sqrt((mueff - 1) / (n + 1)) - 1) + self.__cs
+        )
+        self.__chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n**2))
+        self.__decomposition_gap = max(1, int(1 / ((self.__c1 + self.__cmu) * n * 10)))
+
+        self.__mean = np.random.uniform(lower, upper)
+        self.__sigma0 = sigma * float(np.mean(upper - lower))
+        self.__step = self.__sigma0
+        self.__c = np.eye(n)
+        self.__b = np.eye(n)
+        self.__d = np.ones(n)
+        self.__pc = np.zeros(n)
+        self.__ps = np.zeros(n)
+        self.__count = 0
+        self.__decomposed = 0
+        self.__best = np.inf
+        self.__stagnation = 0
+
+    def __generation(self):
+        """
+        Internal: Samples, evaluates and selects one generation and updates the distribution.
+        """
+
+        n = len(self.__mean)
+        z = np.random.standard_normal((self.__size, n))
+        real = self.clamp(self.__mean + self.__step * (z * self.__d) @ self.__b.T)
+        costs = self.evaluate(real)
+        self.publish(costs, real)
+        self.__count += 1
+
+        if np.min(costs) < self.__best:
+            self.__best = np.min(costs)
+            self.__stagnation = 0
+        else:
+            self.__stagnation += 1
+
+        # Steps are taken from restored samples, so the update follows evaluated points.
+        steps = (real - self.__mean) / self.__step
+        selected = steps[np.argsort(costs)[: self.__mu]]
+        step = self.__weights @ selected
+        self.__mean = self.__mean + self.__step * step
+
+        inverse_root = (self.__b / self.__d) @ self.__b.T
+        cs, cc = self.__cs, self.__cc
+        self.__ps = (1 - cs) * self.__ps + math.sqrt(cs * (2 - cs) * self.__mueff) * (
+            inverse_root @ step
+        )
+        norm = np.linalg.norm(self.__ps) / math.sqrt(1 - (1 - cs) ** (2 * self.__count))
+        hsig = norm / self.__chi_n < 1.4 + 2 / (n + 1)
+        self.__pc = (1 - cc) * self.__pc + hsig * math.sqrt(
+            cc * (2 - cc) * self.__mueff
+        ) * step
+
+        c1, cmu = self.__c1, self.__cmu
+        rank_one = (
+            np.outer(self.__pc, self.__pc) + (1 - hsig) * cc * (2 - cc) * self.__c
+        )
+        rank_mu = (selected.T * self.__weights) @ selected
+        self.__c = (1 - c1 - cmu) * self.__c + c1 * rank_one + cmu * rank_mu
+        self.__step *= math.exp(
+            cs / self.__damps * (np.linalg.norm(self.__ps) / self.__chi_n - 1)
+        )
+
+        if self.__count - self.__decomposed >= self.__decomposition_gap:
+            self.__decompose()
+
+    def __decompose(self):
+        """
+        Internal: Updates the eigendecomposition of the covariance matrix.
+        """
+
+        self.__c = np.triu(self.__c) + np.triu(self.__c, 1).T
+        eigenvalues, self.__b = np.linalg.eigh(self.__c)
+        self.__d = np.sqrt(np.maximum(eigenvalues, 1e-300))
+        self.__decomposed = self.__count
+
+    def __stalled(self) -> bool:
+        """
+        Internal: Checks whether the search stalled or its distribution degenerated.
+        """
+
+        # A new run rarely beats the best individual of previous runs at once,
+        # so the run itself must have stalled too.
+        stalled = (
+            min(self.statistic_engine.stagnation, self.__stagnation)
+            >= self.restart_stagnation
+        )
+        collapsed = self.__step * np.max(self.__d) < 1e-12 * self.__sigma0
+        ill_conditioned = np.max(self.__d) > 1e7 * np.min(self.__d)
+        return stalled or collapsed or ill_conditioned
+
+    def __restart(self):
+        """
+        Internal: Restarts the search with the population size and step size chosen by 'restart'.
+        """
+
+        self.statistic_engine.restarts += 1
+        evaluations = self.statistic_engine.evaluations
+        self.__budgets[self.__regime] += evaluations - self.__spent
+        self.__spent = evaluations
+
+        default = self.__default_size()
+        sigma = self.sigma
+        if (
+            self.restart == GaRestartStrategy.BIPOP
+            and self.__budgets["small"] < self.__budgets["large"]
+        ):
+            self.__regime = "small"
+            large = default * self.population_growth**self.__large_restarts
+            u = np.random.uniform()
+            size = max(2, int(default * (large / default) ** (u**2)))
+            sigma = self.sigma * 10 ** (-2 * u)
+        else:
+            self.__regime = "large"
+            self.__large_restarts += 1
+            size = int(default * self.population_growth**self.__large_restarts)
+        self.__initialize(size, sigma)
+
+    def configuration(self) -> dict:
+        """
+        Returns every setting which determines the course of the simulation.
+
+        :returns: Dictionary mapping setting names to their values.
+        :rtype: dict
+        """
+
+        return super().configuration() | {
+            "sigma": self.sigma,
+            "restart": self.restart,
+            "restart_stagnation": self.restart_stagnation,
+            "population_growth": self.population_growth,
+        }
+
+    def set_sigma(self, sigma: float):
+        """
+        Setter method.
+
+        Set the initial step size relative to the mean width of the domain.
+
+        :param sigma: Relative step size.
+        :type sigma: float.
+        :returns: None.
+        """
+
+        self.sigma = sigma
+
+    def set_restart(self, restart: GaRestartStrategy):
+        """
+        Setter method.
+
+        Set the strategy restarting a stalled search.
+
+        :param restart: Restart strategy.
+        :type restart: :class:`GaRestartStrategy`.
+        :returns: None.
+        """
+
+        self.restart = restart
+
+    def set_restart_stagnation(self, count: int):
+        """
+        Setter method.
+
+        Set the number of generations without improvement after which the search is restarted.
+
+        :param count: Number of generations.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.restart_stagnation = count
+
+    def set_population_growth(self, factor: float):
+        """
+        Setter method.
+
+        Set the factor multiplying the population size on every large restart.
+
+        :param factor: Growth factor.
+        :type factor: float.
+        :returns: None.
+        """
+
+        self.population_growth = factor
@@ -0,0 +1,336 @@
+from typing import Callable, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.engines.DifferentialEvolutionIsland import (
+    DifferentialEvolutionIsland,
+)
+from evolvekit.core.Ga.engines.GaEngine import GaEngine
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.enums.GaGrouping import GaGrouping
+
+
+class _GaGroupEvaluator(GaEvaluator):
+    """
+    Internal: Evaluator of a sub-island, which sees only the genes of its
+    group and evaluates them inserted into the context vector. Values are
+    costs of the whole problem, so they are always minimized.
+    """
+
+    def __init__(
+        self,
+        domain: List[Tuple[float, float]],
+        evaluate: Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]],
+    ):
+        self.__domain = domain
+        self.__evaluate = evaluate
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        return self.evaluate_batch([args])[0]
+
+    def evaluate_batch(self, args: List[GaEvaluatorArgs]) -> List[float]:
+        return list(self.__evaluate(np.array([arg.real_chrom for arg in args])))
+
+    def extremum(self) -> GaExtremum:
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        return self.__domain
+
+
+class CooperativeCoevolutionIsland(GaEngine):
+    """
+    Cooperative coevolution on real valued chromosomes of large dimension.
+
+    Genes are decomposed into groups by 'grouping', and every group is
+    evolved by its own sub-island created by 'engine_factory', an engine
+    whose chromosomes hold only the genes of the group. Sub-islands are
+    evaluated against a shared context vector, the best chromosome found
+    so far: every generation of a sub-island is inserted into copies of the
+    context vector and evaluated as one batch, and its best chromosome
+    replaces its genes in the context vector if it is better. Operators of
+    a sub-island therefore work on matrices of the group size, not of the
+    whole dimension.
+
+    Every generation gives each sub-island a turn of 'island_generations'
+    generations. Costs a sub-island keeps from its previous turn were
+    computed in an older context vector, so they are evaluated again at the
+    start of its turn, see :func:`GaEngine.reevaluate()`. 'population_size'
+    is the population size of every sub-island, None keeps their defaults.
+
+    Differential grouping costs about ``n * (n + 1) / 2`` evaluations for n
+    separable genes before the first generation, fewer the more genes interact.
+    Genes whose effects differ by more than 'interaction_threshold' times the
+    magnitude of the fitness are considered interacting.
+    """
+
+    grouping: GaGrouping
+    group_size: int
+    interaction_threshold: float
+    engine_factory: Callable[[], GaEngine]
+    island_generations: int
+
+    def __init__(self):
+        super().__init__()
+        self.grouping = GaGrouping.RANDOM
+        self.group_size = 100
+        self.interaction_threshold = 1e-3
+        self.engine_factory = DifferentialEvolutionIsland
+        self.island_generations = 10
+        self.__groups = None
+        self.__context = None
+        self.__context_cost = np.inf
+        self.__islands = []
+
+    @property
+    def groups(self) -> List[npt.NDArray[np.int64]] | None:
+        """
+        Indices of the genes of every group, None before the simulation started.
+
+        :returns: One index array per group.
+        :rtype: List[npt.NDArray[np.int64]] | None
+        """
+        return self.__groups
+
+    @property
+    def context(self) -> npt.NDArray[np.float64] | None:
+        """
+        Context vector the groups are evaluated in, None before the simulation started.
+
+        :returns: Best real chromosome found so far.
+        :rtype: npt.NDArray[np.float64] | None
+        """
+        return self.__context
+
+    def verify(self):
+        """
+        Self-verifies integrity of provided data.
+
+        :returns: None.
+        """
+
+        super().verify()
+
+        if not self.evaluator.real_domain() or self.evaluator.bin_length() > 0:
+            raise ValueError(
+                "Cooperative coevolution requires an evaluator with real chromosomes only."
+            )
+
+        if self.group_size <= 0:
+            raise ValueError("Group size must be greater than 0.")
+
+        if self.interaction_threshold < 0:
+            raise ValueError("Interaction threshold cannot be negative.")
+
+        if self.island_generations <= 0:
+            raise ValueError("Island generations must be greater than 0.")
+
+    def start(self):
+        """
+        Decomposes the genes, evaluates a random context vector and starts every sub-island.
+
+        :returns: None.
+        """
+
+        lower, upper = self.bounds()
+        self.__context = np.random.uniform(lower, upper)
+        self.__context_cost = self.evaluate(self.__context[np.newaxis, :])[0]
+        if self.grouping == GaGrouping.DIFFERENTIAL:
+            self.__groups = self.__differential_groups()
+        else:
+            self.__groups = self.__split(np.random.permutation(len(lower)))
+
+        domain = self.evaluator.real_domain()
+        self.__islands = []
+        for genes in self.__groups:
+            island = self.engine_factory()
+            island.set_evaluator(
+                _GaGroupEvaluator(
+                    [domain[gene] for gene in genes],
+                    lambda real, genes=genes: self.__evaluate_group(genes, real),
+                )
+            )
+            island.set_real_clamp_strategy(self.real_clamp_strategy)
+            if self.population_size is not None:
+                island.set_population_size(self.population_size)
+            island.verify()
+            island.statistic_engine.start(island)
+            self.__islands.append(island)
+
+        for island in self.__islands:
+            island.start()
+        self.__publish()
+
+    def step(self):
+        """
+        Gives every sub-island a turn in the current context vector.
+
+        :returns: None.
+        """
+
+        for island in self.__islands:
+            island.reevaluate()
+            for _ in range(self.island_generations):
+                island.step()
+        self.__publish()
+
+    def __publish(self):
+        """
+        Internal: Exposes the context vector as the population.
+        """
+
+        self.publish(np.array([self.__context_cost]), self.__context[np.newaxis, :])
+
+    def __evaluate_group(
+        self, genes: npt.NDArray[np.int64], real: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """
+        Internal: Evaluates genes of a group, one chromosome per row, inserted into the
+        context vector, and updates the context vector with the best of them if it is better.
+        """
+
+        full = np.repeat(self.__context[np.newaxis, :], len(real), axis=0)
+        full[:, genes] = real
+        costs = self.evaluate(full)
+
+        best = int(np.argmin(costs))
+        if costs[best] < self.__context_cost:
+            self.__context = full[best]
+            self.__context_cost = costs[best]
+        return costs
+
+    def __split(self, genes: npt.NDArray[np.int64]) -> List[npt.NDArray[np.int64]]:
+        """
+        Internal: Splits genes into groups of at most 'group_size' genes of about equal size.
+        """
+
+        if not len(genes):
+            return []
+        count = -(-len(genes) // self.group_size)
+        return [np.sort(group) for group in np.array_split(genes, count)]
+
+    def __differential_groups(self) -> List[npt.NDArray[np.int64]]:
+        """
+        Internal: Groups genes which interact, directly or through other genes. Two genes
+        interact if moving one of them changes the fitness by a different amount after
+        the other one was moved too. Separable genes are split into groups.
+        """
+
+        lower, upper = self.bounds()
+        n = len(lower)
+        middle = (lower + upper) / 2
+
+        # Genes are moved from the lower bound to the middle of their domain.
+        points = np.repeat(lower[np.newaxis, :], n + 1, axis=0)
+        points[1 + np.arange(n), np.arange(n)] = middle
+        costs = self.evaluate(points)
+        base, moved = costs[0], costs[1:]
+        epsilon = self.interaction_threshold * max(1.0, abs(base))
+
+        groups = []
+        separable = []
+        remaining = np.arange(n)
+        while len(remaining):
+            group, remaining = remaining[:1], remaining[1:]
+            frontier = list(group)
+            while frontier and len(remaining):
+                gene = frontier.pop()
+                both = np.repeat(points[1 + gene][np.newaxis, :], len(remaining), 0)
+                both[np.arange(len(remaining)), remaining] = middle[remaining]
+                delta = self.evaluate(both) - moved[remaining]
+                interacting = np.abs((moved[gene] - base) - delta) > epsilon
+                group = np.append(group, remaining[interacting])
+                frontier.extend(remaining[interacting])
+                remaining = remaining[~interacting]
+
+            if len(group) > 1:
+                groups.append(np.sort(group))
+            else:
+                separable.extend(group)
+        return groups + self.__split(np.array(separable, dtype=np.int64))
+
+    def configuration(self) -> dict:
+        """
+        Returns every setting which determines the course of the simulation.
+
+        :returns: Dictionary mapping setting names to their values.
+        :rtype: dict
+        """
+
+        return super().configuration() | {
+            "grouping": self.grouping,
+            "group_size": self.group_size,
+            "interaction_threshold": self.interaction_threshold,
+            "engine_factory": self.engine_factory,
+            "island_generations": self.island_generations,
+        }
+
+    def set_grouping(self, grouping: GaGrouping):
+        """
+        Setter method.
+
+        Set the way genes are decomposed into groups.
+
+        :param grouping: Grouping.
+        :type grouping: :class:`GaGrouping`.
+        :returns: None.
+        """
+
+        self.grouping = grouping
+
+    def set_group_size(self, size: int):
+        """
+        Setter method.
+
+        Set the largest number of genes in a group of random or separable genes.
+
+        :param size: Group size.
+        :type size: int.
+        :returns: None.
+        """
+
+        self.group_size = size
+
+    def set_interaction_threshold(self, threshold: float):
+        """
+        Setter method.
+
+        Set the change of fitness, relative to its magnitude, above which
+        differential grouping considers two genes interacting.
+
+        :param threshold: Interaction threshold.
+        :type threshold: float.
+        :returns: None.
+        """
+
+        self.interaction_threshold = threshold
+
+    def set_engine_factory(self, factory: Callable[[], GaEngine]):
+        """
+        Setter method.
+
+        Set the function creating the sub-island evolving every group,
+        e.g. an engine class.
+
+        :param factory: Function creating an engine on real chromosomes.
+        :type factory: Callable[[], :class:`GaEngine`].
+        :returns: None.
+        """
+
+        self.engine_factory = factory
+
+    def set_island_generations(self, count: int):
+        """
+        Setter method.
+
+        Set the number of generations of a sub-island in every turn.
+
+        :param count: Number of generations.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.island_generations = count
@@ -0,0 +1,337 @@
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.engines.GaEngine import GaEngine
+from evolvekit.core.Ga.enums.GaDeAdaptation import GaDeAdaptation
+from evolvekit.core.Ga.enums.GaDeCrossover import GaDeCrossover
+from evolvekit.core.Ga.enums.GaDeStrategy import GaDeStrategy
+
+
+class DifferentialEvolutionIsland(GaEngine):
+    """
+    Differential Evolution on real valued chromosomes.
+
+    The population is kept as a matrix with one chromosome per row, and a
+    generation is computed with a constant number of matrix operations:
+    mutant vectors of every individual are built by 'strategy', mixed with
+    the population by 'crossover', restored to the domain with
+    'real_clamp_strategy', evaluated as one batch, and every trial vector
+    replaces its parent if it is not worse.
+
+    With 'adaptation' set to JADE or SHADE, every individual draws its own
+    scale factor and crossover rate, and their distributions follow the
+    parameters of trial vectors which improved on their parents.
+    """
+
+    strategy: GaDeStrategy
+    crossover: GaDeCrossover
+    adaptation: GaDeAdaptation
+    scale_factor: float
+    crossover_rate: float
+    p_best: float
+    learning_rate: float
+    memory_size: int
+
+    def __init__(self):
+        super().__init__()
+        self.strategy = GaDeStrategy.RAND_1
+        self.crossover = GaDeCrossover.BINOMIAL
+        self.adaptation = GaDeAdaptation.NONE
+        self.scale_factor = 0.5
+        self.crossover_rate = 0.9
+        self.p_best = 0.1
+        self.learning_rate = 0.1
+        self.memory_size = 10
+        self.__real = None
+        self.__costs = None
+        self.__mean_f = None
+        self.__mean_cr = None
+        self.__slot = 0
+
+    def verify(self):
+        """
+        Self-verifies integrity of provided data.
+
+        :returns: None.
+        """
+
+        super().verify()
+
+        if not self.evaluator.real_domain() or self.evaluator.bin_length() > 0:
+            raise ValueError(
+                "Differential Evolution requires an evaluator with real chromosomes only."
+            )
+
+        if self.population_size < 4:
+            raise ValueError("Population size must be at least 4.")
+
+        if not 0 < self.scale_factor <= 2:
+            raise ValueError("Scale factor must be in range (0, 2].")
+
+        if not 0 <= self.crossover_rate <= 1:
+            raise ValueError("Crossover rate must be in range [0, 1].")
+
+        if not 0 < self.p_best <= 1:
+            raise ValueError("Fraction of best individuals must be in range (0, 1].")
+
+        if not 0 < self.learning_rate <= 1:
+            raise ValueError("Learning rate must be in range (0, 1].")
+
+        if self.memory_size <= 0:
+            raise ValueError("Memory size must be greater than 0.")
+
+    def start(self):
+        """
+        Creates and evaluates a population drawn uniformly from the domain.
+
+        :returns: None.
+        """
+
+        lower, upper = self.bounds()
+        self.__real = np.random.uniform(
+            lower, upper, (self.population_size, len(lower))
+        )
+        self.__costs = self.evaluate(self.__real)
+        size = self.memory_size if self.adaptation == GaDeAdaptation.SHADE else 1
+        self.__mean_f = np.full(size, self.scale_factor)
+        self.__mean_cr = np.full(size, self.crossover_rate)
+        self.__slot = 0
+        self.publish(self.__costs, self.__real)
+
+    def step(self):
+        """
+        Creates, evaluates and selects trial vectors of the whole population.
+
+        :returns: None.
+        """
+
+        f, cr = self.__parameters()
+        mask = self.__crossover_mask(cr)
+        trial = self.clamp(np.where(mask, self.__mutants(f), self.__real))
+        trial_costs = self.evaluate(trial)
+
+        replaced = trial_costs <= self.__costs
+        improved = trial_costs < self.__costs
+        self.__adapt(f[improved], cr[improved], (self.__costs - trial_costs)[improved])
+        self.__real[replaced] = trial[replaced]
+        self.__costs[replaced] = trial_costs[replaced]
+        self.publish(self.__costs, self.__real)
+
+    def reevaluate(self):
+        """
+        Evaluates the population again.
+
+        :returns: None.
+        """
+
+        self.__costs = self.evaluate(self.__real)
+
+    def __parameters(self):
+        """
+        Internal: Returns the scale factor and crossover rate of every individual.
+        """
+
+        size = len(self.__real)
+        if self.adaptation == GaDeAdaptation.NONE:
+            return np.full(size, self.scale_factor), np.full(size, self.crossover_rate)
+
+        slots = np.random.randint(len(self.__mean_f), size=size)
+        cr = np.clip(np.random.normal(self.__mean_cr[slots], 0.1), 0.0, 1.0)
+        f = self.__mean_f[slots] + 0.1 * np.random.standard_cauchy(size)
+        # Non-positive scale factors are drawn again, too large ones are truncated.
+        while np.any(invalid := f <= 0):
+            means = self.__mean_f[slots[invalid]]
+            f[invalid] = means + 0.1 * np.random.standard_cauchy(len(means))
+        return np.minimum(f, 1.0), cr
+
+    def __mutants(self, f: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Internal: Builds mutant vectors of the whole population by 'strategy'.
+        """
+
+        x = self.__real
+        size = len(x)
+        # Sorting random keys gives every row distinct indices other than its own.
+        keys = np.random.random((size, size))
+        np.fill_diagonal(keys, 2.0)
+        r1, r2, r3 = np.argsort(keys, axis=1)[:, :3].T
+        f = f[:, np.newaxis]
+
+        if self.strategy == GaDeStrategy.RAND_1:
+            return x[r1] + f * (x[r2] - x[r3])
+
+        if self.adaptation != GaDeAdaptation.NONE:
+            top = np.argsort(self.__costs)[: max(1, round(self.p_best * size))]
+            best = top[np.random.randint(len(top), size=size)]
+        else:
+            best = np.full(size, np.argmin(self.__costs))
+
+        if self.strategy == GaDeStrategy.BEST_1:
+            return x[best] + f * (x[r1] - x[r2])
+        return x + f * (x[best] - x) + f * (x[r1] - x[r2])
+
+    def __crossover_mask(self, cr: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        """
+        Internal: Returns which genes of every trial vector are taken from its mutant.
+        """
+
+        size, dim = self.__real.shape
+        rows = np.arange(size)
+        start = np.random.randint(dim, size=size)
+
+        if self.crossover == GaDeCrossover.BINOMIAL:
+            mask = np.random.random((size, dim)) < cr[:, np.newaxis]
+            mask[rows, start] = True
+            return mask
+
+        # Run length L satisfies P(L >= k) = CR^(k-1), a geometric distribution.
+        length = np.random.geometric(np.maximum(1.0 - cr, 1e-12))
+        offsets = (np.arange(dim)[np.newaxis, :] - start[:, np.newaxis]) % dim
+        return offsets < length[:, np.newaxis]
+
+    def __adapt(
+        self,
+        f: npt.NDArray[np.float64],
+        cr: npt.NDArray[np.float64],
+        improvement: npt.NDArray[np.float64],
+    ):
+        """
+        Internal: Moves parameter means towards the parameters of improving trial vectors.
+        """
+
+        if self.adaptation == GaDeAdaptation.NONE or not len(f):
+            return
+
+        if self.adaptation == GaDeAdaptation.JADE:
+            c = self.learning_rate
+            self.__mean_cr[0] = (1 - c) * self.__mean_cr[0] + c * np.mean(cr)
+            self.__mean_f[0] = (1 - c) * self.__mean_f[0] + c * np.sum(f**2) / np.sum(f)
+            return
+
+        weights = improvement / np.sum(improvement)
+        self.__mean_cr[self.__slot] = np.sum(weights * cr)
+        self.__mean_f[self.__slot] = np.sum(weights * f**2) / np.sum(weights * f)
+        self.__slot = (self.__slot + 1) % len(self.__mean_f)
+
+    def configuration(self) -> dict:
+        """
+        Returns every setting which determines the course of the simulation.
+
+        :returns: Dictionary mapping setting names to their values.
+        :rtype: dict
+        """
+
+        return super().configuration() | {
+            "strategy": self.strategy,
+            "crossover": self.crossover,
+            "adaptation": self.adaptation,
+            "scale_factor": self.scale_factor,
+            "crossover_rate": self.crossover_rate,
+            "p_best": self.p_best,
+            "learning_rate": self.learning_rate,
+            "memory_size": self.memory_size,
+        }
+
+    def set_strategy(self, strategy: GaDeStrategy):
+        """
+        Setter method.
+
+        Set the strategy building mutant vectors.
+
+        :param strategy: Mutation strategy.
+        :type strategy: :class:`GaDeStrategy`.
+        :returns: None.
+        """
+
+        self.strategy = strategy
+
+    def set_crossover(self, crossover: GaDeCrossover):
+        """
+        Setter method.
+
+        Set the crossover mixing mutant vectors with the population.
+
+        :param crossover: Crossover.
+        :type crossover: :class:`GaDeCrossover`.
+        :returns: None.
+        """
+
+        self.crossover = crossover
+
+    def set_adaptation(self, adaptation: GaDeAdaptation):
+        """
+        Setter method.
+
+        Set the way the scale factor and crossover rate are controlled.
+
+        :param adaptation: Parameter adaptation.
+        :type adaptation: :class:`GaDeAdaptation`.
+        :returns: None.
+        """
+
+        self.adaptation = adaptation
+
+    def set_scale_factor(self, factor: float):
+        """
+        Setter method.
+
+        Set the scale factor F of difference vectors, the initial mean with adaptation.
+
+        :param factor: Scale factor in range (0, 2].
+        :type factor: float.
+        :returns: None.
+        """
+
+        self.scale_factor = factor
+
+    def set_crossover_rate(self, rate: float):
+        """
+        Setter method.
+
+        Set the crossover rate CR, the initial mean with adaptation.
+
+        :param rate: Crossover rate in range [0, 1].
+        :type rate: float.
+        :returns: None.
+        """
+
+        self.crossover_rate = rate
+
+    def set_p_best(self, fraction: float):
+        """
+        Setter method.
+
+        Set the fraction of best individuals current-to-best/1 draws from with adaptation.
+
+        :param fraction: Fraction in range (0, 1].
+        :type fraction: float.
+        :returns: None.
+        """
+
+        self.p_best = fraction
+
+    def set_learning_rate(self, rate: float):
+        """
+        Setter method.
+
+        Set the rate at which JADE moves parameter means.
+
+        :param rate: Learning rate in range (0, 1].
+        :type rate: float.
+        :returns: None.
+        """
+
+        self.learning_rate = rate
+
+    def set_memory_size(self, size: int):
+        """
+        Setter method.
+
+        Set the number of parameter means SHADE keeps.
+
+        :param size: Memory size.
+        :type size: int.
+        :returns: None.
+        """
+
+        self.memory_size = size
@@ -0,0 +1,207 @@
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.engines.GaEngine import GaEngine
+from evolvekit.core.Ga.enums.GaEdaModel import GaEdaModel
+
+
+class EstimationOfDistributionIsland(GaEngine):
+    """
+    Estimation of distribution algorithms on binary chromosomes.
+
+    Instead of a population, only the probability of every bit being set is
+    carried from one generation to the next. Every generation samples
+    individuals from the probabilities, evaluates them as one batch and
+    updates the probabilities by 'model'. Samples are drawn and packed in
+    chunks of at most about a million bits, so a generation of
+    population_size samples takes population_size * bin_length / 8 bytes.
+    Evaluating and publishing a generation each wrap a copy of it in
+    individuals, and the published 'current_population' is kept until the
+    next generation, so the memory used peaks at about three times the
+    packed generation.
+
+    With PBIL and UMDA probabilities are kept at least 1 / bin_length away
+    from 0 and 1, so no bit is fixed for good.
+    """
+
+    model: GaEdaModel
+    learning_rate: float
+    selection_rate: float
+
+    __CHUNK_BITS = 2**20
+
+    def __init__(self):
+        super().__init__()
+        self.model = GaEdaModel.COMPACT
+        self.learning_rate = 0.1
+        self.selection_rate = 0.5
+        self.__probabilities = None
+
+    @property
+    def probabilities(self) -> npt.NDArray[np.float64] | None:
+        """
+        Probability of every bit being set, None before the simulation started.
+
+        :returns: Probability vector of length bin_length.
+        :rtype: npt.NDArray[np.float64] | None
+        """
+        return self.__probabilities
+
+    def verify(self):
+        """
+        Self-verifies integrity of provided data.
+
+        :returns: None.
+        """
+
+        super().verify()
+
+        if self.evaluator.real_domain() or self.evaluator.bin_length() <= 0:
+            raise ValueError(
+                "Estimation of distribution requires an evaluator with binary chromosomes only."
+            )
+
+        if self.population_size < 2:
+            raise ValueError("Population size must be at least 2.")
+
+        if not 0 < self.learning_rate <= 1:
+            raise ValueError("Learning rate must be in range (0, 1].")
+
+        if not 0 < self.selection_rate <= 1:
+            raise ValueError("Selection rate must be in range (0, 1].")
+
+    def start(self):
+        """
+        Starts from uniform probabilities and evaluates the first generation.
+
+        :returns: None.
+        """
+
+        self.__probabilities = np.full(self.evaluator.bin_length(), 0.5)
+        self.step()
+
+    def step(self):
+        """
+        Samples and evaluates a generation and updates the probabilities.
+
+        :returns: None.
+        """
+
+        count = 2 if self.model == GaEdaModel.COMPACT else self.population_size
+        bins = self.__sample(count)
+        costs = self.evaluate(bins=bins)
+        self.publish(costs, bins=bins)
+        ranking = np.argsort(costs, kind="stable")
+
+        if self.model == GaEdaModel.COMPACT:
+            winner, loser = self.__unpack(bins[ranking]).astype(np.float64)
+            self.__probabilities += (winner - loser) / self.population_size
+            np.clip(self.__probabilities, 0.0, 1.0, out=self.__probabilities)
+            return
+
+        selected = ranking[: max(1, round(self.selection_rate * count))]
+        frequencies = self.__frequencies(bins, selected)
+        if self.model == GaEdaModel.PBIL:
+            self.__probabilities += self.learning_rate * (
+                frequencies - self.__probabilities
+            )
+        else:
+            self.__probabilities = frequencies
+        margin = 1 / len(self.__probabilities)
+        np.clip(self.__probabilities, margin, 1 - margin, out=self.__probabilities)
+
+    def __rows(self) -> int:
+        """
+        Internal: Returns the number of chromosomes handled at once to bound temporary memory.
+        """
+
+        return max(1, self.__CHUNK_BITS // len(self.__probabilities))
+
+    def __unpack(self, bins: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+        """
+        Internal: Unpacks chromosomes into one byte per bit.
+        """
+
+        return np.unpackbits(bins, axis=1, count=len(self.__probabilities))
+
+    def __sample(self, count: int) -> npt.NDArray[np.uint8]:
+        """
+        Internal: Samples packed chromosomes from the probabilities.
+        """
+
+        length = len(self.__probabilities)
+        bins = np.empty((count, (length + 7) // 8), dtype=np.uint8)
+        rows = self.__rows()
+        for first in range(0, count, rows):
+            last = min(count, first + rows)
+            bits = np.random.random((last - first, length)) < self.__probabilities
+            bins[first:last] = np.packbits(bits, axis=1)
+        return bins
+
+    def __frequencies(
+        self, bins: npt.NDArray[np.uint8], selected: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.float64]:
+        """
+        Internal: Returns how often every bit is set in the selected packed chromosomes,
+        gathering them chunk by chunk instead of copying the selection at once.
+        """
+
+        totals = np.zeros(len(self.__probabilities))
+        rows = self.__rows()
+        for first in range(0, len(selected), rows):
+            chunk = bins[selected[first : first + rows]]
+            totals += self.__unpack(chunk).sum(axis=0)
+        return totals / len(selected)
+
+    def configuration(self) -> dict:
+        """
+        Returns every setting which determines the course of the simulation.
+
+        :returns: Dictionary mapping setting names to their values.
+        :rtype: dict
+        """
+
+        return super().configuration() | {
+            "model": self.model,
+            "learning_rate": self.learning_rate,
+            "selection_rate": self.selection_rate,
+        }
+
+    def set_model(self, model: GaEdaModel):
+        """
+        Setter method.
+
+        Set the algorithm updating the probabilities.
+
+        :param model: Estimation of distribution algorithm.
+        :type model: :class:`GaEdaModel`.
+        :returns: None.
+        """
+
+        self.model = model
+
+    def set_learning_rate(self, rate: float):
+        """
+        Setter method.
+
+        Set the rate at which PBIL moves the probabilities.
+
+        :param rate: Learning rate in range (0, 1].
+        :type rate: float.
+        :returns: None.
+        """
+
+        self.learning_rate = rate
+
+    def set_selection_rate(self, rate: float):
+        """
+        Setter method.
+
+        Set the fraction of best samples PBIL and UMDA learn from.
+
+        :param rate: Selection rate in range (0, 1].
+        :type rate: float.
+        :returns: None.
+        """
+
+        self.selection_rate = rate
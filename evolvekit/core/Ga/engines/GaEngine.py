@@ -0,0 +1,378 @@
+import copy
+import time
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.AsyncGaEvaluator import AsyncGaEvaluator
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.GaInspector import GaInspector
+from evolvekit.core.Ga.GaResults import GaResults
+from evolvekit.core.Ga.GaState import GaState
+from evolvekit.core.Ga.enums.GaAction import GaAction
+from evolvekit.core.Ga.enums.GaClampStrategy import GaClampStrategy
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.helpers.ClampStrategy import clamp_matrix
+from evolvekit.core.Ga.parallel.GaEvaluationPool import GaEvaluationPool
+
+
+class GaEngine(GaState, ABC):
+    """
+    Base class of optimizers which, unlike :class:`GaIsland`, compute a
+    whole generation as matrix operations on real or binary chromosomes.
+
+    Engines share evaluators, inspectors, statistics and results with
+    :class:`GaIsland`. Engines implement :func:`start()` and :func:`step()`:
+    every generation is evaluated as one batch by :func:`evaluate()`, with
+    :func:`GaEvaluator.evaluate_batch()` or in worker processes if
+    ``workers`` is greater than 1, and the population is exposed as
+    'current_population' for :class:`GaStatisticEngine` by :func:`publish()`.
+    The best individual found so far is kept in 'current_population' like
+    an elite, so the result never gets worse.
+
+    Engines minimize costs: :func:`evaluate()` negates values of maximized
+    problems and :func:`publish()` restores them.
+
+    Engines deriving their population size from the problem accept None
+    as 'population_size'.
+    """
+
+    population_size: int | None
+    inspector: GaInspector | None
+    workers: int
+
+    def __init__(self):
+        super().__init__()
+        self.population_size = 50
+        self.max_generations = 200
+        self.seed = 0
+        self.real_clamp_strategy = GaClampStrategy.CLAMP
+        self.workers = 1
+        self.inspector = None
+        self.__pool = None
+        self.__best = None
+
+    def verify(self):
+        """
+        Self-verifies integrity of provided data. Engines override it to check their own parameters.
+
+        :returns: None.
+        """
+
+        if not self.evaluator:
+            raise TypeError("Evaluator cannot be empty")
+
+        if isinstance(self.evaluator, AsyncGaEvaluator):
+            raise TypeError(f"{type(self).__name__} does not support AsyncGaEvaluator.")
+
+        if self.population_size is not None and self.population_size <= 0:
+            raise ValueError("Population size must be greater than 0.")
+
+        if self.max_generations <= 0:
+            raise ValueError("Max generations must be greater than 0.")
+
+        if self.workers <= 0:
+            raise ValueError("Number of workers must be greater than 0.")
+
+    @abstractmethod
+    def start(self):
+        """
+        Creates and evaluates the first generation.
+
+        :returns: None.
+        """
+        pass
+
+    @abstractmethod
+    def step(self):
+        """
+        Creates and evaluates the next generation.
+
+        :returns: None.
+        """
+        pass
+
+    def reevaluate(self):
+        """
+        Evaluates again the chromosomes whose costs the engine keeps from
+        earlier generations, e.g. after the problem changed. Engines which
+        keep such costs override it.
+
+        :returns: None.
+        """
+        pass
+
+    def bounds(self) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Returns the domain of the real valued chromosome as arrays.
+
+        :returns: Lower and upper bound of every gene.
+        :rtype: Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
+        """
+
+        domain = np.array(self.evaluator.real_domain(), dtype=np.float64)
+        return domain[:, 0], domain[:, 1]
+
+    def clamp(self, real: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Restores genes of a matrix of real chromosomes to their domain with 'real_clamp_strategy'.
+
+        :param real: Chromosomes, one per row.
+        :type real: npt.NDArray[np.float64].
+        :returns: Restored chromosomes.
+        :rtype: npt.NDArray[np.float64]
+        """
+
+        return clamp_matrix(self.real_clamp_strategy, real, *self.bounds())
+
+    def evaluate(
+        self,
+        real: npt.NDArray[np.float64] | None = None,
+        bins: npt.NDArray[np.uint8] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Evaluates a generation given as matrices of chromosomes, one per row.
+
+        :param real: Real chromosomes, or None if the evaluator has none.
+        :type real: npt.NDArray[np.float64] | None.
+        :param bins: Packed binary chromosomes, or None if the evaluator has none.
+        :type bins: npt.NDArray[np.uint8] | None.
+        :returns: Values of every chromosome, negated for maximized problems so that lower is better.
+        :rtype: npt.NDArray[np.float64]
+        """
+
+        population = self.__individuals(real, bins)
+        if self.__pool:
+            values = self.__pool.evaluate(population)
+            self.statistic_engine.failures = self.__pool.failures
+            self.statistic_engine.timeouts = self.__pool.timeouts
+            self.statistic_engine.add_latencies(self.__pool.drain_latencies())
+        else:
+            started = time.perf_counter()
+            values = self.evaluator.evaluate_batch(
+                [GaEvaluatorArgs(indiv) for indiv in population]
+            )
+            latency = (time.perf_counter() - started) / len(population)
+            self.statistic_engine.add_latencies([latency] * len(population))
+        self.statistic_engine.evaluations += len(population)
+
+        costs = np.asarray(values, dtype=np.float64)
+        if self.evaluator.extremum() == GaExtremum.MAXIMUM:
+            costs = -costs
+        return costs
+
+    def publish(
+        self,
+        costs: npt.NDArray[np.float64],
+        real: npt.NDArray[np.float64] | None = None,
+        bins: npt.NDArray[np.uint8] | None = None,
+    ):
+        """
+        Exposes a generation as 'current_population', together with the best individual found so far.
+
+        :param costs: Values returned by :func:`evaluate()` for every chromosome.
+        :type costs: npt.NDArray[np.float64].
+        :param real: Real chromosomes, or None if the evaluator has none.
+        :type real: npt.NDArray[np.float64] | None.
+        :param bins: Packed binary chromosomes, or None if the evaluator has none.
+        :type bins: npt.NDArray[np.uint8] | None.
+        :returns: None.
+        """
+
+        population = self.__individuals(real, bins)
+        sign = -1.0 if self.evaluator.extremum() == GaExtremum.MAXIMUM else 1.0
+        for indiv, cost in zip(population, costs):
+            indiv.value = float(sign * cost)
+
+        best = int(np.argmin(costs))
+        if self.__best is None or costs[best] < self.__best[0]:
+            self.__best = (costs[best], copy.deepcopy(population[best]))
+        else:
+            population.append(copy.deepcopy(self.__best[1]))
+        self.current_population = population
+
+    @staticmethod
+    def __individuals(
+        real: npt.NDArray[np.float64] | None, bins: npt.NDArray[np.uint8] | None
+    ) -> List[GaIndividual]:
+        """
+        Internal: Creates individuals from rows of chromosome matrices, copied so that
+        later changes to the matrices do not affect them.
+        """
+
+        count = len(real) if real is not None else len(bins)
+        real = (
+            np.array(real, dtype=np.float64)
+            if real is not None
+            else np.empty((count, 0), dtype=np.float64)
+        )
+        bins = (
+            np.array(bins, dtype=np.uint8)
+            if bins is not None
+            else np.empty((count, 0), dtype=np.uint8)
+        )
+        return [
+            GaIndividual(real_chrom=real[i], bin_chrom=bins[i]) for i in range(count)
+        ]
+
+    def configuration(self) -> dict:
+        """
+        Returns every setting which determines the course of the simulation,
+        e.g. to compare or hash configurations. Engines extend it with their own parameters.
+
+        :returns: Dictionary mapping setting names to their values.
+        :rtype: dict
+        """
+
+        return {
+            "engine": type(self).__name__,
+            "population_size": self.population_size,
+            "max_generations": self.max_generations,
+            "seed": self.seed,
+            "real_clamp_strategy": self.real_clamp_strategy,
+            "evaluator": self.evaluator,
+            "inspector": self.inspector,
+        }
+
+    def __advance(self) -> bool:
+        """
+        Internal: Updates statistics, consults the inspector and checks the generation limit.
+
+        :returns: True if the simulation should continue.
+        """
+
+        self.statistic_engine.advance(self)
+        if self.inspector:
+            action = self.inspector.inspect(self.statistic_engine)
+            if action is GaAction.TERMINATE:
+                return False
+        return self.statistic_engine.generation <= self.max_generations
+
+    def run(self) -> GaResults:
+        """
+        Run entire simulation.
+
+        :returns: Object representing final result of the run.
+        :rtype: :class:`GaResults`.
+        """
+
+        self.verify()
+        np.random.seed(self.seed)
+        self.__best = None
+        if self.inspector:
+            self.inspector.initialize()
+        self.statistic_engine.start(self)
+        if self.workers > 1:
+            self.__pool = GaEvaluationPool(self.evaluator, self.workers)
+            self.__pool.start()
+        else:
+            self.evaluator.setup_worker()
+
+        try:
+            self.start()
+            while self.__advance():
+                self.step()
+        finally:
+            if self.__pool:
+                self.__pool.shutdown()
+                self.__pool = None
+
+        if self.inspector:
+            self.inspector.finish(self.statistic_engine)
+        return GaResults(self.statistic_engine)
+
+    def set_max_generations(self, count: int):
+        """
+        Setter method.
+
+        Set the maximum number of generations.
+
+        :param count: Number of generations.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.max_generations = count
+
+    def set_seed(self, seed: int):
+        """
+        Setter method.
+
+        Set the seed of the random number generator.
+
+        :param seed: Seed.
+        :type seed: int.
+        :returns: None.
+        """
+
+        self.seed = seed
+
+    def set_evaluator(self, evaluator: GaEvaluator):
+        """
+        Setter method.
+
+        Set the evaluator computing fitness values.
+
+        :param evaluator: Evaluator.
+        :type evaluator: :class:`GaEvaluator`.
+        :returns: None.
+        """
+
+        self.evaluator = evaluator
+
+    def set_inspector(self, inspector: GaInspector):
+        """
+        Setter method.
+
+        Set the inspector consulted after every generation.
+
+        :param inspector: Inspector.
+        :type inspector: :class:`GaInspector`.
+        :returns: None.
+        """
+
+        self.inspector = inspector
+
+    def set_real_clamp_strategy(self, strategy: GaClampStrategy):
+        """
+        Setter method.
+
+        Set the strategy restoring real genes to their domain.
+
+        :param strategy: Clamp strategy.
+        :type strategy: :class:`GaClampStrategy`.
+        :returns: None.
+        """
+
+        self.real_clamp_strategy = strategy
+
+    def set_workers(self, count: int):
+        """
+        Setter method.
+
+        Set the number of worker processes evaluating every generation,
+        1 evaluates in the calling process.
+
+        :param count: Number of worker processes.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.workers = count
+
+    def set_population_size(self, size: int):
+        """
+        Setter method.
+
+        Set the number of individuals in every generation.
+
+        :param size: Number of individuals.
+        :type size: int.
+        :returns: None.
+        """
+
+        self.population_size = size
@@ -0,0 +1,249 @@
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.engines.GaEngine import GaEngine
+from evolvekit.core.Ga.enums.GaSwarmTopology import GaSwarmTopology
+
+
+class ParticleSwarmIsland(GaEngine):
+    """
+    Particle Swarm Optimization on real valued chromosomes.
+
+    Positions, velocities and personal best positions of the swarm are kept
+    as matrices with one particle per row, and every iteration updates the
+    whole swarm at once::
+
+        v = inertia * v + cognitive * r1 * (personal_best - x) + social * r2 * (local_best - x)
+        x = x + v
+
+    where local_best is the best personal best position of the particle's
+    neighborhood in 'topology'. Neighborhoods are precomputed as an index
+    array with one row per particle, so finding every local best is a
+    single gather and argmin. Velocities are limited to 'velocity_limit'
+    times the width of the domain, and positions are restored to the domain
+    with 'real_clamp_strategy', after which velocities are set to the move
+    actually made.
+
+    Each iteration is one generation, evaluated as one batch or by worker
+    processes if 'workers' is greater than 1.
+    """
+
+    topology: GaSwarmTopology
+    inertia: float
+    cognitive: float
+    social: float
+    velocity_limit: float
+
+    def __init__(self):
+        super().__init__()
+        self.topology = GaSwarmTopology.GLOBAL
+        self.inertia = 0.7298
+        self.cognitive = 1.49618
+        self.social = 1.49618
+        self.velocity_limit = 0.2
+        self.__neighbors = None
+
+    def verify(self):
+        """
+        Self-verifies integrity of provided data.
+
+        :returns: None.
+        """
+
+        super().verify()
+
+        if not self.evaluator.real_domain() or self.evaluator.bin_length() > 0:
+            raise ValueError(
+                "Particle Swarm Optimization requires an evaluator with real chromosomes only."
+            )
+
+        if self.inertia < 0 or self.cognitive < 0 or self.social < 0:
+            raise ValueError(
+                "Inertia and acceleration coefficients cannot be negative."
+            )
+
+        if self.velocity_limit <= 0:
+            raise ValueError("Velocity limit must be greater than 0.")
+
+    @staticmethod
+    def neighbors(topology: GaSwarmTopology, size: int) -> npt.NDArray[np.int64] | None:
+        """
+        Computes neighborhoods of a swarm, every particle included in its own.
+
+        :param topology: Topology of the swarm.
+        :type topology: :class:`GaSwarmTopology`.
+        :param size: Number of particles.
+        :type size: int.
+        :returns: Indices of the neighbors of every particle, one row per particle,
+            or None for the global topology.
+        :rtype: npt.NDArray[np.int64] | None
+        """
+
+        particles = np.arange(size)
+        match topology:
+            case GaSwarmTopology.GLOBAL:
+                return None
+            case GaSwarmTopology.RING:
+                offsets = np.array([-1, 0, 1])
+                return (particles[:, np.newaxis] + offsets) % size
+            case GaSwarmTopology.VON_NEUMANN:
+                # The grid is as square as the number of particles allows.
+                rows = max(d for d in range(1, math.isqrt(size) + 1) if size % d == 0)
+                columns = size // rows
+                row, column = np.divmod(particles, columns)
+                return np.stack(
+                    [
+                        particles,
+                        (row - 1) % rows * columns + column,
+                        (row + 1) % rows * columns + column,
+                        row * columns + (column - 1) % columns,
+                        row * columns + (column + 1) % columns,
+                    ],
+                    axis=1,
+                )
+
+    def start(self):
+        """
+        Creates and evaluates a swarm spread uniformly over the domain.
+
+        :returns: None.
+        """
+
+        lower, upper = self.bounds()
+        shape = (self.population_size, len(lower))
+        self.__limit = self.velocity_limit * (upper - lower)
+        self.__neighbors = self.neighbors(self.topology, self.population_size)
+        self.__position = np.random.uniform(lower, upper, shape)
+        self.__velocity = np.random.uniform(-self.__limit, self.__limit, shape)
+        self.__costs = self.evaluate(self.__position)
+        self.__best_position = self.__position.copy()
+        self.__best_costs = self.__costs.copy()
+        self.publish(self.__costs, self.__position)
+
+    def step(self):
+        """
+        Moves and evaluates the whole swarm.
+
+        :returns: None.
+        """
+
+        shape = self.__position.shape
+        cognitive = self.__best_position - self.__position
+        social = self.__best_position[self.__local_best()] - self.__position
+        velocity = (
+            self.inertia * self.__velocity
+            + self.cognitive * np.random.random(shape) * cognitive
+            + self.social * np.random.random(shape) * social
+        )
+        self.__velocity = np.clip(velocity, -self.__limit, self.__limit)
+        position = self.clamp(self.__position + self.__velocity)
+        self.__velocity = position - self.__position
+        self.__position = position
+        self.__costs = self.evaluate(position)
+
+        improved = self.__costs < self.__best_costs
+        self.__best_position[improved] = position[improved]
+        self.__best_costs[improved] = self.__costs[improved]
+        self.publish(self.__costs, position)
+
+    def reevaluate(self):
+        """
+        Evaluates personal best positions again.
+
+        :returns: None.
+        """
+
+        self.__best_costs = self.evaluate(self.__best_position)
+
+    def __local_best(self) -> npt.NDArray[np.int64]:
+        """
+        Internal: Returns the index of the best personal best in the neighborhood of every particle.
+        """
+
+        if self.__neighbors is None:
+            return np.full(len(self.__best_costs), np.argmin(self.__best_costs))
+        best = np.argmin(self.__best_costs[self.__neighbors], axis=1)
+        return self.__neighbors[np.arange(len(best)), best]
+
+    def configuration(self) -> dict:
+        """
+        Returns every setting which determines the course of the simulation.
+
+        :returns: Dictionary mapping setting names to their values.
+        :rtype: dict
+        """
+
+        return super().configuration() | {
+            "topology": self.topology,
+            "inertia": self.inertia,
+            "cognitive": self.cognitive,
+            "social": self.social,
+            "velocity_limit": self.velocity_limit,
+        }
+
+    def set_topology(self, topology: GaSwarmTopology):
+        """
+        Setter method.
+
+        Set the neighborhoods of the swarm.
+
+        :param topology: Topology.
+        :type topology: :class:`GaSwarmTopology`.
+        :returns: None.
+        """
+
+        self.topology = topology
+
+    def set_inertia(self, inertia: float):
+        """
+        Setter method.
+
+        Set the weight of the previous velocity.
+
+        :param inertia: Inertia weight.
+        :type inertia: float.
+        :returns: None.
+        """
+
+        self.inertia = inertia
+
+    def set_cognitive(self, coefficient: float):
+        """
+        Setter method.
+
+        Set the acceleration towards the personal best position.
+
+        :param coefficient: Cognitive coefficient.
+        :type coefficient: float.
+        :returns: None.
+        """
+
+        self.cognitive = coefficient
+
+    def set_social(self, coefficient: float):
+        """
+        Setter method.
+
+        Set the acceleration towards the best position of the neighborhood.
+
+        :param coefficient: Social coefficient.
+        :type coefficient: float.
+        :returns: None.
+        """
+
+        self.social = coefficient
+
+    def set_velocity_limit(self, limit: float):
+        """
+        Setter method.
+
+        Set the largest velocity of a gene relative to the width of its domain.
+
+        :param limit: Velocity limit.
+        :type limit: float.
+        :returns: None.
+        """
+
+        self.velocity_limit = limit
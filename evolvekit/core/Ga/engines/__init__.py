@@ -0,0 +1,22 @@
+# GA Engines
+from evolvekit.core.Ga.engines.CmaEsIsland import CmaEsIsland
+from evolvekit.core.Ga.engines.CooperativeCoevolutionIsland import (
+    CooperativeCoevolutionIsland,
+)
+from evolvekit.core.Ga.engines.DifferentialEvolutionIsland import (
+    DifferentialEvolutionIsland,
+)
+from evolvekit.core.Ga.engines.EstimationOfDistributionIsland import (
+    EstimationOfDistributionIsland,
+)
+from evolvekit.core.Ga.engines.GaEngine import GaEngine
+from evolvekit.core.Ga.engines.ParticleSwarmIsland import ParticleSwarmIsland
+
+__all__ = [
+    "CmaEsIsland",
+    "CooperativeCoevolutionIsland",
+    "DifferentialEvolutionIsland",
+    "EstimationOfDistributionIsland",
+    "GaEngine",
+    "ParticleSwarmIsland",
+]
@@ -0,0 +1,20 @@
+from enum import Enum, auto
+
+
+class GaBanditPolicy(Enum):
+    """
+    Enum represents the policy by which an adaptive operator allocates offspring
+    among the operators of its pool, based on the quality of every operator:
+    a recency-weighted average of its normalized fitness improvements.
+
+    :cvar UCB: Upper confidence bound. The operator with the highest quality plus
+        an exploration bonus shrinking with the number of its offspring is chosen.
+    :cvar PROBABILITY_MATCHING: Operators are chosen with probabilities proportional
+        to their quality, no lower than a minimum probability.
+    :cvar ADAPTIVE_PURSUIT: The probability of the operator with the highest quality
+        is pursued towards a maximum, the others towards the minimum probability.
+    """
+
+    UCB = auto()
+    PROBABILITY_MATCHING = auto()
+    ADAPTIVE_PURSUIT = auto()
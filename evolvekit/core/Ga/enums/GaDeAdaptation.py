@@ -0,0 +1,20 @@
+from enum import Enum, auto
+
+
+class GaDeAdaptation(Enum):
+    """
+    Enum represents the way :class:`DifferentialEvolutionIsland` controls its
+    scale factor F and crossover rate CR.
+
+    :cvar NONE: F and CR are constant.
+    :cvar JADE: Every individual draws F from a Cauchy and CR from a normal
+        distribution around means, which move towards the Lehmer mean of
+        successful F and the mean of successful CR after every generation.
+    :cvar SHADE: Like JADE, but the means are drawn from a memory of
+        'memory_size' entries, each updated in turn with means of successful
+        parameters weighted by the improvement they achieved.
+    """
+
+    NONE = auto()
+    JADE = auto()
+    SHADE = auto()
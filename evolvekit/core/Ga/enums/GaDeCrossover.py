@@ -0,0 +1,17 @@
+from enum import Enum, auto
+
+
+class GaDeCrossover(Enum):
+    """
+    Enum represents the crossover of :class:`DifferentialEvolutionIsland`,
+    i.e. which genes of the trial vector are taken from the mutant vector.
+
+    :cvar BINOMIAL: Every gene is taken from the mutant with probability CR,
+        one random gene always is.
+    :cvar EXPONENTIAL: A run of consecutive genes, starting at a random gene and
+        wrapping around, is taken from the mutant. Every further gene continues
+        the run with probability CR.
+    """
+
+    BINOMIAL = auto()
+    EXPONENTIAL = auto()
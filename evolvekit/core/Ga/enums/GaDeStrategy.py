@@ -0,0 +1,18 @@
+from enum import Enum, auto
+
+
+class GaDeStrategy(Enum):
+    """
+    Enum represents the mutation strategy of :class:`DifferentialEvolutionIsland`,
+    i.e. how the mutant vector of every individual is built. F is the scale factor,
+    r1, r2 and r3 are distinct random individuals other than the current one.
+
+    :cvar RAND_1: Mutant is x_r1 + F * (x_r2 - x_r3).
+    :cvar BEST_1: Mutant is x_best + F * (x_r1 - x_r2).
+    :cvar CURRENT_TO_BEST_1: Mutant is x + F * (x_best - x) + F * (x_r1 - x_r2).
+        With adaptive parameters x_best is drawn from the best 'p_best' fraction of the population.
+    """
+
+    RAND_1 = auto()
+    BEST_1 = auto()
+    CURRENT_TO_BEST_1 = auto()
@@ -0,0 +1,21 @@
+from enum import Enum, auto
+
+
+class GaDeduplication(Enum):
+    """
+    Enum represents the way in which individuals with identical chromosomes,
+    evaluated together in one generation, are handled.
+
+    :cvar NONE: Every individual is evaluated, duplicates included.
+    :cvar SHARE: Every distinct chromosome is evaluated once and its value is
+        shared with all of its duplicates.
+    :cvar RANDOM: Duplicates are replaced with random individuals, which are
+        evaluated instead, to preserve diversity.
+    :cvar MUTATE: A single random gene of every duplicate is changed, so that
+        it is evaluated as a new individual close to the original.
+    """
+
+    NONE = auto()
+    SHARE = auto()
+    RANDOM = auto()
+    MUTATE = auto()
@@ -0,0 +1,21 @@
+from enum import Enum, auto
+
+
+class GaEdaModel(Enum):
+    """
+    Enum represents the algorithm by which :class:`EstimationOfDistributionIsland`
+    learns the probability of every bit being set.
+
+    :cvar COMPACT: Compact GA. Two individuals are sampled every generation and
+        every bit where they differ moves by 1 / 'population_size' towards the winner,
+        which simulates a GA with a population of that size.
+    :cvar PBIL: Population-Based Incremental Learning. Probabilities move by
+        'learning_rate' towards the bit frequencies of the best 'selection_rate'
+        fraction of 'population_size' samples.
+    :cvar UMDA: Univariate Marginal Distribution Algorithm. Probabilities are set to
+        the bit frequencies of the best 'selection_rate' fraction of 'population_size' samples.
+    """
+
+    COMPACT = auto()
+    PBIL = auto()
+    UMDA = auto()
@@ -0,0 +1,22 @@
+from enum import Enum, auto
+
+
+class GaEvolutionMode(Enum):
+    """
+    Enum represents the way in which a population is replaced
+    during the evolution loop.
+
+    :cvar GENERATIONAL: The whole population is replaced by offspring every
+        generation. Evaluation of a generation has to finish before the next
+        one is bred.
+    :cvar STEADY_STATE: Only a few individuals (see ``replacement_size``) are
+        bred at a time and they replace the worst individuals of the population.
+    :cvar ASYNC_STEADY_STATE: Steady-state evolution driven by a pool of worker
+        processes. A new offspring is submitted as soon as any evaluation
+        finishes and results are inserted into the population in the order
+        they arrive, so there is no generational barrier.
+    """
+
+    GENERATIONAL = auto()
+    STEADY_STATE = auto()
+    ASYNC_STEADY_STATE = auto()
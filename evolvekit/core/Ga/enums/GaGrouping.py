@@ -0,0 +1,16 @@
+from enum import Enum, auto
+
+
+class GaGrouping(Enum):
+    """
+    Enum represents the way genes of a real chromosome are decomposed into
+    groups evolved separately by cooperative coevolution.
+
+    :cvar RANDOM: Genes are shuffled and split into groups of equal size.
+    :cvar DIFFERENTIAL: Genes which interact, i.e. whose effects on the
+        fitness do not add up, are grouped together and the remaining,
+        separable genes are split into groups of equal size.
+    """
+
+    RANDOM = auto()
+    DIFFERENTIAL = auto()
@@ -0,0 +1,17 @@
+from enum import Enum, auto
+
+
+class GaRestartStrategy(Enum):
+    """
+    Enum represents the way a stagnating search is restarted from new random
+    individuals, while the best individual found so far is kept as the result.
+
+    :cvar NONE: The search is never restarted.
+    :cvar IPOP: Every restart multiplies the population size by 'population_growth'.
+    :cvar BIPOP: Restarts alternate between the IPOP regime and small populations
+        with random sizes and step sizes, whichever has used fewer evaluations.
+    """
+
+    NONE = auto()
+    IPOP = auto()
+    BIPOP = auto()
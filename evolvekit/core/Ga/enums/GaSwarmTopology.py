@@ -0,0 +1,18 @@
+from enum import Enum, auto
+
+
+class GaSwarmTopology(Enum):
+    """
+    Enum represents the neighborhood from which every particle of
+    :class:`ParticleSwarmIsland` takes the best position it is attracted to.
+
+    :cvar GLOBAL: Every particle is attracted to the best position of the swarm.
+    :cvar RING: Particles form a ring, every particle is attracted to the best
+        position of itself and its two neighbors.
+    :cvar VON_NEUMANN: Particles form a toroidal grid, every particle is attracted
+        to the best position of itself and its four neighbors.
+    """
+
+    GLOBAL = auto()
+    RING = auto()
+    VON_NEUMANN = auto()
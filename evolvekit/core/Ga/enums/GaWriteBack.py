@@ -0,0 +1,16 @@
+from enum import Enum, auto
+
+
+class GaWriteBack(Enum):
+    """
+    Enum represents the way results of local search are written back to
+    the refined individuals.
+
+    :cvar LAMARCKIAN: Individuals take the refined chromosomes along with their values.
+    :cvar BALDWINIAN: Individuals keep their chromosomes and take only the refined
+        values, so that selection favors individuals from which local search
+        finds good solutions.
+    """
+
+    LAMARCKIAN = auto()
+    BALDWINIAN = auto()
@@ -1,7 +1,34 @@
 # GA Enums
 from evolvekit.core.Ga.enums.GaAction import GaAction
+from evolvekit.core.Ga.enums.GaBanditPolicy import GaBanditPolicy
 from evolvekit.core.Ga.enums.GaClampStrategy import GaClampStrategy
+from evolvekit.core.Ga.enums.GaDeAdaptation import GaDeAdaptation
+from evolvekit.core.Ga.enums.GaDeCrossover import GaDeCrossover
+from evolvekit.core.Ga.enums.GaDeStrategy import GaDeStrategy
+from evolvekit.core.Ga.enums.GaDeduplication import GaDeduplication
+from evolvekit.core.Ga.enums.GaEdaModel import GaEdaModel
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.enums.GaGrouping import GaGrouping
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
+from evolvekit.core.Ga.enums.GaRestartStrategy import GaRestartStrategy
+from evolvekit.core.Ga.enums.GaSwarmTopology import GaSwarmTopology
+from evolvekit.core.Ga.enums.GaWriteBack import GaWriteBack
 
-__all__ = ["GaAction", "GaClampStrategy", "GaExtremum", "GaOpCategory"]
+__all__ = [
+    "GaAction",
+    "GaBanditPolicy",
+    "GaClampStrategy",
+    "GaDeAdaptation",
+    "GaDeCrossover",
+    "GaDeStrategy",
+    "GaDeduplication",
+    "GaEdaModel",
+    "GaEvolutionMode",
+    "GaExtremum",
+    "GaGrouping",
+    "GaOpCategory",
+    "GaRestartStrategy",
+    "GaSwarmTopology",
+    "GaWriteBack",
+]
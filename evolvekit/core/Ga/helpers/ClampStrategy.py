@@ -1,5 +1,6 @@
 from typing import Tuple, Callable
 import numpy as np
+import numpy.typing as npt
 
 from evolvekit.core.Ga.enums.GaClampStrategy import GaClampStrategy
 
@@ -48,3 +49,43 @@ def get_clamp_strategy(
     }
 
     return MAP_STRATEGY_NAME_TO_FUNCTION[strategy]
+
+
+def clamp_matrix(
+    strategy: GaClampStrategy,
+    values: npt.NDArray[np.float64],
+    lower: npt.NDArray[np.float64],
+    upper: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Applies :class:`GaClampStrategy` to every gene of a matrix of real chromosomes at once.
+    Genes inside their domain are left unchanged, the others are restored as by
+    :func:`get_clamp_strategy()`.
+
+    :param strategy: :class:`GaClampStrategy` value.
+    :param values: Chromosomes, one per row.
+    :param lower: Lower bound of every gene.
+    :param upper: Upper bound of every gene.
+    :returns: Matrix of restored chromosomes.
+    """
+
+    outside = (values < lower) | (values > upper)
+    if strategy == GaClampStrategy.NONE or not outside.any():
+        return values
+
+    match strategy:
+        case GaClampStrategy.CLAMP:
+            restored = np.clip(values, lower, upper)
+        case GaClampStrategy.BOUNCE:
+            range_size = upper - lower
+            normalized = (values - lower) % (2 * range_size)
+            normalized = np.where(
+                normalized > range_size, 2 * range_size - normalized, normalized
+            )
+            restored = lower + normalized
+        case GaClampStrategy.OVERFLOW:
+            restored = lower + (values - lower) % (upper - lower + 1)
+        case GaClampStrategy.RANDOM:
+            restored = np.random.uniform(lower, upper, values.shape)
+
+    return np.where(outside, restored, values)
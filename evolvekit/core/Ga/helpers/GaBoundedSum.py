@@ -0,0 +1,46 @@
+import math
+from typing import Callable
+
+
+def bounded_sum(
+    partial_sum: Callable[[int, int], float],
+    count: int,
+    cutoff: float | None,
+    offset: float = 0.0,
+    chunk_size: int | None = None,
+) -> float:
+    """
+    Accumulates a minimized objective made of nonnegative terms chunk by
+    chunk and stops once the sum exceeds ``cutoff``, e.g.
+    ``bounded_sum(lambda i, j: np.sum(x[i:j] ** 2), len(x), args.cutoff)``.
+
+    The remaining terms can only make the sum larger, so a value returned
+    early lies between the cutoff and the exact sum, as expected from
+    evaluators supporting bounded evaluation (see :class:`GaEvaluatorArgs`).
+
+    :param partial_sum: Returns the sum of terms from the first index up to, but excluding, the second one.
+    :type partial_sum: Callable[[int, int], float].
+    :param count: Number of terms.
+    :type count: int.
+    :param cutoff: Value after which accumulation stops, or None to compute the exact sum.
+    :type cutoff: float | None.
+    :param offset: Constant added to the sum.
+    :type offset: float.
+    :param chunk_size: Number of terms summed between comparisons with the cutoff,
+        by default an eighth of the terms, so that short sums stop early too.
+    :type chunk_size: int | None.
+    :returns: Exact sum, or a lower bound of it greater than the cutoff.
+    :rtype: float
+    """
+
+    if cutoff is None:
+        return float(offset + partial_sum(0, count))
+
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(count / 8))
+    total = offset
+    for start in range(0, count, chunk_size):
+        total += partial_sum(start, min(start + chunk_size, count))
+        if total > cutoff:
+            break
+    return float(total)
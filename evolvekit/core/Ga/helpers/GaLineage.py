@@ -0,0 +1,78 @@
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+
+Lineage = List[Tuple[int, float]]
+
+
+def mix_lineage(lineages: Sequence[Lineage], weights: Sequence[float]) -> Lineage:
+    """
+    Combines lineages of parents mixed with given coefficients into the lineage of their child.
+
+    Crossover operators call it with the lineages of the parents they
+    picked, so that the child refers to the parents' positions in the
+    selected population, e.g.
+    ``child.lineage = mix_lineage([p1.lineage, p2.lineage], [0.3, 0.7])``.
+
+    :param lineages: Lineage of every parent.
+    :type lineages: Sequence[List[Tuple[int, float]]].
+    :param weights: Mixing coefficient of every parent.
+    :type weights: Sequence[float].
+    :returns: Pairs of parent index and weight, one per distinct parent.
+    :rtype: List[Tuple[int, float]]
+    """
+
+    mixed = {}
+    for lineage, weight in zip(lineages, weights):
+        for index, share in lineage:
+            mixed[index] = mixed.get(index, 0.0) + float(weight) * share
+    return list(mixed.items())
+
+
+def project_lineage(
+    chrom: npt.NDArray[np.float64], parent_1: GaIndividual, parent_2: GaIndividual
+) -> Lineage:
+    """
+    Derives the lineage of a child whose genes were mixed independently,
+    from the position of its real chromosome projected on the line
+    through both parents.
+
+    :param chrom: Real chromosome of the child.
+    :type chrom: npt.NDArray[np.float64].
+    :param parent_1: First parent.
+    :type parent_1: :class:`GaIndividual`.
+    :param parent_2: Second parent.
+    :type parent_2: :class:`GaIndividual`.
+    :returns: Pairs of parent index and weight, one per distinct parent.
+    :rtype: List[Tuple[int, float]]
+    """
+
+    direction = np.asarray(parent_2.real_chrom) - np.asarray(parent_1.real_chrom)
+    length = np.dot(direction, direction)
+    if length == 0:
+        t = 0.5
+    else:
+        t = np.dot(np.asarray(chrom) - parent_1.real_chrom, direction) / length
+    return mix_lineage([parent_1.lineage, parent_2.lineage], [1 - t, t])
+
+
+def mark_changed_genes(individual: GaIndividual, indices: Iterable[int]):
+    """
+    Records real genes changed by a mutation operator, so that the
+    individual can be evaluated incrementally from its parent. Nothing is
+    recorded for individuals without a known parent.
+
+    :param individual: Mutated individual.
+    :type individual: :class:`GaIndividual`.
+    :param indices: Indices of changed real genes.
+    :type indices: Iterable[int].
+    :returns: None.
+    """
+
+    if individual.changed_genes is not None:
+        individual.changed_genes = np.union1d(
+            individual.changed_genes, np.fromiter(indices, dtype=np.intp)
+        )
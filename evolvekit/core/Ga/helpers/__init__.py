@@ -1,7 +1,21 @@
 # GA Helpers
-from evolvekit.core.Ga.helpers.ClampStrategy import get_clamp_strategy
+from evolvekit.core.Ga.helpers.ClampStrategy import clamp_matrix, get_clamp_strategy
+from evolvekit.core.Ga.helpers.GaBoundedSum import bounded_sum
+from evolvekit.core.Ga.helpers.GaLineage import (
+    mark_changed_genes,
+    mix_lineage,
+    project_lineage,
+)
 from evolvekit.core.Ga.helpers.GaGenerateRandomPopulation import (
     generate_random_population,
 )
 
-__all__ = ["get_clamp_strategy", "generate_random_population"]
+__all__ = [
+    "bounded_sum",
+    "clamp_matrix",
+    "get_clamp_strategy",
+    "generate_random_population",
+    "mark_changed_genes",
+    "mix_lineage",
+    "project_lineage",
+]
@@ -0,0 +1,234 @@
+from typing import Callable, List
+
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.enums.GaWriteBack import GaWriteBack
+
+
+class _GaBudgetExhausted(Exception):
+    """
+    Internal: Raised to stop an optimizer which asked for more evaluations than left in the budget.
+    """
+
+
+class _GaLocalRun:
+    """
+    Internal: Refinement of a single individual, which keeps the best
+    chromosomes evaluated so far and the number of evaluations left.
+    Costs are values negated when maximizing, so lower is always better.
+    """
+
+    def __init__(
+        self,
+        indiv: GaIndividual,
+        sign: float,
+        budget: int,
+        evaluate: Callable[[List[GaIndividual]], None],
+    ):
+        self.real = np.copy(indiv.real_chrom)
+        self.bins = np.copy(indiv.bin_chrom)
+        self.value = indiv.value
+        self.cost = sign * indiv.value
+        self.improved = False
+        self.sign = sign
+        self.remaining = budget
+        self.evaluate = evaluate
+
+    def costs(
+        self, real: npt.NDArray[np.float64], bins: npt.NDArray[np.uint8]
+    ) -> npt.NDArray[np.float64]:
+        """
+        Internal: Evaluates chromosomes given as rows of matrices as one batch and returns their costs.
+        """
+
+        if len(real) > self.remaining:
+            raise _GaBudgetExhausted()
+        individuals = [
+            GaIndividual(np.copy(r), np.copy(b), 0.0) for r, b in zip(real, bins)
+        ]
+        self.evaluate(individuals)
+        self.remaining -= len(individuals)
+
+        values = np.array([indiv.value for indiv in individuals], dtype=np.float64)
+        costs = self.sign * values
+        best = int(np.argmin(costs))
+        if costs[best] < self.cost:
+            self.real = individuals[best].real_chrom
+            self.bins = individuals[best].bin_chrom
+            self.value = float(values[best])
+            self.cost = costs[best]
+            self.improved = True
+        return costs
+
+
+class GaLocalSearch:
+    """
+    Memetic refinement stage of :class:`GaIsland`.
+
+    Every 'interval' generations, once the population is evaluated, the
+    best 'count' individuals which were not refined before are improved by
+    a local optimizer using at most 'budget' evaluations each. Real
+    chromosomes are refined by :func:`scipy.optimize.minimize` with
+    'method' within the bounds of the real domain, binary chromosomes by a
+    bit-flip hill climber, one after the other for mixed chromosomes.
+
+    Points asked for by the optimizers are evaluated by the island in
+    batches, so they are spread across its worker pool: with L-BFGS-B the
+    gradient is estimated by forward differences evaluated together with
+    the point, and the hill climber evaluates 'flips' single bit flips at
+    a time, every bit by default. Nelder-Mead asks for one point at a time.
+
+    'write_back' decides whether refined individuals take the refined
+    chromosomes or only their values, see :class:`GaWriteBack`.
+    """
+
+    METHODS = ("L-BFGS-B", "Nelder-Mead")
+
+    count: int
+    budget: int
+    method: str
+    write_back: GaWriteBack
+    interval: int
+    flips: int | None
+
+    def __init__(
+        self,
+        count: int = 1,
+        budget: int = 100,
+        method: str = "L-BFGS-B",
+        write_back: GaWriteBack = GaWriteBack.LAMARCKIAN,
+        interval: int = 1,
+        flips: int | None = None,
+    ):
+        """
+        Constructor method.
+
+        :param count: Number of best individuals refined in a generation.
+        :type count: int.
+        :param budget: Maximum number of evaluations spent refining a single individual.
+        :type budget: int.
+        :param method: Optimizer of real chromosomes, one of :attr:`METHODS`.
+        :type method: str.
+        :param write_back: Way results are written back to refined individuals.
+        :type write_back: :class:`GaWriteBack`.
+        :param interval: Number of generations between refinements.
+        :type interval: int.
+        :param flips: Number of bit flips evaluated at a time by the hill climber, every bit if None.
+        :type flips: int | None.
+        :returns: None.
+        :raises ValueError: If the method is unknown or a setting is out of range.
+        """
+
+        if method not in self.METHODS:
+            raise ValueError(f"Method must be one of {', '.join(self.METHODS)}.")
+        if count <= 0:
+            raise ValueError("Count must be greater than 0.")
+        if budget <= 0:
+            raise ValueError("Budget must be greater than 0.")
+        if interval <= 0:
+            raise ValueError("Interval must be greater than 0.")
+        if flips is not None and flips <= 0:
+            raise ValueError("Flips must be greater than 0.")
+
+        self.count = count
+        self.budget = budget
+        self.method = method
+        self.write_back = write_back
+        self.interval = interval
+        self.flips = flips
+
+    def refine(
+        self,
+        indiv: GaIndividual,
+        evaluator: GaEvaluator,
+        evaluate: Callable[[List[GaIndividual]], None],
+    ) -> GaIndividual | None:
+        """
+        Refines an evaluated individual with at most 'budget' evaluations.
+
+        :param indiv: Individual to refine, left unchanged.
+        :type indiv: :class:`GaIndividual`.
+        :param evaluator: Evaluator describing the chromosomes and the optimization criterion.
+        :type evaluator: :class:`GaEvaluator`.
+        :param evaluate: Function assigning true values to a batch of individuals.
+        :type evaluate: Callable[[List[GaIndividual]], None].
+        :returns: The best individual found, or None if no better one was found.
+        :rtype: :class:`GaIndividual` | None
+        """
+
+        sign = -1.0 if evaluator.extremum() == GaExtremum.MAXIMUM else 1.0
+        run = _GaLocalRun(indiv, sign, self.budget, evaluate)
+        try:
+            if evaluator.real_domain():
+                self.__refine_real(run, evaluator.real_domain())
+            if evaluator.bin_length() > 0:
+                self.__refine_binary(run, evaluator.bin_length())
+        except _GaBudgetExhausted:
+            pass
+
+        if not run.improved:
+            return None
+        return GaIndividual(run.real, run.bins, run.value)
+
+    def __refine_real(self, run: _GaLocalRun, domain: List[List[float]]):
+        """
+        Internal: Refines the real chromosome with scipy, the binary one stays fixed.
+        """
+
+        # scipy is imported on first use, it is slow to import.
+        from scipy.optimize import minimize
+
+        lower, upper = np.array(domain, dtype=np.float64).T
+        bins = run.bins
+        start = np.clip(run.real, lower, upper)
+
+        if self.method == "Nelder-Mead":
+            minimize(
+                lambda x: run.costs(x[np.newaxis, :], bins[np.newaxis, :])[0],
+                start,
+                method="Nelder-Mead",
+                bounds=list(zip(lower, upper)),
+                options={"maxfev": run.remaining},
+            )
+            return
+
+        def cost_and_gradient(x):
+            steps = np.sqrt(np.finfo(np.float64).eps) * np.maximum(1.0, np.abs(x))
+            # Steps beyond the upper bound are taken backwards.
+            steps = np.where(x + steps <= upper, steps, -steps)
+            points = np.vstack([x, x + np.diag(steps)])
+            costs = run.costs(points, np.repeat(bins[np.newaxis, :], len(points), 0))
+            return costs[0], (costs[1:] - costs[0]) / steps
+
+        minimize(
+            cost_and_gradient,
+            start,
+            jac=True,
+            method="L-BFGS-B",
+            bounds=list(zip(lower, upper)),
+            options={"maxfun": max(1, run.remaining // (len(start) + 1))},
+        )
+
+    def __refine_binary(self, run: _GaLocalRun, length: int):
+        """
+        Internal: Refines the binary chromosome by flipping single bits, the real one stays fixed.
+        Moves to the best improving flip of every batch and stops once no flip of the whole
+        chromosome improves it.
+        """
+
+        batch = length if self.flips is None else min(self.flips, length)
+        while run.remaining > 0:
+            count = min(batch, run.remaining)
+            bits = np.random.choice(length, count, replace=False)
+            bins = np.repeat(run.bins[np.newaxis, :], count, axis=0)
+            bins[np.arange(count), bits // 8] ^= (1 << (7 - bits % 8)).astype(np.uint8)
+            real = np.repeat(run.real[np.newaxis, :], count, axis=0)
+
+            cost = run.cost
+            run.costs(real, bins)
+            if run.cost >= cost and count == length:
+                return
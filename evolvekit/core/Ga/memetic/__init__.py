@@ -0,0 +1,4 @@
+# GA Memetic Algorithms
+from evolvekit.core.Ga.memetic.GaLocalSearch import GaLocalSearch
+
+__all__ = ["GaLocalSearch"]
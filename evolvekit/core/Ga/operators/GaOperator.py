@@ -23,6 +23,46 @@ class GaOperator(ABC):
         """
         pass
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Optional method that can be overridden by mutation operators which record every real gene
+        they change with :func:`mark_changed_genes()`. Offspring mutated by other operators are
+        evaluated from scratch instead of incrementally.
+
+        :returns: True if the operator records changed genes.
+        :rtype: bool
+        """
+        return False
+
+    def comparison_only(self) -> bool:
+        """
+        Optional method that can be overridden by selection operators which only compare fitness
+        values of individuals, e.g. tournaments and truncation. Such operators rank an individual
+        worse than a cutoff correctly against every individual better than the cutoff when it carries
+        a bound instead of its exact fitness, which is required by bounded evaluation (see
+        :func:`GaIsland.set_bounded_evaluation()`). Individuals carrying bounds are ranked among
+        themselves by their bounds.
+
+        :returns: True if the operator only compares fitness values.
+        :rtype: bool
+        """
+        return False
+
+    def feedback(self, offspring: List[GaIndividual], improvements: List[float]):
+        """
+        Optional method that can be overridden by operators which learn from the results of their
+        offspring, e.g. adaptive operators recording the 'arms' they chose. It is called with every
+        offspring evaluated after being created by an adaptive operator, and how much better than
+        its parents each one is.
+
+        :param offspring: Evaluated offspring.
+        :type offspring: List[GaIndividual]
+        :param improvements: Improvement of every offspring over its 'reference_value',
+            positive if it is better whether the fitness is minimized or maximized.
+        :type improvements: List[float]
+        """
+        pass
+
     @abstractmethod
     def category(self) -> GaOpCategory:
         """
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+
+
+@dataclass
+class GaEvaluationPolicy:
+    """
+    Data class describing how evaluation failures are handled.
+
+    An evaluation fails when the evaluator raises an exception, when the
+    worker process evaluating it dies, or when it takes longer than
+    ``timeout`` seconds. A failed evaluation is repeated up to
+    ``max_retries`` times; when it keeps failing, the individual receives
+    the ``penalty`` fitness instead of stopping the simulation.
+
+    Timeouts and worker recycling require evaluation in worker processes,
+    so setting any of them makes :class:`GaIsland` start a worker pool even
+    when a single worker is configured.
+
+    :ivar timeout: Maximum duration of a single evaluation in seconds, no limit if None.
+    :ivar max_retries: Number of times a failed evaluation is repeated.
+    :ivar penalty: Fitness assigned when all attempts fail. If None, the worst
+        possible value is used (infinity when minimizing, minus infinity when
+        maximizing).
+    :ivar max_tasks_per_worker: Number of evaluations after which a worker
+        process is replaced by a fresh one, never if None.
+    :ivar max_memory_growth: Growth of a worker's resident memory in bytes,
+        measured from its first evaluation, after which the worker is
+        replaced by a fresh one, never if None.
+    """
+
+    timeout: float | None = field(default=None)
+    max_retries: int = field(default=0)
+    penalty: float | None = field(default=None)
+    max_tasks_per_worker: int | None = field(default=None)
+    max_memory_growth: int | None = field(default=None)
+
+    def penalty_value(self, extremum: GaExtremum) -> float:
+        """
+        Returns the fitness assigned to individuals whose evaluation failed.
+
+        :param extremum: Optimization criterion of the posited problem.
+        :type extremum: :class:`GaExtremum`.
+        :returns: Penalty fitness value.
+        :rtype: float
+        """
+
+        if self.penalty is not None:
+            return self.penalty
+        return float("-inf") if extremum == GaExtremum.MAXIMUM else float("inf")
+
+    def requires_workers(self) -> bool:
+        """
+        Checks whether the policy can only be enforced in worker processes.
+
+        :returns: True if a timeout or worker recycling is configured.
+        :rtype: bool
+        """
+
+        return (
+            self.timeout is not None
+            or self.max_tasks_per_worker is not None
+            or self.max_memory_growth is not None
+        )
@@ -0,0 +1,524 @@
+import math
+import multiprocessing
+import os
+import resource
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import Deque, Dict, Hashable, List, Tuple
+
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.parallel.GaEvaluationPolicy import GaEvaluationPolicy
+
+_RESULT = "result"
+_STEAL = "steal"
+_STOLEN = "stolen"
+
+
+def _resident_memory() -> int:
+    """
+    Internal: Returns resident memory of the current process in bytes.
+    Falls back to peak resident memory where /proc is not available.
+    """
+
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _worker_main(evaluator: GaEvaluator, connection: Connection):
+    """
+    Internal: Entry point of a single evaluation worker process.
+
+    The worker receives chunks of ``(key, individual)`` tasks and
+    answers every task separately with a ``(_RESULT, key, value, error,
+    latency, memory)`` tuple. Messages are received by a background thread,
+    so a ``_STEAL`` request is answered even during a long evaluation: the
+    worker gives up the later half of its unstarted tasks and answers with
+    ``(_STOLEN, keys)``. It stops after receiving ``None`` or when its
+    connection gets closed.
+
+    :param evaluator: Evaluator used to compute fitness values.
+    :param connection: Worker side of the pipe connected to the pool.
+    :returns: None.
+    """
+
+    tasks = deque()
+    available = threading.Condition()
+    stopped = False
+
+    def receive():
+        nonlocal stopped
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                message = None
+            with available:
+                if message is None:
+                    stopped = True
+                elif message == _STEAL:
+                    stolen = [tasks.pop()[0] for _ in range((len(tasks) + 1) // 2)]
+                    connection.send((_STOLEN, stolen))
+                else:
+                    tasks.extend(message)
+                available.notify()
+            if message is None:
+                return
+
+    evaluator.setup_worker()
+    threading.Thread(target=receive, daemon=True).start()
+    while True:
+        with available:
+            while not tasks and not stopped:
+                available.wait()
+            if stopped:
+                break
+            key, individual = tasks.popleft()
+
+        started = time.perf_counter()
+        try:
+            args = GaEvaluatorArgs(individual)
+            if args.changed_genes is None:
+                value = evaluator.evaluate(args)
+            else:
+                value = evaluator.evaluate_delta(args)
+            error = None
+        except Exception:
+            value = None
+            error = traceback.format_exc()
+        latency = time.perf_counter() - started
+        with available:
+            connection.send((_RESULT, key, value, error, latency, _resident_memory()))
+
+
+class _GaTask:
+    """
+    Internal: A single evaluation request together with its failed attempts.
+    """
+
+    def __init__(self, key: Hashable, individual: GaIndividual):
+        self.key = key
+        self.individual = individual
+        self.attempts = 0
+
+
+class _GaWorker:
+    """
+    Internal: Bookkeeping record of a single worker process.
+
+    Tasks sent to the worker are kept in order, the first one is the task
+    being evaluated since 'started'.
+    """
+
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        self.tasks: Dict[Hashable, _GaTask] = {}
+        self.started = 0.0
+        self.completed = 0
+        self.memory = 0
+        self.baseline_memory: int | None = None
+        self.stealing = False
+
+    def idle(self) -> bool:
+        """
+        Internal: Checks whether the worker can receive new tasks.
+        """
+
+        return not self.tasks and not self.stealing
+
+
+class GaEvaluationPool:
+    """
+    Pool of long-lived worker processes evaluating individuals in parallel.
+
+    The evaluator is handed to every worker once, when the worker starts,
+    and :func:`GaEvaluator.setup_worker()` is called there before the first
+    evaluation. Afterwards only chromosomes and fitness values travel between
+    processes.
+
+    Idle workers receive chunks of queued tasks. Chunks are sized from the
+    observed evaluation latency, so that cheap evaluations are sent in
+    batches taking about ``chunk_time`` seconds while expensive ones are
+    sent one at a time, and never exceed an equal share of the queue. When
+    the queue runs empty, an idle worker steals the later half of the
+    unstarted tasks of the busiest worker, so a few slow evaluations
+    do not leave the remaining workers waiting. Latencies of individual
+    evaluations are available through :func:`drain_latencies()`.
+
+    Without a :class:`GaEvaluationPolicy`, a failed evaluation raises
+    :class:`RuntimeError`. With a policy, failed evaluations are retried
+    and finally receive the penalty fitness and are marked 'failed', hung
+    workers are killed after the timeout and workers are recycled as
+    configured. The numbers of failed and timed out attempts are available
+    in :attr:`failures` and :attr:`timeouts`.
+    """
+
+    failures: int
+    timeouts: int
+
+    def __init__(
+        self,
+        evaluator: GaEvaluator,
+        workers: int,
+        policy: GaEvaluationPolicy | None = None,
+        chunk_time: float = 0.05,
+    ):
+        """
+        Constructor method.
+
+        :param evaluator: Evaluator used to compute fitness values.
+        :type evaluator: :class:`GaEvaluator`.
+        :param workers: Number of worker processes.
+        :type workers: int.
+        :param policy: Handling of failed evaluations, failures raise if None.
+        :type policy: :class:`GaEvaluationPolicy` | None.
+        :param chunk_time: Targeted duration of a chunk of tasks in seconds.
+        :type chunk_time: float.
+        :raises ValueError: If the number of workers is lower than 1.
+        """
+
+        if workers < 1:
+            raise ValueError("Number of workers must be greater than 0.")
+
+        self.evaluator = evaluator
+        self.workers = workers
+        self.policy = policy
+        self.chunk_time = chunk_time
+        self.failures = 0
+        self.timeouts = 0
+        self.__context = multiprocessing.get_context()
+        self.__workers: List[_GaWorker] = []
+        self.__queue: Deque[_GaTask] = deque()
+        self.__results: List[Tuple[Hashable, float]] = []
+        self.__latencies: List[float] = []
+        self.__latency: float | None = None
+        self.__in_flight = 0
+
+    def __enter__(self) -> "GaEvaluationPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.shutdown()
+
+    def __spawn_worker(self) -> _GaWorker:
+        """
+        Internal: Starts a new worker process.
+        """
+
+        parent_connection, child_connection = self.__context.Pipe()
+        process = self.__context.Process(
+            target=_worker_main,
+            args=(self.evaluator, child_connection),
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        return _GaWorker(process, parent_connection)
+
+    def __replace_worker(self, worker: _GaWorker, kill: bool):
+        """
+        Internal: Stops given worker and starts a fresh one in its place.
+        Tasks the worker did not finish are put back at the front of the queue.
+        """
+
+        self.__queue.extendleft(reversed(list(worker.tasks.values())))
+        worker.tasks = {}
+        if kill:
+            worker.process.kill()
+        else:
+            try:
+                worker.connection.send(None)
+            except (BrokenPipeError, OSError):
+                worker.process.kill()
+        worker.process.join()
+        worker.connection.close()
+        self.__workers[self.__workers.index(worker)] = self.__spawn_worker()
+
+    def __chunk_size(self, worker: _GaWorker) -> int:
+        """
+        Internal: Returns the number of queued tasks to send to an idle worker.
+        """
+
+        size = math.ceil(len(self.__queue) / self.workers)
+        if self.__latency is None:
+            size = 1
+        elif self.__latency > 0:
+            size = min(size, max(1, int(self.chunk_time / self.__latency)))
+        if self.policy is not None and self.policy.max_tasks_per_worker is not None:
+            size = min(size, self.policy.max_tasks_per_worker - worker.completed)
+        return max(1, size)
+
+    def __dispatch(self):
+        """
+        Internal: Hands queued tasks over to idle workers, or lets idle
+        workers steal unstarted tasks from busy ones when the queue is empty.
+        """
+
+        idle = [worker for worker in self.__workers if worker.idle()]
+        while idle and self.__queue:
+            worker = idle.pop(0)
+            chunk = [
+                self.__queue.popleft()
+                for _ in range(min(self.__chunk_size(worker), len(self.__queue)))
+            ]
+            worker.tasks = {task.key: task for task in chunk}
+            worker.started = time.monotonic()
+            worker.connection.send([(task.key, task.individual) for task in chunk])
+
+        victims = sorted(
+            (
+                worker
+                for worker in self.__workers
+                if len(worker.tasks) > 1 and not worker.stealing
+            ),
+            key=lambda worker: len(worker.tasks),
+            reverse=True,
+        )
+        for victim in victims[: len(idle)]:
+            victim.stealing = True
+            victim.connection.send(_STEAL)
+
+    def __finish(self, task: _GaTask, value: float):
+        """
+        Internal: Stores the final result of a task.
+        """
+
+        self.__in_flight -= 1
+        self.__results.append((task.key, value))
+
+    def __fail(self, task: _GaTask, reason: str):
+        """
+        Internal: Retries a failed task or assigns it the penalty fitness.
+
+        :raises RuntimeError: If no evaluation policy is set.
+        """
+
+        if self.policy is None:
+            raise RuntimeError(reason)
+
+        self.failures += 1
+        task.attempts += 1
+        if task.attempts > self.policy.max_retries:
+            task.individual.failed = True
+            self.__finish(task, self.policy.penalty_value(self.evaluator.extremum()))
+        else:
+            self.__queue.appendleft(task)
+
+    def __exhausted(self, worker: _GaWorker) -> bool:
+        """
+        Internal: Checks whether an idle worker should be recycled according to the policy.
+        """
+
+        if self.policy is None or not worker.idle():
+            return False
+        if (
+            self.policy.max_tasks_per_worker is not None
+            and worker.completed >= self.policy.max_tasks_per_worker
+        ):
+            return True
+        return (
+            self.policy.max_memory_growth is not None
+            and worker.memory - worker.baseline_memory > self.policy.max_memory_growth
+        )
+
+    def __receive(self, worker: _GaWorker):
+        """
+        Internal: Handles a message or a crash of given worker.
+        """
+
+        try:
+            message = worker.connection.recv()
+        except EOFError:
+            exitcode = worker.process.exitcode
+            if not worker.tasks:
+                self.__replace_worker(worker, kill=True)
+                return
+            task = worker.tasks.pop(next(iter(worker.tasks)))
+            self.__replace_worker(worker, kill=True)
+            self.__fail(
+                task,
+                f"Evaluation worker terminated unexpectedly (exit code: {exitcode}).",
+            )
+            return
+
+        if message[0] == _STOLEN:
+            worker.stealing = False
+            for key in message[1]:
+                self.__queue.appendleft(worker.tasks.pop(key))
+        else:
+            _, key, value, error, latency, memory = message
+            task = worker.tasks.pop(key)
+            worker.started = time.monotonic()
+            worker.completed += 1
+            worker.memory = memory
+            if worker.baseline_memory is None:
+                worker.baseline_memory = memory
+            self.__latencies.append(latency)
+            if self.__latency is None:
+                self.__latency = latency
+            else:
+                self.__latency = 0.8 * self.__latency + 0.2 * latency
+            if error is not None:
+                self.__fail(task, f"Evaluation failed in worker process:\n{error}")
+            else:
+                self.__finish(task, value)
+
+        if self.__exhausted(worker):
+            self.__replace_worker(worker, kill=False)
+
+    def __expire(self):
+        """
+        Internal: Kills workers whose current evaluation exceeded the timeout.
+        """
+
+        now = time.monotonic()
+        for worker in list(self.__workers):
+            if not worker.tasks or now - worker.started < self.policy.timeout:
+                continue
+            task = worker.tasks.pop(next(iter(worker.tasks)))
+            self.timeouts += 1
+            self.__replace_worker(worker, kill=True)
+            self.__fail(
+                task, f"Evaluation exceeded the timeout of {self.policy.timeout} s."
+            )
+
+    def __enqueue(self, key: Hashable, individual: GaIndividual):
+        """
+        Internal: Adds a task to the queue without dispatching it.
+        """
+
+        self.__queue.append(_GaTask(key, individual))
+        self.__in_flight += 1
+
+    def start(self):
+        """
+        Starts worker processes. Calling it on a running pool has no effect.
+
+        :returns: None.
+        """
+
+        while len(self.__workers) < self.workers:
+            self.__workers.append(self.__spawn_worker())
+
+    def submit(self, key: Hashable, individual: GaIndividual):
+        """
+        Schedules evaluation of a single individual.
+
+        :param key: Unique identifier returned together with the result.
+        :type key: Hashable.
+        :param individual: Individual to evaluate.
+        :type individual: :class:`GaIndividual`.
+        :returns: None.
+        """
+
+        self.__enqueue(key, individual)
+        self.__dispatch()
+
+    def pending(self) -> int:
+        """
+        Returns the number of submitted tasks whose results were not collected yet.
+
+        :returns: Number of pending tasks.
+        :rtype: int
+        """
+
+        return self.__in_flight + len(self.__results)
+
+    def collect(self) -> List[Tuple[Hashable, float]]:
+        """
+        Waits until at least one submitted evaluation finishes and returns
+        every result available at that moment.
+
+        :returns: List of ``(key, value)`` tuples in order of completion.
+        :rtype: List[Tuple[Hashable, float]]
+        :raises RuntimeError: If a worker failed to evaluate an individual
+            or terminated unexpectedly and no evaluation policy is set.
+        """
+
+        timeout = self.policy.timeout if self.policy else None
+        while not self.__results and self.__in_flight:
+            self.__dispatch()
+            busy = {
+                worker.connection: worker
+                for worker in self.__workers
+                if worker.tasks or worker.stealing
+            }
+            remaining = None
+            # Workers answering a steal request may have no task left to time out.
+            oldest = min(
+                (worker.started for worker in busy.values() if worker.tasks),
+                default=None,
+            )
+            if timeout is not None and oldest is not None:
+                remaining = max(0.0, oldest + timeout - time.monotonic())
+
+            for connection in wait(list(busy), timeout=remaining):
+                self.__receive(busy[connection])
+            if timeout is not None:
+                self.__expire()
+
+        results, self.__results = self.__results, []
+        return results
+
+    def evaluate(self, individuals: List[GaIndividual]) -> List[float]:
+        """
+        Evaluates a list of individuals and waits for all of them.
+
+        :param individuals: Individuals to evaluate.
+        :type individuals: List[:class:`GaIndividual`].
+        :returns: Fitness values in the same order as ``individuals``.
+        :rtype: List[float]
+        """
+
+        values: Dict[int, float] = {}
+        for index, individual in enumerate(individuals):
+            self.__enqueue(index, individual)
+        while len(values) < len(individuals):
+            values.update(self.collect())
+        return [values[index] for index in range(len(individuals))]
+
+    def drain_latencies(self) -> List[float]:
+        """
+        Returns durations of evaluations finished since the previous call, in seconds.
+
+        :returns: Latencies measured inside worker processes, in order of completion.
+        :rtype: List[float]
+        """
+
+        latencies, self.__latencies = self.__latencies, []
+        return latencies
+
+    def shutdown(self):
+        """
+        Stops all workers. Queued tasks are dropped and workers that are
+        still evaluating are terminated.
+
+        :returns: None.
+        """
+
+        self.__queue.clear()
+        self.__results = []
+        self.__in_flight = 0
+        for worker in self.__workers:
+            if worker.idle():
+                try:
+                    worker.connection.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            else:
+                worker.process.terminate()
+        for worker in self.__workers:
+            worker.process.join()
+            worker.connection.close()
+        self.__workers = []
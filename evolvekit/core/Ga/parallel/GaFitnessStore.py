@@ -0,0 +1,263 @@
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+from typing import List, Sequence
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+
+
+class GaFitnessStore:
+    """
+    Persistent table of fitness values shared by runs and processes.
+
+    Values are kept in a SQLite database in write-ahead logging mode, so
+    any number of processes can read it while one of them writes. Every
+    value is keyed by a BLAKE2 hash of the chromosome bytes and ``tag``,
+    a version string of the evaluator which should be changed whenever
+    the fitness function changes. :class:`GaIsland` consults the store
+    before evaluating individuals and hands new values to a background
+    thread which writes them in batches, so writing never blocks
+    evolution. Values become visible to other readers once written, use
+    :func:`flush()` to wait for it. A value the writer failed to write is
+    reported by raising its error from the next call of :func:`put()`,
+    :func:`put_many()`, :func:`flush()` or :func:`close()`.
+
+    Pickling a :class:`GaFitnessStore` only transfers its path and tag.
+    Every process and thread opens its own connection on first use, so a
+    store can be shared by runs in a pool of worker processes.
+    """
+
+    path: str
+    tag: str
+    timeout: float
+
+    def __init__(self, path: str, tag: str = "", timeout: float = 30.0):
+        """
+        Constructor method.
+        Creates the database if it does not exist.
+
+        :param path: Path of the SQLite database file.
+        :type path: str.
+        :param tag: Version tag of the evaluator, part of every key.
+        :type tag: str.
+        :param timeout: Seconds to wait for a database locked by another writer.
+        :type timeout: float.
+        :returns: None.
+        """
+
+        self.path = path
+        self.tag = tag
+        self.timeout = timeout
+        self.__local = threading.local()
+        self.__queue = None
+        self.__writer = None
+        self.__error = None
+
+        connection = self.__connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS fitness (key BLOB PRIMARY KEY, value REAL)"
+        )
+        connection.commit()
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path, "tag": self.tag, "timeout": self.timeout}
+
+    def __setstate__(self, state: dict):
+        self.path = state["path"]
+        self.tag = state["tag"]
+        self.timeout = state["timeout"]
+        self.__local = threading.local()
+        self.__queue = None
+        self.__writer = None
+        self.__error = None
+
+    def __enter__(self) -> "GaFitnessStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        self.flush()
+        return self.__connection().execute("SELECT COUNT(*) FROM fitness").fetchone()[0]
+
+    def __connection(self) -> sqlite3.Connection:
+        """
+        Internal: Returns the connection of the calling thread, opening one
+        in every new process instead of reusing an inherited one.
+        """
+
+        if getattr(self.__local, "pid", None) != os.getpid():
+            self.__local.pid = os.getpid()
+            self.__local.connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self.__local.connection.execute("PRAGMA synchronous=NORMAL")
+        return self.__local.connection
+
+    def __write(self):
+        """
+        Internal: Writer thread storing queued values, one transaction per batch.
+        """
+
+        stop = False
+        while not stop:
+            rows = self.__queue.get()
+            done = 1
+            stop = rows is None
+            rows = list(rows or [])
+            while not stop:
+                try:
+                    batch = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+                done += 1
+                stop = batch is None
+                rows.extend(batch or [])
+
+            try:
+                if rows:
+                    connection = self.__connection()
+                    with connection:
+                        connection.executemany(
+                            "INSERT OR REPLACE INTO fitness VALUES (?, ?)", rows
+                        )
+            except Exception as error:
+                if self.__error is None:
+                    self.__error = error
+            finally:
+                for _ in range(done):
+                    self.__queue.task_done()
+
+        if getattr(self.__local, "pid", None) == os.getpid():
+            self.__local.connection.close()
+
+    def __raise_error(self):
+        """
+        Internal: Raises the first error of the writer thread since the last call.
+        """
+
+        error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def key(self, indiv: GaIndividual) -> bytes:
+        """
+        Computes the key of an individual's chromosomes.
+
+        :param indiv: Individual to compute the key for.
+        :type indiv: :class:`GaIndividual`.
+        :returns: 16-byte BLAKE2 digest.
+        :rtype: bytes
+        """
+
+        digest = hashlib.blake2b(self.tag.encode(), digest_size=16)
+        digest.update(len(indiv.real_chrom).to_bytes(8, "little"))
+        digest.update(indiv.real_chrom.astype("<f8").tobytes())
+        digest.update(indiv.bin_chrom.astype("u1").tobytes())
+        return digest.digest()
+
+    def get(self, indiv: GaIndividual) -> float | None:
+        """
+        Returns the stored fitness of an individual.
+
+        :param indiv: Individual to look up.
+        :type indiv: :class:`GaIndividual`.
+        :returns: Stored fitness value, or None if the individual is not stored.
+        :rtype: float | None
+        """
+
+        return self.get_many([indiv])[0]
+
+    def get_many(self, individuals: Sequence[GaIndividual]) -> List[float | None]:
+        """
+        Returns stored fitness values of many individuals with a single query.
+
+        :param individuals: Individuals to look up.
+        :type individuals: Sequence[:class:`GaIndividual`].
+        :returns: Stored fitness value, or None, for every individual.
+        :rtype: List[float | None]
+        """
+
+        keys = [self.key(indiv) for indiv in individuals]
+        found = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            found.update(
+                self.__connection().execute(
+                    "SELECT key, value FROM fitness WHERE key IN "
+                    f"({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return [found.get(key) for key in keys]
+
+    def put(self, indiv: GaIndividual, value: float):
+        """
+        Stores the fitness of an individual in the background.
+
+        :param indiv: Evaluated individual.
+        :type indiv: :class:`GaIndividual`.
+        :param value: Fitness value of the individual.
+        :type value: float.
+        :returns: None.
+        :raises Exception: Error of the writer thread failing to write earlier values.
+        """
+
+        self.put_many([indiv], [value])
+
+    def put_many(self, individuals: Sequence[GaIndividual], values: Sequence[float]):
+        """
+        Stores fitness values of many individuals in the background.
+
+        :param individuals: Evaluated individuals.
+        :type individuals: Sequence[:class:`GaIndividual`].
+        :param values: Fitness value of every individual.
+        :type values: Sequence[float].
+        :returns: None.
+        :raises Exception: Error of the writer thread failing to write earlier values.
+        """
+
+        self.__raise_error()
+        rows = [
+            (self.key(indiv), float(value)) for indiv, value in zip(individuals, values)
+        ]
+        if not rows:
+            return
+
+        if self.__writer is None or not self.__writer.is_alive():
+            self.__queue = queue.Queue()
+            self.__writer = threading.Thread(target=self.__write, daemon=True)
+            self.__writer.start()
+        self.__queue.put(rows)
+
+    def flush(self):
+        """
+        Waits until every value handed to the store is written.
+
+        :returns: None.
+        :raises Exception: Error of the writer thread failing to write a value.
+        """
+
+        if self.__writer is not None and self.__writer.is_alive():
+            self.__queue.join()
+        self.__raise_error()
+
+    def close(self):
+        """
+        Writes pending values, stops the writer thread and closes the
+        connection of the calling thread.
+
+        :returns: None.
+        :raises Exception: Error of the writer thread failing to write a value.
+        """
+
+        if self.__writer is not None and self.__writer.is_alive():
+            self.__queue.put(None)
+            self.__writer.join()
+        self.__writer = None
+        if getattr(self.__local, "pid", None) == os.getpid():
+            self.__local.connection.close()
+        self.__local = threading.local()
+        self.__raise_error()
@@ -0,0 +1,149 @@
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+
+class GaSharedArray:
+    """
+    Read-only NumPy array published once and shared by all worker processes.
+
+    The data lives either in a ``multiprocessing.shared_memory`` block or,
+    when ``path`` is given, in a memory-mapped ``.npy`` file. Pickling a
+    :class:`GaSharedArray` only transfers its shape, dtype and location,
+    so an evaluator holding large reference data in it can be sent to worker
+    processes cheaply. Workers attach to the data zero-copy on first access
+    to :attr:`array`, e.g. in :func:`GaEvaluator.setup_worker()`.
+
+    The process which published the array owns it and should call
+    :func:`close()` (or use the object as a context manager) once all workers
+    are done, which releases the shared memory block.
+    """
+
+    shape: Tuple[int, ...]
+    dtype: np.dtype
+    name: str | None
+    path: str | None
+
+    def __init__(self, array: npt.ArrayLike, path: str | None = None):
+        """
+        Constructor method.
+        Publishes a copy of ``array`` for other processes.
+
+        :param array: Data to publish.
+        :type array: npt.ArrayLike.
+        :param path: Optional path of a file backing the data. If omitted,
+            the data is placed in shared memory.
+        :type path: str | None.
+        :returns: None.
+        """
+
+        source = np.ascontiguousarray(array)
+        self.shape = source.shape
+        self.dtype = source.dtype
+        self.name = None
+        self.path = path
+        self.__memory = None
+        self.__owner = True
+
+        if path is not None:
+            mapped = np.lib.format.open_memmap(
+                path, mode="w+", dtype=self.dtype, shape=self.shape
+            )
+            mapped[...] = source
+            mapped.flush()
+            del mapped
+            self.__array = np.load(path, mmap_mode="r")
+        else:
+            self.__memory = SharedMemory(create=True, size=max(source.nbytes, 1))
+            self.name = self.__memory.name
+            self.__array = np.ndarray(
+                self.shape, dtype=self.dtype, buffer=self.__memory.buf
+            )
+            self.__array[...] = source
+            self.__array.flags.writeable = False
+
+    def __getstate__(self) -> dict:
+        return {
+            "shape": self.shape,
+            "dtype": self.dtype.str,
+            "name": self.name,
+            "path": self.path,
+        }
+
+    def __setstate__(self, state: dict):
+        self.shape = tuple(state["shape"])
+        self.dtype = np.dtype(state["dtype"])
+        self.name = state["name"]
+        self.path = state["path"]
+        self.__memory = None
+        self.__owner = False
+        self.__array = None
+
+    def cache_key(self) -> npt.NDArray:
+        """
+        Returns the published data, which identifies the array regardless
+        of where it is published, e.g. for :class:`GaResultCache`.
+
+        :returns: Read-only view of the published data.
+        :rtype: npt.NDArray
+        """
+
+        return self.array
+
+    def __enter__(self) -> "GaSharedArray":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def __attach(self):
+        """
+        Internal: Maps published data into the current process without copying it.
+        """
+
+        if self.path is not None:
+            self.__array = np.load(self.path, mmap_mode="r")
+            return
+
+        if sys.version_info >= (3, 13):
+            self.__memory = SharedMemory(name=self.name, track=False)
+        else:
+            # Worker processes share the resource tracker of the owner,
+            # so registering the block again is harmless there.
+            self.__memory = SharedMemory(name=self.name)
+        self.__array = np.ndarray(
+            self.shape, dtype=self.dtype, buffer=self.__memory.buf
+        )
+        self.__array.flags.writeable = False
+
+    @property
+    def array(self) -> npt.NDArray:
+        """
+        Read-only view of the published data.
+
+        :returns: Array backed by shared memory or by a memory-mapped file.
+        :rtype: npt.NDArray
+        """
+
+        if self.__array is None:
+            self.__attach()
+        return self.__array
+
+    def close(self):
+        """
+        Detaches the data from the current process. When called by the
+        owner, the shared memory block is released as well. A backing file
+        is never removed.
+
+        :returns: None.
+        """
+
+        self.__array = None
+        if self.__memory is not None:
+            self.__memory.close()
+            if self.__owner:
+                self.__memory.unlink()
+            self.__memory = None
@@ -0,0 +1,290 @@
+import struct
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+
+_REQUEST_HEADER = struct.Struct("<III")
+_RECORD_INDEX = struct.Struct("<I")
+_RESPONSE_HEADER = struct.Struct("<I")
+_RESPONSE_RECORD = struct.Struct("<Id")
+
+
+def _read_exact(stream, size: int) -> bytes:
+    """
+    Internal: Reads exactly 'size' bytes from a stream.
+
+    :raises EOFError: If the stream ends before enough bytes are read.
+    """
+
+    data = stream.read(size)
+    if data is None or len(data) < size:
+        raise EOFError("Evaluator process closed its output.")
+    return data
+
+
+class GaSubprocessEvaluator(GaEvaluator):
+    """
+    Evaluator delegating fitness calculation to long-lived external programs.
+
+    A pool of ``processes`` programs is started on first use and kept alive
+    between calls, so the start-up cost is paid once instead of once per
+    individual. Every call to :func:`evaluate_batch()` splits the batch
+    between the programs and streams it over their standard input.
+
+    All numbers are little-endian. A request consists of the header
+    ``(count: uint32, real_length: uint32, bin_length: uint32)`` followed by
+    ``count`` records, each made of ``index: uint32``, ``real_length`` float64
+    genes and ``bin_length`` bytes of packed binary chromosome. The program
+    answers on standard output with ``count: uint32`` followed by ``count``
+    records ``(index: uint32, value: float64)``. Records may be answered in
+    any order, results are put back in place using their index.
+
+    When a program crashes, it is restarted and its part of the batch is
+    sent again, at most ``max_restarts`` times per call. When a call does
+    not finish within ``timeout`` seconds, the programs still working on it
+    are killed, they are restarted on next use and :class:`TimeoutError` is
+    raised.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        extremum: GaExtremum,
+        real_domain: List[Tuple[float, float]] | None = None,
+        bin_length: int = 0,
+        processes: int = 1,
+        timeout: float | None = None,
+        max_restarts: int = 3,
+    ):
+        """
+        Constructor method.
+
+        :param command: Program and its arguments, as accepted by :class:`subprocess.Popen`.
+        :type command: Sequence[str].
+        :param extremum: Optimization criterion of the posited problem.
+        :type extremum: :class:`GaExtremum`.
+        :param real_domain: Domain of the real valued chromosome.
+        :type real_domain: List[Tuple[float, float]] | None.
+        :param bin_length: Bit length of the binary chromosome.
+        :type bin_length: int.
+        :param processes: Number of programs running in parallel.
+        :type processes: int.
+        :param timeout: Maximum duration of a single call in seconds, no limit if None.
+        :type timeout: float | None.
+        :param max_restarts: Maximum number of restarts after crashes during a single call.
+        :type max_restarts: int.
+        :raises ValueError: If the number of processes is lower than 1.
+        """
+
+        if processes < 1:
+            raise ValueError("Number of processes must be greater than 0.")
+
+        self.command = list(command)
+        self.processes = processes
+        self.timeout = timeout
+        self.max_restarts = max_restarts
+        self.__extremum = extremum
+        self.__real_domain = list(real_domain or [])
+        self.__bin_length = bin_length
+        self.__programs: List[subprocess.Popen | None] = []
+        self.__threads: ThreadPoolExecutor | None = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_GaSubprocessEvaluator__programs"] = []
+        state["_GaSubprocessEvaluator__threads"] = None
+        return state
+
+    def cache_key(self) -> object:
+        """
+        Returns the command and the settings which determine fitness values,
+        without the running programs.
+
+        :returns: Dictionary of settings.
+        :rtype: object
+        """
+
+        return {
+            "command": self.command,
+            "extremum": self.__extremum,
+            "real_domain": self.__real_domain,
+            "bin_length": self.__bin_length,
+            "timeout": self.timeout,
+            "max_restarts": self.max_restarts,
+        }
+
+    def __enter__(self) -> "GaSubprocessEvaluator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def extremum(self) -> GaExtremum:
+        """
+        Returns the optimization direction given in the constructor.
+
+        :returns: A value signaling whether to search for minimum or maximum.
+        """
+        return self.__extremum
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        """
+        Returns the domain of the real valued chromosome given in the constructor.
+
+        :returns: List of (lower, upper) tuples.
+        """
+        return self.__real_domain
+
+    def bin_length(self) -> int:
+        """
+        Returns the bit length of the binary chromosome given in the constructor.
+
+        :returns: A length in bits.
+        """
+        return self.__bin_length
+
+    def __program(self, slot: int) -> subprocess.Popen:
+        """
+        Internal: Returns a running program for given slot, starting it if needed.
+        """
+
+        program = self.__programs[slot]
+        if program is None or program.poll() is not None:
+            program = subprocess.Popen(
+                self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            self.__programs[slot] = program
+        return program
+
+    def __kill(self, slot: int):
+        """
+        Internal: Kills the program in given slot, it will be restarted on next use.
+        """
+
+        program = self.__programs[slot]
+        self.__programs[slot] = None
+        if program is not None:
+            program.kill()
+            program.wait()
+            for stream in (program.stdin, program.stdout):
+                stream.close()
+
+    def __encode(self, args: List[GaEvaluatorArgs]) -> bytes:
+        """
+        Internal: Builds a request frame for a part of the batch.
+        """
+
+        real_length = len(self.__real_domain)
+        bin_bytes = (self.__bin_length + 7) // 8
+        frame = [_REQUEST_HEADER.pack(len(args), real_length, bin_bytes)]
+        for index, arg in enumerate(args):
+            frame.append(_RECORD_INDEX.pack(index))
+            frame.append(np.asarray(arg.real_chrom, dtype="<f8").tobytes())
+            frame.append(np.asarray(arg.bin_chrom, dtype=np.uint8).tobytes())
+        return b"".join(frame)
+
+    def __exchange(self, slot: int, args: List[GaEvaluatorArgs]) -> List[float]:
+        """
+        Internal: Sends a part of the batch to a program and reads its answer,
+        restarting the program if it crashes.
+        """
+
+        request = self.__encode(args)
+        restarts = 0
+        while True:
+            program = self.__program(slot)
+            try:
+                program.stdin.write(request)
+                program.stdin.flush()
+                (count,) = _RESPONSE_HEADER.unpack(
+                    _read_exact(program.stdout, _RESPONSE_HEADER.size)
+                )
+                payload = _read_exact(program.stdout, count * _RESPONSE_RECORD.size)
+                break
+            except (EOFError, BrokenPipeError, OSError, ValueError):
+                if self.__programs[slot] is not program:
+                    raise TimeoutError("Evaluator process was stopped.")
+                self.__kill(slot)
+                restarts += 1
+                if restarts > self.max_restarts:
+                    raise RuntimeError(
+                        f"Evaluator process crashed {restarts} times in a row."
+                    )
+
+        values: Dict[int, float] = dict(_RESPONSE_RECORD.iter_unpack(payload))
+        if sorted(values) != list(range(len(args))):
+            raise RuntimeError("Evaluator process returned mismatched record indices.")
+        return [values[index] for index in range(len(args))]
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Calculates the fitness value of a single solution using an external program.
+
+        :param args: Object representing a particular solution.
+        :returns: Fitness value of the solution.
+        :rtype: float
+        """
+        return self.evaluate_batch([args])[0]
+
+    def evaluate_batch(self, args: List[GaEvaluatorArgs]) -> List[float]:
+        """
+        Calculates fitness values for a batch of solutions using the external programs.
+
+        :param args: Objects representing solutions for the posited problem.
+        :returns: Fitness values in the same order as ``args``.
+        :rtype: List[float]
+        :raises TimeoutError: If the call did not finish within ``timeout`` seconds.
+        :raises RuntimeError: If a program kept crashing or answered with invalid data.
+        """
+
+        if not args:
+            return []
+        if not self.__programs:
+            self.__programs = [None] * self.processes
+            self.__threads = ThreadPoolExecutor(max_workers=self.processes)
+
+        chunks = np.array_split(np.arange(len(args)), min(self.processes, len(args)))
+        futures = {
+            self.__threads.submit(self.__exchange, slot, [args[i] for i in chunk]): slot
+            for slot, chunk in enumerate(chunks)
+        }
+        _, not_done = wait(futures, timeout=self.timeout)
+        if not_done:
+            for future in not_done:
+                self.__kill(futures[future])
+            wait(not_done)
+            raise TimeoutError(
+                f"Batch evaluation did not finish within {self.timeout} seconds."
+            )
+
+        values = []
+        for future in futures:
+            values.extend(future.result())
+        return values
+
+    def close(self):
+        """
+        Stops all external programs. They are started again on next use.
+
+        :returns: None.
+        """
+
+        for slot, program in enumerate(self.__programs):
+            if program is None:
+                continue
+            try:
+                program.stdin.close()
+                program.wait(timeout=1.0)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self.__kill(slot)
+        self.__programs = []
+        if self.__threads is not None:
+            self.__threads.shutdown()
+            self.__threads = None
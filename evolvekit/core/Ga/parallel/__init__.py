@@ -0,0 +1,14 @@
+# GA Parallel Evaluation
+from evolvekit.core.Ga.parallel.GaEvaluationPolicy import GaEvaluationPolicy
+from evolvekit.core.Ga.parallel.GaEvaluationPool import GaEvaluationPool
+from evolvekit.core.Ga.parallel.GaFitnessStore import GaFitnessStore
+from evolvekit.core.Ga.parallel.GaSharedArray import GaSharedArray
+from evolvekit.core.Ga.parallel.GaSubprocessEvaluator import GaSubprocessEvaluator
+
+__all__ = [
+    "GaEvaluationPolicy",
+    "GaEvaluationPool",
+    "GaFitnessStore",
+    "GaSharedArray",
+    "GaSubprocessEvaluator",
+]
@@ -0,0 +1,176 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+
+
+class GaSurrogate(ABC):
+    """
+    Abstract class representing a cheap model of the fitness function.
+
+    :class:`GaIsland` keeps an archive of truly evaluated individuals in
+    the surrogate and, once it holds 'min_samples' of them, pre-screens
+    offspring: the surrogate predicts their fitness, only the 'fraction'
+    with the most promising predictions is evaluated and the rest keeps
+    the predicted value, marked with :attr:`GaIndividual.estimated`. The
+    model is fitted again whenever 'retrain_interval' new individuals were
+    archived since the last fit. Individuals inserted one at a time in
+    asynchronous steady-state mode are archived but not screened.
+
+    To use it, derive your own class from it and implement :func:`fit()`
+    and :func:`predict()`. Chromosomes are passed as feature matrices with
+    genes of the real chromosome followed by bits of the binary one.
+    """
+
+    fraction: float
+    retrain_interval: int
+    min_samples: int
+    archive_size: int
+
+    def __init__(
+        self,
+        fraction: float = 0.5,
+        retrain_interval: int = 1,
+        min_samples: int = 20,
+        archive_size: int = 1000,
+    ):
+        """
+        Constructor method.
+
+        :param fraction: Fraction of screened individuals sent to the evaluator.
+        :type fraction: float.
+        :param retrain_interval: Number of newly archived individuals after which the model is fitted again.
+        :type retrain_interval: int.
+        :param min_samples: Number of archived individuals needed before screening starts.
+        :type min_samples: int.
+        :param archive_size: Maximum number of archived individuals, the oldest are dropped first.
+        :type archive_size: int.
+        :returns: None.
+        """
+
+        if not 0 < fraction <= 1:
+            raise ValueError("Fraction must be greater than 0 and at most 1.")
+        if retrain_interval <= 0:
+            raise ValueError("Retrain interval must be greater than 0.")
+        if not 0 < min_samples <= archive_size:
+            raise ValueError("Min samples must be between 1 and archive size.")
+
+        self.fraction = fraction
+        self.retrain_interval = retrain_interval
+        self.min_samples = min_samples
+        self.archive_size = archive_size
+        self.__features = []
+        self.__values = []
+        self.__since_fit = None
+
+    @abstractmethod
+    def fit(self, x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]):
+        """
+        Fits the model to archived individuals.
+
+        :param x: Feature matrix, one row per individual.
+        :type x: npt.NDArray[np.float64].
+        :param y: Fitness value of every individual.
+        :type y: npt.NDArray[np.float64].
+        :returns: None.
+        """
+
+        pass
+
+    @abstractmethod
+    def predict(self, x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Predicts fitness values with the fitted model.
+
+        :param x: Feature matrix, one row per individual.
+        :type x: npt.NDArray[np.float64].
+        :returns: Predicted fitness value of every individual.
+        :rtype: npt.NDArray[np.float64]
+        """
+
+        pass
+
+    @staticmethod
+    def features(
+        individuals: Sequence[GaIndividual], bin_length: int | None = None
+    ) -> npt.NDArray[np.float64]:
+        """
+        Builds the feature matrix of individuals.
+
+        :param individuals: Individuals to describe.
+        :type individuals: Sequence[:class:`GaIndividual`].
+        :param bin_length: Number of bits of binary chromosomes, all packed bits are used if None.
+        :type bin_length: int | None.
+        :returns: Matrix with one row of genes per individual.
+        :rtype: npt.NDArray[np.float64]
+        """
+
+        return np.array(
+            [
+                np.concatenate(
+                    [ind.real_chrom, np.unpackbits(ind.bin_chrom, count=bin_length)]
+                )
+                for ind in individuals
+            ],
+            dtype=np.float64,
+        )
+
+    def archive(
+        self, individuals: Sequence[GaIndividual], bin_length: int | None = None
+    ):
+        """
+        Adds truly evaluated individuals to the training archive.
+        Individuals with non-finite fitness values are skipped.
+
+        :param individuals: Evaluated individuals.
+        :type individuals: Sequence[:class:`GaIndividual`].
+        :param bin_length: Number of bits of binary chromosomes, all packed bits are used if None.
+        :type bin_length: int | None.
+        :returns: None.
+        """
+
+        individuals = [ind for ind in individuals if np.isfinite(ind.value)]
+        if not individuals:
+            return
+
+        self.__features.extend(self.features(individuals, bin_length))
+        self.__values.extend(ind.value for ind in individuals)
+        del self.__features[: -self.archive_size]
+        del self.__values[: -self.archive_size]
+        if self.__since_fit is not None:
+            self.__since_fit += len(individuals)
+
+    def ready(self) -> bool:
+        """
+        Checks whether enough individuals were archived to start screening.
+
+        :returns: True if the archive holds at least 'min_samples' individuals.
+        :rtype: bool
+        """
+
+        return len(self.__values) >= self.min_samples
+
+    def estimate(
+        self, individuals: Sequence[GaIndividual], bin_length: int | None = None
+    ) -> List[float]:
+        """
+        Predicts fitness values of individuals, fitting the model first if it is stale.
+
+        :param individuals: Individuals to predict fitness for.
+        :type individuals: Sequence[:class:`GaIndividual`].
+        :param bin_length: Number of bits of binary chromosomes, all packed bits are used if None.
+        :type bin_length: int | None.
+        :returns: Predicted fitness value of every individual.
+        :rtype: List[float]
+        """
+
+        if self.__since_fit is None or self.__since_fit >= self.retrain_interval:
+            self.fit(np.array(self.__features), np.array(self.__values))
+            self.__since_fit = 0
+        return [
+            float(value)
+            for value in self.predict(self.features(individuals, bin_length))
+        ]
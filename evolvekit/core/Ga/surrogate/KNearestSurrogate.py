@@ -0,0 +1,50 @@
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.surrogate.GaSurrogate import GaSurrogate
+
+
+class KNearestSurrogate(GaSurrogate):
+    """
+    Surrogate predicting the inverse-distance weighted mean fitness of the
+    'k' nearest archived individuals. Fitting only stores the archive, so
+    it is cheap enough to be retrained every generation.
+    """
+
+    k: int
+
+    def __init__(self, k: int = 5, **kwargs):
+        """
+        Constructor method.
+
+        :param k: Number of neighbours.
+        :type k: int.
+        :param kwargs: Screening settings passed to :class:`GaSurrogate`.
+        :returns: None.
+        """
+
+        if k <= 0:
+            raise ValueError("Number of neighbours must be greater than 0.")
+
+        super().__init__(**kwargs)
+        self.k = k
+        self.__x = None
+        self.__y = None
+
+    def fit(self, x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]):
+        self.__x = x
+        self.__y = y
+
+    def predict(self, x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        distances = np.sqrt(
+            np.maximum(
+                np.sum(x**2, axis=1)[:, None]
+                + np.sum(self.__x**2, axis=1)[None, :]
+                - 2 * x @ self.__x.T,
+                0.0,
+            )
+        )
+        k = min(self.k, len(self.__y))
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        weights = 1.0 / (np.take_along_axis(distances, nearest, axis=1) + 1e-12)
+        return np.sum(weights * self.__y[nearest], axis=1) / np.sum(weights, axis=1)
@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from evolvekit.core.Ga.surrogate.GaSurrogate import GaSurrogate
+
+
+class RbfSurrogate(GaSurrogate):
+    """
+    Surrogate interpolating archived individuals with radial basis functions,
+    see :class:`scipy.interpolate.RBFInterpolator`. Fitting solves a dense
+    linear system in the number of archived individuals, so keep
+    'archive_size' in the hundreds or raise 'retrain_interval'.
+
+    Kernels such as the default thin plate spline add a polynomial tail,
+    which needs more archived individuals than there are genes. Until the
+    archive is that large, the model interpolates without the tail.
+
+    Kernels in :attr:`SHAPED_KERNELS` depend on the distance scaled by a
+    shape parameter 'epsilon', which has to be given for them.
+    """
+
+    KERNELS = (
+        "linear",
+        "thin_plate_spline",
+        "cubic",
+        "quintic",
+        "multiquadric",
+        "inverse_multiquadric",
+        "inverse_quadratic",
+        "gaussian",
+    )
+    SHAPED_KERNELS = KERNELS[4:]
+
+    # Degree of the polynomial tail scipy adds to kernels by default, 0 for others.
+    __DEGREES = {"thin_plate_spline": 1, "cubic": 1, "quintic": 2}
+
+    kernel: str
+    smoothing: float
+    epsilon: float | None
+
+    def __init__(
+        self,
+        kernel: str = "thin_plate_spline",
+        smoothing: float = 0.0,
+        epsilon: float | None = None,
+        **kwargs,
+    ):
+        """
+        Constructor method.
+
+        :param kernel: Radial basis function, one of :attr:`KERNELS`.
+        :type kernel: str.
+        :param smoothing: Smoothing parameter, 0 interpolates archived values exactly.
+        :type smoothing: float.
+        :param epsilon: Shape parameter, required by :attr:`SHAPED_KERNELS` and ignored by others.
+        :type epsilon: float | None.
+        :param kwargs: Screening settings passed to :class:`GaSurrogate`.
+        :returns: None.
+        :raises ValueError: If the kernel is unknown or its shape parameter is missing or not positive.
+        """
+
+        if kernel not in self.KERNELS:
+            raise ValueError(f"Kernel must be one of {', '.join(self.KERNELS)}.")
+        if kernel in self.SHAPED_KERNELS and epsilon is None:
+            raise ValueError(f"Kernel {kernel} requires epsilon.")
+        if epsilon is not None and epsilon <= 0:
+            raise ValueError("Epsilon must be greater than 0.")
+
+        super().__init__(**kwargs)
+        self.kernel = kernel
+        self.smoothing = smoothing
+        self.epsilon = epsilon
+        self.__model = None
+
+    def fit(self, x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]):
+        # scipy is imported on first use, it is slow to import.
+        from scipy.interpolate import RBFInterpolator
+
+        # Repeated chromosomes make the interpolation matrix singular.
+        x, unique = np.unique(x, axis=0, return_index=True)
+        degree = self.__DEGREES.get(self.kernel, 0)
+        if len(x) < math.comb(x.shape[1] + degree, degree):
+            degree = -1
+        self.__model = RBFInterpolator(
+            x,
+            y[unique],
+            kernel=self.kernel,
+            smoothing=self.smoothing,
+            epsilon=self.epsilon,
+            degree=degree,
+        )
+
+    def predict(self, x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return self.__model(x)
@@ -0,0 +1,6 @@
+# GA Surrogate Models
+from evolvekit.core.Ga.surrogate.GaSurrogate import GaSurrogate
+from evolvekit.core.Ga.surrogate.KNearestSurrogate import KNearestSurrogate
+from evolvekit.core.Ga.surrogate.RbfSurrogate import RbfSurrogate
+
+__all__ = ["GaSurrogate", "KNearestSurrogate", "RbfSurrogate"]
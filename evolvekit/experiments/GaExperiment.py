@@ -0,0 +1,286 @@
+import copy
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.GaResults import GaResults
+from evolvekit.core.Ga.operators.GaOperator import GaOperator
+from evolvekit.experiments.GaExperimentResults import GaExperimentResults
+from evolvekit.experiments.GaResultCache import GaResultCache
+
+
+def _label(value: Any) -> Any:
+    """
+    Internal: Returns the value stored in the results table for a configured value.
+    """
+
+    if isinstance(value, GaOperator):
+        return type(value).__name__
+    return value
+
+
+def _configure(island: GaIsland, configuration: Dict[str, Any], seed: int) -> GaIsland:
+    """
+    Internal: Returns a copy of the island with given configuration and seed.
+    """
+
+    island = copy.deepcopy(island)
+    for key, value in configuration.items():
+        if isinstance(value, GaOperator):
+            island.set_operator(copy.deepcopy(value))
+        else:
+            setattr(island, key, value)
+    island.set_seed(seed)
+    return island
+
+
+def _metrics(results: GaResults) -> dict:
+    """
+    Internal: Returns dictionary with the metrics of a run.
+    """
+
+    return {
+        "value": results.value,
+        "generations": results.total_generations,
+        "time": results.total_time,
+        "evaluations": results.total_evaluations,
+    }
+
+
+def _run_configuration(
+    island: GaIsland, configuration: Dict[str, Any], seed: int
+) -> dict:
+    """
+    Internal: Runs a copy of the island with given configuration and seed.
+
+    :returns: Dictionary with the metrics of the run.
+    """
+
+    return _metrics(_configure(island, configuration, seed).run())
+
+
+class GaExperiment:
+    """
+    Runs many configurations of a :class:`GaIsland` over many seeds.
+
+    Configurations are produced from a parameter grid or sampled from a
+    random search space. Every parameter is either the name of a
+    :class:`GaIsland` attribute, e.g. ``population_size`` or
+    ``mutation_prob``, or an arbitrary label whose values are
+    :class:`GaOperator` objects set with :func:`GaIsland.set_operator()`.
+    Every configuration is run once per seed on a copy of the base island,
+    in a pool of worker processes if more than one worker is set. With a
+    :class:`GaResultCache` set, runs found in the cache are not repeated,
+    so extending a sweep only computes the new configurations and seeds.
+    """
+
+    island: GaIsland
+    seeds: List[int]
+    workers: int
+    configurations: List[Dict[str, Any]]
+    cache: GaResultCache | None
+    tag: str
+
+    def __init__(self, island: GaIsland):
+        """
+        Constructor method.
+
+        :param island: Base island, configured with everything that is shared by all runs.
+        :type island: :class:`GaIsland`.
+        :returns: None.
+        """
+
+        self.island = island
+        self.seeds = [0]
+        self.workers = 1
+        self.configurations = [{}]
+        self.cache = None
+        self.tag = ""
+
+    def __verify(self):
+        """
+        Self-verifies integrity of provided data.
+
+        :returns: None.
+        """
+
+        if not self.seeds:
+            raise ValueError("Seed list cannot be empty.")
+
+        if self.workers <= 0:
+            raise ValueError("Number of workers must be greater than 0.")
+
+        if not self.configurations:
+            raise ValueError("Experiment needs at least one configuration.")
+
+        for configuration in self.configurations:
+            for key, value in configuration.items():
+                if not isinstance(value, GaOperator) and not hasattr(self.island, key):
+                    raise ValueError(f"GaIsland has no parameter named '{key}'.")
+
+    def set_seeds(self, seeds: Sequence[int]):
+        """
+        Setter method.
+
+        Set the seeds every configuration is run with.
+
+        :param seeds: Simulation seeds.
+        :type seeds: Sequence[int].
+        :returns: None.
+        """
+
+        self.seeds = list(seeds)
+
+    def set_workers(self, count: int):
+        """
+        Setter method.
+
+        Set the number of worker processes running simulations.
+        A value of 1 runs all simulations in the calling process.
+
+        :param count: Number of worker processes.
+        :type count: int.
+        :returns: None.
+        """
+
+        self.workers = count
+
+    def set_cache(self, cache: GaResultCache | None, tag: str = ""):
+        """
+        Setter method.
+
+        Set the cache of runs. Runs are looked up in and stored to it.
+
+        :param cache: Result cache, None disables caching.
+        :type cache: :class:`GaResultCache` | None.
+        :param tag: Version tag of the evaluator, see :class:`GaResultCache`.
+        :type tag: str.
+        :returns: None.
+        """
+
+        self.cache = cache
+        self.tag = tag
+
+    def set_grid(self, grid: Dict[str, Sequence[Any]]):
+        """
+        Setter method.
+
+        Set the configurations to every combination of given parameter values.
+
+        :param grid: Values to try for every parameter.
+        :type grid: Dict[str, Sequence[Any]].
+        :returns: None.
+        """
+
+        keys = list(grid)
+        self.configurations = [
+            dict(zip(keys, values))
+            for values in itertools.product(*(grid[key] for key in keys))
+        ]
+
+    def set_random_search(
+        self,
+        space: Dict[str, Sequence[Any] | Callable[[np.random.Generator], Any]],
+        samples: int,
+        seed: int = 0,
+    ):
+        """
+        Setter method.
+
+        Set the configurations to 'samples' configurations drawn at random.
+        Every parameter value is either picked uniformly from a sequence of
+        choices or drawn by a callable from a NumPy random generator, e.g.
+        ``lambda rng: rng.uniform(0.01, 0.2)``.
+
+        :param space: Choices or sampling function for every parameter.
+        :type space: Dict[str, Sequence[Any] | Callable[[np.random.Generator], Any]].
+        :param samples: Number of configurations.
+        :type samples: int.
+        :param seed: Seed of the generator drawing configurations.
+        :type seed: int.
+        :returns: None.
+        """
+
+        rng = np.random.default_rng(seed)
+        self.configurations = [
+            {
+                key: (
+                    choices(rng)
+                    if callable(choices)
+                    else choices[rng.integers(len(choices))]
+                )
+                for key, choices in space.items()
+            }
+            for _ in range(samples)
+        ]
+
+    def __run_cached(self, tasks: List[tuple]) -> List[dict]:
+        """
+        Internal: Runs tasks missing from the cache and returns metrics of every task.
+        """
+
+        islands = [_configure(self.island, c, seed) for _, c, seed in tasks]
+        keys = [GaResultCache.key(island, self.tag) for island in islands]
+        results = [self.cache.lookup(key) for key in keys]
+        missing = [i for i, entry in enumerate(results) if entry is None]
+
+        if self.workers == 1:
+            computed = [GaResultCache.record(islands[i]) for i in missing]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                computed = list(
+                    executor.map(GaResultCache.record, [islands[i] for i in missing])
+                )
+
+        for i, entry in zip(missing, computed):
+            self.cache.store(keys[i], *entry, tag=self.tag)
+            results[i] = entry
+        return [_metrics(entry[0]) for entry in results]
+
+    def run(self) -> GaExperimentResults:
+        """
+        Runs every configuration with every seed.
+
+        :returns: Table with the outcome of every run.
+        :rtype: :class:`GaExperimentResults`.
+        """
+
+        self.__verify()
+
+        tasks = [
+            (index, configuration, seed)
+            for index, configuration in enumerate(self.configurations)
+            for seed in self.seeds
+        ]
+        if self.cache is not None:
+            metrics = self.__run_cached(tasks)
+        elif self.workers == 1:
+            metrics = [
+                _run_configuration(self.island, configuration, seed)
+                for _, configuration, seed in tasks
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                metrics = list(
+                    executor.map(
+                        _run_configuration,
+                        itertools.repeat(self.island),
+                        [configuration for _, configuration, _ in tasks],
+                        [seed for _, _, seed in tasks],
+                    )
+                )
+
+        parameters = list(dict.fromkeys(key for c in self.configurations for key in c))
+        rows = [
+            {
+                "configuration": index,
+                **{key: _label(configuration.get(key)) for key in parameters},
+                "seed": seed,
+                **run_metrics,
+            }
+            for (index, configuration, seed), run_metrics in zip(tasks, metrics)
+        ]
+        return GaExperimentResults(parameters, rows)
@@ -0,0 +1,106 @@
+import csv
+from typing import Dict, List
+
+import numpy as np
+import numpy.typing as npt
+
+METRICS = ["value", "generations", "time", "evaluations"]
+
+
+class GaExperimentResults:
+    """
+    Columnar table with the outcome of every run of a :class:`GaExperiment`.
+
+    Every row describes a single run. The table contains the column
+    ``configuration`` with the index of the configuration, one column per
+    configured parameter, the column ``seed`` and one column per metric:
+    ``value`` (best fitness), ``generations``, ``time`` (processor time in
+    seconds) and ``evaluations``. Rows are ordered by configuration and seed.
+    """
+
+    columns: Dict[str, npt.NDArray]
+
+    def __init__(self, parameters: List[str], rows: List[dict]):
+        """
+        Constructor method.
+
+        :param parameters: Names of configured parameters.
+        :type parameters: List[str].
+        :param rows: One dictionary per run containing every column.
+        :type rows: List[dict].
+        :returns: None.
+        """
+
+        self.parameters = list(parameters)
+        self.columns = {
+            "configuration": np.array([row["configuration"] for row in rows], dtype=int)
+        }
+        for parameter in self.parameters:
+            self.columns[parameter] = np.array(
+                [row[parameter] for row in rows], dtype=object
+            )
+        self.columns["seed"] = np.array([row["seed"] for row in rows], dtype=int)
+        self.columns["value"] = np.array([row["value"] for row in rows], dtype=float)
+        self.columns["generations"] = np.array(
+            [row["generations"] for row in rows], dtype=int
+        )
+        self.columns["time"] = np.array([row["time"] for row in rows], dtype=float)
+        self.columns["evaluations"] = np.array(
+            [row["evaluations"] for row in rows], dtype=int
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns["configuration"])
+
+    def __getitem__(self, column: str) -> npt.NDArray:
+        return self.columns[column]
+
+    def summary(self) -> Dict[str, npt.NDArray]:
+        """
+        Summarizes runs of every configuration across seeds.
+
+        The returned table contains one row per configuration with the
+        columns ``configuration``, one column per configured parameter,
+        ``runs`` and, for every metric, the columns ``<metric>_mean``,
+        ``<metric>_median`` and ``<metric>_iqr`` (interquartile range).
+
+        :returns: Columnar table of summaries.
+        :rtype: Dict[str, npt.NDArray]
+        """
+
+        configurations, first_rows = np.unique(
+            self.columns["configuration"], return_index=True
+        )
+        summary = {"configuration": configurations}
+        for parameter in self.parameters:
+            summary[parameter] = self.columns[parameter][first_rows]
+        summary["runs"] = np.array(
+            [np.sum(self.columns["configuration"] == c) for c in configurations]
+        )
+
+        for metric in METRICS:
+            groups = [
+                self.columns[metric][self.columns["configuration"] == c].astype(float)
+                for c in configurations
+            ]
+            quartiles = np.array(
+                [np.percentile(group, [25, 50, 75]) for group in groups]
+            )
+            summary[f"{metric}_mean"] = np.array([np.mean(group) for group in groups])
+            summary[f"{metric}_median"] = quartiles[:, 1]
+            summary[f"{metric}_iqr"] = quartiles[:, 2] - quartiles[:, 0]
+        return summary
+
+    def to_csv(self, filename: str):
+        """
+        Writes every run as a row of a CSV file.
+
+        :param filename: Output CSV file path.
+        :type filename: str.
+        :returns: None.
+        """
+
+        with open(filename, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(list(self.columns))
+            writer.writerows(zip(*self.columns.values()))
@@ -0,0 +1,279 @@
+import copy
+import dataclasses
+import enum
+import hashlib
+import json
+import pickle
+import sqlite3
+import time
+from typing import Any, List, Tuple
+
+import numpy as np
+
+from evolvekit.core.Ga.GaInspector import GaInspector
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.GaResults import GaResults
+from evolvekit.core.Ga.GaStatistics import GaStatistics
+from evolvekit.core.Ga.enums.GaAction import GaAction
+
+
+def _canonical(value: Any, visited: frozenset = frozenset()) -> Any:
+    """
+    Internal: Converts a value into JSON compatible data which does not
+    depend on object identity or memory layout.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, enum.Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return {"dtype": value.dtype.str, "data": _canonical(value.tolist())}
+        # Large arrays are hashed instead of converted to lists.
+        return {
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+            "sha256": hashlib.sha256(np.ascontiguousarray(value).data).hexdigest(),
+        }
+    if isinstance(value, np.random.Generator):
+        return _canonical(value.bit_generator.state, visited)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item, visited) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            json.dumps(_canonical(item, visited), sort_keys=True) for item in value
+        )
+    if isinstance(value, dict):
+        return {str(key): _canonical(item, visited) for key, item in value.items()}
+    if callable(value) and not hasattr(value, "__dict__"):
+        return getattr(value, "__qualname__", type(value).__qualname__)
+
+    name = f"{type(value).__module__}.{type(value).__qualname__}"
+    if id(value) in visited:
+        return name
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{value.__module__}.{value.__qualname__}"
+
+    # Objects describe themselves by a hook, otherwise by public attributes,
+    # so that private runtime state does not change the key.
+    for hook in ("cache_key", "configuration"):
+        method = getattr(value, hook, None)
+        if callable(method):
+            state = method()
+            break
+    else:
+        if not hasattr(value, "__dict__"):
+            return name
+        state = {
+            key: item for key, item in vars(value).items() if not key.startswith("_")
+        }
+    return {"type": name, "state": _canonical(state, visited | {id(value)})}
+
+
+class _GaHistoryInspector(GaInspector):
+    """
+    Internal: Inspector recording statistics of every generation and
+    delegating decisions to the inspector configured by the user.
+    """
+
+    def __init__(self, inspector: GaInspector | None):
+        self.inspector = inspector
+        self.history: List[GaStatistics] = []
+
+    def initialize(self):
+        if self.inspector:
+            self.inspector.initialize()
+
+    def inspect(self, stats: GaStatistics) -> GaAction:
+        self.history.append(
+            GaStatistics(
+                **{
+                    field.name: copy.deepcopy(getattr(stats, field.name))
+                    for field in dataclasses.fields(GaStatistics)
+                }
+            )
+        )
+        if self.inspector:
+            return self.inspector.inspect(stats)
+        return GaAction.CONTINUE
+
+    def finish(self, stats: GaStatistics):
+        if self.inspector:
+            self.inspector.finish(stats)
+
+
+class GaResultCache:
+    """
+    On-disk cache of whole simulation runs, indexed in a SQLite database.
+
+    A run is identified by a SHA-256 hash of the island configuration (see
+    :func:`GaIsland.configuration()`), including the parameters of its
+    operators, evaluator, inspector and evaluation policy, the seed and a
+    version tag of the evaluator. Objects in the configuration are described
+    by their ``cache_key()`` or ``configuration()`` method if they have one,
+    see :func:`GaEvaluator.cache_key()`, otherwise by their public attributes.
+    The tag should be changed whenever the fitness function changes in a way
+    not visible in this description. Every entry stores the :class:`GaResults` of the run and
+    the :class:`GaStatistics` of every generation.
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self, path: str):
+        """
+        Constructor method.
+        Opens the cache database, creating it if it does not exist.
+
+        :param path: Path of the SQLite database file.
+        :type path: str.
+        :returns: None.
+        """
+
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.__connection = sqlite3.connect(path)
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "key TEXT PRIMARY KEY, tag TEXT, created REAL, results BLOB, history BLOB)"
+        )
+        self.__connection.commit()
+
+    def __enter__(self) -> "GaResultCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    @staticmethod
+    def key(island: GaIsland, tag: str = "") -> str:
+        """
+        Computes the cache key of a run.
+
+        :param island: Configured island.
+        :type island: :class:`GaIsland`.
+        :param tag: Version tag of the evaluator.
+        :type tag: str.
+        :returns: Hexadecimal SHA-256 digest.
+        :rtype: str
+        """
+
+        document = json.dumps(
+            {"tag": tag, "island": _canonical(island.configuration())},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(document.encode()).hexdigest()
+
+    @staticmethod
+    def record(island: GaIsland) -> Tuple[GaResults, List[GaStatistics]]:
+        """
+        Runs the simulation while recording statistics of every generation.
+
+        :param island: Configured island.
+        :type island: :class:`GaIsland`.
+        :returns: Results of the run and statistics of every generation.
+        :rtype: Tuple[:class:`GaResults`, List[:class:`GaStatistics`]]
+        """
+
+        inspector = island.inspector
+        recorder = _GaHistoryInspector(inspector)
+        island.set_inspector(recorder)
+        try:
+            results = island.run()
+        finally:
+            island.inspector = inspector
+        return results, recorder.history
+
+    def lookup(self, key: str) -> Tuple[GaResults, List[GaStatistics]] | None:
+        """
+        Returns a cached run.
+
+        :param key: Cache key computed by :func:`key()`.
+        :type key: str.
+        :returns: Results and statistics history, or None if the run is not cached.
+        :rtype: Tuple[:class:`GaResults`, List[:class:`GaStatistics`]] | None
+        """
+
+        row = self.__connection.execute(
+            "SELECT results, history FROM runs WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(row[0]), pickle.loads(row[1])
+
+    def store(
+        self,
+        key: str,
+        results: GaResults,
+        history: List[GaStatistics],
+        tag: str = "",
+    ):
+        """
+        Stores a run, replacing an entry with the same key.
+
+        :param key: Cache key computed by :func:`key()`.
+        :type key: str.
+        :param results: Results of the run.
+        :type results: :class:`GaResults`.
+        :param history: Statistics of every generation.
+        :type history: List[:class:`GaStatistics`].
+        :param tag: Version tag of the evaluator, stored for reference.
+        :type tag: str.
+        :returns: None.
+        """
+
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?)",
+            (key, tag, time.time(), pickle.dumps(results), pickle.dumps(history)),
+        )
+        self.__connection.commit()
+
+    def run(self, island: GaIsland, tag: str = "") -> GaResults:
+        """
+        Returns results of a cached run, running and caching the simulation if needed.
+
+        :param island: Configured island.
+        :type island: :class:`GaIsland`.
+        :param tag: Version tag of the evaluator.
+        :type tag: str.
+        :returns: Object representing final result of running genetic algorithm.
+        :rtype: :class:`GaResults`.
+        """
+
+        key = self.key(island, tag)
+        entry = self.lookup(key)
+        if entry is None:
+            entry = self.record(island)
+            self.store(key, *entry, tag=tag)
+        return entry[0]
+
+    def history(self, island: GaIsland, tag: str = "") -> List[GaStatistics] | None:
+        """
+        Returns statistics of every generation of a cached run.
+
+        :param island: Configured island.
+        :type island: :class:`GaIsland`.
+        :param tag: Version tag of the evaluator.
+        :type tag: str.
+        :returns: Statistics history, or None if the run is not cached.
+        :rtype: List[:class:`GaStatistics`] | None
+        """
+
+        entry = self.lookup(self.key(island, tag))
+        return entry[1] if entry else None
+
+    def close(self):
+        """
+        Closes the cache database.
+
+        :returns: None.
+        """
+
+        self.__connection.close()
@@ -0,0 +1,6 @@
+# GA Experiments
+from evolvekit.experiments.GaExperiment import GaExperiment
+from evolvekit.experiments.GaExperimentResults import GaExperimentResults
+from evolvekit.experiments.GaResultCache import GaResultCache
+
+__all__ = ["GaExperiment", "GaExperimentResults", "GaResultCache"]
@@ -1,11 +1,5 @@
 # GA Operators
-from evolvekit.operators.Ga.binary import *
-from evolvekit.operators.Ga.real import *
-from evolvekit.operators.Ga.universal import *
+# Subpackages are imported when one of their operators is first accessed (PEP 562).
+from evolvekit.operators.GaLazyPackage import lazy_package
 
-# Combine __all__
-from evolvekit.operators.Ga.binary import __all__ as binary_all
-from evolvekit.operators.Ga.real import __all__ as real_all
-from evolvekit.operators.Ga.universal import __all__ as universal_all
-
-__all__ = binary_all + real_all + universal_all
+__getattr__, __dir__ = lazy_package(globals(), ["binary", "real", "universal"])
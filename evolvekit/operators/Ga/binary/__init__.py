@@ -1,9 +1,5 @@
 # Binary Operators
-from evolvekit.operators.Ga.binary.crossover import *
-from evolvekit.operators.Ga.binary.mutation import *
+# Subpackages are imported when one of their operators is first accessed (PEP 562).
+from evolvekit.operators.GaLazyPackage import lazy_package
 
-# Combine __all__
-from evolvekit.operators.Ga.binary.crossover import __all__ as crossover_all
-from evolvekit.operators.Ga.binary.mutation import __all__ as mutation_all
-
-__all__ = crossover_all + mutation_all
+__getattr__, __dir__ = lazy_package(globals(), ["crossover", "mutation"])
@@ -5,6 +5,7 @@ from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage
 
 
 class OnePointCrossover(GaOperator):
@@ -55,5 +56,11 @@ class OnePointCrossover(GaOperator):
 
         individual_1.bin_chrom = np.packbits(binary_offspring1)
         individual_2.bin_chrom = np.packbits(binary_offspring2)
+        share = crossover_point / len(binary_parent1)
+        lineages = [individual_1.lineage, individual_2.lineage]
+        individual_1.lineage, individual_2.lineage = (
+            mix_lineage(lineages, [share, 1 - share]),
+            mix_lineage(lineages, [1 - share, share]),
+        )
         offspring_population = [individual_1, individual_2]
         return offspring_population
@@ -7,6 +7,7 @@ from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage
 
 
 class ArithmeticalCrossover(GaOperator):
@@ -45,5 +46,6 @@ class ArithmeticalCrossover(GaOperator):
             child.real_chrom = sum(
                 alpha * parent.real_chrom for alpha, parent in zip(alphas, parents)
             )
+            child.lineage = mix_lineage([parent.lineage for parent in parents], alphas)
             offspring.append(child)
         return offspring
@@ -4,6 +4,7 @@ import numpy as np
 
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
 
@@ -31,4 +32,5 @@ class AverageCrossover(GaOperator):
             (chrom1 + chrom2) / 2
             for chrom1, chrom2 in zip(parent_1.real_chrom, parent_2.real_chrom)
         ]
+        child.lineage = mix_lineage([parent_1.lineage, parent_2.lineage], [0.5, 0.5])
         return [child]
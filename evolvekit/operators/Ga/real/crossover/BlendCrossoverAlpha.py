@@ -4,6 +4,7 @@ import numpy as np
 
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import project_lineage
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
 
@@ -51,4 +52,6 @@ class BlendCrossoverAlpha(GaOperator):
         child_1.real_chrom = u
         u = np.random.uniform(low=low_boundary, high=high_boundary)
         child_2.real_chrom = u
+        child_1.lineage = project_lineage(child_1.real_chrom, parent_1, parent_2)
+        child_2.lineage = project_lineage(child_2.real_chrom, parent_1, parent_2)
         return [child_1, child_2]
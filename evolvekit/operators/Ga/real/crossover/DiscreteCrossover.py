@@ -30,6 +30,8 @@ class DiscreteCrossover(GaOperator):
         alpha = np.random.uniform()
         if alpha <= 0.5:
             child.real_chrom = parent_1.real_chrom
+            child.lineage = list(parent_1.lineage)
         else:
             child.real_chrom = parent_2.real_chrom
+            child.lineage = list(parent_2.lineage)
         return [child]
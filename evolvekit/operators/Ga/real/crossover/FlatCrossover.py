@@ -4,6 +4,7 @@ import numpy as np
 
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import project_lineage
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
 
@@ -31,4 +32,5 @@ class FlatCrossover(GaOperator):
         low_boundary = np.minimum(parent_1.real_chrom, parent_2.real_chrom)
         high_boundary = np.maximum(parent_1.real_chrom, parent_2.real_chrom)
         child.real_chrom = np.random.uniform(low=low_boundary, high=high_boundary)
+        child.lineage = project_lineage(child.real_chrom, parent_1, parent_2)
         return [child]
@@ -3,6 +3,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import project_lineage
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -40,4 +41,5 @@ class HeuristicCrossover(GaOperator):
         bigger_chrom = np.where(is_1_bigger, parent_1.real_chrom, parent_2.real_chrom)
         smaller_chrom = np.where(is_1_bigger, parent_2.real_chrom, parent_1.real_chrom)
         child.real_chrom = smaller_chrom + alphas * (bigger_chrom - smaller_chrom)
+        child.lineage = project_lineage(child.real_chrom, parent_1, parent_2)
         return [child]
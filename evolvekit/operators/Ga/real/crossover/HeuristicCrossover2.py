@@ -3,6 +3,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -37,9 +38,15 @@ class HeuristicCrossover2(GaOperator):
                 alpha * (parent_2.real_chrom - parent_1.real_chrom)
                 + parent_2.real_chrom
             )
+            child.lineage = mix_lineage(
+                [parent_1.lineage, parent_2.lineage], [-alpha, 1 + alpha]
+            )
         else:
             child.real_chrom = (
                 alpha * (parent_1.real_chrom - parent_2.real_chrom)
                 + parent_1.real_chrom
             )
+            child.lineage = mix_lineage(
+                [parent_1.lineage, parent_2.lineage], [1 + alpha, -alpha]
+            )
         return [child]
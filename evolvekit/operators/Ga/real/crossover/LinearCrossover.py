@@ -6,6 +6,7 @@ from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage
 from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
 
@@ -38,6 +39,10 @@ class LinearCrossover(GaOperator):
         child_Z.real_chrom = 0.5 * parent_1.real_chrom + 0.5 * parent_2.real_chrom
         child_V.real_chrom = 1.5 * parent_1.real_chrom - 0.5 * parent_2.real_chrom
         child_W.real_chrom = -0.5 * parent_1.real_chrom + 1.5 * parent_2.real_chrom
+        lineages = [parent_1.lineage, parent_2.lineage]
+        child_Z.lineage = mix_lineage(lineages, [0.5, 0.5])
+        child_V.lineage = mix_lineage(lineages, [1.5, -0.5])
+        child_W.lineage = mix_lineage(lineages, [-0.5, 1.5])
         child_Z.value = args.evaluator.evaluate(GaEvaluatorArgs(child_Z))
         child_V.value = args.evaluator.evaluate(GaEvaluatorArgs(child_V))
         child_W.value = args.evaluator.evaluate(GaEvaluatorArgs(child_W))
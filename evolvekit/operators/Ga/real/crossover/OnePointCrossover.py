@@ -7,6 +7,7 @@ from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage
 
 
 class OnePointCrossover(GaOperator):
@@ -44,4 +45,8 @@ class OnePointCrossover(GaOperator):
         offspring_2.real_chrom[:crossover_point] = parent_2.real_chrom[:crossover_point]
         offspring_1.real_chrom[crossover_point:] = parent_2.real_chrom[crossover_point:]
         offspring_2.real_chrom[crossover_point:] = parent_1.real_chrom[crossover_point:]
+        share = crossover_point / len(parent_1.real_chrom)
+        lineages = [parent_1.lineage, parent_2.lineage]
+        offspring_1.lineage = mix_lineage(lineages, [share, 1 - share])
+        offspring_2.lineage = mix_lineage(lineages, [1 - share, share])
         return [offspring_1, offspring_2]
@@ -3,6 +3,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -35,6 +36,7 @@ class SimpleCrossover(GaOperator):
         cross_point = np.random.randint(1, size_of_chrom + 1)
         child_1.real_chrom = parent_1.real_chrom[:cross_point]
         child_2.real_chrom = parent_2.real_chrom[:cross_point]
+        mixed = 0.0
         if cross_point < size_of_chrom:
             alphas = np.random.uniform(
                 low=0.0,
@@ -56,4 +58,8 @@ class SimpleCrossover(GaOperator):
                     + one_minus_alphas * parent_2.real_chrom[cross_point:],
                 ),
             )
+            mixed = np.sum(alphas) / size_of_chrom
+        lineages = [parent_1.lineage, parent_2.lineage]
+        child_1.lineage = mix_lineage(lineages, [1 - mixed, mixed])
+        child_2.lineage = mix_lineage(lineages, [mixed, 1 - mixed])
         return [child_1, child_2]
@@ -4,6 +4,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -21,6 +22,14 @@ class BoundaryMutation(GaOperator):
         """
         self.p_bm = float(p_bm)
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True, changed genes are recorded for incremental evaluation.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of the operator, used to classify
@@ -56,6 +65,7 @@ class BoundaryMutation(GaOperator):
                 low, up = domain[k]
 
                 child.real_chrom[k] = low if np.random.rand() < 0.5 else up
+                mark_changed_genes(child, [k])
 
             new_population.append(child)
 
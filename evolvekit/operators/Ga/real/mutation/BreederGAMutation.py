@@ -4,6 +4,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -24,6 +25,14 @@ class BreederGAMutation(GaOperator):
         self.p_m = float(p_m)
         self.k = float(k)
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True, changed genes are recorded for incremental evaluation.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of the operator, used to classify
@@ -66,6 +75,7 @@ class BreederGAMutation(GaOperator):
                         new_value = child.real_chrom[i] + step
 
                     child.real_chrom[i] = new_value
+                    mark_changed_genes(child, [i])
 
             new_population.append(child)
 
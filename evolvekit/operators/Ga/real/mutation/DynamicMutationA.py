@@ -4,6 +4,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -20,6 +21,14 @@ class DynamicMutationA(GaOperator):
         """
         self.p_m = float(p_m)
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True, changed genes are recorded for incremental evaluation.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of the operator, used to classify
@@ -62,6 +71,7 @@ class DynamicMutationA(GaOperator):
                     x_new = x - (x - low) * s
 
                 child.real_chrom[lam] = x_new
+                mark_changed_genes(child, [lam])
 
             new_population.append(child)
 
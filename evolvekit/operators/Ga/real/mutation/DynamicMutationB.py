@@ -4,6 +4,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -23,6 +24,14 @@ class DynamicMutationB(GaOperator):
         self.p_m = p_m
         self.beta = beta
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True, changed genes are recorded for incremental evaluation.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of the operator, used to classify
@@ -72,6 +81,7 @@ class DynamicMutationB(GaOperator):
                             x_new = x - gamma
 
                     child.real_chrom[i] = x_new
+                    mark_changed_genes(child, [i])
 
             new_population.append(child)
 
@@ -4,6 +4,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -20,6 +21,14 @@ class DynamicMutationE(GaOperator):
         """
         self.p_m = p_m
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True, changed genes are recorded for incremental evaluation.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of the operator, used to classify
@@ -55,6 +64,7 @@ class DynamicMutationE(GaOperator):
                     chromosome[lam],
                 )
                 child.real_chrom = chromosome
+                mark_changed_genes(child, [lam, lam + 1])
 
             new_population.append(child)
 
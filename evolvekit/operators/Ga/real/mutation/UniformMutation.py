@@ -3,6 +3,7 @@ from typing import List
 import numpy as np
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -18,6 +19,14 @@ class UniformMutation(GaOperator):
         """
         self.p_um = p_um
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True, changed genes are recorded for incremental evaluation.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """Returns the category of the operator, used to classify its
         type in the evolutionary algorithm framework.
@@ -49,4 +58,5 @@ class UniformMutation(GaOperator):
                 individual.real_chrom[muttation_point] = np.random.uniform(
                     low=lower_limit, high=upper_limit
                 )
+                mark_changed_genes(individual, [muttation_point])
         return population
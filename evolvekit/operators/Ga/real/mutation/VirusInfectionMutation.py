@@ -3,6 +3,7 @@ import numpy as np
 from typing import List, Optional
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
 from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
 from evolvekit.core.Ga.operators.GaOperator import GaOperator
 from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
@@ -37,6 +38,14 @@ class VirusInfectionMutation(GaOperator):
         self.p_copy = p_copy
         self.p_replace = p_replace
 
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True, changed genes are recorded for incremental evaluation.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of the operator, used to classify
@@ -79,6 +88,7 @@ class VirusInfectionMutation(GaOperator):
             for i in range(n):
                 if virus[i] is not None:
                     infected.real_chrom[i] = virus[i]
+            mark_changed_genes(infected, [i for i in range(n) if virus[i] is not None])
 
             new_population.append(infected)
 
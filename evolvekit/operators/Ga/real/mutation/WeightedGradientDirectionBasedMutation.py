@@ -1,7 +1,5 @@
 from typing import Callable, List
 
-from autograd import grad
-from scipy.stats import gamma
 import numpy as np
 
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
@@ -34,6 +32,9 @@ class WeightedGradientDirectionBasedMutation(GaOperator):
             direction-based mutation
         :type p_m: float
         """
+        # autograd and scipy are imported on first use, they are slow to import.
+        from autograd import grad
+
         self.constraint_functions = constraint_functions
         self.gradient_constraint_functions = [grad(g) for g in constraint_functions]
         self.p_m = p_m
@@ -63,6 +64,9 @@ class WeightedGradientDirectionBasedMutation(GaOperator):
             not workig with autograd. All of these methods needs to be
             written using autograd.numpy
         """
+        from autograd import grad
+        from scipy.stats import gamma
+
         population = args.population
         evaulator_wrapper = self.EvaluatorWrapper(args.evaluator)
         gradient_evaluation_function = grad(evaulator_wrapper.evaluate)
@@ -1,7 +1,5 @@
 # Universal Operators
-from evolvekit.operators.Ga.universal.selection import *
+# Subpackages are imported when one of their operators is first accessed (PEP 562).
+from evolvekit.operators.GaLazyPackage import lazy_package
 
-# Combine __all__
-from evolvekit.operators.Ga.universal.selection import __all__ as selection_all
-
-__all__ = selection_all
+__getattr__, __dir__ = lazy_package(globals(), ["adaptive", "selection"])
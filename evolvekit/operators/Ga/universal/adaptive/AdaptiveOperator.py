@@ -0,0 +1,289 @@
+import copy
+import math
+from typing import List
+
+import numpy as np
+
+from evolvekit.core.Ga import GaState
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.enums.GaBanditPolicy import GaBanditPolicy
+from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
+from evolvekit.core.Ga.operators.GaOperator import GaOperator
+from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
+
+
+class AdaptiveOperator(GaOperator):
+    """
+    Crossover or mutation operator which allocates offspring among a pool
+    of operators of the same category as a multi-armed bandit.
+
+    Every crossover chooses one operator of the pool, every individual
+    to mutate is assigned one operator of the pool, and the chosen
+    operator is recorded in the 'arms' of the offspring. Mutation
+    operators of the pool may return the individuals in any order, but
+    must return one copy of each. Once offspring are evaluated,
+    :class:`GaIsland` reports their improvement over their parents
+    through :func:`feedback()`. The mean improvement of every
+    operator, normalized by the best mean of the batch, updates its
+    quality by 'adaptation_rate', from which 'policy' allocates further
+    offspring. The best operator for a problem is therefore found within
+    a single run.
+
+    Usage and reward statistics of every operator are available from
+    :func:`report()`.
+    """
+
+    operators: List[GaOperator]
+    policy: GaBanditPolicy
+    exploration: float
+    adaptation_rate: float
+    min_probability: float
+    pursuit_rate: float
+
+    def __init__(
+        self,
+        operators: List[GaOperator],
+        policy: GaBanditPolicy = GaBanditPolicy.UCB,
+        exploration: float = 0.5,
+        adaptation_rate: float = 0.3,
+        min_probability: float | None = None,
+        pursuit_rate: float = 0.3,
+    ):
+        """
+        Initializes adaptive operator selection.
+
+        :param operators: Pool of crossover or mutation operators of the same category.
+        :type operators: List[GaOperator]
+        :param policy: Policy allocating offspring among the operators.
+        :type policy: GaBanditPolicy
+        :param exploration: Weight of the exploration bonus of UCB.
+        :type exploration: float
+        :param adaptation_rate: Rate at which qualities follow new rewards.
+        :type adaptation_rate: float
+        :param min_probability: Lowest probability of choosing an operator with probability
+            matching and adaptive pursuit, by default 0.2 divided by the number of operators.
+        :type min_probability: float | None
+        :param pursuit_rate: Rate at which adaptive pursuit moves probabilities.
+        :type pursuit_rate: float
+        :raises ValueError: If the pool is empty, mixes categories, holds selection
+            operators or a parameter is out of range.
+        """
+        if not operators:
+            raise ValueError("Pool of operators cannot be empty.")
+        categories = {operator.category() for operator in operators}
+        if len(categories) != 1:
+            raise ValueError("Operators in the pool must belong to the same category.")
+        if categories == {GaOpCategory.SELECTION}:
+            raise ValueError("Selection operators cannot be chosen adaptively.")
+        if min_probability is None:
+            min_probability = 0.2 / len(operators)
+        if not 0 <= min_probability <= 1 / len(operators):
+            raise ValueError("Minimum probability must be in range [0, 1 / operators].")
+        if not 0 < adaptation_rate <= 1 or not 0 < pursuit_rate <= 1:
+            raise ValueError("Adaptation and pursuit rates must be in range (0, 1].")
+        if exploration < 0:
+            raise ValueError("Exploration cannot be negative.")
+
+        self.operators = list(operators)
+        self.policy = policy
+        self.exploration = exploration
+        self.adaptation_rate = adaptation_rate
+        self.min_probability = min_probability
+        self.pursuit_rate = pursuit_rate
+        self.__category = categories.pop()
+        self.__reset()
+
+    def __reset(self):
+        """
+        Internal: Forgets everything learned about the operators.
+        """
+
+        count = len(self.operators)
+        self.__quality = np.zeros(count)
+        self.__probabilities = np.full(count, 1 / count)
+        self.__pulls = np.zeros(count, dtype=np.int64)
+        self.__usage = np.zeros(count, dtype=np.int64)
+        self.__rewards = np.zeros(count)
+
+    def initialize(self, state: GaState):
+        """
+        Initializes every operator of the pool and forgets what was learned in a previous run.
+
+        :param state: The current state of the genetic algorithm.
+        :type state: GaState
+        """
+        self.__reset()
+        for operator in self.operators:
+            operator.initialize(state)
+
+    def tracks_changed_genes(self) -> bool:
+        """
+        Returns True if every operator of the pool records the real genes it changes.
+
+        :returns: True if changed genes are recorded.
+        :rtype: bool
+        """
+        return all(operator.tracks_changed_genes() for operator in self.operators)
+
+    def category(self) -> GaOpCategory:
+        """
+        Returns the category of the operators in the pool.
+
+        :returns: The operator category.
+        :rtype: GaOpCategory
+        """
+        return self.__category
+
+    def perform(self, args: GaOperatorArgs) -> List[GaIndividual]:
+        """
+        Performs a crossover with one chosen operator, or mutates every individual
+        with its own chosen operator, and records the choice in offspring.
+
+        :param args: Arguments required for the operator's execution.
+        :type args: GaOperatorArgs
+        :returns: Offspring created by the chosen operators.
+        :rtype: List[GaIndividual]
+        :raises ValueError: If a mutation operator does not return one copy of every individual.
+        """
+        if self.__category in (GaOpCategory.REAL_CROSSOVER, GaOpCategory.BIN_CROSSOVER):
+            arm = self.__choose()
+            offspring = self.operators[arm].perform(args)
+            return [self.__record(indiv, arm) for indiv in offspring]
+
+        arms = np.array([self.__choose() for _ in args.population], dtype=np.int64)
+        offspring = list(args.population)
+        for arm in np.unique(arms):
+            indices = np.flatnonzero(arms == arm)
+            sub_args = copy.copy(args)
+            # Operators may reorder their output, so every individual carries its
+            # position in the slot of 'arms' its chosen operator is recorded in.
+            sub_args.population = [
+                self.__record(copy.copy(args.population[i]), i) for i in indices
+            ]
+            for indiv in self.__match(self.operators[arm].perform(sub_args), indices):
+                position = indiv.arms[self.__category]
+                offspring[position] = self.__record(indiv, arm)
+        return offspring
+
+    def __match(
+        self, offspring: List[GaIndividual], indices: np.ndarray
+    ) -> List[GaIndividual]:
+        """
+        Internal: Verifies that mutated individuals carry the positions of distinct inputs.
+        """
+
+        positions = sorted(
+            (indiv.arms or {}).get(self.__category, -1) for indiv in offspring
+        )
+        if positions != indices.tolist():
+            raise ValueError(
+                "Mutation operators in the pool must return one copy of every individual."
+            )
+        return offspring
+
+    def __record(self, indiv: GaIndividual, arm: int) -> GaIndividual:
+        """
+        Internal: Records in an offspring which operator of the pool created it.
+        """
+
+        indiv.arms = (indiv.arms or {}) | {self.__category: int(arm)}
+        return indiv
+
+    def __choose(self) -> int:
+        """
+        Internal: Chooses an operator of the pool by 'policy'.
+        """
+
+        if self.policy != GaBanditPolicy.UCB:
+            return int(np.random.choice(len(self.operators), p=self.__probabilities))
+
+        untried = np.flatnonzero(self.__pulls == 0)
+        if len(untried):
+            arm = int(np.random.choice(untried))
+        else:
+            bonus = np.sqrt(2 * math.log(np.sum(self.__pulls)) / self.__pulls)
+            arm = int(np.argmax(self.__quality + self.exploration * bonus))
+        # Pulls are counted on choice, so choices within a generation are spread.
+        self.__pulls[arm] += 1
+        return arm
+
+    def feedback(self, offspring: List[GaIndividual], improvements: List[float]):
+        """
+        Credits improvements of evaluated offspring to the operators which created them
+        and updates the allocation of further offspring.
+
+        :param offspring: Evaluated offspring.
+        :type offspring: List[GaIndividual]
+        :param improvements: Improvement of every offspring over its parents.
+        :type improvements: List[float]
+        """
+        count = len(self.operators)
+        totals = np.zeros(count)
+        usage = np.zeros(count, dtype=np.int64)
+        for indiv, improvement in zip(offspring, improvements):
+            arm = (indiv.arms or {}).get(self.__category)
+            if arm is not None:
+                totals[arm] += max(0.0, improvement)
+                usage[arm] += 1
+        used = usage > 0
+        if not np.any(used):
+            return
+
+        self.__usage += usage
+        self.__rewards += totals
+        means = np.zeros(count)
+        means[used] = totals[used] / usage[used]
+        if np.max(means) > 0:
+            means /= np.max(means)
+        self.__quality[used] += self.adaptation_rate * (
+            means[used] - self.__quality[used]
+        )
+        self.__update_probabilities()
+
+    def __update_probabilities(self):
+        """
+        Internal: Updates probabilities of choosing operators from their quality.
+        """
+
+        count = len(self.operators)
+        p_min = self.min_probability
+        match self.policy:
+            case GaBanditPolicy.PROBABILITY_MATCHING:
+                total = np.sum(self.__quality)
+                if total > 0:
+                    self.__probabilities = (
+                        p_min + (1 - count * p_min) * self.__quality / total
+                    )
+            case GaBanditPolicy.ADAPTIVE_PURSUIT:
+                p_max = 1 - (count - 1) * p_min
+                target = np.full(count, p_min)
+                target[np.argmax(self.__quality)] = p_max
+                self.__probabilities += self.pursuit_rate * (
+                    target - self.__probabilities
+                )
+        self.__probabilities /= np.sum(self.__probabilities)
+
+    def report(self) -> List[dict]:
+        """
+        Returns usage and reward statistics of every operator of the pool.
+
+        :returns: For every operator: its name, number of evaluated offspring,
+            total and mean improvement over parents, quality and probability of
+            being chosen (not used by UCB).
+        :rtype: List[dict]
+        """
+        return [
+            {
+                "operator": type(operator).__name__,
+                "usage": int(self.__usage[arm]),
+                "reward": float(self.__rewards[arm]),
+                "mean_reward": float(
+                    self.__rewards[arm] / self.__usage[arm]
+                    if self.__usage[arm]
+                    else 0.0
+                ),
+                "quality": float(self.__quality[arm]),
+                "probability": float(self.__probabilities[arm]),
+            }
+            for arm, operator in enumerate(self.operators)
+        ]
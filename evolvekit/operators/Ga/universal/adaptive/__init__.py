@@ -0,0 +1,6 @@
+# Adaptive Operators
+from evolvekit.operators.Ga.universal.adaptive.AdaptiveOperator import (
+    AdaptiveOperator,
+)
+
+__all__ = ["AdaptiveOperator"]
@@ -19,6 +19,14 @@ class RankSelection(GaOperator):
         """
         self.target_population = target_population
 
+    def comparison_only(self) -> bool:
+        """
+        Returns True, individuals are only compared by their fitness values.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of this operator.
@@ -44,12 +52,10 @@ class RankSelection(GaOperator):
         sorted_pop = sorted(
             args.population,
             key=lambda obj: obj.value,
-            reverse=(args.evaluator.extremum == GaExtremum.MINIMUM),
+            reverse=(args.evaluator.extremum() == GaExtremum.MINIMUM),
         )
 
-        for i in range(pop_size):
-            sorted_pop[i].value = i + 1
-
+        # Ranks are used as weights only, selected individuals keep their fitness.
         while len(selected_individuals) < self.target_population:
             index = np.random.randint(0, pop_size)
             individual = sorted_pop[index]
@@ -28,6 +28,14 @@ class StochasticTournamentSelection(GaOperator):
         self.tournament_size = tournament_size
         self.p = p
 
+    def comparison_only(self) -> bool:
+        """
+        Returns True, individuals are only compared by their fitness values.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of this operator.
@@ -24,6 +24,14 @@ class TournamentSelection(GaOperator):
         self.target_population = target_population
         self.tournament_size = tournament_size
 
+    def comparison_only(self) -> bool:
+        """
+        Returns True, individuals are only compared by their fitness values.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of this operator.
@@ -22,6 +22,14 @@ class TruncationSelection(GaOperator):
 
         self.target_population = target_population
 
+    def comparison_only(self) -> bool:
+        """
+        Returns True, individuals are only compared by their fitness values.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of this operator.
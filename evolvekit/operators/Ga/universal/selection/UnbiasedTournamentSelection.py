@@ -19,6 +19,14 @@ class UnbiasedTournamentSelection(GaOperator):
     def __init__(self):
         pass
 
+    def comparison_only(self) -> bool:
+        """
+        Returns True, individuals are only compared by their fitness values.
+
+        :returns: True.
+        """
+        return True
+
     def category(self) -> GaOpCategory:
         """
         Returns the category of this operator.
@@ -0,0 +1,52 @@
+import importlib
+from typing import Any, Callable, List, MutableMapping, Tuple
+
+
+def lazy_package(
+    namespace: MutableMapping[str, Any], subpackages: List[str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds module-level '__getattr__' and '__dir__' functions (PEP 562) of a
+    package which imports its subpackages when one of their names is first
+    accessed. Names defined in several subpackages resolve to the last of
+    them, the same as with star imports, and are cached in the package.
+
+    :param namespace: Namespace of the package, i.e. its ``globals()``.
+    :type namespace: MutableMapping[str, Any].
+    :param subpackages: Names of the subpackages, in the order they would be star imported.
+    :type subpackages: List[str].
+    :returns: The '__getattr__' and '__dir__' functions of the package.
+    :rtype: Tuple[Callable[[str], Any], Callable[[], List[str]]]
+    """
+
+    package = namespace["__name__"]
+
+    def __getattr__(name: str):
+        """
+        Internal: Imports operators on first access and caches them in the package.
+        """
+
+        if name == "__all__":
+            value = [
+                operator
+                for subpackage in subpackages
+                for operator in importlib.import_module(
+                    f"{package}.{subpackage}"
+                ).__all__
+            ]
+        else:
+            for subpackage in reversed(subpackages):
+                module = importlib.import_module(f"{package}.{subpackage}")
+                if name in module.__all__:
+                    value = getattr(module, name)
+                    break
+            else:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(__getattr__("__all__")))
+
+    return __getattr__, __dir__
@@ -1,7 +1,5 @@
 # 'import evolvekit.operators'
-from evolvekit.operators.Ga import *
+# Subpackages are imported when one of their operators is first accessed (PEP 562).
+from evolvekit.operators.GaLazyPackage import lazy_package
 
-# Combine __all__
-from evolvekit.operators.Ga import __all__ as ga_all
-
-__all__ = ga_all
+__getattr__, __dir__ = lazy_package(globals(), ["Ga"])
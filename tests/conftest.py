@@ -8,6 +8,7 @@ from tests.utils import (
     evaluator_factory_fixture,
     state_with_population_fixture,
     configured_state_fixture,
+    island_runner,
 )
 
 
@@ -0,0 +1,67 @@
+"""
+Performance tests for package import time.
+
+Tests run in a fresh interpreter that importing the simulation core does not
+load slow optional dependencies of single operators, and that the time spent
+importing evolvekit itself, excluding NumPy, stays within budget.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Time spent importing evolvekit modules, excluding NumPy, in seconds.
+IMPORT_BUDGET = 0.5
+
+HEAVY_MODULES = ("scipy", "autograd")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def _cumulative_import_times(stderr: str) -> dict:
+    """Parse ``-X importtime`` output into cumulative microseconds per top-level entry."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times.setdefault(name.strip(), int(cumulative))
+    return times
+
+
+class TestImportTime:
+    """Guard against regressions in the time needed to import evolvekit."""
+
+    @pytest.mark.parametrize("module", ["evolvekit", "evolvekit.core.Ga.GaIsland"])
+    def test_heavy_dependencies_are_not_imported(self, module):
+        """Test that importing the core leaves scipy and autograd unloaded.
+
+        :param module: Module imported in a fresh interpreter.
+        :returns: None
+        :raises: None
+        """
+        result = _run_python(
+            "-c",
+            f"import sys, {module}; "
+            f"print(sorted({{m.split('.')[0] for m in sys.modules}}))",
+        )
+
+        loaded = result.stdout
+        assert not any(f"'{heavy}'" in loaded for heavy in HEAVY_MODULES)
+
+    def test_import_time_is_within_budget(self):
+        """Test that importing evolvekit, excluding NumPy, takes less than IMPORT_BUDGET seconds.
+
+        :returns: None
+        :raises: None
+        """
+        result = _run_python("-X", "importtime", "-c", "import evolvekit")
+        times = _cumulative_import_times(result.stderr)
+
+        own_time = (times["evolvekit"] - times.get("numpy", 0)) / 1e6
+        assert own_time < IMPORT_BUDGET
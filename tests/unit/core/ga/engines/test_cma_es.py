@@ -0,0 +1,132 @@
+"""
+Unit tests for CmaEsIsland.
+
+Tests that CMA-ES solves the ill-conditioned Rosenbrock function with few
+evaluations, derives its default population size from the dimension,
+keeps samples inside the domain, and that IPOP and BIPOP restarts are
+triggered by stagnation, grow the population and never lose the best
+individual.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.RastriginEvaluator import RastriginEvaluator
+from evolvekit.benchmarks.RosenbrockEvaluator import RosenbrockEvaluator
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.engines.CmaEsIsland import CmaEsIsland
+from evolvekit.core.Ga.enums.GaRestartStrategy import GaRestartStrategy
+from tests.utils import FitnessCapturingInspector, MockBinaryEvaluator
+
+
+def _island(evaluator, generations=100, restart=GaRestartStrategy.NONE):
+    island = CmaEsIsland()
+    island.set_evaluator(evaluator)
+    island.set_max_generations(generations)
+    island.set_restart(restart)
+    island.set_seed(3)
+    return island
+
+
+class TestCmaEsIsland:
+    """Test the CMA-ES engine."""
+
+    def test_solves_rosenbrock(self):
+        """Test that the non-separable Rosenbrock function is solved within 6000 evaluations.
+
+        :returns: None
+        :raises: None
+        """
+        results = _island(RosenbrockEvaluator(10), generations=599).run()
+
+        assert results.value < 1e-8
+        assert results.total_evaluations == 10 * 600
+        assert np.allclose(results.real_chrom, 1.0, atol=1e-3)
+
+    def test_default_population_size(self):
+        """Test that the population size defaults to 4 + 3 ln(n).
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(20), generations=1)
+        results = island.run()
+
+        assert results.total_evaluations == 2 * 12
+        assert island.population_size is None
+
+    def test_samples_stay_in_domain(self):
+        """Test that samples are restored to the domain.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(4, bounds=(1.0, 2.0)), generations=30)
+        island.set_sigma(2.0)
+        results = island.run()
+
+        for indiv in island.current_population:
+            assert np.all((indiv.real_chrom >= 1.0) & (indiv.real_chrom <= 2.0))
+        assert results.value == pytest.approx(4.0, abs=1e-3)
+
+    @pytest.mark.parametrize(
+        "restart", [GaRestartStrategy.IPOP, GaRestartStrategy.BIPOP]
+    )
+    def test_restarts_on_stagnation(self, restart):
+        """Test that a stalled search is restarted and the best value never gets worse.
+
+        :returns: None
+        :raises: None
+        """
+        inspector = FitnessCapturingInspector()
+        island = _island(RastriginEvaluator(5), generations=400, restart=restart)
+        island.set_restart_stagnation(10)
+        island.set_inspector(inspector)
+        results = island.run()
+
+        assert island.statistic_engine.restarts > 0
+        assert inspector.best_values == sorted(inspector.best_values, reverse=True)
+        assert results.value == min(inspector.best_values)
+
+    def test_ipop_grows_population(self):
+        """Test that IPOP restarts multiply the population size.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(
+            RastriginEvaluator(5), generations=300, restart=GaRestartStrategy.IPOP
+        )
+        island.set_restart_stagnation(10)
+        results = island.run()
+        restarts = island.statistic_engine.restarts
+
+        assert restarts > 0
+        assert results.total_evaluations > 301 * 8
+        assert len(island.current_population) >= 8 * 2**restarts
+
+    def test_no_restart_without_strategy(self):
+        """Test that the search is not restarted by default.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(RastriginEvaluator(5), generations=200)
+        island.set_restart_stagnation(5)
+        island.run()
+
+        assert island.statistic_engine.restarts == 0
+
+    def test_invalid_parameters(self):
+        """Test that invalid parameters and binary evaluators are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(3))
+        island.set_sigma(0.0)
+        with pytest.raises(ValueError):
+            island.run()
+
+        with pytest.raises(ValueError):
+            _island(MockBinaryEvaluator(bin_len=8)).run()
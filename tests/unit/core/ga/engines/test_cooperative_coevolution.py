@@ -0,0 +1,195 @@
+"""
+Unit tests for CooperativeCoevolutionIsland.
+
+Tests that random grouping partitions the genes, that differential
+grouping finds interacting genes, that sub-islands improve a shared context
+vector on large Sphere problems for any engine and both extrema, that
+evaluations are counted per sub-island turn and that worker processes give
+the same result as batch evaluation.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.RosenbrockEvaluator import RosenbrockEvaluator
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.engines.CmaEsIsland import CmaEsIsland
+from evolvekit.core.Ga.engines.CooperativeCoevolutionIsland import (
+    CooperativeCoevolutionIsland,
+)
+from evolvekit.core.Ga.engines.ParticleSwarmIsland import ParticleSwarmIsland
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.enums.GaGrouping import GaGrouping
+from tests.utils import FitnessCapturingInspector, MockBinaryEvaluator
+
+
+class _InteractingEvaluator(GaEvaluator):
+    """Sphere with interactions between genes 0 and 5, 2 and 3, and 3 and 6."""
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        x = args.real_chrom
+        return float(np.sum(x**2) + x[0] * x[5] + x[2] * x[3] + x[3] * x[6])
+
+    def extremum(self) -> GaExtremum:
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        return [(-5.0, 5.0)] * 8
+
+
+class _NegatedSphereEvaluator(SphereEvaluator):
+    """Sphere function negated and maximized."""
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        return -super().evaluate(args)
+
+    def extremum(self) -> GaExtremum:
+        return GaExtremum.MAXIMUM
+
+
+def _island(evaluator=None, generations=10):
+    island = CooperativeCoevolutionIsland()
+    island.set_evaluator(evaluator or SphereEvaluator(100))
+    island.set_group_size(10)
+    island.set_population_size(10)
+    island.set_island_generations(5)
+    island.set_max_generations(generations)
+    island.set_seed(4)
+    return island
+
+
+class TestCooperativeCoevolutionIsland:
+    """Test the cooperative coevolution engine."""
+
+    def test_random_grouping_partitions_genes(self):
+        """Test that random groups cover every gene once and respect the group size.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(25), generations=1)
+        island.run()
+
+        assert [len(genes) for genes in island.groups] == [9, 8, 8]
+        assert sorted(np.concatenate(island.groups).tolist()) == list(range(25))
+        assert np.concatenate(island.groups).tolist() != list(range(25))
+
+    def test_differential_grouping_finds_interactions(self):
+        """Test that interacting genes are grouped, also through other genes.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(_InteractingEvaluator(), generations=1)
+        island.set_grouping(GaGrouping.DIFFERENTIAL)
+        island.set_group_size(4)
+        island.run()
+
+        assert [genes.tolist() for genes in island.groups] == [
+            [0, 5],
+            [2, 3, 6],
+            [1, 4, 7],
+        ]
+
+    def test_differential_grouping_keeps_chain_together(self):
+        """Test that genes of the Rosenbrock chain form a single group.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(RosenbrockEvaluator(12), generations=1)
+        island.set_grouping(GaGrouping.DIFFERENTIAL)
+        island.run()
+
+        assert [genes.tolist() for genes in island.groups] == [list(range(12))]
+
+    @pytest.mark.parametrize(
+        "factory", [None, ParticleSwarmIsland, CmaEsIsland], ids=["de", "pso", "cma"]
+    )
+    def test_improves_context_on_large_sphere(self, factory):
+        """Test that sub-islands of every engine improve the context vector.
+
+        :returns: None
+        :raises: None
+        """
+        inspector = FitnessCapturingInspector()
+        island = _island()
+        island.set_inspector(inspector)
+        if factory:
+            island.set_engine_factory(factory)
+        results = island.run()
+
+        assert results.value < inspector.best_values[0] / 20
+        assert inspector.best_values == sorted(inspector.best_values, reverse=True)
+        assert np.array_equal(results.real_chrom, island.context)
+        assert results.value == pytest.approx(np.sum(island.context**2))
+
+    def test_maximizes(self):
+        """Test that maximized problems are improved towards the maximum.
+
+        :returns: None
+        :raises: None
+        """
+        inspector = FitnessCapturingInspector()
+        island = _island(_NegatedSphereEvaluator(100))
+        island.set_inspector(inspector)
+        results = island.run()
+
+        assert results.value > inspector.best_values[0] / 20
+
+    def test_evaluations_per_turn(self):
+        """Test that every turn re-evaluates and evolves the population of a sub-island.
+
+        :returns: None
+        :raises: None
+        """
+        results = _island(generations=3).run()
+
+        assert results.total_evaluations == 1 + 10 * 10 + 3 * 10 * 10 * (1 + 5)
+
+    def test_workers_match_batch_evaluation(self):
+        """Test that worker processes give the same result as batch evaluation.
+
+        :returns: None
+        :raises: None
+        """
+        expected = _island(generations=2).run()
+        island = _island(generations=2)
+        island.set_workers(2)
+        results = island.run()
+
+        assert results.value == expected.value
+        assert np.array_equal(results.real_chrom, expected.real_chrom)
+
+    @pytest.mark.parametrize(
+        "setter, value",
+        [
+            ("set_group_size", 0),
+            ("set_interaction_threshold", -1.0),
+            ("set_island_generations", 0),
+        ],
+    )
+    def test_invalid_settings_raise(self, setter, value):
+        """Test that invalid settings raise ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        getattr(island, setter)(value)
+
+        with pytest.raises(ValueError):
+            island.run()
+
+    def test_rejects_binary_evaluator(self):
+        """Test that evaluators with binary chromosomes raise ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(ValueError):
+            _island(MockBinaryEvaluator()).run()
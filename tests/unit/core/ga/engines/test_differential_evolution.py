@@ -0,0 +1,204 @@
+"""
+Unit tests for DifferentialEvolutionIsland.
+
+Tests that every mutation strategy, crossover and parameter adaptation
+converges on the Sphere function, that maximized problems and worker
+processes are supported, that the engine shares inspectors, statistics
+and results with GaIsland, and that clamp_matrix() restores genes like
+the scalar clamp strategies.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.engines.DifferentialEvolutionIsland import (
+    DifferentialEvolutionIsland,
+)
+from evolvekit.core.Ga.enums.GaClampStrategy import GaClampStrategy
+from evolvekit.core.Ga.enums.GaDeAdaptation import GaDeAdaptation
+from evolvekit.core.Ga.enums.GaDeCrossover import GaDeCrossover
+from evolvekit.core.Ga.enums.GaDeStrategy import GaDeStrategy
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.helpers.ClampStrategy import clamp_matrix, get_clamp_strategy
+from tests.utils import MockBinaryEvaluator, TerminatingInspector
+
+
+class NegatedSphereEvaluator(SphereEvaluator):
+    """Sphere evaluator maximizing the negated function."""
+
+    def evaluate(self, args):
+        return -super().evaluate(args)
+
+    def extremum(self) -> GaExtremum:
+        return GaExtremum.MAXIMUM
+
+
+def _island(evaluator=None, generations=100):
+    island = DifferentialEvolutionIsland()
+    island.set_evaluator(evaluator or SphereEvaluator(5))
+    island.set_population_size(20)
+    island.set_max_generations(generations)
+    island.set_seed(1)
+    return island
+
+
+class TestDifferentialEvolutionIsland:
+    """Test the Differential Evolution engine."""
+
+    @pytest.mark.parametrize("strategy", list(GaDeStrategy))
+    @pytest.mark.parametrize("crossover", list(GaDeCrossover))
+    @pytest.mark.parametrize("adaptation", list(GaDeAdaptation))
+    def test_converges_on_sphere(self, strategy, crossover, adaptation):
+        """Test that every variant approaches the optimum.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_strategy(strategy)
+        island.set_crossover(crossover)
+        island.set_adaptation(adaptation)
+        results = island.run()
+
+        assert results.value < 1e-2
+        assert results.value == pytest.approx(float(np.sum(results.real_chrom**2)))
+        assert results.total_evaluations == 20 * 101
+
+    def test_best_value_never_gets_worse(self):
+        """Test that greedy replacement keeps the best value monotone.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(generations=1)
+        values = []
+        for generations in range(1, 30, 7):
+            island.set_max_generations(generations)
+            values.append(island.run().value)
+
+        assert values == sorted(values, reverse=True)
+
+    def test_maximization(self):
+        """Test that maximized problems are solved and reported with their own sign.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(NegatedSphereEvaluator(5))
+        results = island.run()
+
+        assert -1e-2 < results.value <= 0
+        assert all(indiv.value <= 0 for indiv in island.current_population)
+
+    def test_population_stays_in_domain(self):
+        """Test that trial vectors are restored to the domain.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(5, bounds=(1.0, 2.0)), generations=10)
+        island.set_strategy(GaDeStrategy.CURRENT_TO_BEST_1)
+        island.set_scale_factor(1.5)
+        results = island.run()
+
+        for indiv in island.current_population:
+            assert np.all((indiv.real_chrom >= 1.0) & (indiv.real_chrom <= 2.0))
+        assert results.value == pytest.approx(5.0, abs=0.1)
+
+    def test_inspector_terminates(self):
+        """Test that the inspector can stop the simulation.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_inspector(TerminatingInspector())
+        results = island.run()
+
+        assert results.total_generations == 1
+        assert results.total_evaluations == 20
+
+    def test_workers(self):
+        """Test that worker processes give the same result as serial evaluation.
+
+        :returns: None
+        :raises: None
+        """
+        serial = _island(generations=5).run()
+        island = _island(generations=5)
+        island.set_workers(2)
+        parallel = island.run()
+
+        assert parallel.value == serial.value
+        assert np.array_equal(parallel.real_chrom, serial.real_chrom)
+
+    @pytest.mark.parametrize(
+        "setter, value",
+        [
+            ("set_population_size", 3),
+            ("set_scale_factor", 0.0),
+            ("set_crossover_rate", 1.5),
+            ("set_p_best", 0.0),
+            ("set_memory_size", 0),
+        ],
+    )
+    def test_invalid_parameters(self, setter, value):
+        """Test that invalid parameters are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        getattr(island, setter)(value)
+
+        with pytest.raises(ValueError):
+            island.run()
+
+    def test_requires_real_chromosomes(self):
+        """Test that evaluators with binary chromosomes are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(ValueError):
+            _island(MockBinaryEvaluator(bin_len=8)).run()
+
+
+class TestClampMatrix:
+    """Test vectorized clamp strategies."""
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [GaClampStrategy.CLAMP, GaClampStrategy.BOUNCE, GaClampStrategy.OVERFLOW],
+    )
+    def test_matches_scalar_strategy(self, strategy):
+        """Test that every gene is restored as by the scalar strategy.
+
+        :returns: None
+        :raises: None
+        """
+        values = np.random.uniform(-30.0, 30.0, (10, 4))
+        lower, upper = np.full(4, -8.0), np.full(4, 1.0)
+        scalar = get_clamp_strategy(strategy)
+
+        restored = clamp_matrix(strategy, values, lower, upper)
+
+        for value, gene in zip(values.flat, restored.flat):
+            expected = value if -8.0 <= value <= 1.0 else scalar(value, (-8.0, 1.0))
+            assert gene == pytest.approx(expected)
+
+    def test_random_keeps_genes_inside_domain(self):
+        """Test that RANDOM only replaces genes outside the domain.
+
+        :returns: None
+        :raises: None
+        """
+        values = np.array([[0.5, 3.0, -9.0]])
+
+        restored = clamp_matrix(
+            GaClampStrategy.RANDOM, values, np.full(3, -8.0), np.full(3, 1.0)
+        )
+
+        assert restored[0, 0] == 0.5
+        assert np.all((restored >= -8.0) & (restored <= 1.0))
@@ -0,0 +1,123 @@
+"""
+Unit tests for EstimationOfDistributionIsland.
+
+Tests that compact GA, PBIL and UMDA solve OneMax, that the compact GA
+evaluates two individuals per generation, that probabilities stay inside
+their margins, that chromosomes are sampled packed with the expected bit
+frequencies, that UMDA learns from the selected samples when they span
+several chunks, and that non-binary evaluators are rejected.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.engines.EstimationOfDistributionIsland import (
+    EstimationOfDistributionIsland,
+)
+from evolvekit.core.Ga.enums.GaEdaModel import GaEdaModel
+from tests.utils import MockBinaryEvaluator, MockEvaluator
+
+
+def _island(model, bin_len=60, population=40, generations=60):
+    island = EstimationOfDistributionIsland()
+    island.set_evaluator(MockBinaryEvaluator(bin_len))
+    island.set_model(model)
+    island.set_population_size(population)
+    island.set_max_generations(generations)
+    island.set_seed(4)
+    return island
+
+
+class TestEstimationOfDistributionIsland:
+    """Test the estimation of distribution engines."""
+
+    @pytest.mark.parametrize("model", [GaEdaModel.PBIL, GaEdaModel.UMDA])
+    def test_population_models_solve_onemax(self, model):
+        """Test that PBIL and UMDA find the chromosome of all ones.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(model)
+        island.set_learning_rate(0.3)
+        results = island.run()
+
+        assert results.value == 60.0
+        assert results.total_evaluations == 40 * 61
+        assert np.all(island.probabilities >= 1 / 60)
+        assert np.all(island.probabilities <= 1 - 1 / 60)
+
+    def test_compact_ga_solves_onemax(self):
+        """Test that the compact GA converges to all ones with two evaluations per generation.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(GaEdaModel.COMPACT, population=50, generations=2000)
+        results = island.run()
+
+        assert results.value == 60.0
+        assert results.total_evaluations == 2 * 2001
+        assert np.mean(island.probabilities) > 0.95
+
+    def test_samples_are_packed(self):
+        """Test that sampled chromosomes are packed and follow the probabilities.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(GaEdaModel.UMDA, bin_len=13, population=2000, generations=1)
+        island.set_selection_rate(1.0)
+        island.run()
+        population = island.current_population[:2000]
+
+        assert all(len(indiv.bin_chrom) == 2 for indiv in population)
+        bits = np.unpackbits(np.array([i.bin_chrom for i in population]), axis=1)
+        assert np.all(bits[:, 13:] == 0)
+        assert np.mean(bits[:, :13]) == pytest.approx(0.5, abs=0.02)
+
+    def test_selected_frequencies_span_chunks(self, monkeypatch):
+        """Test that UMDA learns the bit frequencies of the best samples gathered in chunks.
+
+        :returns: None
+        :raises: None
+        """
+        monkeypatch.setattr(
+            EstimationOfDistributionIsland,
+            "_EstimationOfDistributionIsland__CHUNK_BITS",
+            3 * 60,
+        )
+        island = _island(GaEdaModel.UMDA, population=40, generations=1)
+        island.run()
+        population = sorted(island.current_population[:40], key=lambda i: -i.value)
+        bits = np.unpackbits(np.array([i.bin_chrom for i in population[:20]]), axis=1)
+        expected = np.clip(bits[:, :60].mean(axis=0), 1 / 60, 1 - 1 / 60)
+
+        assert np.allclose(island.probabilities, expected)
+
+    def test_maximization_selects_best(self):
+        """Test that probabilities move towards the bits of maximized samples.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(GaEdaModel.UMDA, generations=1)
+        island.run()
+
+        assert np.mean(island.probabilities) > 0.5
+
+    def test_invalid_parameters(self):
+        """Test that invalid parameters and real valued evaluators are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(GaEdaModel.PBIL)
+        island.set_selection_rate(0.0)
+        with pytest.raises(ValueError):
+            island.run()
+
+        island = _island(GaEdaModel.PBIL)
+        island.set_evaluator(MockEvaluator(dim=3))
+        with pytest.raises(ValueError):
+            island.run()
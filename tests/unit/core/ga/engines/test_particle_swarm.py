@@ -0,0 +1,119 @@
+"""
+Unit tests for ParticleSwarmIsland.
+
+Tests that every topology converges on the Sphere function, that
+neighborhoods are precomputed correctly, that particles stay inside the
+domain with their velocities limited, and that worker processes give the
+same result as batch evaluation.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.engines.ParticleSwarmIsland import ParticleSwarmIsland
+from evolvekit.core.Ga.enums.GaClampStrategy import GaClampStrategy
+from evolvekit.core.Ga.enums.GaSwarmTopology import GaSwarmTopology
+from tests.utils import MockBinaryEvaluator
+
+
+def _island(evaluator=None, generations=150):
+    island = ParticleSwarmIsland()
+    island.set_evaluator(evaluator or SphereEvaluator(5))
+    island.set_population_size(20)
+    island.set_max_generations(generations)
+    island.set_seed(2)
+    return island
+
+
+class TestParticleSwarmIsland:
+    """Test the Particle Swarm Optimization engine."""
+
+    @pytest.mark.parametrize("topology", list(GaSwarmTopology))
+    def test_converges_on_sphere(self, topology):
+        """Test that every topology approaches the optimum.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_topology(topology)
+        results = island.run()
+
+        assert results.value < 1e-4
+        assert results.total_evaluations == 20 * 151
+
+    def test_ring_neighbors(self):
+        """Test that ring neighborhoods wrap around.
+
+        :returns: None
+        :raises: None
+        """
+        neighbors = ParticleSwarmIsland.neighbors(GaSwarmTopology.RING, 5)
+
+        assert neighbors.tolist()[0] == [4, 0, 1]
+        assert neighbors.tolist()[4] == [3, 4, 0]
+        assert ParticleSwarmIsland.neighbors(GaSwarmTopology.GLOBAL, 5) is None
+
+    def test_von_neumann_neighbors(self):
+        """Test that von Neumann neighborhoods form a toroidal grid.
+
+        :returns: None
+        :raises: None
+        """
+        neighbors = ParticleSwarmIsland.neighbors(GaSwarmTopology.VON_NEUMANN, 12)
+
+        # 12 particles form a 3 x 4 grid.
+        assert neighbors.shape == (12, 5)
+        assert sorted(neighbors[0].tolist()) == [0, 1, 3, 4, 8]
+        assert sorted(neighbors[5].tolist()) == [1, 4, 5, 6, 9]
+        for particle, row in enumerate(neighbors):
+            for neighbor in row:
+                assert particle in neighbors[neighbor]
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [GaClampStrategy.CLAMP, GaClampStrategy.BOUNCE, GaClampStrategy.RANDOM],
+    )
+    def test_particles_stay_in_domain(self, strategy):
+        """Test that particles are restored to the domain.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(4, bounds=(1.0, 2.0)), generations=20)
+        island.set_real_clamp_strategy(strategy)
+        island.set_velocity_limit(5.0)
+        results = island.run()
+
+        for indiv in island.current_population:
+            assert np.all((indiv.real_chrom >= 1.0) & (indiv.real_chrom <= 2.0))
+        assert results.value >= 4.0
+
+    def test_workers(self):
+        """Test that worker processes give the same result as batch evaluation.
+
+        :returns: None
+        :raises: None
+        """
+        serial = _island(generations=5).run()
+        island = _island(generations=5)
+        island.set_workers(2)
+        parallel = island.run()
+
+        assert parallel.value == serial.value
+        assert np.array_equal(parallel.real_chrom, serial.real_chrom)
+
+    def test_invalid_parameters(self):
+        """Test that invalid parameters and binary evaluators are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_velocity_limit(0.0)
+        with pytest.raises(ValueError):
+            island.run()
+
+        with pytest.raises(ValueError):
+            _island(MockBinaryEvaluator(bin_len=8)).run()
@@ -0,0 +1,217 @@
+"""
+Unit tests for bounded evaluation with a cutoff.
+
+Tests that bounded_sum() stops once the cutoff is exceeded and returns a
+bound between the cutoff and the exact sum, also for short sums, that
+benchmarks honour the cutoff, and that GaIsland passes the worst survivor as
+cutoff to offspring in steady-state modes, marks those worse than it as
+partial, keeps them worse than every exactly evaluated survivor and their
+bounds out of the fitness store, only reports exactly evaluated individuals
+as the result and rejects generational mode.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.RastriginEvaluator import RastriginEvaluator
+from evolvekit.benchmarks.RosenbrockEvaluator import RosenbrockEvaluator
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
+from evolvekit.core.Ga.helpers.GaBoundedSum import bounded_sum
+from evolvekit.core.Ga.parallel.GaFitnessStore import GaFitnessStore
+from evolvekit.operators.Ga.universal.selection.SaRouletteWindowSelection import (
+    SaRouletteWindowSelection,
+)
+from evolvekit.operators.Ga.universal.selection.TournamentSelection import (
+    TournamentSelection,
+)
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+class CountingSphereEvaluator(SphereEvaluator):
+    """Sphere evaluator counting evaluations with and without a cutoff."""
+
+    def __init__(self, dim: int):
+        super().__init__(dim)
+        self.bounded = 0
+        self.exact = 0
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        if args.cutoff is None:
+            self.exact += 1
+        else:
+            self.bounded += 1
+        return super().evaluate(args)
+
+
+class CheckingTournamentSelection(TournamentSelection):
+    """Tournament selection checking that partial individuals are worse than exact ones."""
+
+    def __init__(self, target_population: int):
+        super().__init__(target_population)
+        self.partial = 0
+
+    def perform(self, args):
+        exact = [indiv.value for indiv in args.population if not indiv.partial]
+        for indiv in args.population:
+            if indiv.partial:
+                self.partial += 1
+                value = args.evaluator.evaluate(
+                    GaEvaluatorArgs(GaIndividual(real_chrom=indiv.real_chrom))
+                )
+                assert value > max(exact)
+        return super().perform(args)
+
+
+def _island(evaluator, mode=GaEvolutionMode.STEADY_STATE):
+    island = minimal_island_factory(dim=8, max_generations=6, population_size=20)
+    island.set_evaluator(evaluator)
+    island.set_operator(TournamentSelection(target_population=20))
+    island.set_evolution_mode(mode)
+    island.set_bounded_evaluation(True)
+    return island
+
+
+class TestBoundedSum:
+    """Test early-abort accumulation."""
+
+    def test_exact_sum_without_cutoff(self):
+        """Test that every term is summed when there is no cutoff.
+
+        :returns: None
+        :raises: None
+        """
+        terms = np.arange(10, dtype=np.float64)
+
+        assert bounded_sum(lambda i, j: np.sum(terms[i:j]), 10, None, 1.0) == 46.0
+
+    def test_stops_after_exceeding_cutoff(self):
+        """Test that summing stops at the first chunk exceeding the cutoff.
+
+        :returns: None
+        :raises: None
+        """
+        calls = []
+
+        def partial_sum(i, j):
+            calls.append((i, j))
+            return float(j - i)
+
+        value = bounded_sum(partial_sum, 100, cutoff=25.0, chunk_size=10)
+
+        assert value == 30.0
+        assert calls[-1] == (20, 30)
+
+    def test_short_sums_stop_early_by_default(self):
+        """Test that the default chunk size lets sums of a few terms stop early.
+
+        :returns: None
+        :raises: None
+        """
+        terms = np.ones(15)
+
+        assert bounded_sum(lambda i, j: np.sum(terms[i:j]), 15, cutoff=1.0) == 2.0
+
+    @pytest.mark.parametrize(
+        "evaluator",
+        [
+            SphereEvaluator(300),
+            RastriginEvaluator(300),
+            RosenbrockEvaluator(300),
+            SphereEvaluator(15),
+            RastriginEvaluator(15),
+            RosenbrockEvaluator(15),
+        ],
+    )
+    def test_benchmark_bound_lies_between_cutoff_and_exact_value(self, evaluator):
+        """Test that benchmarks return a bound when the cutoff is exceeded.
+
+        :returns: None
+        :raises: None
+        """
+        dim = len(evaluator.real_domain())
+        indiv = GaIndividual(real_chrom=np.random.uniform(-5.0, 5.0, dim))
+        exact = evaluator.evaluate(GaEvaluatorArgs(indiv))
+        indiv.cutoff = exact / 10
+
+        bound = evaluator.evaluate(GaEvaluatorArgs(indiv))
+
+        assert indiv.cutoff < bound <= exact
+
+
+class TestGaIslandBoundedEvaluation:
+    """Test that islands evaluate offspring with a cutoff."""
+
+    def test_offspring_get_cutoff_and_result_is_exact(self):
+        """Test that offspring are bounded and the reported best value is exact.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = CountingSphereEvaluator(8)
+        island = _island(evaluator)
+        island.set_seed(3)
+        results = island.run()
+
+        assert evaluator.bounded > 0
+        assert island.statistic_engine.partial_evaluations > 0
+        assert results.value == pytest.approx(float(np.sum(results.real_chrom**2)))
+        for indiv in island.current_population:
+            assert indiv.cutoff is None
+
+    def test_partial_values_are_not_stored(self, tmp_path):
+        """Test that bounds never reach the fitness store.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = SphereEvaluator(8)
+        island = _island(evaluator)
+        with GaFitnessStore(str(tmp_path / "fitness.db")) as store:
+            island.set_fitness_store(store)
+            island.run()
+
+            stored = store.get_many(island.current_population)
+        for indiv, value in zip(island.current_population, stored):
+            if value is not None:
+                assert value == evaluator.evaluate(GaEvaluatorArgs(indiv))
+
+    def test_partial_individuals_are_worse_than_exact_ones(self):
+        """Test that selection compares partial individuals with exact ones correctly.
+
+        :returns: None
+        :raises: None
+        """
+        selection = CheckingTournamentSelection(target_population=20)
+        island = _island(SphereEvaluator(8))
+        island.set_operator(selection)
+        island.set_mutation_probability(0.5)
+        island.set_seed(2)
+        island.run()
+
+        assert selection.partial > 0
+
+    def test_rejects_generational_mode(self):
+        """Test that generational mode, where every partial offspring survives, is rejected.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(8), GaEvolutionMode.GENERATIONAL)
+
+        with pytest.raises(ValueError):
+            island.run()
+
+    def test_requires_comparison_only_selection(self):
+        """Test that selection using fitness magnitudes is rejected.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(SphereEvaluator(8))
+        island.set_operator(SaRouletteWindowSelection(target_population=20))
+
+        with pytest.raises(ValueError):
+            island.run()
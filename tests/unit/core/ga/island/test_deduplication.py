@@ -0,0 +1,114 @@
+"""
+Unit tests for within-generation duplicate elimination.
+
+Tests that with GaDeduplication.SHARE every distinct chromosome of a
+generation is evaluated once and its value is shared with its duplicates,
+and that RANDOM and MUTATE replace duplicates so every evaluated
+chromosome of a generation is distinct, for real and binary chromosomes.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.enums.GaDeduplication import GaDeduplication
+from tests.utils import MockAsyncEvaluator, MockBinaryEvaluator, MockEvaluator
+
+
+def _island(evaluator, deduplication):
+    island = GaIsland()
+    island.set_evaluator(evaluator)
+    island.set_population_size(20)
+    island.set_max_generations(4)
+    # Without crossover and mutation every offspring is a clone of a selected parent.
+    island.set_crossover_probability(0.0)
+    island.set_mutation_probability(0.0)
+    island.set_deduplication(deduplication)
+    return island
+
+
+def _distinct(population):
+    return len({i.real_chrom.tobytes() + i.bin_chrom.tobytes() for i in population})
+
+
+class TestDeduplication:
+    """Test handling of duplicated chromosomes."""
+
+    def test_share_evaluates_each_chromosome_once(self):
+        """Test that duplicates are not evaluated and receive the value of their original.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockEvaluator(dim=4)
+        island = _island(evaluator, GaDeduplication.SHARE)
+        island.run()
+        stats = island.statistic_engine
+
+        assert stats.duplicates > 0
+        assert evaluator.evaluation_count == stats.evaluations
+        assert stats.evaluations + stats.duplicates == 20 * 5
+        assert all(indiv.value == 1.0 for indiv in island.current_population)
+
+    def test_none_evaluates_duplicates(self):
+        """Test that duplicates are evaluated when deduplication is disabled.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockEvaluator(dim=4)
+        island = _island(evaluator, GaDeduplication.NONE)
+        island.run()
+
+        assert island.statistic_engine.duplicates == 0
+        assert evaluator.evaluation_count == 20 * 5
+        assert _distinct(island.current_population) < 20
+
+    @pytest.mark.parametrize(
+        "evaluator", [MockEvaluator(dim=4), MockBinaryEvaluator(bin_len=12)]
+    )
+    @pytest.mark.parametrize(
+        "deduplication", [GaDeduplication.RANDOM, GaDeduplication.MUTATE]
+    )
+    def test_replacement_keeps_generation_distinct(self, evaluator, deduplication):
+        """Test that replaced duplicates leave only distinct chromosomes.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(evaluator, deduplication)
+        island.run()
+
+        assert island.statistic_engine.duplicates > 0
+        assert island.statistic_engine.evaluations == 20 * 5
+        assert _distinct(island.current_population) == 20
+
+    def test_mutated_binary_duplicate_is_evaluated(self):
+        """Test that a mutated binary duplicate gets the value of its own chromosome.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockBinaryEvaluator(bin_len=12)
+        island = _island(evaluator, GaDeduplication.MUTATE)
+        island.run()
+
+        for indiv in island.current_population:
+            assert indiv.value == float(np.sum(np.unpackbits(indiv.bin_chrom)[:12]))
+
+    def test_async_share(self):
+        """Test that run_async() shares values with duplicates as well.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(MockAsyncEvaluator(dim=3), GaDeduplication.SHARE)
+        asyncio.run(island.run_async())
+        stats = island.statistic_engine
+
+        assert stats.duplicates > 0
+        assert stats.evaluations + stats.duplicates == 20 * 5
+        for indiv in island.current_population:
+            assert indiv.value == pytest.approx(float(np.sum(indiv.real_chrom**2)))
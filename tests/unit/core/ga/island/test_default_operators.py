@@ -0,0 +1,98 @@
+"""
+Unit tests for default operators of GaIsland.
+
+Tests that default operators are built on run only for empty slots needed by
+the evaluator, sized from the evaluator's chromosomes, reproducible for a seed
+and rebuilt when the evaluator changes between runs.
+"""
+
+import pytest
+
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.operators.Ga.real.crossover.OnePointCrossover import OnePointCrossover
+from tests.utils.factories.island_factories import minimal_island_factory
+from tests.utils.mocks.mock_objects import MockBinaryEvaluator, MockMixedEvaluator
+
+
+class TestGaIslandDefaultOperators:
+    """Test deferred construction of default operators."""
+
+    @pytest.mark.parametrize("dim", [2, 7, 40])
+    def test_real_viruses_match_evaluator_dimension(self, dim):
+        """Test that default real viruses have one gene per dimension of the evaluator.
+
+        :param dim: Evaluator dimension.
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory(dim=dim)
+        island.run()
+
+        assert all(len(virus) == dim for virus in island.real_mutation.virus_vectors)
+
+    def test_binary_viruses_match_bit_length(self):
+        """Test that default binary viruses have one gene per bit of the evaluator.
+
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory()
+        island.set_evaluator(MockBinaryEvaluator(bin_len=6))
+        island.run()
+
+        assert all(len(virus) == 6 for virus in island.bin_mutation.virus_vectors)
+        assert island.real_mutation is None
+
+    def test_user_operator_is_kept(self):
+        """Test that an operator set by the user is not replaced by a default.
+
+        :returns: None
+        :raises: None
+        """
+        crossover = OnePointCrossover()
+        island = minimal_island_factory()
+        island.set_operator(crossover)
+        island.run()
+
+        assert island.real_crossover is crossover
+
+    def test_defaults_are_reproducible_for_seed(self):
+        """Test that two islands with the same seed build identical default viruses.
+
+        :returns: None
+        :raises: None
+        """
+        islands = [minimal_island_factory(), minimal_island_factory()]
+        for island in islands:
+            island.run()
+
+        first, second = (island.real_mutation.virus_vectors for island in islands)
+        assert first[2] == second[2]
+
+    def test_defaults_are_rebuilt_for_new_evaluator(self):
+        """Test that defaults built by a previous run follow a changed evaluator.
+
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory(dim=4)
+        island.run()
+        island.set_evaluator(SphereEvaluator(dim=9))
+        island.run()
+
+        assert all(len(virus) == 9 for virus in island.real_mutation.virus_vectors)
+
+    def test_mixed_chromosomes_run_without_fixed_dimension(self):
+        """Test that evaluators with fewer than 15 genes and bits can be run with defaults.
+
+        :returns: None
+        :raises: None
+        """
+        island = GaIsland()
+        island.set_evaluator(MockMixedEvaluator())
+        island.set_population_size(10)
+        island.set_max_generations(3)
+        island.set_mutation_probability(1.0)
+
+        assert island.run().total_generations == 4
@@ -0,0 +1,193 @@
+"""
+Unit tests for incremental evaluation of partially changed chromosomes.
+
+Tests that Sphere and Rastrigin update a parent's value with the terms of
+changed genes only, that mutation operators record changed genes of
+offspring copied from an evaluated parent, and that GaIsland routes such
+offspring to evaluate_delta() in the calling process and in a worker pool
+while keeping values equal to a full evaluation.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.RastriginEvaluator import RastriginEvaluator
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.helpers.GaLineage import mark_changed_genes
+from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
+from evolvekit.operators.Ga.real.mutation.UniformMutation import UniformMutation
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+class CountingSphereEvaluator(SphereEvaluator):
+    """Sphere evaluator counting full and incremental evaluations."""
+
+    def __init__(self, dim: int):
+        super().__init__(dim)
+        self.full = 0
+        self.delta = 0
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        self.full += 1
+        return super().evaluate(args)
+
+    def evaluate_delta(self, args: GaEvaluatorArgs) -> float:
+        self.delta += 1
+        return super().evaluate_delta(args)
+
+
+def _offspring(evaluator, parent_chrom, changed):
+    chrom = np.copy(parent_chrom)
+    chrom[changed] = np.random.uniform(-5.0, 5.0, len(changed))
+    return GaIndividual(
+        real_chrom=chrom,
+        parent_real_chrom=parent_chrom,
+        parent_value=evaluator.evaluate(
+            GaEvaluatorArgs(GaIndividual(real_chrom=parent_chrom))
+        ),
+        changed_genes=np.array(changed, dtype=np.intp),
+    )
+
+
+class TestEvaluateDelta:
+    """Test reference implementations of evaluate_delta()."""
+
+    @pytest.mark.parametrize("evaluator", [SphereEvaluator(8), RastriginEvaluator(8)])
+    def test_delta_matches_full_evaluation(self, evaluator):
+        """Test that the updated value equals evaluating the whole chromosome.
+
+        :returns: None
+        :raises: None
+        """
+        parent_chrom = np.random.uniform(-5.0, 5.0, 8)
+        offspring = _offspring(evaluator, parent_chrom, [1, 6])
+        args = GaEvaluatorArgs(offspring)
+
+        assert evaluator.evaluate_delta(args) == pytest.approx(evaluator.evaluate(args))
+
+    def test_default_evaluate_batch_routes_by_changed_genes(self):
+        """Test that evaluate_batch() uses evaluate_delta() for recorded offspring only.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = CountingSphereEvaluator(4)
+        parent_chrom = np.ones(4)
+        evaluator.evaluate_batch(
+            [
+                GaEvaluatorArgs(_offspring(evaluator, parent_chrom, [0])),
+                GaEvaluatorArgs(GaIndividual(real_chrom=parent_chrom)),
+            ]
+        )
+
+        assert (evaluator.full, evaluator.delta) == (2, 1)
+
+    def test_arguments_without_parent_have_no_changed_genes(self):
+        """Test that arguments only carry the parent of recorded offspring.
+
+        :returns: None
+        :raises: None
+        """
+        args = GaEvaluatorArgs(GaIndividual(real_chrom=np.ones(3)))
+
+        assert args.changed_genes is None
+        assert args.parent_real_chrom is None
+        assert args.parent_value is None
+
+
+class TestChangedGenes:
+    """Test recording of changed genes."""
+
+    def test_mark_is_ignored_without_parent(self):
+        """Test that individuals without a recorded parent are left unchanged.
+
+        :returns: None
+        :raises: None
+        """
+        indiv = GaIndividual(real_chrom=np.ones(3))
+        mark_changed_genes(indiv, [1])
+
+        assert indiv.changed_genes is None
+
+    def test_mark_collects_sorted_unique_indices(self):
+        """Test that marks accumulate without duplicates.
+
+        :returns: None
+        :raises: None
+        """
+        indiv = GaIndividual(
+            real_chrom=np.ones(5), changed_genes=np.array([], dtype=np.intp)
+        )
+        mark_changed_genes(indiv, [3, 1])
+        mark_changed_genes(indiv, [1, 4])
+
+        assert indiv.changed_genes.tolist() == [1, 3, 4]
+
+    def test_mutation_records_changed_gene(self):
+        """Test that UniformMutation marks the single gene it changes.
+
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory(dim=6)
+        island.offspring_population = [
+            GaIndividual(
+                real_chrom=np.zeros(6), changed_genes=np.array([], dtype=np.intp)
+            )
+        ]
+        island.current_population = island.offspring_population
+
+        mutation = UniformMutation()
+        mutated = mutation.perform(GaOperatorArgs(island, mutation.category()))[0]
+
+        assert mutation.tracks_changed_genes()
+        assert (
+            np.flatnonzero(mutated.real_chrom).tolist()
+            == mutated.changed_genes.tolist()
+        )
+
+
+class TestGaIslandDeltaEvaluation:
+    """Test that islands evaluate mutated copies of parents incrementally."""
+
+    def test_island_uses_delta_and_keeps_values_exact(self):
+        """Test that some offspring are evaluated incrementally with correct values.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = CountingSphereEvaluator(6)
+        island = minimal_island_factory(dim=6, max_generations=10, population_size=20)
+        island.set_evaluator(evaluator)
+        island.set_crossover_probability(0.3)
+        island.set_seed(3)
+        island.run()
+
+        assert evaluator.delta > 0
+        for indiv in island.current_population:
+            assert indiv.value == pytest.approx(
+                float(np.sum(np.square(indiv.real_chrom))), abs=1e-9
+            )
+            assert indiv.changed_genes is None
+
+    def test_pool_workers_use_delta(self):
+        """Test that worker processes give the same values as the calling process.
+
+        :returns: None
+        :raises: None
+        """
+        results = []
+        for workers in (None, 2):
+            island = minimal_island_factory(
+                dim=6, max_generations=4, population_size=16
+            )
+            island.set_crossover_probability(0.3)
+            island.set_seed(5)
+            if workers:
+                island.set_workers(workers)
+            results.append(island.run())
+
+        assert results[1].value == pytest.approx(results[0].value)
+        assert np.array_equal(results[1].real_chrom, results[0].real_chrom)
@@ -0,0 +1,116 @@
+"""
+Unit tests for GaIsland evolution modes.
+
+Tests that steady-state and asynchronous steady-state modes keep the population
+size constant, count one generation per population_size evaluations, never lose
+the best individual, and that parallel generational evaluation works.
+"""
+
+import pytest
+
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
+from tests.utils.factories.island_factories import minimal_island_factory
+from tests.utils.mocks.mock_objects import FitnessCapturingInspector
+
+
+class TestGaIslandSteadyState:
+    """Test steady-state replacement of a few individuals at a time."""
+
+    @pytest.mark.parametrize(
+        "mode", [GaEvolutionMode.STEADY_STATE, GaEvolutionMode.ASYNC_STEADY_STATE]
+    )
+    def test_population_size_is_preserved(self, mode):
+        """Test that replacing individuals never changes the population size.
+
+        :param mode: Steady-state evolution mode under test.
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory(population_size=12, max_generations=3)
+        island.set_evolution_mode(mode)
+        island.set_workers(2)
+        island.run()
+
+        assert len(island.current_population) == 12
+
+    @pytest.mark.parametrize(
+        "mode", [GaEvolutionMode.STEADY_STATE, GaEvolutionMode.ASYNC_STEADY_STATE]
+    )
+    def test_generation_counts_population_size_evaluations(self, mode):
+        """Test that every generation corresponds to population_size evaluations.
+
+        :param mode: Steady-state evolution mode under test.
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory(population_size=10, max_generations=4)
+        island.set_evolution_mode(mode)
+        island.set_replacement_size(3)
+        results = island.run()
+
+        assert results.total_generations == 5
+        assert results.total_evaluations == 5 * 10
+
+    @pytest.mark.parametrize(
+        "mode", [GaEvolutionMode.STEADY_STATE, GaEvolutionMode.ASYNC_STEADY_STATE]
+    )
+    def test_best_fitness_never_deteriorates(self, mode):
+        """Test that replacing only the worst individuals keeps the best one alive.
+
+        :param mode: Steady-state evolution mode under test.
+        :returns: None
+        :raises: None
+        """
+        inspector = FitnessCapturingInspector()
+        island = minimal_island_factory(population_size=16, max_generations=5)
+        island.set_evolution_mode(mode)
+        island.set_workers(2)
+        island.set_inspector(inspector)
+        island.run()
+
+        for previous, current in zip(inspector.best_values, inspector.best_values[1:]):
+            assert current <= previous
+
+    @pytest.mark.parametrize("size", [0, 11])
+    def test_run_raises_on_invalid_replacement_size(self, size):
+        """Test that a replacement size outside [1, population_size] raises ValueError.
+
+        :param size: Invalid replacement size.
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory(population_size=10)
+        island.set_evolution_mode(GaEvolutionMode.STEADY_STATE)
+        island.set_replacement_size(size)
+
+        with pytest.raises(ValueError):
+            island.run()
+
+
+class TestGaIslandParallelGenerational:
+    """Test generational evolution with evaluation spread across worker processes."""
+
+    def test_parallel_run_evaluates_every_individual(self):
+        """Test that a run with several workers evaluates the whole population.
+
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory(population_size=8, max_generations=2)
+        island.set_workers(3)
+        results = island.run()
+
+        assert results.total_evaluations == 3 * 8
+        assert all(isinstance(ind.value, float) for ind in island.current_population)
+
+    def test_run_raises_on_non_positive_worker_count(self):
+        """Test that zero workers is rejected with ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory()
+        island.set_workers(0)
+
+        with pytest.raises(ValueError):
+            island.run()
@@ -0,0 +1,123 @@
+"""
+Unit tests for fitness inheritance and crossover lineage.
+
+Tests that crossovers report parent indices with mixing coefficients, that
+lineages of mixed parents combine, that RankSelection keeps the fitness of
+selected individuals, and that GaIsland gives a fraction of offspring an
+inherited fitness instead of evaluating them, never reporting it as the result.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
+from evolvekit.core.Ga.helpers.GaLineage import mix_lineage, project_lineage
+from evolvekit.core.Ga.operators.GaOperatorArgs import GaOperatorArgs
+from evolvekit.operators.Ga.real.crossover.AverageCrossover import AverageCrossover
+from evolvekit.operators.Ga.real.crossover.FlatCrossover import FlatCrossover
+from evolvekit.operators.Ga.real.crossover.OnePointCrossover import OnePointCrossover
+from evolvekit.operators.Ga.universal.selection.RankSelection import RankSelection
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+def _parents(*chromosomes):
+    parents = [
+        GaIndividual(real_chrom=np.array(c, dtype=np.float64)) for c in chromosomes
+    ]
+    for index, parent in enumerate(parents):
+        parent.value = float(np.sum(parent.real_chrom))
+        parent.lineage = [(index, 1.0)]
+    return parents
+
+
+def _args(population, category=GaOpCategory.REAL_CROSSOVER):
+    island = minimal_island_factory(dim=len(population[0].real_chrom))
+    island.selected_population = population
+    island.current_population = population
+    return GaOperatorArgs(island, category)
+
+
+class TestLineage:
+    """Test lineage helpers and crossover reports."""
+
+    def test_mix_lineage_combines_shared_parents(self):
+        """Test that weights of the same parent add up.
+
+        :returns: None
+        :raises: None
+        """
+        lineage = mix_lineage([[(0, 1.0)], [(0, 0.5), (1, 0.5)]], [0.5, 0.5])
+
+        assert dict(lineage) == pytest.approx({0: 0.75, 1: 0.25})
+
+    def test_project_lineage_measures_position_on_crossover_line(self):
+        """Test that the child's position between parents gives their weights.
+
+        :returns: None
+        :raises: None
+        """
+        parent_1, parent_2 = _parents([0.0, 0.0], [4.0, 0.0])
+
+        lineage = project_lineage(np.array([1.0, 3.0]), parent_1, parent_2)
+
+        assert dict(lineage) == pytest.approx({0: 0.75, 1: 0.25})
+
+    @pytest.mark.parametrize(
+        "crossover", [AverageCrossover(), FlatCrossover(), OnePointCrossover()]
+    )
+    def test_crossover_children_report_parents(self, crossover):
+        """Test that children refer to both parents with weights summing to one.
+
+        :returns: None
+        :raises: None
+        """
+        children = crossover.perform(_args(_parents([0.0, 0.0, 0.0], [1.0, 1.0, 1.0])))
+
+        for child in children:
+            assert {index for index, _ in child.lineage} == {0, 1}
+            assert sum(weight for _, weight in child.lineage) == pytest.approx(1.0)
+
+    def test_rank_selection_keeps_fitness(self):
+        """Test that selected individuals keep their fitness instead of their rank.
+
+        :returns: None
+        :raises: None
+        """
+        population = _parents([5.0], [-2.0], [7.0], [1.0])
+        selected = RankSelection(target_population=10).perform(
+            _args(population, GaOpCategory.SELECTION)
+        )
+
+        assert all(ind.value == ind.real_chrom[0] for ind in selected)
+
+
+class TestGaIslandFitnessInheritance:
+    """Test inheriting fitness in GaIsland."""
+
+    def test_fraction_of_offspring_is_not_evaluated(self, island_runner):
+        """Test that inheritance cuts evaluations and results are true values.
+
+        :returns: None
+        :raises: None
+        """
+        _, baseline = island_runner(dim=4, max_generations=10, population_size=20)
+        island, results = island_runner(
+            dim=4, max_generations=10, population_size=20, fitness_inheritance=0.5
+        )
+
+        assert results.total_evaluations < 0.8 * baseline.total_evaluations
+        assert not island.statistic_engine.best_indiv.estimated
+        assert results.value == pytest.approx(float(np.sum(results.real_chrom**2)))
+
+    def test_invalid_fraction_raises(self):
+        """Test that a fraction outside [0, 1) is rejected.
+
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory()
+        island.set_fitness_inheritance(1.0)
+
+        with pytest.raises(ValueError):
+            island.run()
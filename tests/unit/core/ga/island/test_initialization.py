@@ -6,6 +6,7 @@ required default operators, and that __verify raises appropriate exceptions
 for invalid configurations before run() begins.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock
 
@@ -83,8 +84,8 @@ class TestGaIslandDefaultValues:
         "bin_crossover",
         "bin_mutation",
     ])
-    def test_default_operators_are_set(self, operator_field):
-        """Test that all genetic operators are wired up by default.
+    def test_default_operators_are_deferred(self, operator_field):
+        """Test that no genetic operator is built on construction.
 
         :param operator_field: Name of the operator attribute.
         :returns: None
@@ -92,7 +93,20 @@ class TestGaIslandDefaultValues:
         """
         island = GaIsland()
 
-        assert getattr(island, operator_field) is not None
+        assert getattr(island, operator_field) is None
+
+    def test_construction_leaves_global_random_state_untouched(self):
+        """Test that constructing an island does not draw from the global RNG.
+
+        :returns: None
+        :raises: None
+        """
+        np.random.seed(123)
+        expected = np.random.random()
+        np.random.seed(123)
+        GaIsland()
+
+        assert np.random.random() == expected
 
     def test_is_subclass_of_ga_state(self):
         """Test that GaIsland inherits from GaState.
@@ -117,17 +131,17 @@ class TestGaIslandParameterValidation:
         with pytest.raises(TypeError):
             island.run()
 
-    def test_run_raises_when_selection_is_none(self):
-        """Test that a TypeError is raised when selection operator is removed.
+    def test_run_builds_default_selection_when_none(self):
+        """Test that an empty selection slot is filled with the default operator on run.
 
         :returns: None
         :raises: None
         """
         island = minimal_island_factory()
         island.selection = None
+        island.run()
 
-        with pytest.raises(TypeError):
-            island.run()
+        assert island.selection.category() == GaOpCategory.SELECTION
 
     @pytest.mark.parametrize("field, invalid_value", [
         ("population_size", 0),
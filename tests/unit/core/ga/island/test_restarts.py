@@ -0,0 +1,206 @@
+"""
+Unit tests for GaIsland restart strategies.
+
+Tests that a stalled search or a population whose diversity collapsed is
+restarted from random individuals, that the best individuals survive
+restarts without being evaluated again, that IPOP restarts grow the population and that the evaluation
+budget is shared by every restart.
+"""
+
+import asyncio
+
+import pytest
+
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
+from evolvekit.core.Ga.enums.GaRestartStrategy import GaRestartStrategy
+from tests.utils import (
+    FitnessCapturingInspector,
+    MockAsyncEvaluator,
+    MockBinaryEvaluator,
+    MockEvaluator,
+)
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+def _island(restart=GaRestartStrategy.IPOP, generations=20):
+    island = minimal_island_factory(dim=3, max_generations=generations)
+    island.set_restart(restart)
+    island.set_restart_stagnation(3)
+    return island
+
+
+class TestGaIslandRestarts:
+    """Test restarting a stalled search."""
+
+    @pytest.mark.parametrize(
+        "mode", [GaEvolutionMode.GENERATIONAL, GaEvolutionMode.STEADY_STATE]
+    )
+    def test_stagnating_search_is_restarted(self, mode):
+        """Test that a search without improvement is restarted and restarts are counted.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_evaluator(MockEvaluator(dim=3))
+        island.set_evolution_mode(mode)
+        results = island.run()
+
+        assert island.statistic_engine.restarts > 0
+        assert results.total_restarts == island.statistic_engine.restarts
+
+    def test_ipop_grows_population(self):
+        """Test that IPOP restarts multiply the population size, which is restored after the run.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_evaluator(MockEvaluator(dim=3))
+        results = island.run()
+        restarts = results.total_restarts
+
+        assert restarts > 0
+        assert len(island.current_population) == 10 * 2**restarts
+        assert island.population_size == 10
+
+    def test_restart_without_growth_keeps_population_size(self):
+        """Test that a population growth of 1 restarts with the same population size.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_evaluator(MockEvaluator(dim=3))
+        island.set_population_growth(1.0)
+        results = island.run()
+
+        assert results.total_restarts > 0
+        assert len(island.current_population) == 10
+
+    @pytest.mark.parametrize(
+        "restart", [GaRestartStrategy.IPOP, GaRestartStrategy.BIPOP]
+    )
+    def test_best_individual_survives_restarts(self, restart):
+        """Test that the best value never gets worse, since the elite archive is kept.
+
+        :returns: None
+        :raises: None
+        """
+        inspector = FitnessCapturingInspector()
+        island = _island(restart, generations=40)
+        island.set_elite_count(1)
+        island.set_restart_stagnation(2)
+        island.set_max_evaluations(2000)
+        island.set_inspector(inspector)
+        results = island.run()
+
+        assert results.total_restarts > 0
+        assert inspector.best_values == sorted(inspector.best_values, reverse=True)
+        assert results.value == min(inspector.best_values)
+
+    @pytest.mark.parametrize("run_async", [False, True])
+    def test_restart_evaluates_only_new_individuals(self, run_async):
+        """Test that a generational restart does not evaluate the elite archive again.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(generations=6)
+        island.set_evaluator(
+            MockAsyncEvaluator(dim=3) if run_async else MockEvaluator(dim=3)
+        )
+        island.set_elite_count(3)
+        island.set_population_growth(1.0)
+        island.set_restart_diversity(0.99999)
+        results = asyncio.run(island.run_async()) if run_async else island.run()
+        restarts = results.total_restarts
+        evolved = island.statistic_engine.generation - 1 - restarts
+
+        assert restarts > 0
+        assert results.total_evaluations == 10 + 7 * restarts + 10 * evolved
+
+    def test_collapsed_diversity_restarts_search(self):
+        """Test that a population less diverse than 'restart_diversity' is restarted.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(generations=5)
+        island.set_evaluator(MockBinaryEvaluator(bin_len=16))
+        island.set_restart_stagnation(1000)
+        island.set_restart_diversity(0.99999)
+        results = island.run()
+
+        assert results.total_restarts > 0
+
+    def test_no_restart_without_strategy(self):
+        """Test that a stalled search is not restarted by default.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(GaRestartStrategy.NONE)
+        island.set_evaluator(MockEvaluator(dim=3))
+        results = island.run()
+
+        assert results.total_restarts == 0
+        assert len(island.current_population) == 10
+
+
+class TestGaIslandEvaluationBudget:
+    """Test the evaluation budget shared by restarts."""
+
+    @pytest.mark.parametrize(
+        "restart", [GaRestartStrategy.NONE, GaRestartStrategy.IPOP]
+    )
+    def test_run_ends_after_max_evaluations(self, restart):
+        """Test that the simulation ends in the generation the budget is used up.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(restart, generations=1000)
+        island.set_evaluator(MockEvaluator(dim=3))
+        island.set_max_evaluations(95)
+        results = island.run()
+
+        assert 95 <= results.total_evaluations
+        assert results.total_generations < 1000
+
+
+class TestGaIslandRestartVerification:
+    """Test validation of restart settings."""
+
+    @pytest.mark.parametrize(
+        "setter, value",
+        [
+            ("set_restart_stagnation", 0),
+            ("set_restart_diversity", 1.0),
+            ("set_population_growth", 0.5),
+            ("set_max_evaluations", 0),
+        ],
+    )
+    def test_invalid_settings_raise(self, setter, value):
+        """Test that invalid restart settings raise ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        getattr(island, setter)(value)
+
+        with pytest.raises(ValueError):
+            island.run()
+
+    def test_async_steady_state_is_rejected(self):
+        """Test that restarts in asynchronous steady-state mode raise ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_evolution_mode(GaEvolutionMode.ASYNC_STEADY_STATE)
+
+        with pytest.raises(ValueError):
+            island.run()
@@ -0,0 +1,184 @@
+"""
+Unit tests for GaIsland.run_async().
+
+Tests that coroutine evaluators are run concurrently with bounded concurrency,
+that evaluator and run method are checked against each other, that evaluation
+timeouts are penalized and that in-flight evaluations are cancelled when the
+simulation stops early or fails.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaVisitedSet import GaVisitedSet
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
+from evolvekit.core.Ga.parallel.GaEvaluationPolicy import GaEvaluationPolicy
+from tests.utils.factories.island_factories import minimal_island_factory
+from tests.utils.mocks.mock_objects import (
+    AfterNGenerationsInspector,
+    MockAsyncEvaluator,
+)
+
+
+class CountingVisitedSet(GaVisitedSet):
+    """Visited set counting lookups and cached values found."""
+
+    def __init__(self):
+        super().__init__(capacity=1000, cache_size=1000)
+        self.lookups = 0
+        self.hits = 0
+
+    def get(self, indiv):
+        value = super().get(indiv)
+        self.lookups += 1
+        self.hits += value is not None
+        return value
+
+
+def _async_island(evaluator: MockAsyncEvaluator, **kwargs):
+    island = minimal_island_factory(**kwargs)
+    island.set_evaluator(evaluator)
+    return island
+
+
+class TestGaIslandRunAsync:
+    """Test running a simulation with a coroutine evaluator."""
+
+    @pytest.mark.parametrize(
+        "mode",
+        [
+            GaEvolutionMode.GENERATIONAL,
+            GaEvolutionMode.STEADY_STATE,
+            GaEvolutionMode.ASYNC_STEADY_STATE,
+        ],
+    )
+    def test_population_is_evaluated(self, mode):
+        """Test that every individual is assigned the value computed by the coroutine.
+
+        :param mode: Evolution mode under test.
+        :returns: None
+        :raises: None
+        """
+        island = _async_island(MockAsyncEvaluator(), population_size=12)
+        island.set_evolution_mode(mode)
+        results = asyncio.run(island.run_async())
+
+        assert results.total_evaluations >= 12 * 3
+        for indiv in island.current_population:
+            assert indiv.value == pytest.approx(np.sum(np.square(indiv.real_chrom)))
+
+    def test_concurrency_is_bounded(self):
+        """Test that evaluations overlap but never exceed max_concurrency.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockAsyncEvaluator(delay=0.01)
+        island = _async_island(evaluator, population_size=20)
+        island.set_max_concurrency(5)
+        asyncio.run(island.run_async())
+
+        assert evaluator.max_active == 5
+
+    def test_run_rejects_async_evaluator(self):
+        """Test that the synchronous run method refuses a coroutine evaluator.
+
+        :returns: None
+        :raises: None
+        """
+        island = _async_island(MockAsyncEvaluator())
+
+        with pytest.raises(TypeError):
+            island.run()
+
+    def test_run_async_rejects_sync_evaluator(self):
+        """Test that run_async refuses an evaluator without coroutine evaluation.
+
+        :returns: None
+        :raises: None
+        """
+        island = minimal_island_factory()
+        island.set_evaluator(SphereEvaluator(dim=15))
+
+        with pytest.raises(TypeError):
+            asyncio.run(island.run_async())
+
+    def test_timeouts_are_penalized(self):
+        """Test that evaluations exceeding the policy timeout receive the penalty.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockAsyncEvaluator(hang_above=0.0)
+        island = _async_island(evaluator, population_size=8, max_generations=1)
+        island.set_evaluation_policy(GaEvaluationPolicy(timeout=0.05, penalty=99.0))
+        asyncio.run(island.run_async())
+
+        assert island.statistic_engine.timeouts > 0
+        assert all(
+            indiv.value == 99.0
+            for indiv in island.current_population
+            if indiv.real_chrom[0] > 0.0
+        )
+
+    @pytest.mark.parametrize(
+        "mode", [GaEvolutionMode.GENERATIONAL, GaEvolutionMode.ASYNC_STEADY_STATE]
+    )
+    def test_individuals_are_looked_up_once(self, mode):
+        """Test that cached values are looked up once for every individual.
+
+        :param mode: Evolution mode under test.
+        :returns: None
+        :raises: None
+        """
+        visited = CountingVisitedSet()
+        island = _async_island(MockAsyncEvaluator(), population_size=12)
+        island.set_evolution_mode(mode)
+        island.set_visited_set(visited)
+        # No evaluation is left in flight, and uncounted, when the run stops.
+        island.set_max_concurrency(1)
+        results = asyncio.run(island.run_async())
+
+        assert visited.hits > 0
+        assert results.total_evaluations == visited.lookups - visited.hits
+
+
+class TestGaIslandRunAsyncCancellation:
+    """Test cancellation of evaluations still in flight."""
+
+    def test_early_termination_cancels_in_flight_evaluations(self):
+        """Test that stopping asynchronous steady-state evolution cancels remaining evaluations.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockAsyncEvaluator(delay=0.001)
+        island = _async_island(evaluator, population_size=10, max_generations=50)
+        island.set_evolution_mode(GaEvolutionMode.ASYNC_STEADY_STATE)
+        island.set_max_concurrency(8)
+        island.set_inspector(AfterNGenerationsInspector(2))
+        asyncio.run(island.run_async())
+
+        assert evaluator.cancelled > 0
+        assert evaluator.active == 0
+
+    def test_failure_cancels_remaining_evaluations(self):
+        """Test that without a policy a timed out evaluation stops the run and cancels the rest.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockAsyncEvaluator(hang_above=0.0)
+        island = _async_island(evaluator, population_size=8)
+
+        async def run_with_deadline():
+            await asyncio.wait_for(island.run_async(), 0.1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run_with_deadline())
+
+        assert evaluator.cancelled > 0
+        assert evaluator.active == 0
@@ -0,0 +1,143 @@
+"""
+Unit tests for GaVisitedSet.
+
+Tests that the Bloom filter never misses added chromosomes, keeps its
+false positive rate near the configured one with a memory size fixed on
+creation, that the exact cache evicts least recently used values, and
+that GaIsland serves cached values, counts revisits and regenerates
+revisited binary chromosomes.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.GaVisitedSet import GaVisitedSet
+from evolvekit.core.Ga.enums.GaDeduplication import GaDeduplication
+from tests.utils import MockBinaryEvaluator
+
+
+class CountingBinaryEvaluator(MockBinaryEvaluator):
+    """Binary evaluator counting evaluations."""
+
+    def __init__(self, bin_len: int):
+        super().__init__(bin_len)
+        self.calls = 0
+
+    def evaluate(self, args):
+        self.calls += 1
+        return super().evaluate(args)
+
+
+def _bits(number: int) -> GaIndividual:
+    return GaIndividual(
+        bin_chrom=np.frombuffer(number.to_bytes(4, "big"), dtype=np.uint8).copy()
+    )
+
+
+def _island(evaluator, visited_set):
+    island = GaIsland()
+    island.set_evaluator(evaluator)
+    island.set_population_size(30)
+    island.set_max_generations(5)
+    island.set_visited_set(visited_set)
+    return island
+
+
+class TestGaVisitedSet:
+    """Test the filter and the cache."""
+
+    def test_added_chromosomes_are_always_seen(self):
+        """Test that the filter has no false negatives.
+
+        :returns: None
+        :raises: None
+        """
+        visited = GaVisitedSet(capacity=1000, error_rate=0.01)
+        for number in range(1000):
+            assert not visited.add(_bits(number)) or number > 0
+
+        assert all(_bits(number) in visited for number in range(1000))
+        assert visited.add(_bits(5))
+
+    def test_false_positive_rate_and_memory(self):
+        """Test that a full filter reports about 'error_rate' of new chromosomes as seen.
+
+        :returns: None
+        :raises: None
+        """
+        visited = GaVisitedSet(capacity=5000, error_rate=0.01)
+        for number in range(5000):
+            visited.add(_bits(number))
+        false_positives = sum(_bits(number) in visited for number in range(5000, 25000))
+
+        assert false_positives / 20000 < 0.02
+        assert visited.false_positive_rate() == pytest.approx(0.01, rel=0.2)
+        assert visited.nbytes == pytest.approx(5000 * 9.585 / 8, rel=0.01)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache keeps the most recently used values only.
+
+        :returns: None
+        :raises: None
+        """
+        visited = GaVisitedSet(capacity=100, cache_size=2)
+        visited.put_many([_bits(1), _bits(2)], [1.0, 2.0])
+        assert visited.get(_bits(1)) == 1.0
+        visited.put_many([_bits(3)], [3.0])
+
+        assert visited.get(_bits(2)) is None
+        assert visited.get(_bits(1)) == 1.0
+        assert visited.get(_bits(3)) == 3.0
+        assert _bits(2) in visited
+
+    def test_invalid_parameters(self):
+        """Test that invalid sizes and rates are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(ValueError):
+            GaVisitedSet(capacity=0)
+        with pytest.raises(ValueError):
+            GaVisitedSet(error_rate=1.0)
+        with pytest.raises(ValueError):
+            GaVisitedSet(cache_size=-1)
+
+
+class TestGaIslandVisitedSet:
+    """Test that islands consult the visited set."""
+
+    def test_cached_values_are_served(self):
+        """Test that revisited chromosomes with cached values are not evaluated.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = CountingBinaryEvaluator(6)
+        island = _island(evaluator, GaVisitedSet(capacity=1000, cache_size=64))
+        island.run()
+        stats = island.statistic_engine
+
+        assert stats.revisits > 0
+        assert evaluator.calls == stats.evaluations < 30 * 6
+        for indiv in island.current_population:
+            assert indiv.value == float(np.sum(np.unpackbits(indiv.bin_chrom)[:6]))
+
+    def test_revisits_are_regenerated(self):
+        """Test that offspring visited before are regenerated instead of evaluated again.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = CountingBinaryEvaluator(16)
+        visited = GaVisitedSet(capacity=10000, regenerate=True)
+        island = _island(evaluator, visited)
+        island.set_elite_count(0)
+        island.set_deduplication(GaDeduplication.SHARE)
+        island.run()
+
+        # Only chromosomes not visited before are evaluated.
+        assert island.statistic_engine.revisits > 0
+        assert len(visited) == evaluator.calls
@@ -0,0 +1,307 @@
+"""
+Unit tests for the memetic local-search stage.
+
+Tests that GaLocalSearch refines real chromosomes with scipy optimizers and
+binary chromosomes with a bit-flip hill climber within its evaluation
+budget, and that GaIsland refines the best individuals of the population
+with Lamarckian or Baldwinian write-back, in every supported mode, reporting
+learned values only with the chromosomes they belong to.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.RosenbrockEvaluator import RosenbrockEvaluator
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.enums.GaClampStrategy import GaClampStrategy
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
+from evolvekit.core.Ga.enums.GaWriteBack import GaWriteBack
+from evolvekit.core.Ga.memetic.GaLocalSearch import GaLocalSearch
+from evolvekit.core.Ga.parallel.GaFitnessStore import GaFitnessStore
+from tests.utils import MockBinaryEvaluator
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+class _CountingEvaluation:
+    """Evaluates batches with an evaluator and records their sizes."""
+
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+        self.batches = []
+
+    def __call__(self, individuals):
+        self.batches.append(len(individuals))
+        for indiv in individuals:
+            indiv.value = self.evaluator.evaluate(GaEvaluatorArgs(indiv))
+
+
+class _ParentCheckingSphereEvaluator(SphereEvaluator):
+    """Sphere evaluator counting incremental evaluations against wrong parent values."""
+
+    def __init__(self, dim):
+        super().__init__(dim)
+        self.delta = 0
+        self.wrong_parents = 0
+
+    def evaluate_delta(self, args):
+        self.delta += 1
+        if args.parent_value != pytest.approx(float(np.sum(args.parent_real_chrom**2))):
+            self.wrong_parents += 1
+        return super().evaluate_delta(args)
+
+
+def _evaluated(evaluator, real=(), bins=()):
+    indiv = GaIndividual(
+        np.array(real, dtype=np.float64), np.array(bins, dtype=np.uint8), 0.0
+    )
+    indiv.value = evaluator.evaluate(GaEvaluatorArgs(indiv))
+    return indiv
+
+
+class TestGaLocalSearch:
+    """Test refinement of single individuals."""
+
+    @pytest.mark.parametrize("method", GaLocalSearch.METHODS)
+    def test_real_chromosome_is_refined_within_budget(self, method):
+        """Test that scipy optimizers improve a real chromosome without exceeding the budget.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = SphereEvaluator(dim=4)
+        evaluation = _CountingEvaluation(evaluator)
+        indiv = _evaluated(evaluator, real=[1.0, -2.0, 0.5, 3.0])
+
+        refined = GaLocalSearch(budget=150, method=method).refine(
+            indiv, evaluator, evaluation
+        )
+
+        assert refined.value < indiv.value / 10
+        assert sum(evaluation.batches) <= 150
+        assert refined.value == evaluator.evaluate(GaEvaluatorArgs(refined))
+        assert list(indiv.real_chrom) == [1.0, -2.0, 0.5, 3.0]
+
+    def test_gradient_is_evaluated_as_one_batch(self):
+        """Test that L-BFGS-B evaluates a point with its finite differences together.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = SphereEvaluator(dim=4)
+        evaluation = _CountingEvaluation(evaluator)
+        indiv = _evaluated(evaluator, real=[1.0, -2.0, 0.5, 3.0])
+
+        GaLocalSearch(budget=50).refine(indiv, evaluator, evaluation)
+
+        assert set(evaluation.batches) == {5}
+
+    def test_refined_chromosome_stays_in_domain(self):
+        """Test that refinement of a chromosome at the bound stays within the domain.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = SphereEvaluator(dim=2)
+        upper = evaluator.real_domain()[0][1]
+        indiv = _evaluated(evaluator, real=[upper, upper])
+
+        refined = GaLocalSearch(budget=60).refine(
+            indiv, evaluator, _CountingEvaluation(evaluator)
+        )
+
+        for gene, (low, high) in zip(refined.real_chrom, evaluator.real_domain()):
+            assert low <= gene <= high
+
+    def test_optimum_is_not_refined(self):
+        """Test that None is returned when no better individual is found.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = SphereEvaluator(dim=3)
+        indiv = _evaluated(evaluator, real=[0.0, 0.0, 0.0])
+
+        refined = GaLocalSearch(budget=40).refine(
+            indiv, evaluator, _CountingEvaluation(evaluator)
+        )
+
+        assert refined is None
+
+    @pytest.mark.parametrize("flips", [None, 3])
+    def test_hill_climber_maximizes_binary_chromosome(self, flips):
+        """Test that the bit-flip hill climber reaches the maximum of a binary problem.
+
+        :returns: None
+        :raises: None
+        """
+        np.random.seed(0)
+        evaluator = MockBinaryEvaluator(bin_len=12)
+        evaluation = _CountingEvaluation(evaluator)
+        indiv = _evaluated(evaluator, bins=[0b10100000, 0b00010000])
+
+        refined = GaLocalSearch(budget=500, flips=flips).refine(
+            indiv, evaluator, evaluation
+        )
+
+        assert refined.value == 12
+        assert max(evaluation.batches) == (flips or 12)
+
+    def test_hill_climber_stops_at_local_optimum(self):
+        """Test that the hill climber stops once no single flip improves the chromosome.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = MockBinaryEvaluator(bin_len=8)
+        evaluation = _CountingEvaluation(evaluator)
+        indiv = _evaluated(evaluator, bins=[0b00000000])
+
+        GaLocalSearch(budget=1000).refine(indiv, evaluator, evaluation)
+
+        assert evaluation.batches == [8] * 9
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"method": "BFGS"},
+            {"count": 0},
+            {"budget": 0},
+            {"interval": 0},
+            {"flips": 0},
+        ],
+    )
+    def test_invalid_settings_raise(self, kwargs):
+        """Test that invalid settings raise ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(ValueError):
+            GaLocalSearch(**kwargs)
+
+
+def _island(local_search, mode=GaEvolutionMode.GENERATIONAL):
+    island = minimal_island_factory(max_generations=5)
+    island.set_evaluator(RosenbrockEvaluator(dim=4))
+    island.set_real_clamp_strategy(GaClampStrategy.CLAMP)
+    island.set_evolution_mode(mode)
+    island.set_local_search(local_search)
+    return island
+
+
+class TestGaIslandLocalSearch:
+    """Test the local-search stage of GaIsland."""
+
+    @pytest.mark.parametrize(
+        "mode", [GaEvolutionMode.GENERATIONAL, GaEvolutionMode.STEADY_STATE]
+    )
+    def test_lamarckian_refinement_improves_result(self, mode):
+        """Test that refined chromosomes and their values are written back.
+
+        :returns: None
+        :raises: None
+        """
+        plain = _island(None, mode).run()
+        island = _island(GaLocalSearch(budget=200), mode)
+        results = island.run()
+
+        assert island.statistic_engine.refinements > 0
+        assert results.value < plain.value / 10
+        assert results.total_evaluations > plain.total_evaluations
+        assert results.value == island.evaluator.evaluate(
+            GaEvaluatorArgs(GaIndividual(results.real_chrom, results.bin_chrom))
+        )
+
+    def test_baldwinian_refinement_keeps_chromosomes(self):
+        """Test that Baldwinian write-back changes values but not chromosomes.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(
+            GaLocalSearch(count=2, budget=60, write_back=GaWriteBack.BALDWINIAN)
+        )
+        island.set_max_generations(1)
+        island.run()
+        evaluator = island.evaluator
+
+        learned = [
+            indiv
+            for indiv in island.current_population
+            if indiv.value < evaluator.evaluate(GaEvaluatorArgs(indiv))
+        ]
+        assert island.statistic_engine.refinements > 0
+        assert learned
+
+    @pytest.mark.parametrize(
+        "mode", [GaEvolutionMode.GENERATIONAL, GaEvolutionMode.STEADY_STATE]
+    )
+    def test_baldwinian_result_matches_its_chromosomes(self, mode):
+        """Test that a learned value is reported with the refined chromosomes it belongs to.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(
+            GaLocalSearch(count=2, budget=60, write_back=GaWriteBack.BALDWINIAN), mode
+        )
+        results = island.run()
+        best = island.statistic_engine.best_indiv
+
+        assert island.statistic_engine.refinements > 0
+        assert results.value == island.evaluator.evaluate(
+            GaEvaluatorArgs(GaIndividual(results.real_chrom, results.bin_chrom))
+        )
+        assert best.value == island.evaluator.evaluate(GaEvaluatorArgs(best))
+
+    def test_learned_values_are_not_recorded(self, tmp_path):
+        """Test that learned values reach neither the store nor incrementally evaluated offspring.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = _ParentCheckingSphereEvaluator(6)
+        island = minimal_island_factory(dim=6, max_generations=10, population_size=20)
+        island.set_evaluator(evaluator)
+        island.set_crossover_probability(0.3)
+        island.set_seed(3)
+        island.set_local_search(
+            GaLocalSearch(count=4, budget=60, write_back=GaWriteBack.BALDWINIAN)
+        )
+        with GaFitnessStore(str(tmp_path / "fitness.db")) as store:
+            island.set_fitness_store(store)
+            island.run()
+            stored = store.get_many(island.current_population)
+
+        assert island.statistic_engine.refinements > 0
+        assert evaluator.delta > 0
+        assert evaluator.wrong_parents == 0
+        for indiv, value in zip(island.current_population, stored):
+            if value is not None:
+                assert value == pytest.approx(float(np.sum(indiv.real_chrom**2)))
+
+    def test_refinement_with_worker_pool(self):
+        """Test that refinement evaluates through the worker pool.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(GaLocalSearch(count=2, budget=60))
+        island.set_workers(2)
+        results = island.run()
+
+        assert island.statistic_engine.refinements > 0
+        assert np.isfinite(results.value)
+
+    def test_async_steady_state_is_rejected(self):
+        """Test that local search in asynchronous steady-state mode raises ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island(GaLocalSearch(), GaEvolutionMode.ASYNC_STEADY_STATE)
+
+        with pytest.raises(ValueError):
+            island.run()
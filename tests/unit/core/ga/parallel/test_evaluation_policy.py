@@ -0,0 +1,252 @@
+"""
+Unit tests for GaEvaluationPolicy.
+
+Tests that hung evaluations are cut off by the timeout and penalized, failed
+evaluations are retried, worker processes are recycled after a number of tasks,
+and that failures and timeouts are counted in island statistics.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.GaVisitedSet import GaVisitedSet
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.parallel.GaEvaluationPolicy import GaEvaluationPolicy
+from evolvekit.core.Ga.parallel.GaEvaluationPool import GaEvaluationPool
+from tests.utils.mocks.mock_objects import (
+    FailingEvaluator,
+    FailOnceEvaluator,
+    HangingEvaluator,
+    MockEvaluator,
+    ProcessIdEvaluator,
+)
+
+
+class FlakyEvaluator(MockEvaluator):
+    """Evaluator counting calls and failing for individuals whose first gene is above 0.5."""
+
+    def __init__(self, dim: int = 15):
+        super().__init__(dim=dim)
+        self.calls = 0
+        self.raised = 0
+        self.batches = 0
+
+    def evaluate(self, args):
+        self.calls += 1
+        if args.real_chrom[0] > 0.5:
+            self.raised += 1
+            raise RuntimeError("evaluation failed")
+        return float(args.real_chrom[0])
+
+
+class FlakyBatchEvaluator(FlakyEvaluator):
+    """Flaky evaluator with a batch evaluation, which fails if any individual fails."""
+
+    def evaluate_batch(self, args):
+        self.batches += 1
+        return [self.evaluate(arg) for arg in args]
+
+
+def _individual(first_gene: float, dim: int = 3):
+    return GaIndividual(real_chrom=np.array([first_gene] + [0.0] * (dim - 1)))
+
+
+class TestGaEvaluationPolicy:
+    """Test penalty values and worker requirements of the policy itself."""
+
+    @pytest.mark.parametrize(
+        "extremum,expected",
+        [(GaExtremum.MINIMUM, float("inf")), (GaExtremum.MAXIMUM, float("-inf"))],
+    )
+    def test_default_penalty_is_worst_possible_value(self, extremum, expected):
+        """Test that without an explicit penalty the worst value for the extremum is used.
+
+        :returns: None
+        :raises: None
+        """
+        assert GaEvaluationPolicy().penalty_value(extremum) == expected
+
+    def test_retries_alone_do_not_require_workers(self):
+        """Test that only timeouts and recycling force evaluation in worker processes.
+
+        :returns: None
+        :raises: None
+        """
+        assert not GaEvaluationPolicy(max_retries=2).requires_workers()
+        assert GaEvaluationPolicy(timeout=1.0).requires_workers()
+        assert GaEvaluationPolicy(max_tasks_per_worker=5).requires_workers()
+
+
+class TestGaEvaluationPoolWithPolicy:
+    """Test fault handling of the worker pool."""
+
+    def test_hung_evaluation_receives_penalty(self):
+        """Test that an evaluation exceeding the timeout is killed and penalized.
+
+        :returns: None
+        :raises: None
+        """
+        policy = GaEvaluationPolicy(timeout=0.3, penalty=100.0)
+        individuals = [_individual(-0.5), _individual(0.5), _individual(-0.25)]
+
+        with GaEvaluationPool(HangingEvaluator(), workers=2, policy=policy) as pool:
+            values = pool.evaluate(individuals)
+
+        assert values == [-0.5, 100.0, -0.25]
+        assert pool.timeouts == 1
+        assert pool.failures == 1
+
+    def test_failed_evaluation_is_retried(self, tmp_path):
+        """Test that an evaluation which fails once succeeds on retry.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = FailOnceEvaluator(str(tmp_path / "marker"))
+        policy = GaEvaluationPolicy(max_retries=1)
+
+        with GaEvaluationPool(evaluator, workers=1, policy=policy) as pool:
+            values = pool.evaluate([_individual(0.5)])
+
+        assert values == [0.5]
+        assert pool.failures == 1
+
+    def test_exhausted_retries_receive_penalty(self):
+        """Test that an evaluation failing on every attempt gets the penalty.
+
+        :returns: None
+        :raises: None
+        """
+        policy = GaEvaluationPolicy(max_retries=2, penalty=-1.0)
+
+        with GaEvaluationPool(FailingEvaluator(), workers=1, policy=policy) as pool:
+            values = pool.evaluate([_individual(0.0)])
+
+        assert values == [-1.0]
+        assert pool.failures == 3
+
+    def test_workers_are_recycled_after_max_tasks(self):
+        """Test that a worker is replaced by a fresh process after max_tasks_per_worker tasks.
+
+        :returns: None
+        :raises: None
+        """
+        policy = GaEvaluationPolicy(max_tasks_per_worker=2)
+
+        with GaEvaluationPool(ProcessIdEvaluator(), workers=1, policy=policy) as pool:
+            values = pool.evaluate([_individual(0.0) for _ in range(6)])
+
+        assert len(set(values)) == 3
+
+
+class TestGaIslandEvaluationPolicy:
+    """Test evaluation policies applied by GaIsland."""
+
+    def test_timeouts_are_reported_in_statistics(self, island_runner):
+        """Test that a run with hanging evaluations finishes and counts timeouts.
+
+        :returns: None
+        :raises: None
+        """
+        island, _ = island_runner(
+            HangingEvaluator(dim=15),
+            population_size=4,
+            max_generations=1,
+            evaluation_policy=GaEvaluationPolicy(timeout=0.2, penalty=5.0),
+        )
+
+        assert island.statistic_engine.timeouts > 0
+        assert island.statistic_engine.timeouts == island.statistic_engine.failures
+        assert all(
+            indiv.value == 5.0 and indiv.failed
+            for indiv in island.current_population
+            if indiv.real_chrom[0] > 0
+        )
+
+    def test_serial_failures_are_retried_and_penalized(self, island_runner):
+        """Test that without workers every failed evaluation is retried, counted and penalized.
+
+        :returns: None
+        :raises: None
+        """
+        island, _ = island_runner(
+            FailingEvaluator(dim=15),
+            population_size=4,
+            max_generations=1,
+            evaluation_policy=GaEvaluationPolicy(max_retries=1, penalty=7.0),
+        )
+
+        assert all(indiv.value == 7.0 for indiv in island.current_population)
+        assert (
+            island.statistic_engine.failures == 2 * island.statistic_engine.evaluations
+        )
+
+    def test_serial_evaluation_attempts_each_individual_once(self, island_runner):
+        """Test that without retries a failure costs no further evaluations of the batch.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = FlakyEvaluator()
+        island, _ = island_runner(
+            evaluator,
+            population_size=20,
+            max_generations=1,
+            evaluation_policy=GaEvaluationPolicy(max_retries=0, penalty=10.0),
+        )
+
+        failed = sum(indiv.failed for indiv in island.current_population)
+        assert evaluator.calls == island.statistic_engine.evaluations == 40
+        assert island.statistic_engine.failures > 0
+        assert failed == sum(
+            indiv.real_chrom[0] > 0.5 for indiv in island.current_population
+        )
+
+    def test_failed_batch_counts_as_attempt(self, island_runner):
+        """Test that a failed batch is counted before its individuals are evaluated one by one.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = FlakyBatchEvaluator()
+        island, _ = island_runner(
+            evaluator,
+            population_size=20,
+            max_generations=1,
+            evaluation_policy=GaEvaluationPolicy(max_retries=0, penalty=10.0),
+        )
+
+        # Both failed batches stop at their first failure, then every individual gets a batch.
+        assert evaluator.batches == 2 + 40
+        assert island.statistic_engine.failures == evaluator.raised
+
+    def test_values_equal_to_penalty_are_cached(self, island_runner):
+        """Test that a true fitness equal to the penalty is not mistaken for a failure.
+
+        :returns: None
+        :raises: None
+        """
+        island, _ = island_runner(
+            MockEvaluator(dim=15, constant_value=7.0),
+            population_size=4,
+            max_generations=1,
+            evaluation_policy=GaEvaluationPolicy(max_retries=1, penalty=7.0),
+            visited_set=GaVisitedSet(capacity=100, cache_size=100),
+        )
+
+        assert not any(indiv.failed for indiv in island.current_population)
+        assert all(
+            island.visited_set.get(indiv) == 7.0 for indiv in island.current_population
+        )
+
+    def test_failure_without_policy_stops_simulation(self, island_runner):
+        """Test that the default strict behaviour still raises on failed evaluation.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(RuntimeError):
+            island_runner(
+                FailingEvaluator(dim=15), population_size=4, max_generations=1
+            )
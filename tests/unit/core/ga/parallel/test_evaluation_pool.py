@@ -0,0 +1,76 @@
+"""
+Unit tests for GaEvaluationPool.
+
+Tests that a pool of worker processes returns fitness values matching a serial
+evaluation, keeps results paired with their keys when collected in completion
+order, and reports failures raised inside worker processes.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.parallel.GaEvaluationPool import GaEvaluationPool
+from tests.utils.mocks.mock_objects import FailingEvaluator
+
+
+def _population(size: int, dim: int):
+    rng = np.random.default_rng(0)
+    return [GaIndividual(real_chrom=rng.uniform(-5, 5, dim)) for _ in range(size)]
+
+
+class TestGaEvaluationPool:
+    """Test parallel evaluation of individuals in worker processes."""
+
+    def test_evaluate_matches_serial_evaluation(self):
+        """Test that values returned by the pool equal serial evaluation, in input order.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = SphereEvaluator(dim=4)
+        population = _population(12, 4)
+
+        with GaEvaluationPool(evaluator, workers=3) as pool:
+            values = pool.evaluate(population)
+
+        expected = [evaluator.evaluate(GaEvaluatorArgs(ind)) for ind in population]
+        assert values == pytest.approx(expected)
+
+    def test_collect_returns_every_submitted_key(self):
+        """Test that collecting until nothing is pending yields each submitted key once.
+
+        :returns: None
+        :raises: None
+        """
+        population = _population(7, 3)
+
+        with GaEvaluationPool(SphereEvaluator(dim=3), workers=2) as pool:
+            for key, individual in enumerate(population):
+                pool.submit(key, individual)
+            results = []
+            while pool.pending():
+                results.extend(pool.collect())
+
+        assert sorted(key for key, _ in results) == list(range(7))
+
+    def test_worker_exception_is_reported(self):
+        """Test that an exception raised by the evaluator surfaces as RuntimeError.
+
+        :returns: None
+        :raises: None
+        """
+        with GaEvaluationPool(FailingEvaluator(), workers=1) as pool:
+            with pytest.raises(RuntimeError):
+                pool.evaluate(_population(1, 3))
+
+    def test_rejects_non_positive_worker_count(self):
+        """Test that constructing a pool without workers raises ValueError.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(ValueError):
+            GaEvaluationPool(SphereEvaluator(dim=3), workers=0)
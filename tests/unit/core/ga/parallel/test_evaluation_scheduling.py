@@ -0,0 +1,134 @@
+"""
+Unit tests for scheduling in GaEvaluationPool.
+
+Tests that idle workers steal unstarted tasks queued behind a slow evaluation,
+that chunked evaluation keeps results in input order, that waiting for a steal
+answered after every stolen task finished does not fail, and that evaluation
+latency percentiles are reported per generation.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.parallel.GaEvaluationPolicy import GaEvaluationPolicy
+from evolvekit.core.Ga.parallel.GaEvaluationPool import _STEAL, GaEvaluationPool
+from tests.utils.factories.state_factories import statistic_engine_factory
+from tests.utils.mocks.mock_objects import SleepingEvaluator
+
+
+def _sleeping(seconds: float):
+    return GaIndividual(real_chrom=np.array([seconds, 0.0, 0.0]))
+
+
+class TestGaEvaluationPoolScheduling:
+    """Test adaptive chunking and work stealing."""
+
+    def test_idle_worker_steals_tasks_queued_behind_slow_ones(self):
+        """Test that slow tasks sent to one worker in a chunk are shared with an idle worker.
+
+        :returns: None
+        :raises: None
+        """
+        with GaEvaluationPool(SleepingEvaluator(), workers=2, chunk_time=10.0) as pool:
+            pool.evaluate([_sleeping(0.0), _sleeping(0.0)])
+            pids = pool.evaluate([_sleeping(0.3)] * 4 + [_sleeping(0.0)] * 4)
+
+        assert len(set(pids[:4])) == 2
+
+    def test_chunked_evaluation_keeps_input_order(self):
+        """Test that cheap evaluations sent in large chunks are returned in input order.
+
+        :returns: None
+        :raises: None
+        """
+        evaluator = SphereEvaluator(dim=4)
+        rng = np.random.default_rng(0)
+        population = [
+            GaIndividual(real_chrom=rng.uniform(-5, 5, 4)) for _ in range(200)
+        ]
+
+        with GaEvaluationPool(evaluator, workers=3) as pool:
+            pool.evaluate(population[:3])
+            values = pool.evaluate(population)
+
+        expected = [evaluator.evaluate(GaEvaluatorArgs(ind)) for ind in population]
+        assert values == pytest.approx(expected)
+
+    def test_collect_waits_for_steal_of_finished_tasks(self):
+        """Test that a timeout is not computed when the only busy worker has no task left.
+
+        :returns: None
+        :raises: None
+        """
+        policy = GaEvaluationPolicy(timeout=5.0)
+        with GaEvaluationPool(SleepingEvaluator(), workers=1, policy=policy) as pool:
+            # A steal whose tasks all finished before the worker answered it.
+            worker = pool._GaEvaluationPool__workers[0]
+            worker.stealing = True
+            worker.connection.send(_STEAL)
+            pool.submit("key", _sleeping(0.0))
+
+            assert [key for key, _ in pool.collect()] == ["key"]
+
+    def test_latencies_are_drained(self):
+        """Test that every evaluation reports its latency exactly once.
+
+        :returns: None
+        :raises: None
+        """
+        with GaEvaluationPool(SleepingEvaluator(), workers=2) as pool:
+            pool.evaluate([_sleeping(0.01)] * 5)
+            latencies = pool.drain_latencies()
+
+            assert len(latencies) == 5
+            assert all(latency >= 0.01 for latency in latencies)
+            assert pool.drain_latencies() == []
+
+
+class TestGaLatencyStatistics:
+    """Test latency percentiles in statistics."""
+
+    def test_percentiles_are_calculated_per_generation(self):
+        """Test that percentiles use only latencies recorded since the previous generation.
+
+        :returns: None
+        :raises: None
+        """
+        engine, state = statistic_engine_factory([1.0, 2.0, 3.0])
+        engine.add_latencies([1.0] * 10)
+        engine.advance(state)
+        engine.add_latencies(np.arange(101) / 100)
+        engine.advance(state)
+
+        assert engine.latency_p50 == pytest.approx(0.5)
+        assert engine.latency_p90 == pytest.approx(0.9)
+        assert engine.latency_p99 == pytest.approx(0.99)
+
+    def test_percentiles_are_reset_without_latencies(self):
+        """Test that a generation without evaluations does not repeat previous percentiles.
+
+        :returns: None
+        :raises: None
+        """
+        engine, state = statistic_engine_factory([1.0, 2.0, 3.0])
+        engine.add_latencies([1.0] * 10)
+        engine.advance(state)
+        engine.advance(state)
+
+        assert engine.latency_p50 == engine.latency_p90 == engine.latency_p99 == 0
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_island_reports_ordered_percentiles(self, workers, island_runner):
+        """Test that a run fills latency percentiles in both serial and parallel evaluation.
+
+        :param workers: Number of worker processes.
+        :returns: None
+        :raises: None
+        """
+        island, _ = island_runner(population_size=8, workers=workers)
+
+        engine = island.statistic_engine
+        assert 0 < engine.latency_p50 <= engine.latency_p90 <= engine.latency_p99
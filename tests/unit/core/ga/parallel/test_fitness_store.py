@@ -0,0 +1,163 @@
+"""
+Unit tests for GaFitnessStore.
+
+Tests that values are keyed by chromosome bytes and evaluator tag, survive
+reopening the database, are readable from other processes through a pickled
+store, that failed writes are reported instead of dropped silently, and that GaIsland reuses stored values across runs instead of
+evaluating individuals again, while never storing failure penalties.
+"""
+
+import asyncio
+import pickle
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.parallel.GaEvaluationPolicy import GaEvaluationPolicy
+from evolvekit.core.Ga.parallel.GaFitnessStore import GaFitnessStore
+from tests.utils import FailingEvaluator, MockAsyncEvaluator
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+def _individual(*genes):
+    return GaIndividual(real_chrom=np.array(genes, dtype=np.float64))
+
+
+def _read_in_worker(store: GaFitnessStore, genes: list) -> float | None:
+    return store.get(_individual(*genes))
+
+
+class TestGaFitnessStore:
+    """Test storing and looking up fitness values."""
+
+    def test_values_are_keyed_by_chromosome_and_tag(self, tmp_path):
+        """Test round trips and that another tag does not see the value.
+
+        :returns: None
+        :raises: None
+        """
+        path = str(tmp_path / "fitness.db")
+        with GaFitnessStore(path, tag="v1") as store:
+            store.put_many([_individual(1.0, 2.0), _individual(3.0)], [5.0, 9.0])
+            store.flush()
+
+            assert store.get_many(
+                [_individual(1.0, 2.0), _individual(3.0), _individual(2.0, 1.0)]
+            ) == [5.0, 9.0, None]
+        with GaFitnessStore(path, tag="v2") as store:
+            assert store.get(_individual(1.0, 2.0)) is None
+
+    def test_values_persist_after_reopening(self, tmp_path):
+        """Test that values handed to the writer are written before close returns.
+
+        :returns: None
+        :raises: None
+        """
+        path = str(tmp_path / "fitness.db")
+        with GaFitnessStore(path) as store:
+            store.put(_individual(0.5), 0.25)
+        with GaFitnessStore(path) as store:
+            assert store.get(_individual(0.5)) == 0.25
+            assert len(store) == 1
+
+    def test_pickled_store_is_readable_from_worker_processes(self, tmp_path):
+        """Test that worker processes open their own connections to the same data.
+
+        :returns: None
+        :raises: None
+        """
+        with GaFitnessStore(str(tmp_path / "fitness.db")) as store:
+            store.put(_individual(1.0), 1.0)
+            store.flush()
+            assert len(pickle.dumps(store)) < 200
+
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                values = list(
+                    executor.map(_read_in_worker, [store] * 2, [[1.0], [2.0]])
+                )
+
+        assert values == [1.0, None]
+
+    def test_failed_writes_are_raised(self, tmp_path):
+        """Test that flush and close raise the error of the writer thread.
+
+        :returns: None
+        :raises: None
+        """
+        path = str(tmp_path / "fitness.db")
+        store = GaFitnessStore(path)
+        with sqlite3.connect(path) as connection:
+            connection.execute("DROP TABLE fitness")
+
+        store.put(_individual(1.0), 1.0)
+        with pytest.raises(sqlite3.OperationalError):
+            store.flush()
+        store.flush()
+
+        store.put(_individual(2.0), 2.0)
+        with pytest.raises(sqlite3.OperationalError):
+            store.close()
+
+
+class TestGaIslandFitnessStore:
+    """Test that islands consult and update the store."""
+
+    def test_repeated_run_is_served_from_store(self, tmp_path):
+        """Test that a second identical run evaluates nothing and gives the same result.
+
+        :returns: None
+        :raises: None
+        """
+        with GaFitnessStore(str(tmp_path / "fitness.db"), tag="sphere") as store:
+            first = minimal_island_factory(dim=4, max_generations=3)
+            first.set_fitness_store(store)
+            expected = first.run()
+
+            second = minimal_island_factory(dim=4, max_generations=3)
+            second.set_fitness_store(store)
+            results = second.run()
+
+        assert expected.total_evaluations > 0
+        assert results.total_evaluations == 0
+        assert second.statistic_engine.store_hits >= expected.total_evaluations
+        assert results.value == expected.value
+
+    def test_failure_penalties_are_not_stored(self, tmp_path):
+        """Test that individuals penalized after failed evaluations are left out.
+
+        :returns: None
+        :raises: None
+        """
+        island = GaIsland()
+        island.set_evaluator(FailingEvaluator())
+        island.set_population_size(6)
+        island.set_max_generations(2)
+        island.set_evaluation_policy(GaEvaluationPolicy(penalty=100.0))
+        with GaFitnessStore(str(tmp_path / "fitness.db")) as store:
+            island.set_fitness_store(store)
+            island.run()
+
+            assert len(store) == 0
+
+    def test_async_run_uses_store(self, tmp_path):
+        """Test that run_async() looks up and stores values as well.
+
+        :returns: None
+        :raises: None
+        """
+        with GaFitnessStore(str(tmp_path / "fitness.db")) as store:
+            values = []
+            for _ in range(2):
+                island = GaIsland()
+                island.set_evaluator(MockAsyncEvaluator(dim=3))
+                island.set_population_size(8)
+                island.set_max_generations(2)
+                island.set_fitness_store(store)
+                values.append(asyncio.run(island.run_async()))
+
+        assert values[1].total_evaluations == 0
+        assert values[1].value == values[0].value
@@ -0,0 +1,108 @@
+"""
+Unit tests for worker initialization and shared read-only data.
+
+Tests that GaEvaluator.setup_worker runs before evaluation both in worker
+processes and in the main process, and that GaSharedArray publishes data once,
+pickles to a small handle and is attached read-only by other processes.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.parallel.GaEvaluationPool import GaEvaluationPool
+from evolvekit.core.Ga.parallel.GaSharedArray import GaSharedArray
+
+
+class ReferenceDataEvaluator(GaEvaluator):
+    """Evaluator measuring the distance to shared reference data."""
+
+    def __init__(self, reference: GaSharedArray):
+        self.reference = reference
+        self.target = None
+
+    def setup_worker(self):
+        self.target = np.asarray(self.reference.array)
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        return float(np.sum((args.real_chrom - self.target) ** 2))
+
+    def extremum(self) -> GaExtremum:
+        return GaExtremum.MINIMUM
+
+    def real_domain(self):
+        return [(-1.0, 1.0)] * self.reference.shape[0]
+
+
+class TestGaSharedArray:
+    """Test publishing and attaching shared read-only arrays."""
+
+    @pytest.mark.parametrize("use_file", [False, True])
+    def test_pickled_handle_attaches_to_same_data(self, use_file, tmp_path):
+        """Test that an unpickled copy sees the published values.
+
+        :param use_file: Whether the data is backed by a memory-mapped file.
+        :param tmp_path: Temporary directory provided by pytest.
+        :returns: None
+        :raises: None
+        """
+        data = np.arange(200_000, dtype=np.float64)
+        path = str(tmp_path / "data.npy") if use_file else None
+
+        with GaSharedArray(data, path=path) as shared:
+            payload = pickle.dumps(shared)
+            attached = pickle.loads(payload)
+
+            assert len(payload) < 1024
+            np.testing.assert_array_equal(attached.array, data)
+            attached.close()
+
+    def test_array_is_read_only(self):
+        """Test that the published array cannot be modified in place.
+
+        :returns: None
+        :raises: None
+        """
+        with GaSharedArray(np.zeros(4)) as shared:
+            with pytest.raises(ValueError):
+                shared.array[0] = 1.0
+
+
+class TestSetupWorker:
+    """Test that setup_worker prepares evaluators before evaluation."""
+
+    def test_workers_evaluate_with_shared_reference(self):
+        """Test that worker processes evaluate against attached shared data.
+
+        :returns: None
+        :raises: None
+        """
+        reference = np.linspace(-1.0, 1.0, 5)
+        individual = GaIndividual(real_chrom=np.zeros(5))
+
+        with GaSharedArray(reference) as shared:
+            with GaEvaluationPool(ReferenceDataEvaluator(shared), workers=2) as pool:
+                values = pool.evaluate([individual] * 4)
+
+        assert values == pytest.approx([float(np.sum(reference**2))] * 4)
+
+    def test_island_calls_setup_worker_without_workers(self):
+        """Test that a serial run calls setup_worker in the main process.
+
+        :returns: None
+        :raises: None
+        """
+        with GaSharedArray(np.zeros(15)) as shared:
+            island = GaIsland()
+            island.set_evaluator(ReferenceDataEvaluator(shared))
+            island.set_population_size(10)
+            island.set_max_generations(1)
+            results = island.run()
+
+        assert results.value >= 0.0
@@ -0,0 +1,129 @@
+"""
+Unit tests for GaSubprocessEvaluator.
+
+Tests the binary batch protocol against a local echo-style simulator: results
+are reordered to match the batch, programs are reused between calls, crashed
+programs are restarted and slow calls are interrupted by the timeout.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.parallel.GaSubprocessEvaluator import GaSubprocessEvaluator
+
+SIMULATOR = [
+    sys.executable,
+    str(Path(__file__).parents[4] / "utils" / "programs" / "echo_simulator.py"),
+]
+
+
+def _evaluator(*options, dim=3, bits=8, **kwargs) -> GaSubprocessEvaluator:
+    return GaSubprocessEvaluator(
+        SIMULATOR + list(options),
+        GaExtremum.MINIMUM,
+        real_domain=[(-1.0, 1.0)] * dim,
+        bin_length=bits,
+        **kwargs,
+    )
+
+
+def _args(count: int):
+    rng = np.random.default_rng(1)
+    return [
+        GaEvaluatorArgs(
+            GaIndividual(
+                real_chrom=rng.uniform(-1, 1, 3),
+                bin_chrom=np.array([rng.integers(0, 256)], dtype=np.uint8),
+            )
+        )
+        for _ in range(count)
+    ]
+
+
+def _expected(args):
+    return [
+        float(np.sum(a.real_chrom**2) + np.unpackbits(a.bin_chrom).sum()) for a in args
+    ]
+
+
+class TestGaSubprocessEvaluator:
+    """Test batch evaluation in long-lived external programs."""
+
+    @pytest.mark.parametrize("processes", [1, 3])
+    def test_batch_results_are_in_input_order(self, processes):
+        """Test that reversed answers are put back in batch order.
+
+        :param processes: Number of external programs.
+        :returns: None
+        :raises: None
+        """
+        args = _args(10)
+
+        with _evaluator(processes=processes) as evaluator:
+            values = evaluator.evaluate_batch(args)
+
+        assert values == pytest.approx(_expected(args))
+
+    def test_programs_are_reused_between_calls(self):
+        """Test that several calls are served by the same running program.
+
+        :returns: None
+        :raises: None
+        """
+        args = _args(4)
+
+        with _evaluator() as evaluator:
+            first = evaluator.evaluate_batch(args)
+            second = evaluator.evaluate_batch(args)
+            single = evaluator.evaluate(args[0])
+
+        assert first == second
+        assert single == pytest.approx(first[0])
+
+    def test_crashed_program_is_restarted(self, tmp_path):
+        """Test that a batch is resent to a fresh program after a crash.
+
+        :param tmp_path: Temporary directory provided by pytest.
+        :returns: None
+        :raises: None
+        """
+        args = _args(5)
+
+        with _evaluator("--crash-once", str(tmp_path / "crashed")) as evaluator:
+            values = evaluator.evaluate_batch(args)
+
+        assert values == pytest.approx(_expected(args))
+
+    def test_slow_call_raises_timeout_and_recovers(self):
+        """Test that exceeding the timeout raises TimeoutError and later calls still work.
+
+        :returns: None
+        :raises: None
+        """
+        with _evaluator("--sleep", "0.5", timeout=0.2) as evaluator:
+            with pytest.raises(TimeoutError):
+                evaluator.evaluate_batch(_args(2))
+            evaluator.timeout = None
+            assert len(evaluator.evaluate_batch(_args(2))) == 2
+
+    def test_island_evaluates_population_in_batches(self):
+        """Test that GaIsland runs with an external evaluator.
+
+        :returns: None
+        :raises: None
+        """
+        with _evaluator(dim=15, bits=16, processes=2) as evaluator:
+            island = GaIsland()
+            island.set_evaluator(evaluator)
+            island.set_population_size(10)
+            island.set_max_generations(2)
+            results = island.run()
+
+        assert results.total_evaluations == 30
@@ -20,9 +20,22 @@ from tests.utils.factories.state_factories import statistic_engine_factory
 EXPECTED_FIELDS = {
     "generation",
     "stagnation",
+    "evaluations",
+    "store_hits",
+    "partial_evaluations",
+    "duplicates",
+    "revisits",
+    "restarts",
+    "refinements",
+    "failures",
+    "timeouts",
     "mean",
     "median",
     "stdev",
+    "latency_p50",
+    "latency_p90",
+    "latency_p99",
+    "surrogate_error",
     "best_indiv",
     "worst_indiv",
     "start_time",
@@ -38,9 +51,22 @@ class TestGaStatisticsDefaultValues:
     @pytest.mark.parametrize("field,expected", [
         ("generation", 0),
         ("stagnation", 0),
+        ("evaluations", 0),
+        ("store_hits", 0),
+        ("partial_evaluations", 0),
+        ("duplicates", 0),
+        ("revisits", 0),
+        ("restarts", 0),
+        ("refinements", 0),
+        ("failures", 0),
+        ("timeouts", 0),
         ("mean", 0.0),
         ("median", 0.0),
         ("stdev", 0.0),
+        ("latency_p50", 0.0),
+        ("latency_p90", 0.0),
+        ("latency_p99", 0.0),
+        ("surrogate_error", 0.0),
         ("start_time", 0.0),
         ("last_time", 0.0),
         ("best_indiv", None),
@@ -89,7 +115,19 @@ class TestGaStatisticsFieldTypes:
         engine.advance(state)
         self.engine = engine
 
-    @pytest.mark.parametrize("field", ["generation", "stagnation"])
+    @pytest.mark.parametrize("field", [
+        "generation",
+        "stagnation",
+        "evaluations",
+        "store_hits",
+        "partial_evaluations",
+        "duplicates",
+        "revisits",
+        "restarts",
+        "refinements",
+        "failures",
+        "timeouts",
+    ])
     def test_counter_fields_are_int(self, field):
         """generation and stagnation must be int instances after advance().
 
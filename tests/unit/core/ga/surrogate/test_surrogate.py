@@ -0,0 +1,201 @@
+"""
+Unit tests for surrogate-assisted pre-screening.
+
+Tests that k-NN and RBF surrogates predict archived fitness values, that the
+RBF surrogate fits archives smaller than the number of genes, that binary
+chromosomes are described by their bits, that the archive is bounded and
+skips non-finite values, that the surrogate error is reported per
+generation, and that GaIsland only sends
+the most promising fraction of offspring to the evaluator once the archive is
+large enough, marks the rest as estimated, never reports an estimated value
+as the result, and records the surrogate error.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.surrogate.KNearestSurrogate import KNearestSurrogate
+from evolvekit.core.Ga.surrogate.RbfSurrogate import RbfSurrogate
+from tests.utils.factories.state_factories import statistic_engine_factory
+
+
+def _sphere_individuals(count: int, dim: int = 2, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    individuals = [
+        GaIndividual(real_chrom=rng.uniform(-1, 1, dim)) for _ in range(count)
+    ]
+    for indiv in individuals:
+        indiv.value = float(np.sum(indiv.real_chrom**2))
+    return individuals
+
+
+class TestGaSurrogateModels:
+    """Test fitting and predicting with surrogate models."""
+
+    @pytest.mark.parametrize(
+        "surrogate",
+        [
+            KNearestSurrogate(k=3),
+            RbfSurrogate(),
+            RbfSurrogate(kernel="gaussian", epsilon=1.0),
+        ],
+    )
+    def test_archived_points_are_predicted_closely(self, surrogate):
+        """Test that predictions at archived chromosomes match their values.
+
+        :returns: None
+        :raises: None
+        """
+        archive = _sphere_individuals(40)
+        surrogate.archive(archive)
+
+        predictions = surrogate.estimate(archive[:5])
+
+        assert predictions == pytest.approx(
+            [ind.value for ind in archive[:5]], abs=1e-6
+        )
+
+    def test_rbf_predicts_unseen_points(self):
+        """Test that the RBF surrogate generalizes on a smooth function.
+
+        :returns: None
+        :raises: None
+        """
+        surrogate = RbfSurrogate()
+        surrogate.archive(_sphere_individuals(60))
+        unseen = _sphere_individuals(10, seed=1)
+
+        predictions = surrogate.estimate(unseen)
+
+        assert predictions == pytest.approx([ind.value for ind in unseen], abs=0.1)
+
+    def test_rbf_fits_fewer_samples_than_genes(self):
+        """Test that the RBF surrogate interpolates an archive smaller than the dimension.
+
+        :returns: None
+        :raises: None
+        """
+        surrogate = RbfSurrogate()
+        archive = _sphere_individuals(20, dim=30)
+        surrogate.archive(archive)
+
+        predictions = surrogate.estimate(archive[:5])
+
+        assert predictions == pytest.approx(
+            [ind.value for ind in archive[:5]], abs=1e-6
+        )
+
+    def test_binary_chromosomes_are_described_by_bits(self):
+        """Test that packed binary chromosomes become one feature per bit.
+
+        :returns: None
+        :raises: None
+        """
+        bits = np.array([1, 0, 1, 1, 0, 0, 0, 0, 0, 1], dtype=np.uint8)
+        indiv = GaIndividual(real_chrom=np.array([0.5]), bin_chrom=np.packbits(bits))
+
+        features = KNearestSurrogate.features([indiv], bin_length=10)
+
+        assert features.tolist() == [[0.5, *bits.tolist()]]
+
+    def test_archive_is_bounded_and_skips_non_finite_values(self):
+        """Test readiness, the archive limit and that infinite penalties are ignored.
+
+        :returns: None
+        :raises: None
+        """
+        surrogate = KNearestSurrogate(min_samples=5, archive_size=8)
+        penalized = _sphere_individuals(10)
+        for indiv in penalized:
+            indiv.value = float("inf")
+        surrogate.archive(penalized)
+        assert not surrogate.ready()
+
+        surrogate.archive(_sphere_individuals(20))
+        assert surrogate.ready()
+        assert len(surrogate.features(_sphere_individuals(3))) == 3
+
+    def test_invalid_settings_raise(self):
+        """Test that invalid screening settings are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(ValueError):
+            KNearestSurrogate(fraction=0.0)
+        with pytest.raises(ValueError):
+            KNearestSurrogate(min_samples=10, archive_size=5)
+        with pytest.raises(ValueError):
+            RbfSurrogate(kernel="sinc")
+        with pytest.raises(ValueError):
+            RbfSurrogate(kernel="gaussian")
+        with pytest.raises(ValueError):
+            RbfSurrogate(kernel="gaussian", epsilon=0.0)
+
+    def test_error_is_reset_without_predictions(self):
+        """Test that a generation without predictions does not repeat the previous error.
+
+        :returns: None
+        :raises: None
+        """
+        engine, state = statistic_engine_factory([1.0, 2.0, 3.0])
+        engine.add_surrogate_errors([0.5, 1.5])
+        engine.advance(state)
+        assert engine.surrogate_error == pytest.approx(1.0)
+
+        engine.advance(state)
+        assert engine.surrogate_error == 0
+
+
+class TestGaIslandSurrogate:
+    """Test pre-screening offspring in GaIsland."""
+
+    def test_only_promising_fraction_is_evaluated(self, island_runner):
+        """Test that after the first generation only a fraction of offspring is evaluated.
+
+        :returns: None
+        :raises: None
+        """
+        island, results = island_runner(
+            dim=3,
+            max_generations=4,
+            population_size=20,
+            surrogate=KNearestSurrogate(fraction=0.25, min_samples=20),
+        )
+
+        assert results.total_evaluations == 20 + 4 * 5
+        assert any(ind.estimated for ind in island.current_population)
+        assert island.statistic_engine.surrogate_error > 0
+
+    def test_rbf_screens_when_genes_outnumber_samples(self, island_runner):
+        """Test that screening starts even if the archive is smaller than the dimension.
+
+        :returns: None
+        :raises: None
+        """
+        _, results = island_runner(
+            dim=30,
+            max_generations=3,
+            population_size=20,
+            surrogate=RbfSurrogate(fraction=0.5, min_samples=20),
+        )
+
+        assert results.total_evaluations == 20 + 3 * 10
+        assert results.value == pytest.approx(float(np.sum(results.real_chrom**2)))
+
+    def test_result_is_never_an_estimate(self, island_runner):
+        """Test that the reported best individual was truly evaluated.
+
+        :returns: None
+        :raises: None
+        """
+        island, results = island_runner(
+            dim=3,
+            max_generations=5,
+            population_size=20,
+            surrogate=KNearestSurrogate(fraction=0.3, min_samples=20),
+        )
+
+        assert not island.statistic_engine.best_indiv.estimated
+        assert results.value == pytest.approx(float(np.sum(results.real_chrom**2)))
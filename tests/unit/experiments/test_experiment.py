@@ -0,0 +1,195 @@
+"""
+Unit tests for GaExperiment and GaExperimentResults.
+
+Tests grid and random search configurations, that every configuration is run
+once per seed with results matching a direct island run, that parallel runs
+match serial ones, and the per-configuration mean/median/IQR summaries.
+"""
+
+import numpy as np
+import pytest
+
+from evolvekit.experiments.GaExperiment import GaExperiment
+from evolvekit.experiments.GaExperimentResults import GaExperimentResults
+from evolvekit.operators.Ga.universal.selection.RankSelection import RankSelection
+from evolvekit.operators.Ga.universal.selection.TournamentSelection import (
+    TournamentSelection,
+)
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+def _experiment():
+    return GaExperiment(minimal_island_factory(dim=4, max_generations=3))
+
+
+class TestGaExperimentConfigurations:
+    """Test configuration generation."""
+
+    def test_grid_contains_every_combination(self):
+        """Test that a grid produces the cartesian product of parameter values.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = _experiment()
+        experiment.set_grid(
+            {"population_size": [10, 20], "mutation_prob": [0.1, 0.2, 0.3]}
+        )
+
+        assert len(experiment.configurations) == 6
+        assert {
+            "population_size": 20,
+            "mutation_prob": 0.3,
+        } in experiment.configurations
+
+    def test_random_search_draws_from_choices_and_callables(self):
+        """Test that random search samples sequences and callables reproducibly.
+
+        :returns: None
+        :raises: None
+        """
+        space = {
+            "population_size": [10, 20],
+            "mutation_prob": lambda rng: rng.uniform(0.05, 0.2),
+        }
+        experiment = _experiment()
+        experiment.set_random_search(space, samples=5, seed=3)
+        first = experiment.configurations
+        experiment.set_random_search(space, samples=5, seed=3)
+
+        assert first == experiment.configurations
+        assert all(c["population_size"] in (10, 20) for c in first)
+        assert all(0.05 <= c["mutation_prob"] <= 0.2 for c in first)
+
+    def test_unknown_parameter_raises(self):
+        """Test that a parameter which is neither an island attribute nor an operator raises.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = _experiment()
+        experiment.set_grid({"no_such_parameter": [1]})
+
+        with pytest.raises(ValueError):
+            experiment.run()
+
+
+class TestGaExperimentRun:
+    """Test running configurations over seeds."""
+
+    def test_every_configuration_runs_once_per_seed(self):
+        """Test that the table holds one row per configuration and seed, in order.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = _experiment()
+        experiment.set_grid({"population_size": [10, 12]})
+        experiment.set_seeds([1, 2, 3])
+        results = experiment.run()
+
+        assert len(results) == 6
+        assert list(results["configuration"]) == [0, 0, 0, 1, 1, 1]
+        assert list(results["seed"]) == [1, 2, 3, 1, 2, 3]
+        assert list(results["population_size"]) == [10, 10, 10, 12, 12, 12]
+        assert np.all(results["evaluations"] > 0)
+
+    def test_run_matches_direct_island_run(self, island_runner):
+        """Test that a recorded value equals running the configured island directly.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = _experiment()
+        experiment.set_grid({"elite_size": [2]})
+        experiment.set_seeds([7])
+        results = experiment.run()
+
+        _, expected = island_runner(dim=4, max_generations=3, elite_count=2, seed=7)
+
+        assert results["value"][0] == pytest.approx(expected.value)
+
+    def test_operators_are_labelled_by_class_name(self):
+        """Test that operator values are set on the island and stored by name.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = _experiment()
+        experiment.set_grid(
+            {"selection": [RankSelection(target_population=4), TournamentSelection(4)]}
+        )
+        results = experiment.run()
+
+        assert list(results["selection"]) == ["RankSelection", "TournamentSelection"]
+
+    def test_parallel_run_matches_serial_run(self):
+        """Test that runs in worker processes give the same values as serial runs.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = _experiment()
+        experiment.set_grid({"mutation_prob": [0.1, 0.5]})
+        experiment.set_seeds([0, 1])
+        serial = experiment.run()
+        experiment.set_workers(2)
+        parallel = experiment.run()
+
+        assert np.array_equal(serial["value"], parallel["value"])
+
+
+class TestGaExperimentResultsSummary:
+    """Test summaries of runs per configuration."""
+
+    def test_summary_statistics(self):
+        """Test mean, median and interquartile range of a configuration.
+
+        :returns: None
+        :raises: None
+        """
+        rows = [
+            {
+                "configuration": 0,
+                "p": "a",
+                "seed": s,
+                "value": v,
+                "generations": 4,
+                "time": 0.1,
+                "evaluations": 10,
+            }
+            for s, v in enumerate([1.0, 2.0, 3.0, 4.0, 10.0])
+        ] + [
+            {
+                "configuration": 1,
+                "p": "b",
+                "seed": 0,
+                "value": 5.0,
+                "generations": 4,
+                "time": 0.1,
+                "evaluations": 10,
+            }
+        ]
+        summary = GaExperimentResults(["p"], rows).summary()
+
+        assert list(summary["p"]) == ["a", "b"]
+        assert list(summary["runs"]) == [5, 1]
+        assert summary["value_mean"][0] == pytest.approx(4.0)
+        assert summary["value_median"][0] == pytest.approx(3.0)
+        assert summary["value_iqr"][0] == pytest.approx(2.0)
+        assert summary["value_iqr"][1] == 0.0
+
+    def test_to_csv_writes_every_run(self, tmp_path):
+        """Test that the CSV export has a header and one line per run.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = _experiment()
+        experiment.set_seeds([0, 1])
+        path = tmp_path / "runs.csv"
+        experiment.run().to_csv(str(path))
+
+        lines = path.read_text().splitlines()
+        assert lines[0].startswith("configuration,seed,value")
+        assert len(lines) == 3
@@ -0,0 +1,218 @@
+"""
+Unit tests for GaResultCache.
+
+Tests that cache keys depend on the seed, the evaluator tag, island
+parameters and evaluator parameters kept in private attributes, that a cache hit returns the stored results and statistics
+history without running the simulation, and that an extended experiment
+sweep only computes the configurations missing from the cache.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from evolvekit.benchmarks.RastriginEvaluator import RastriginEvaluator
+from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
+from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
+from evolvekit.core.Ga.parallel.GaSharedArray import GaSharedArray
+from evolvekit.core.Ga.parallel.GaSubprocessEvaluator import GaSubprocessEvaluator
+from evolvekit.experiments.GaExperiment import GaExperiment
+from evolvekit.experiments.GaResultCache import GaResultCache
+from tests.utils.factories.island_factories import minimal_island_factory
+
+SIMULATOR = [
+    sys.executable,
+    str(Path(__file__).parents[2] / "utils" / "programs" / "echo_simulator.py"),
+]
+
+
+class WeightedSphereEvaluator(SphereEvaluator):
+    """Sphere evaluator holding shared weights and private runtime state."""
+
+    def __init__(self, weights: GaSharedArray):
+        super().__init__(dim=4)
+        self.weights = weights
+        self._calls = 0
+
+
+def _island(seed: int = 0):
+    island = minimal_island_factory(dim=4, max_generations=3)
+    island.set_seed(seed)
+    return island
+
+
+class TestGaResultCacheKey:
+    """Test content-addressed cache keys."""
+
+    def test_key_is_stable_for_equal_configurations(self):
+        """Test that separately built islands with equal settings share a key.
+
+        :returns: None
+        :raises: None
+        """
+        assert GaResultCache.key(_island(), "v1") == GaResultCache.key(_island(), "v1")
+
+    def test_key_changes_with_seed_tag_and_parameters(self):
+        """Test that the seed, the tag and an island parameter all change the key.
+
+        :returns: None
+        :raises: None
+        """
+        base = GaResultCache.key(_island(), "v1")
+        changed = _island()
+        changed.set_mutation_probability(0.5)
+
+        assert GaResultCache.key(_island(seed=1), "v1") != base
+        assert GaResultCache.key(_island(), "v2") != base
+        assert GaResultCache.key(changed, "v1") != base
+
+    def test_key_survives_a_run(self):
+        """Test that running an island does not change its key.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        before = GaResultCache.key(island)
+        island.run()
+
+        assert GaResultCache.key(island) == before
+
+    def test_key_changes_with_private_evaluator_parameters(self):
+        """Test that benchmark parameters kept in private attributes change the key.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_evaluator(RastriginEvaluator(dim=4, A=5.0))
+        base = GaResultCache.key(island)
+        island.set_evaluator(RastriginEvaluator(dim=4, A=10.0))
+
+        assert GaResultCache.key(island) != base
+        island.set_evaluator(RastriginEvaluator(dim=4, A=5.0))
+        assert GaResultCache.key(island) == base
+
+    def test_key_ignores_running_programs(self):
+        """Test that programs started by a subprocess evaluator do not change the key.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        evaluator = GaSubprocessEvaluator(
+            SIMULATOR, GaExtremum.MINIMUM, real_domain=[(-1.0, 1.0)] * 4
+        )
+        island.set_evaluator(evaluator)
+        with evaluator:
+            before = GaResultCache.key(island)
+            island.run()
+            after = GaResultCache.key(island)
+        island.set_evaluator(
+            GaSubprocessEvaluator(
+                SIMULATOR, GaExtremum.MINIMUM, real_domain=[(-2.0, 2.0)] * 4
+            )
+        )
+
+        assert after == before
+        assert GaResultCache.key(island) != before
+
+    def test_shared_arrays_are_keyed_by_content(self):
+        """Test that shared arrays match by content, not by their shared memory block.
+
+        :returns: None
+        :raises: None
+        """
+        keys = []
+        for weights in ([1.0, 2.0], [1.0, 2.0], [1.0, 3.0]):
+            with GaSharedArray(np.array(weights)) as shared:
+                island = _island()
+                island.set_evaluator(WeightedSphereEvaluator(shared))
+                island.evaluator._calls = len(keys)
+                keys.append(GaResultCache.key(island))
+
+        assert keys[0] == keys[1]
+        assert keys[0] != keys[2]
+
+    def test_key_changes_with_workers(self):
+        """Test that the number of workers, which orders asynchronous evaluations, changes the key.
+
+        :returns: None
+        :raises: None
+        """
+        island = _island()
+        island.set_workers(2)
+
+        assert GaResultCache.key(island) != GaResultCache.key(_island())
+
+
+class TestGaResultCacheRun:
+    """Test storing and retrieving runs."""
+
+    def test_hit_returns_stored_results_and_history(self, tmp_path):
+        """Test that the second run is served from the cache with identical results.
+
+        :returns: None
+        :raises: None
+        """
+        with GaResultCache(str(tmp_path / "cache.db")) as cache:
+            first = cache.run(_island(), "v1")
+            second = cache.run(_island(), "v1")
+            history = cache.history(_island(), "v1")
+
+            assert (cache.hits, cache.misses) == (2, 1)
+        assert second.value == first.value
+        assert np.array_equal(second.real_chrom, first.real_chrom)
+        assert len(history) == first.total_generations
+        assert history[-1].best_indiv.value == first.value
+
+    def test_evaluator_dimensions_are_not_confused(self, tmp_path):
+        """Test that the same evaluator class at another dimension is not a hit.
+
+        :returns: None
+        :raises: None
+        """
+        with GaResultCache(str(tmp_path / "cache.db")) as cache:
+            small = _island()
+            small.set_evaluator(SphereEvaluator(dim=2))
+            cache.run(small)
+            large = _island()
+            large.set_evaluator(SphereEvaluator(dim=40))
+            results = cache.run(large)
+
+            assert (cache.hits, cache.misses) == (0, 2)
+        assert len(results.real_chrom) == 40
+
+    def test_cache_persists_on_disk(self, tmp_path):
+        """Test that a reopened cache still contains stored runs.
+
+        :returns: None
+        :raises: None
+        """
+        path = str(tmp_path / "cache.db")
+        with GaResultCache(path) as cache:
+            value = cache.run(_island()).value
+        with GaResultCache(path) as cache:
+            assert cache.lookup(GaResultCache.key(_island()))[0].value == value
+
+    def test_extended_sweep_only_runs_new_configurations(self, tmp_path):
+        """Test that an experiment reuses cached runs and matches an uncached run.
+
+        :returns: None
+        :raises: None
+        """
+        experiment = GaExperiment(_island())
+        experiment.set_seeds([0, 1])
+        experiment.set_grid({"mutation_prob": [0.1, 0.2]})
+        uncached = experiment.run()
+
+        with GaResultCache(str(tmp_path / "cache.db")) as cache:
+            experiment.set_cache(cache, "v1")
+            experiment.run()
+            experiment.set_grid({"mutation_prob": [0.1, 0.2, 0.3]})
+            extended = experiment.run()
+
+            assert cache.misses == 4 + 2
+            assert cache.hits == 4
+        assert np.array_equal(extended["value"][:4], uncached["value"])
@@ -0,0 +1,194 @@
+"""
+Unit tests for AdaptiveOperator.
+
+Tests that every bandit policy allocates most offspring to the operator
+which improves them, that every evaluated offspring is credited once,
+that crossover pools and steady-state evolution are supported, that
+mutated individuals keep their positions when an operator reorders them,
+and that invalid pools are rejected.
+"""
+
+import copy
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from evolvekit.core.Ga.GaIndividual import GaIndividual
+from evolvekit.core.Ga.enums.GaBanditPolicy import GaBanditPolicy
+from evolvekit.core.Ga.enums.GaEvolutionMode import GaEvolutionMode
+from evolvekit.core.Ga.enums.GaOpCategory import GaOpCategory
+from evolvekit.core.Ga.operators.GaOperator import GaOperator
+from evolvekit.operators.Ga.real.crossover.ArithmeticalCrossover import (
+    ArithmeticalCrossover,
+)
+from evolvekit.operators.Ga.real.crossover.SimpleCrossover import SimpleCrossover
+from evolvekit.operators.Ga.real.mutation.UniformMutation import UniformMutation
+from evolvekit.operators.Ga.universal.adaptive.AdaptiveOperator import (
+    AdaptiveOperator,
+)
+from evolvekit.operators.Ga.universal.selection.TournamentSelection import (
+    TournamentSelection,
+)
+from tests.utils.factories.island_factories import minimal_island_factory
+
+
+class IdleMutation(GaOperator):
+    """Mutation leaving every individual unchanged."""
+
+    def category(self) -> GaOpCategory:
+        return GaOpCategory.REAL_MUTATION
+
+    def perform(self, args):
+        return args.population
+
+
+class ReversingMutation(GaOperator):
+    """Mutation returning unchanged copies of the individuals in reverse order."""
+
+    def category(self) -> GaOpCategory:
+        return GaOpCategory.REAL_MUTATION
+
+    def perform(self, args):
+        return [copy.deepcopy(indiv) for indiv in reversed(args.population)]
+
+
+class DroppingMutation(ReversingMutation):
+    """Mutation losing the last individual."""
+
+    def perform(self, args):
+        return super().perform(args)[1:]
+
+
+def _mutation_island(operator):
+    island = minimal_island_factory(dim=5, max_generations=40, population_size=30)
+    island.set_operator(operator)
+    # Only mutation changes offspring, so improvements are credited to it alone.
+    island.set_crossover_probability(0.0)
+    island.set_mutation_probability(1.0)
+    return island
+
+
+class TestAdaptiveOperator:
+    """Test adaptive operator selection."""
+
+    @pytest.mark.parametrize("policy", list(GaBanditPolicy))
+    def test_prefers_improving_operator(self, policy):
+        """Test that most offspring are allocated to the operator which improves them.
+
+        :returns: None
+        :raises: None
+        """
+        operator = AdaptiveOperator([IdleMutation(), UniformMutation(1.0)], policy)
+        _mutation_island(operator).run()
+        idle, uniform = operator.report()
+
+        assert idle["operator"] == "IdleMutation"
+        assert idle["reward"] == 0.0
+        assert uniform["mean_reward"] > 0.0
+        assert uniform["usage"] > 3 * idle["usage"]
+
+    def test_every_offspring_is_credited_once(self):
+        """Test that usage counts every evaluated offspring and tags are cleared.
+
+        :returns: None
+        :raises: None
+        """
+        operator = AdaptiveOperator([IdleMutation(), UniformMutation(1.0)])
+        island = _mutation_island(operator)
+        island.run()
+
+        assert sum(arm["usage"] for arm in operator.report()) == 30 * 40
+        assert all(indiv.arms is None for indiv in island.current_population)
+
+    def test_crossover_pool_in_steady_state(self):
+        """Test that crossovers are chosen per call and credited in steady-state evolution.
+
+        :returns: None
+        :raises: None
+        """
+        operator = AdaptiveOperator(
+            [ArithmeticalCrossover(), SimpleCrossover()],
+            GaBanditPolicy.ADAPTIVE_PURSUIT,
+        )
+        island = minimal_island_factory(dim=5, max_generations=10, population_size=20)
+        island.set_operator(operator)
+        island.set_operator(TournamentSelection(target_population=20))
+        island.set_evolution_mode(GaEvolutionMode.STEADY_STATE)
+        island.run()
+        report = operator.report()
+
+        assert all(arm["usage"] > 0 for arm in report)
+        assert sum(arm["probability"] for arm in report) == pytest.approx(1.0)
+
+    def test_reordered_output_keeps_positions(self):
+        """Test that offspring and arms stay with their inputs when an operator reorders them.
+
+        :returns: None
+        :raises: None
+        """
+        np.random.seed(0)
+        operator = AdaptiveOperator(
+            [ReversingMutation(), ReversingMutation()],
+            GaBanditPolicy.PROBABILITY_MATCHING,
+        )
+        population = [GaIndividual(real_chrom=np.array([float(i)])) for i in range(8)]
+        offspring = operator.perform(SimpleNamespace(population=population))
+        arms = [indiv.arms[GaOpCategory.REAL_MUTATION] for indiv in offspring]
+
+        assert [indiv.real_chrom[0] for indiv in offspring] == list(range(8))
+        assert set(arms) == {0, 1}
+        assert all(indiv.arms is None for indiv in population)
+
+    def test_lost_individuals_are_rejected(self):
+        """Test that a mutation operator returning fewer individuals is rejected.
+
+        :returns: None
+        :raises: None
+        """
+        operator = AdaptiveOperator([DroppingMutation()])
+        population = [GaIndividual(real_chrom=np.array([float(i)])) for i in range(4)]
+
+        with pytest.raises(ValueError):
+            operator.perform(SimpleNamespace(population=population))
+
+    def test_tracks_changed_genes_of_whole_pool(self):
+        """Test that changed genes are tracked only if every operator tracks them.
+
+        :returns: None
+        :raises: None
+        """
+        assert AdaptiveOperator([UniformMutation()]).tracks_changed_genes()
+        assert not AdaptiveOperator(
+            [UniformMutation(), IdleMutation()]
+        ).tracks_changed_genes()
+
+    def test_arms_survive_deepcopy(self):
+        """Test that recorded arms are copied with the individual.
+
+        :returns: None
+        :raises: None
+        """
+        indiv = GaIndividual(arms={GaOpCategory.REAL_MUTATION: 1}, reference_value=2.0)
+        clone = copy.deepcopy(indiv)
+        clone.arms[GaOpCategory.REAL_MUTATION] = 0
+
+        assert indiv.arms == {GaOpCategory.REAL_MUTATION: 1}
+        assert clone.reference_value == 2.0
+
+    @pytest.mark.parametrize(
+        "operators",
+        [
+            [],
+            [UniformMutation(), SimpleCrossover()],
+            [TournamentSelection(target_population=10)],
+        ],
+    )
+    def test_invalid_pool(self, operators):
+        """Test that empty, mixed and selection pools are rejected.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(ValueError):
+            AdaptiveOperator(operators)
@@ -0,0 +1,94 @@
+"""
+Unit tests for lazy loading of operator packages.
+
+Tests that operators are resolved on first access through the aggregating
+packages with the same precedence as star imports, and that public names and
+heavy dependencies of single operators are only loaded when needed.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import evolvekit.operators.Ga as ga_ops
+import evolvekit.operators.Ga.binary as bin_ops
+import evolvekit.operators.Ga.real as real_ops
+
+
+class TestLazyOperatorPackages:
+    """Test attribute access on lazily loaded operator packages."""
+
+    @pytest.mark.parametrize(
+        "name, module",
+        [
+            (
+                "OnePointCrossover",
+                "evolvekit.operators.Ga.real.crossover.OnePointCrossover",
+            ),
+            (
+                "VirusInfectionMutation",
+                "evolvekit.operators.Ga.real.mutation.VirusInfectionMutation",
+            ),
+            (
+                "RankSelection",
+                "evolvekit.operators.Ga.universal.selection.RankSelection",
+            ),
+        ],
+    )
+    def test_later_subpackages_take_precedence(self, name, module):
+        """Test that names defined in several subpackages resolve as with star imports.
+
+        :param name: Operator name.
+        :param module: Module expected to define the resolved operator.
+        :returns: None
+        :raises: None
+        """
+        assert getattr(ga_ops, name).__module__ == module
+
+    def test_binary_operator_is_resolved_from_its_package(self):
+        """Test that the binary package returns its own operator class.
+
+        :returns: None
+        :raises: None
+        """
+        assert bin_ops.OnePointCrossover.__module__.startswith(
+            "evolvekit.operators.Ga.binary"
+        )
+
+    def test_all_lists_every_operator(self):
+        """Test that __all__ combines the names of all subpackages.
+
+        :returns: None
+        :raises: None
+        """
+        assert "WeightedGradientDirectionBasedMutation" in real_ops.__all__
+        assert "ArithmeticalCrossover" in real_ops.__all__
+        assert set(real_ops.__all__) <= set(ga_ops.__all__)
+        assert set(real_ops.__all__) <= set(dir(real_ops))
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that accessing a missing operator raises AttributeError.
+
+        :returns: None
+        :raises: None
+        """
+        with pytest.raises(AttributeError):
+            real_ops.NoSuchOperator
+
+    def test_gradient_mutation_defers_heavy_imports(self):
+        """Test that scipy is loaded only when the gradient mutation is performed.
+
+        :returns: None
+        :raises: None
+        """
+        code = (
+            "import sys\n"
+            "from evolvekit.operators.Ga.real import WeightedGradientDirectionBasedMutation\n"
+            "print('scipy' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
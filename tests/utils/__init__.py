@@ -29,6 +29,7 @@ from .factories.state_factories import (
 # Import island factories
 from .factories.island_factories import (
     minimal_island_factory,
+    run_island_factory,
 )
 
 # Import test utilities and pytest fixtures
@@ -45,6 +46,7 @@ from .fixtures import (
     evaluator_factory_fixture,    
     state_with_population_fixture,  
     configured_state_fixture,       
+    island_runner,
 )
 
 # Import mock objects
@@ -52,6 +54,12 @@ from .mocks.mock_objects import (
     MockEvaluator,
     MockBinaryEvaluator,
     MockMixedEvaluator,
+    FailingEvaluator,
+    HangingEvaluator,
+    FailOnceEvaluator,
+    ProcessIdEvaluator,
+    SleepingEvaluator,
+    MockAsyncEvaluator,
     MockOperator,
     TestDataGenerator,
     TestScenarios,
@@ -85,6 +93,8 @@ __all__ = [
 
     # Island factories
     "minimal_island_factory",
+    "run_island_factory",
+    "island_runner",
     
     # Test utilities
     "create_evaluator_args",
@@ -99,6 +109,12 @@ __all__ = [
     "MockEvaluator",
     "MockBinaryEvaluator",
     "MockMixedEvaluator",
+    "FailingEvaluator",
+    "HangingEvaluator",
+    "FailOnceEvaluator",
+    "ProcessIdEvaluator",
+    "SleepingEvaluator",
+    "MockAsyncEvaluator",
     "MockOperator",
     "TestDataGenerator",
     "TestScenarios",
@@ -2,7 +2,11 @@
 Factory helpers for creating configured GaIsland instances in tests.
 """
 
+from typing import Tuple
+
+from evolvekit.core.Ga.GaEvaluator import GaEvaluator
 from evolvekit.core.Ga.GaIsland import GaIsland
+from evolvekit.core.Ga.GaResults import GaResults
 from evolvekit.benchmarks.SphereEvaluator import SphereEvaluator
 
 
@@ -27,3 +31,29 @@ def minimal_island_factory(
     island.set_max_generations(max_generations)
     island.set_population_size(population_size)
     return island
+
+
+def run_island_factory(
+    evaluator: GaEvaluator | None = None,
+    population_size: int = 10,
+    max_generations: int = 2,
+    dim: int = 15,
+    **settings,
+) -> Tuple[GaIsland, GaResults]:
+    """
+    Create a minimal GaIsland, apply settings through its setters and run it.
+
+    :param evaluator: Evaluator replacing the default SphereEvaluator.
+    :param population_size: Number of individuals in the population.
+    :param max_generations: Upper bound on the number of evolution cycles.
+    :param dim: Number of real-valued dimensions of the default SphereEvaluator.
+    :param settings: Values passed to island setters, keyed by setter name without
+        the ``set_`` prefix, e.g. ``evaluation_policy=GaEvaluationPolicy()``.
+    :returns: The island after the run and its results.
+    """
+    island = minimal_island_factory(dim, max_generations, population_size)
+    if evaluator is not None:
+        island.set_evaluator(evaluator)
+    for name, value in settings.items():
+        getattr(island, f"set_{name}")(value)
+    return island, island.run()
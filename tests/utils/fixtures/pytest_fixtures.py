@@ -3,6 +3,7 @@ import pytest
 from ..factories.individual_factories import random_individual_factory
 from ..factories.population_factories import population_factory
 from ..factories.evaluator_factories import evaluator_factory
+from ..factories.island_factories import run_island_factory
 from ..factories.state_factories import (
     state_with_population_factory,
     configured_state_factory,
@@ -53,3 +54,12 @@ def configured_state_fixture():
     Usage: state = configured_state_fixture()
     """
     return configured_state_factory
+
+
+@pytest.fixture
+def island_runner():
+    """
+    Fixture that returns the run_island_factory function.
+    Usage: island, results = island_runner(evaluator, population_size=20, workers=2)
+    """
+    return run_island_factory
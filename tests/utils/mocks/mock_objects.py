@@ -1,9 +1,14 @@
+import asyncio
+import os
+import time
+
 import numpy as np
 from typing import List, Tuple, Any
 
 from evolvekit.core.Ga.GaIndividual import GaIndividual
 from evolvekit.core.Ga.GaEvaluatorArgs import GaEvaluatorArgs
 from evolvekit.core.Ga.GaEvaluator import GaEvaluator
+from evolvekit.core.Ga.AsyncGaEvaluator import AsyncGaEvaluator
 from evolvekit.core.Ga.GaInspector import GaInspector
 from evolvekit.core.Ga.enums.GaAction import GaAction
 from evolvekit.core.Ga.enums.GaExtremum import GaExtremum
@@ -94,6 +99,219 @@ class MockBinaryEvaluator(GaEvaluator):
         return self._bin_len
 
 
+class FailingEvaluator(GaEvaluator):
+    """Mock evaluator whose evaluation always raises an exception."""
+
+    def __init__(self, dim: int = 3):
+        """
+        Initialize failing evaluator.
+
+        :param dim: Problem dimension
+        """
+        self.dim = dim
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Raise unconditionally.
+
+        :param args: Evaluation arguments (unused).
+        :raises RuntimeError: Always.
+        """
+        raise RuntimeError("evaluation failed")
+
+    def extremum(self) -> GaExtremum:
+        """
+        Returns MINIMUM.
+
+        :return: GaExtremum.MINIMUM
+        """
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        """Return mock domain bounds."""
+        return [(0.0, 1.0)] * self.dim
+
+
+class HangingEvaluator(GaEvaluator):
+    """Mock evaluator which never finishes for individuals whose first gene is positive."""
+
+    def __init__(self, dim: int = 3):
+        """
+        Initialize hanging evaluator.
+
+        :param dim: Problem dimension
+        """
+        self.dim = dim
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Return the first gene, or sleep far beyond any test timeout if it is positive.
+
+        :param args: Evaluation arguments.
+        :return: First gene of the real chromosome.
+        """
+        if args.real_chrom[0] > 0:
+            time.sleep(60)
+        return float(args.real_chrom[0])
+
+    def extremum(self) -> GaExtremum:
+        """
+        Returns MINIMUM.
+
+        :return: GaExtremum.MINIMUM
+        """
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        """Return mock domain bounds."""
+        return [(-1.0, 1.0)] * self.dim
+
+
+class FailOnceEvaluator(GaEvaluator):
+    """Mock evaluator failing on its very first call across all processes."""
+
+    def __init__(self, marker_path: str, dim: int = 3):
+        """
+        Initialize fail-once evaluator.
+
+        :param marker_path: File created by the first call, later calls succeed once it exists.
+        :param dim: Problem dimension
+        """
+        self.marker_path = marker_path
+        self.dim = dim
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Raise if the marker file does not exist yet, otherwise return the sum of genes.
+
+        :param args: Evaluation arguments.
+        :return: Sum of the real chromosome.
+        :raises RuntimeError: On the first call.
+        """
+        try:
+            os.close(os.open(self.marker_path, os.O_CREAT | os.O_EXCL))
+        except FileExistsError:
+            return float(np.sum(args.real_chrom))
+        raise RuntimeError("first evaluation failed")
+
+    def extremum(self) -> GaExtremum:
+        """
+        Returns MINIMUM.
+
+        :return: GaExtremum.MINIMUM
+        """
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        """Return mock domain bounds."""
+        return [(0.0, 1.0)] * self.dim
+
+
+class ProcessIdEvaluator(GaEvaluator):
+    """Mock evaluator returning the id of the process it runs in."""
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Return the current process id.
+
+        :param args: Evaluation arguments (unused).
+        :return: Process id.
+        """
+        return float(os.getpid())
+
+    def extremum(self) -> GaExtremum:
+        """
+        Returns MINIMUM.
+
+        :return: GaExtremum.MINIMUM
+        """
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        """Return mock domain bounds."""
+        return [(0.0, 1.0)] * 3
+
+
+class SleepingEvaluator(GaEvaluator):
+    """Mock evaluator sleeping for as many seconds as its first gene and returning its process id."""
+
+    def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Sleep for the first gene seconds, then return the current process id.
+
+        :param args: Evaluation arguments.
+        :return: Process id.
+        """
+        time.sleep(float(args.real_chrom[0]))
+        return float(os.getpid())
+
+    def extremum(self) -> GaExtremum:
+        """
+        Returns MINIMUM.
+
+        :return: GaExtremum.MINIMUM
+        """
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        """Return mock domain bounds."""
+        return [(0.0, 1.0)] * 3
+
+
+class MockAsyncEvaluator(AsyncGaEvaluator):
+    """Mock coroutine evaluator computing the sphere function after a delay and tracking concurrency.
+
+    The delay grows up to tenfold with the magnitude of the first gene, so evaluations finish out of order.
+    """
+
+    def __init__(self, dim: int = 15, delay: float = 0.001, hang_above: float | None = None):
+        """
+        Initialize mock coroutine evaluator.
+
+        :param dim: Problem dimension
+        :param delay: Shortest time in seconds an evaluation waits before returning
+        :param hang_above: If set, evaluations of individuals whose first gene exceeds it never finish
+        """
+        self.dim = dim
+        self.delay = delay
+        self.hang_above = hang_above
+        self.active = 0
+        self.max_active = 0
+        self.cancelled = 0
+
+    async def evaluate(self, args: GaEvaluatorArgs) -> float:
+        """
+        Wait for the delay, then return the sum of squared genes.
+
+        :param args: Evaluation arguments.
+        :return: Sphere function value.
+        """
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay * (1 + 9 * abs(args.real_chrom[0])))
+            if self.hang_above is not None and args.real_chrom[0] > self.hang_above:
+                await asyncio.sleep(60)
+            return float(np.sum(np.square(args.real_chrom)))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+
+    def extremum(self) -> GaExtremum:
+        """
+        Returns MINIMUM.
+
+        :return: GaExtremum.MINIMUM
+        """
+        return GaExtremum.MINIMUM
+
+    def real_domain(self) -> List[Tuple[float, float]]:
+        """Return mock domain bounds."""
+        return [(-1.0, 1.0)] * self.dim
+
+
 class TerminatingInspector(GaInspector):
     """Inspector that immediately signals termination on the first inspect call."""
 
@@ -0,0 +1,61 @@
+"""
+Stand-in for an external simulator speaking the GaSubprocessEvaluator protocol.
+
+Every record is answered with the sum of squared real genes plus the number of
+set bits. Records are answered in reverse order to exercise result reordering.
+
+Options:
+    --sleep SECONDS    Wait before answering every batch.
+    --crash-once PATH  Exit without answering if PATH does not exist (and create it).
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+
+
+def read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) < size:
+        raise EOFError
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sleep", type=float, default=0.0)
+    parser.add_argument("--crash-once", default=None)
+    options = parser.parse_args()
+
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        try:
+            count, real_length, bin_bytes = struct.unpack("<III", read_exact(stdin, 12))
+        except EOFError:
+            return
+
+        results = []
+        for _ in range(count):
+            (index,) = struct.unpack("<I", read_exact(stdin, 4))
+            genes = struct.unpack(
+                f"<{real_length}d", read_exact(stdin, 8 * real_length)
+            )
+            bits = read_exact(stdin, bin_bytes)
+            value = sum(g * g for g in genes) + sum(bin(b).count("1") for b in bits)
+            results.append((index, value))
+
+        if options.crash_once and not os.path.exists(options.crash_once):
+            open(options.crash_once, "w").close()
+            sys.exit(1)
+        time.sleep(options.sleep)
+
+        stdout.write(struct.pack("<I", count))
+        for index, value in reversed(results):
+            stdout.write(struct.pack("<Id", index, value))
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    main()